@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+bench_dispatch.py
+~~~~~~~~~~~~~~~~~
+This module benchmarks the update dispatch of the tgbotapi Bot,
+It shows the dispatch cost per update as the number of registered handlers, bot commands and keywords grows.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import timeit
+from tgbotapi import Bot, bot as tgbot, types
+
+UPDATES = 1000
+MESSAGE = {'message_id': 1, 'date': 0, 'chat': {'id': 1, 'type': 'private'}, 'text': 'hello'}
+COMMAND = {'message_id': 1, 'date': 0, 'chat': {'id': 1, 'type': 'private'}, 'text': '/start@MyBot now',
+           'entities': [{'type': 'bot_command', 'offset': 0, 'length': 12}]}
+
+
+def make_bot(handlers):
+    """
+    Builds a bot with one message handler and `handlers` handlers spread over the other update types
+    """
+    bot = Bot(access_token='TOKEN', max_workers=1)
+    other_types = [ttype for ttype in tgbot.UPDATE_TYPES if ttype != 'message']
+    for i in range(handlers):
+        bot.update_handler(update_type=other_types[i % len(other_types)], func=lambda update: True)(lambda update: None)
+    bot.update_handler(update_type='message', func=lambda message: True)(lambda message: None)
+    return bot
+
+
+def make_command_bot(commands):
+    """
+    Builds a bot with `commands` bot_command handlers registered before the /start handler
+    """
+    bot = Bot(access_token='TOKEN', max_workers=1)
+    for i in range(commands):
+        bot.update_handler(bot_command=[f'/command{i}'])(lambda message: None)
+    bot.update_handler(bot_command=['/start'])(lambda message: None)
+    return bot
+
+
+def make_keyword_bot(keywords):
+    """
+    Builds a bot with `keywords` regexp handlers, none of them matches MESSAGE
+    """
+    bot = Bot(access_token='TOKEN', max_workers=1)
+    for i in range(keywords):
+        bot.update_handler(regexp=f'spam{i}')(lambda message: None)
+    bot.update_handler(regexp=r'^h\w+o$')(lambda message: None)
+    return bot
+
+
+def bench(title, factory, update):
+    updates = [types.Update.de_json({'update_id': i, 'message': update}) for i in range(UPDATES)]
+    print(f"{title:>10} {'usec/update':>12}")
+    for handlers in (1, 10, 100, 1000, 10000):
+        bot = factory(handlers)
+        best = min(timeit.repeat(lambda: bot.process_new_updates(updates), number=1, repeat=5))
+        print(f'{handlers:>10} {best / UPDATES * 1e6:>12.2f}')
+
+
+def main():
+    bench('handlers', make_bot, MESSAGE)
+    bench('commands', make_command_bot, COMMAND)
+    bench('keywords', make_keyword_bot, MESSAGE)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+bench_json.py
+~~~~~~~~~~~~~
+This module benchmarks the JSON backends of tgbotapi,
+It shows the cost per update of parsing a getUpdates response and decoding its updates, and the cost of encoding
+a reply markup, for every backend installed.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import importlib
+import json
+import timeit
+import requests
+from tgbotapi import types, utils
+from bench_types import CORPUS
+
+BATCH = 100
+BODY = json.dumps({'ok': True, 'result': [dict(CORPUS[i % len(CORPUS)], update_id=i) for i in range(BATCH)]},
+                  ensure_ascii=False).encode()
+MARKUP = types.InlineKeyboardMarkup([[types.InlineKeyboardButton(f'button {row}{column}',
+                                                                 callback_data=f'vote:{row}:{column}')
+                                      for column in range(3)] for row in range(3)])
+
+
+def requests_json():
+    """
+    Parses the body the way the session did before the codec, through requests
+    """
+    response = requests.models.Response()
+    response._content = BODY
+    response.encoding = None
+    return response.json()
+
+
+def bench(title, loads, encode=True):
+    number = 200
+    parse = min(timeit.repeat(loads, number=number, repeat=5))
+    decode = min(timeit.repeat(lambda: [types.Update.de_json(obj) for obj in loads()['result']], number=number,
+                               repeat=5))
+    per_update = number * BATCH
+    markup = '-'
+    if encode:
+        markup = min(timeit.repeat(lambda: utils.codec.dumps(MARKUP), number=number, repeat=5))
+        markup = f'{markup / number * 1e6:.2f}'
+    print(f'{title:>10} {parse / per_update * 1e6:>12.2f} {decode / per_update * 1e6:>12.2f} {markup:>12}')
+
+
+def main():
+    print(f"{'backend':>10} {'usec/parse':>12} {'usec/decode':>12} {'usec/markup':>12}")
+    bench('requests', requests_json, encode=False)
+    for backend in utils.JsonCodec.backends:
+        try:
+            importlib.import_module(backend)
+        except ImportError:
+            print(f'{backend:>10} {"not installed":>12}')
+            continue
+        utils.codec.use(backend)
+        bench(backend, lambda: utils.codec.loads(BODY))
+    utils.codec.use()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+bench_types.py
+~~~~~~~~~~~~~~
+This module benchmarks the decoding of tgbotapi types,
+It shows the de_json cost per update for a realistic corpus, decoding all fields or only the ones a handler reads,
+and the memory a window of recent updates holds, as bytes per update.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import json
+import timeit
+import tracemalloc
+from tgbotapi import types
+
+USER = {'id': 1111111, 'is_bot': False, 'first_name': 'Mustafa', 'last_name': 'Asaad', 'username': 'ma24th',
+        'language_code': 'en'}
+GROUP = {'id': -1001234567890, 'title': 'Guard Bot', 'username': 'GuardBotc', 'type': 'supergroup'}
+TEXT = {'message_id': 1, 'from': USER, 'chat': GROUP, 'date': 1650000000, 'text': '/start@GuardBot hello there',
+        'entities': [{'type': 'bot_command', 'offset': 0, 'length': 15},
+                     {'type': 'url', 'offset': 16, 'length': 5}]}
+REPLY = dict(TEXT, message_id=2, text='I agree with this', entities=[], reply_to_message=TEXT)
+PHOTO = {'message_id': 3, 'from': USER, 'chat': GROUP, 'date': 1650000000, 'caption': 'look at this',
+         'photo': [{'file_id': f'AgACAgQAAxkBAAI{size}', 'file_unique_id': f'AQAD{size}', 'width': size,
+                    'height': size, 'file_size': size * 40} for size in (90, 320, 800, 1280)]}
+CALLBACK = {'id': '4382bfdwdsb323b2d9', 'from': USER, 'message': TEXT, 'chat_instance': '-8405321342389',
+            'data': 'vote:up'}
+WINDOW = 10000
+CORPUS = [{'update_id': 1, 'message': TEXT}, {'update_id': 2, 'message': REPLY}, {'update_id': 3, 'message': PHOTO},
+          {'update_id': 4, 'callback_query': CALLBACK}]
+
+
+def handle(update):
+    """
+    Reads what a typical handler reads, the chat and the text
+    """
+    message = update.message
+    if message is not None:
+        return message.chat.uid, message.text
+    return update.callback_query.data
+
+
+def memory(update_class):
+    """
+    Keeps a window of WINDOW handled updates, decoded from fresh json like polling does, and measures what it holds
+    """
+    payloads = [json.dumps(obj) for obj in CORPUS]
+    tracemalloc.start()
+    window = []
+    for i in range(WINDOW):
+        update = update_class.de_json(json.loads(payloads[i % len(payloads)]))
+        handle(update)
+        window.append(update)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / WINDOW
+
+
+def bench(title, update_class):
+    number = 2000
+    decode = min(timeit.repeat(lambda: [update_class.de_json(obj) for obj in CORPUS], number=number, repeat=5))
+    dispatch = min(timeit.repeat(lambda: [handle(update_class.de_json(obj)) for obj in CORPUS], number=number,
+                                 repeat=5))
+    per_update = number * len(CORPUS)
+    print(f'{title:>10} {decode / per_update * 1e6:>12.2f} {dispatch / per_update * 1e6:>12.2f} '
+          f'{memory(update_class):>12.0f}')
+
+
+def main():
+    print(f"{'types':>10} {'usec/decode':>12} {'usec/handle':>12} {'bytes/update':>12}")
+    bench('Update', types.Update)
+    bench('LazyUpdate', types.LazyUpdate)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+bench_webhook.py
+~~~~~~~~~~~~~~~~
+This module benchmarks the update ingress of the tgbotapi Bot,
+It compares the webhook server with long polling against a local fake Bot API, counting dispatched updates per second.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import http.client
+import http.server
+import itertools
+import json
+import socket
+import threading
+import time
+from tgbotapi import Bot
+
+UPDATES = 20000
+CONNECTIONS = 40
+MESSAGE = {'message_id': 1, 'date': 0, 'chat': {'id': 1, 'type': 'private'}, 'text': 'hello'}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def counting_bot(based_url=None):
+    """
+    Builds a bot whose message handler sets an event once UPDATES updates were handled
+    """
+    bot = Bot(access_token='TOKEN', max_workers=4, based_url=based_url)
+    # known up front, so starting the bot does not call get_me
+    bot.username = 'BenchBot'
+    done = threading.Event()
+    handled = itertools.count(1)
+
+    @bot.update_handler(update_type='message')
+    def count(message):
+        if next(handled) == UPDATES:
+            done.set()
+
+    return bot, done
+
+
+def post_updates(port, first, count):
+    """
+    Posts updates over one keep-alive connection, like Telegram does
+    """
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    for update_id in range(first, first + count):
+        body = json.dumps({'update_id': update_id, 'message': MESSAGE})
+        connection.request('POST', '/', body, {'Content-Type': 'application/json'})
+        connection.getresponse().read()
+    connection.close()
+
+
+def bench_webhook():
+    bot, done = counting_bot()
+    port = free_port()
+    threading.Thread(target=bot.webhook, kwargs={'listen': '127.0.0.1', 'port': port}, daemon=True).start()
+    time.sleep(.5)
+
+    share = UPDATES // CONNECTIONS
+    clients = [threading.Thread(target=post_updates, args=(port, 1 + i * share, share)) for i in range(CONNECTIONS)]
+    start = time.perf_counter()
+    for client in clients:
+        client.start()
+    done.wait()
+    elapsed = time.perf_counter() - start
+    bot.stop_webhook()
+    return elapsed
+
+
+class FakeApi(http.server.BaseHTTPRequestHandler):
+    """
+    Serves getUpdates batches of 100 updates until UPDATES updates were served, then empty batches
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        first = self.server.served + 1
+        count = min(100, UPDATES - self.server.served)
+        self.server.served += count
+        result = [{'update_id': i, 'message': MESSAGE} for i in range(first, first + count)]
+        body = json.dumps({'ok': True, 'result': result}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+def bench_polling():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FakeApi)
+    server.served = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bot, done = counting_bot(f'http://127.0.0.1:{server.server_address[1]}/bot')
+
+    start = time.perf_counter()
+    threading.Thread(target=bot.polling, kwargs={'timeout': 0}, daemon=True).start()
+    done.wait()
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    return elapsed
+
+
+def main():
+    print(f"{'ingress':>10} {'updates/sec':>12}")
+    for title, bench in (('webhook', bench_webhook), ('polling', bench_polling)):
+        print(f'{title:>10} {UPDATES / bench():>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+fake_api.py
+~~~~~~~~~~~
+This module contains a local fake Bot API server for the tests that send requests,
+It records the calls it receives and answers each of them with the result of a responder.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import http.server
+import json
+import threading
+import urllib.parse
+
+MESSAGE = {'message_id': 1, 'date': 0, 'chat': {'id': 1, 'type': 'private'}, 'text': 'hello'}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """
+    Parses a call, its JSON, form or query parameters, and writes the response of the responder
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        address = urllib.parse.urlsplit(self.path)
+        method = address.path.rsplit('/', 1)[-1]
+        params = dict(urllib.parse.parse_qsl(address.query))
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        content_type = self.headers.get('Content-Type', '')
+        if body and 'json' in content_type:
+            params.update(json.loads(body))
+        elif body and 'urlencoded' in content_type:
+            params.update(urllib.parse.parse_qsl(body.decode('utf-8')))
+
+        api = self.server.api
+        with api.lock:
+            api.calls.append((method, params, self.client_address))
+        response = api.responder(method, params)
+        if not isinstance(response, dict) or 'ok' not in response:
+            response = {'ok': True, 'result': response}
+        data = json.dumps(response).encode('utf-8')
+        self.send_response(200 if response['ok'] else response.get('error_code', 400))
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeApi(object):
+    """
+    A Bot API server on a free local port, url is the based_url of a bot using it
+    """
+
+    def __init__(self, responder=None):
+        """
+        :param function or None responder: takes the method and its parameters, returns the result or a whole
+                                            response dict with ok, default True for every method
+        """
+        self.responder = responder or (lambda method, params: True)
+        self.calls = []
+        self.lock = threading.Lock()
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.server.api = self
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/bot'
+        threading.Thread(target=self.server.serve_forever, args=(.05,), daemon=True).start()
+
+    def methods(self):
+        """
+        Returns the methods called, in order
+        """
+        with self.lock:
+            return [method for method, params, client in self.calls]
+
+    def params(self, method):
+        """
+        Returns the parameters of every call of a method
+        """
+        with self.lock:
+            return [params for called, params, client in self.calls if called == method]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def error(error_code, description, **parameters):
+    """
+    Returns an unsuccessful response, parameters are its ResponseParameters like retry_after
+    """
+    response = {'ok': False, 'error_code': error_code, 'description': description}
+    if parameters:
+        response['parameters'] = parameters
+    return response
@@ -0,0 +1,563 @@
+# -*- coding: utf-8 -*-
+
+"""
+test_dispatch.py
+~~~~~~~~~~~~~~~~
+This module contains tests for how the tgbotapi bot receives updates and dispatches them to its handlers.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import asyncio
+import http.client
+import json
+import random
+import re
+import socket
+import threading
+import time
+import unittest
+from tgbotapi import AioBot, Bot, types, utils
+from fake_api import FakeApi, MESSAGE
+
+USER = {'id': 1, 'is_bot': False, 'first_name': 'User'}
+ME = {'id': 2, 'is_bot': True, 'first_name': 'Bot', 'username': 'TestBot'}
+
+
+def update(update_id, text='hello', chat_id=1, chat_type='private'):
+    """
+    Returns an update dict of a text message, commands get their bot_command entity
+    """
+    message = dict(MESSAGE, message_id=update_id, text=text, chat={'id': chat_id, 'type': chat_type})
+    if text.startswith('/'):
+        message['entities'] = [{'type': 'bot_command', 'offset': 0, 'length': len(text.split()[0])}]
+    return {'update_id': update_id, 'message': message}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Recorder(object):
+    """
+    Collects what the handlers were called with, from the worker threads
+    """
+
+    def __init__(self):
+        self.items = []
+        self.condition = threading.Condition()
+
+    def add(self, item):
+        with self.condition:
+            self.items.append(item)
+            self.condition.notify_all()
+
+    def wait(self, count, timeout=5):
+        with self.condition:
+            self.condition.wait_for(lambda: len(self.items) >= count, timeout)
+            return list(self.items)
+
+
+class TestPolling(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi(self.responder)
+        self.bot = Bot('TOKEN', based_url=self.api.url)
+        self.handled = Recorder()
+
+        @self.bot.update_handler()
+        def handler(message):
+            self.handled.add(message.message_id)
+
+    def tearDown(self):
+        self.api.close()
+
+    def responder(self, method, params):
+        if method == 'getMe':
+            return ME
+        if method != 'getUpdates':
+            return True
+        offset = int(params['offset'])
+        if offset == 3:
+            # updates 1 and 2 are confirmed by this call, polling stops while it is in flight
+            self.bot._Bot__stop_polling.clear()
+        if offset > 3:
+            time.sleep(float(params['timeout']))
+            return []
+        return [update(offset)]
+
+    def test_pipelined(self):
+        thread = threading.Thread(target=self.bot.polling, kwargs={'timeout': 1})
+        thread.start()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        # the offset moves on as soon as a batch is fetched, not once it is handled
+        self.assertEqual([int(params['offset']) for params in self.api.params('getUpdates')], [1, 2, 3])
+        # the batches fetched before polling stopped are all dispatched
+        self.assertEqual(sorted(self.handled.wait(3)), [1, 2, 3])
+
+
+class DispatchTestCase(unittest.TestCase):
+    """
+    A bot whose handlers record what they are called with, updates are dispatched with process_new_updates
+    """
+
+    def setUp(self):
+        self.api = FakeApi()
+        self.bot = Bot('TOKEN', based_url=self.api.url)
+        self.handled = Recorder()
+
+    def tearDown(self):
+        self.api.close()
+
+    def dispatch(self, *updates):
+        self.bot.process_new_updates([types.Update.de_json(data) for data in updates])
+
+
+class TestRoutes(DispatchTestCase):
+    def test_exact_update_types(self):
+        for update_type in ('message', 'edited_message', 'channel_post'):
+            self.bot.update_handler(update_type)(
+                lambda message, update_type=update_type: self.handled.add((update_type, message.message_id)))
+
+        message = update(1)['message']
+        self.dispatch(update(1), {'update_id': 2, 'edited_message': dict(message, message_id=2)},
+                      {'update_id': 3, 'channel_post': dict(message, message_id=3)})
+        self.assertEqual(set(self.handled.wait(3)), {('message', 1), ('edited_message', 2), ('channel_post', 3)})
+
+    def test_list_and_aliases(self):
+        @self.bot.update_handler(['callback_query', 'chosen_inline'])
+        def handler(update):
+            self.handled.add(type(update).__name__)
+
+        chosen = {'result_id': '1', 'from': USER, 'query': '', 'inline_message_id': '1'}
+        self.dispatch({'update_id': 1, 'callback_query': {'id': '1', 'from': USER, 'chat_instance': '1'}},
+                      {'update_id': 2, 'chosen_inline_result': chosen}, update(3))
+        self.assertEqual(sorted(self.handled.wait(2)), ['CallbackQuery', 'ChosenInlineResult'])
+        self.assertEqual(self.handled.wait(3, timeout=.2), self.handled.items[:2])
+
+    def test_unknown_update_type(self):
+        self.assertRaises(ValueError, self.bot.update_handler, 'messages')
+
+    def test_first_match(self):
+        @self.bot.update_handler(func=lambda message: message.text == 'first')
+        def first(message):
+            self.handled.add(('first', message.message_id))
+
+        @self.bot.update_handler()
+        def second(message):
+            self.handled.add(('second', message.message_id))
+
+        self.dispatch(update(1, 'first'), update(2, 'other'))
+        self.assertEqual(sorted(self.handled.wait(2)), [('first', 1), ('second', 2)])
+
+
+class TestCommands(DispatchTestCase):
+    def setUp(self):
+        super().setUp()
+        for name, commands in (('start', '/Start@TestBot'), ('help', ['/help', '/about'])):
+            self.bot.update_handler(bot_command=commands)(
+                lambda message, name=name: self.handled.add((name, message.message_id)))
+        self.bot.update_handler()(lambda message: self.handled.add(('generic', message.message_id)))
+
+    def test_index(self):
+        self.dispatch(update(1, '/start'), update(2, '/HELP me'), update(3, '/about'), update(4, '/unknown'),
+                      update(5, 'start'))
+        self.assertEqual(set(self.handled.wait(5)),
+                         {('start', 1), ('help', 2), ('help', 3), ('generic', 4), ('generic', 5)})
+
+    def test_addressed(self):
+        self.bot.username = 'TestBot'
+        self.dispatch(update(1, '/start@testbot'), update(2, '/start@OtherBot'), update(3, '/help@OtherBot x'))
+        self.assertEqual(set(self.handled.wait(3)), {('start', 1), ('generic', 2), ('generic', 3)})
+
+    def test_username_from_get_me(self):
+        self.api.responder = lambda method, params: ME
+        self.assertEqual(self.bot.get_me().username, 'TestBot')
+        self.assertEqual(self.bot.username, 'TestBot')
+        self.dispatch(update(1, '/start@OtherBot'))
+        self.assertEqual(self.handled.wait(1), [('generic', 1)])
+
+    def test_unknown_username(self):
+        # until the username is known, a command addressed to any bot is routed
+        self.dispatch(update(1, '/start@OtherBot'))
+        self.assertEqual(self.handled.wait(1), [('start', 1)])
+
+
+class TestPatternMatcher(unittest.TestCase):
+    def test_keywords(self):
+        matcher = utils.api_router.PatternMatcher()
+        for pattern in ('he', 'She', 'his', 'hers', 'he'):
+            matcher.add(pattern)
+        self.assertEqual(len(matcher), 4)
+        self.assertEqual(matcher.search('USHERS'), {'he', 'She', 'hers'})
+        self.assertEqual(matcher.search('ahishers'), {'he', 'She', 'his', 'hers'})
+        self.assertEqual(matcher.search('xyz'), set())
+        # a keyword added after a search rebuilds the automaton
+        matcher.add('xy')
+        self.assertEqual(matcher.search('xyz'), {'xy'})
+
+    def test_regexps(self):
+        matcher = utils.api_router.PatternMatcher()
+        for pattern in (r'^\d+$', 'a.c', 'abc', ''):
+            matcher.add(pattern)
+        self.assertEqual(matcher.search('ABC'), {'a.c', 'abc', ''})
+        self.assertEqual(matcher.search('42'), {r'^\d+$', ''})
+
+    def test_same_as_re(self):
+        generator = random.Random(8)
+        patterns = {''.join(generator.choice('abc') for _ in range(generator.randint(1, 4))) for _ in range(40)}
+        patterns.update(('a+b', 'c?ab$', '^b'))
+        matcher = utils.api_router.PatternMatcher()
+        for pattern in patterns:
+            matcher.add(pattern)
+        for _ in range(200):
+            text = ''.join(generator.choice('abcABC ') for _ in range(generator.randint(0, 12)))
+            expected = {pattern for pattern in patterns if re.search(pattern, text, re.IGNORECASE)}
+            self.assertEqual(matcher.search(text), expected, text)
+
+    def test_compiled(self):
+        matcher = utils.api_router.PatternMatcher()
+        digits, word = re.compile(r'\d+'), re.compile('Order')
+        for pattern in (digits, word, 'order'):
+            matcher.add(pattern)
+        # a compiled pattern keeps its own flags
+        self.assertEqual(matcher.search('ORDER 42'), {digits, 'order'})
+        self.assertEqual(matcher.search('Order'), {word, 'order'})
+
+    def test_unicode_same_as_re(self):
+        patterns = ('straße', 'ss', 'ǆ', 'ki', 'si', '\u03a3')
+        matcher = utils.api_router.PatternMatcher()
+        for pattern in patterns:
+            matcher.add(pattern)
+        for text in ('STRASSE', 'Straße', 'ǅ', '\u212ai', '\u017f\u0130', 'SI', '\u03c2', 'ß'):
+            expected = {pattern for pattern in patterns if re.search(pattern, text, re.IGNORECASE)}
+            self.assertEqual(matcher.search(text), expected, text)
+
+
+class TestRegexpRoutes(DispatchTestCase):
+    def test_registration_order(self):
+        for name, regexp in (('order', 'order'), ('digits', r'\d+'), ('generic', None), ('late', 'late')):
+            self.bot.update_handler(regexp=regexp)(lambda message, name=name: self.handled.add((name, message.text)))
+
+        self.dispatch(update(1, 'my ORDER 42'), update(2, 'item 42'), update(3, 'running late'), update(4, 'hi'))
+        self.assertEqual(set(self.handled.wait(4)),
+                         {('order', 'my ORDER 42'), ('digits', 'item 42'), ('generic', 'running late'),
+                          ('generic', 'hi')})
+
+
+class TestSharding(DispatchTestCase):
+    def setUp(self):
+        self.api = FakeApi()
+        self.bot = Bot('TOKEN', max_workers=4, based_url=self.api.url, sharded=True, work_stealing=True)
+        self.handled = Recorder()
+        generator = random.Random(9)
+
+        @self.bot.update_handler()
+        def handler(message):
+            time.sleep(generator.random() / 500)
+            self.handled.add((message.chat.uid, message.message_id))
+
+    def test_chat_order(self):
+        self.dispatch(*(update(update_id, chat_id=update_id % 5) for update_id in range(100)))
+        handled = self.handled.wait(100)
+        self.assertEqual(len(handled), 100)
+        for chat_id in range(5):
+            ids = [message_id for chat, message_id in handled if chat == chat_id]
+            self.assertEqual(ids, sorted(ids))
+
+
+class TestOverflow(DispatchTestCase):
+    def overflowing_bot(self, max_queue, overflow):
+        """
+        Builds a bot with one worker whose handler waits for self.gate
+        """
+        self.bot = Bot('TOKEN', max_workers=1, based_url=self.api.url, max_queue=max_queue, overflow=overflow)
+        self.gate = threading.Event()
+
+        @self.bot.update_handler()
+        def handler(message):
+            self.gate.wait(5)
+            self.handled.add(message.message_id)
+
+    def wait_taken(self):
+        """
+        Waits until the worker took the queued updates, so the next ones fill the queue
+        """
+        while self.bot._Bot__worker_pool.sequence.qsize():
+            time.sleep(.01)
+
+    def test_spill(self):
+        self.overflowing_bot(1, 'spill')
+        self.dispatch(update(1))
+        self.wait_taken()
+        started = time.monotonic()
+        self.dispatch(*(update(update_id) for update_id in range(2, 8)))
+        # the updates beyond max_queue are spilled, the dispatch does not wait for the handler
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(sum(self.bot._Bot__worker_pool.spilled().values()), 5)
+        self.gate.set()
+        self.assertEqual(self.handled.wait(7), [1, 2, 3, 4, 5, 6, 7])
+
+    def test_drop_oldest_without_sharding(self):
+        self.overflowing_bot(2, 'drop_oldest')
+        self.dispatch(update(1, chat_id=9))
+        self.wait_taken()
+        # the update of chat 2 replaces the older update of chat 2, the update of chat 1 stays
+        self.dispatch(update(2, chat_id=1), update(3, chat_id=2), update(4, chat_id=2))
+        self.gate.set()
+        self.assertEqual(self.handled.wait(3), [1, 2, 4])
+        self.assertEqual(self.bot.shed_updates(), {'message': 1})
+
+
+class TestWebhookServer(unittest.TestCase):
+    def setUp(self):
+        self.received = Recorder()
+        self.server = None
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def serve(self, callback=None, max_connections=40):
+        def record(data):
+            self.received.add(data)
+            return callback(data) if callback else None
+
+        self.server = utils.WebhookServer(record, '127.0.0.1', 0, '/hook', max_connections)
+        threading.Thread(target=self.server.serve_forever, args=(.05,), daemon=True).start()
+        return http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=5)
+
+    @staticmethod
+    def post(connection, body, path='/hook'):
+        connection.request('POST', path, body, {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        return response.status, response.read()
+
+    def test_keep_alive(self):
+        connection = self.serve()
+        for update_id in range(3):
+            self.assertEqual(self.post(connection, json.dumps(update(update_id))), (200, b''))
+        connection.close()
+        self.assertEqual([data['update_id'] for data in self.received.items], [0, 1, 2])
+
+    def test_errors(self):
+        def fail(data):
+            raise ValueError('broken handler')
+
+        connection = self.serve(fail)
+        self.assertEqual(self.post(connection, '{}', '/other')[0], 404)
+        self.assertEqual(self.post(connection, 'not json')[0], 400)
+        with self.assertLogs('tgbotapi', 'ERROR'):
+            self.assertEqual(self.post(connection, '{}')[0], 500)
+        connection.close()
+        self.assertEqual(self.received.items, [{}])
+
+    def test_max_connections(self):
+        first = self.serve(max_connections=1)
+        second = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=5)
+        self.assertEqual(self.post(first, '{"update_id": 1}')[0], 200)
+        thread = threading.Thread(target=self.post, args=(second, '{"update_id": 2}'))
+        thread.start()
+        # the second connection waits for the slot the open first connection holds
+        self.assertEqual(len(self.received.wait(2, timeout=.3)), 1)
+        first.close()
+        self.assertEqual(len(self.received.wait(2)), 2)
+        thread.join()
+        second.close()
+
+    def test_shutdown(self):
+        first = self.serve(max_connections=1)
+        second = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=5)
+        self.assertEqual(self.post(first, '{"update_id": 1}')[0], 200)
+        second.request('POST', '/hook', '{"update_id": 2}')
+        time.sleep(.2)
+        # the server does not hang on the connection waiting for the slot of the open first connection
+        thread = threading.Thread(target=self.server.shutdown)
+        thread.start()
+        thread.join(3)
+        self.assertFalse(thread.is_alive())
+        first.close()
+        second.close()
+
+
+class WebhookTestCase(DispatchTestCase):
+    """
+    A bot serving its webhook on a free port
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.bot.username = 'TestBot'
+        self.thread = None
+
+    def tearDown(self):
+        if self.thread is not None:
+            self.bot.stop_webhook()
+            self.thread.join(5)
+        super().tearDown()
+
+    def start_webhook(self, **kwargs):
+        """
+        Starts the webhook of the bot on a free port, returns a connection to it
+        """
+        port = free_port()
+        self.thread = threading.Thread(target=self.bot.webhook, kwargs=dict(kwargs, listen='127.0.0.1', port=port))
+        self.thread.start()
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+        for _ in range(50):
+            try:
+                connection.connect()
+                break
+            except ConnectionRefusedError:
+                time.sleep(.02)
+        return connection
+
+
+class TestWebhook(WebhookTestCase):
+    def test_updates(self):
+        @self.bot.update_handler()
+        def handler(message):
+            self.handled.add(message.message_id)
+
+        connection = self.start_webhook()
+        for update_id in (1, 2):
+            TestWebhookServer.post(connection, json.dumps(update(update_id)), '/')
+        connection.close()
+        self.assertEqual(sorted(self.handled.wait(2)), [1, 2])
+        self.bot.stop_webhook()
+        self.thread.join(5)
+        self.assertFalse(self.thread.is_alive())
+
+    def test_coalesced_edits(self):
+        self.start_webhook().close()
+        edits = self.bot.coalesce_edits(rate=2)
+        for text in ('50%', '100%'):
+            edits.edit_message_text(text, chat_id=1, message_id=1)
+        # stopping the webhook sends the edits still queued
+        self.bot.stop_webhook()
+        self.thread.join(5)
+        self.assertEqual(self.api.params('editMessageText')[-1]['text'], '100%')
+        self.assertRaises(RuntimeError, edits.edit_message_text, 'again', chat_id=1, message_id=1)
+
+    def test_handler_exceptions(self):
+        self.bot = Bot('TOKEN', based_url=self.api.url, max_workers=1)
+        self.bot.username = 'TestBot'
+
+        @self.bot.update_handler()
+        def handler(message):
+            if message.text == 'fail':
+                raise ValueError('handler failed')
+            self.handled.add(message.message_id)
+
+        connection = self.start_webhook()
+        with self.assertLogs('tgbotapi', 'ERROR'):
+            TestWebhookServer.post(connection, json.dumps(update(1, 'fail')), '/')
+            # the only worker logs the exception and handles the next update
+            TestWebhookServer.post(connection, json.dumps(update(2)), '/')
+            self.assertEqual(self.handled.wait(1), [2])
+        connection.close()
+
+
+class TestReply(WebhookTestCase):
+    def setUp(self):
+        super().setUp()
+        self.delay = 0
+
+        @self.bot.update_handler()
+        def handler(message):
+            time.sleep(self.delay)
+            return self.bot.reply.send_message(chat_id=message.chat.uid, text='Hi')
+
+    def sent(self, count=1):
+        """
+        Waits until the fake api received count sendMessage calls, returns their parameters
+        """
+        for _ in range(250):
+            if len(self.api.params('sendMessage')) >= count:
+                break
+            time.sleep(.02)
+        return self.api.params('sendMessage')
+
+    def test_in_response(self):
+        connection = self.start_webhook(reply_timeout=2)
+        status, body = TestWebhookServer.post(connection, json.dumps(update(1)), '/')
+        connection.close()
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {'method': 'sendMessage', 'chat_id': 1, 'text': 'Hi'})
+        self.assertEqual(self.api.calls, [])
+
+    def test_late_reply(self):
+        self.delay = .3
+        connection = self.start_webhook(reply_timeout=.05)
+        # the response does not wait longer than reply_timeout, the handler sends its reply itself
+        self.assertEqual(TestWebhookServer.post(connection, json.dumps(update(1)), '/'), (200, b''))
+        connection.close()
+        self.assertEqual(self.sent(), [{'chat_id': 1, 'text': 'Hi'}])
+
+    def test_without_reply_timeout(self):
+        connection = self.start_webhook()
+        self.assertEqual(TestWebhookServer.post(connection, json.dumps(update(1)), '/'), (200, b''))
+        connection.close()
+        self.assertEqual(self.sent(), [{'chat_id': 1, 'text': 'Hi'}])
+
+    def test_polling(self):
+        self.dispatch(update(1), update(2, chat_id=2))
+        self.assertEqual(sorted(params['chat_id'] for params in self.sent(2)), [1, 2])
+
+
+class TestAioReply(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi(lambda method, params: MESSAGE)
+        self.bot = AioBot('TOKEN', based_url=self.api.url)
+        self.bot.username = 'TestBot'
+
+        @self.bot.update_handler()
+        async def handler(message):
+            return self.bot.reply.send_message(chat_id=message.chat.uid, text='Hi')
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_polling(self):
+        async def main():
+            self.bot.process_new_updates([types.Update.de_json(update(1))])
+            for _ in range(250):
+                if self.api.calls:
+                    break
+                await asyncio.sleep(.02)
+
+        asyncio.run(main())
+        self.assertEqual(self.api.params('sendMessage'), [{'chat_id': 1, 'text': 'Hi'}])
+
+    def test_in_response(self):
+        async def main():
+            port = free_port()
+            webhook = asyncio.ensure_future(self.bot.webhook(listen='127.0.0.1', port=port, reply_timeout=2))
+
+            def post():
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+                for _ in range(50):
+                    try:
+                        connection.connect()
+                        break
+                    except ConnectionRefusedError:
+                        time.sleep(.02)
+                try:
+                    return TestWebhookServer.post(connection, json.dumps(update(1)), '/')
+                finally:
+                    connection.close()
+
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(None, post)
+            finally:
+                await loop.run_in_executor(None, self.bot.stop_webhook)
+                await asyncio.wait_for(webhook, 5)
+
+        status, body = asyncio.run(main())
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {'method': 'sendMessage', 'chat_id': 1, 'text': 'Hi'})
+        self.assertEqual(self.api.calls, [])
@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+
+"""
+test_session.py
+~~~~~~~~~~~~~~~
+This module contains tests for the tgbotapi sessions, against a local fake Bot API.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import asyncio
+import http.client
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from tgbotapi import AioBot, Bot, types, utils
+from fake_api import FakeApi, MESSAGE, error
+
+ME = {'id': 1, 'is_bot': True, 'first_name': 'Bot', 'username': 'TestBot'}
+
+
+def responder(method, params):
+    if method == 'getMe':
+        time.sleep(float(params.get('delay', 0)))
+        return ME
+    if method == 'sendMessage':
+        return {'message_id': 2, 'date': 0, 'chat': {'id': int(params['chat_id']), 'type': 'private'},
+                'text': params['text']}
+    if method == 'getChat':
+        return error(400, 'Bad Request: chat not found')
+    return True
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi(responder)
+        self.bot = Bot('TOKEN', based_url=self.api.url)
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_keep_alive(self):
+        for _ in range(5):
+            self.assertEqual(self.bot.get_me().username, 'TestBot')
+        clients = {client for method, params, client in self.api.calls}
+        self.assertEqual(len(clients), 1)
+
+    def test_pool(self):
+        threads = [threading.Thread(target=self.bot.get_me) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.api.methods(), ['getMe'] * 6)
+
+    def test_json_params(self):
+        message = self.bot.send_message(chat_id=10, text='Hi 👋')
+        self.assertIsInstance(message, types.Message)
+        self.assertEqual(message.text, 'Hi 👋')
+        self.assertEqual(self.api.params('sendMessage')[0]['chat_id'], 10)
+
+    def test_error(self):
+        with self.assertRaises(utils.TelegramAPIError) as raised:
+            self.bot.get_chat(10)
+        self.assertEqual(raised.exception.error_code, 400)
+        self.assertEqual(raised.exception.description, 'Bad Request: chat not found')
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.failures = []
+        self.api = FakeApi(self.responder)
+        self.bot = Bot('TOKEN', based_url=self.api.url, retry_policy=utils.RetryPolicy(backoff=.01))
+
+    def tearDown(self):
+        self.api.close()
+
+    def responder(self, method, params):
+        if self.failures:
+            return self.failures.pop(0)
+        if params['chat_id'] == -1:
+            return error(400, 'Bad Request: group chat was upgraded to a supergroup chat', migrate_to_chat_id=-1001)
+        return responder(method, params)
+
+    def test_retry_after(self):
+        self.failures = [error(429, 'Too Many Requests: retry after 1', retry_after=1)]
+        started = time.monotonic()
+        self.assertEqual(self.bot.send_message(chat_id=10, text='Hi').text, 'Hi')
+        self.assertGreaterEqual(time.monotonic() - started, 1)
+        self.assertEqual(self.api.methods(), ['sendMessage'] * 2)
+
+    def test_server_error(self):
+        self.failures = [error(502, 'Bad Gateway'), error(500, 'Internal Server Error')]
+        self.assertEqual(self.bot.send_message(chat_id=10, text='Hi').text, 'Hi')
+        self.assertEqual(len(self.api.params('sendMessage')), 3)
+
+    def test_give_up(self):
+        self.failures = [error(502, 'Bad Gateway')] * 4
+        with self.assertRaises(utils.TelegramAPIError) as raised:
+            self.bot.send_message(chat_id=10, text='Hi')
+        self.assertEqual(raised.exception.error_code, 502)
+        self.assertEqual(len(self.api.params('sendMessage')), 4)
+
+    def test_migrate(self):
+        self.assertEqual(self.bot.send_message(chat_id=-1, text='Hi').chat.uid, -1001)
+        self.assertEqual([params['chat_id'] for params in self.api.params('sendMessage')], [-1, -1001])
+
+    def test_async(self):
+        async def main():
+            bot = AioBot('TOKEN', based_url=self.api.url, retry_policy=utils.RetryPolicy(backoff=.01))
+            return await bot.send_message(chat_id=-1, text='Hi')
+
+        self.failures = [error(502, 'Bad Gateway')]
+        self.assertEqual(asyncio.run(main()).chat.uid, -1001)
+        self.assertEqual([params['chat_id'] for params in self.api.params('sendMessage')], [-1, -1, -1001])
+
+
+class TestUploadCache(unittest.TestCase):
+    photo = b'\xff\xd8' + bytes(range(256)) * 10
+
+    def setUp(self):
+        self.rejection = None
+        self.api = FakeApi(self.responder)
+
+    def tearDown(self):
+        self.api.close()
+
+    def responder(self, method, params):
+        if 'photo' not in params:
+            # an upload, its multipart body is not decoded
+            return dict(MESSAGE, photo=[{'file_id': 'small', 'file_unique_id': 's', 'width': 1, 'height': 1},
+                                        {'file_id': 'large', 'file_unique_id': 'l', 'width': 9, 'height': 9}])
+        return self.rejection or MESSAGE
+
+    def uploads(self):
+        return ['photo' not in params for params in self.api.params('sendPhoto')]
+
+    def test_cached(self):
+        bot = Bot('TOKEN', based_url=self.api.url, upload_cache=utils.UploadCache())
+        bot.send_photo(chat_id=1, photo=self.photo)
+        bot.send_photo(chat_id=1, photo=self.photo)
+        self.assertEqual(self.uploads(), [True, False])
+        self.assertEqual(self.api.params('sendPhoto')[1]['photo'], 'large')
+
+    def test_file_id_rejected(self):
+        bot = Bot('TOKEN', based_url=self.api.url, upload_cache=utils.UploadCache())
+        bot.send_photo(chat_id=1, photo=self.photo)
+        self.rejection = error(400, 'Bad Request: wrong file identifier/HTTP URL specified')
+        bot.send_photo(chat_id=1, photo=self.photo)
+        self.assertEqual(self.uploads(), [True, False, True])
+
+    def test_other_error(self):
+        bot = Bot('TOKEN', based_url=self.api.url, upload_cache=utils.UploadCache())
+        bot.send_photo(chat_id=1, photo=self.photo)
+        self.rejection = error(400, 'Bad Request: chat not found')
+        with self.assertRaises(utils.TelegramAPIError):
+            bot.send_photo(chat_id=1, photo=self.photo)
+        # the files are not uploaded again for an error they can not fix
+        self.assertEqual(self.uploads(), [True, False])
+
+    def test_async(self):
+        async def main():
+            bot = AioBot('TOKEN', based_url=self.api.url, upload_cache=utils.UploadCache())
+            await bot.send_photo(chat_id=1, photo=self.photo)
+            self.rejection = error(400, 'Bad Request: chat not found')
+            with self.assertRaises(utils.TelegramAPIError):
+                await bot.send_photo(chat_id=1, photo=self.photo)
+            self.rejection = error(400, 'Bad Request: FILE_REFERENCE_EXPIRED')
+            await bot.send_photo(chat_id=1, photo=self.photo)
+
+        asyncio.run(main())
+        self.assertEqual(self.uploads(), [True, False, False, True])
+
+
+class TestBroadcast(unittest.TestCase):
+    def setUp(self):
+        self.limited = set()
+        self.api = FakeApi(self.responder)
+
+    def tearDown(self):
+        self.api.close()
+
+    def responder(self, method, params):
+        chat_id = params['chat_id']
+        if chat_id == -1:
+            return error(400, 'Bad Request: group chat was upgraded to a supergroup chat', migrate_to_chat_id=-1001)
+        if chat_id == 5 and chat_id not in self.limited:
+            self.limited.add(chat_id)
+            return error(429, 'Too Many Requests: retry after 1', retry_after=1)
+        return responder(method, params)
+
+    def check(self, report):
+        # the retry policy of the bot neither hides the migration nor sleeps through a 429 in one worker
+        self.assertEqual(report.counts['sent'], 3)
+        self.assertEqual(report.migrated, {-1: -1001})
+        self.assertGreaterEqual(report.elapsed, 1)
+        chats = [params['chat_id'] for params in self.api.params('sendMessage')]
+        self.assertEqual(sorted(chats), [-1001, -1, 3, 4, 5, 5])
+
+    def test_bot(self):
+        bot = Bot('TOKEN', based_url=self.api.url, retry_policy=utils.RetryPolicy())
+        self.check(bot.broadcast([-1, 3, 4, 5], text='Hi', max_workers=2))
+        self.assertIsNotNone(bot._Bot__session.retry_policy)
+
+    def test_aiobot(self):
+        async def main():
+            bot = AioBot('TOKEN', based_url=self.api.url, retry_policy=utils.RetryPolicy())
+            return await bot.broadcast([-1, 3, 4, 5], text='Hi', max_workers=2)
+
+        self.check(asyncio.run(main()))
+
+
+class TestCaches(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi(self.responder)
+        self.bot = Bot('TOKEN', based_url=self.api.url, file_cache=utils.TTLCache(), chat_cache=utils.ChatCache())
+
+    def tearDown(self):
+        self.api.close()
+
+    @staticmethod
+    def responder(method, params):
+        if method == 'getChat':
+            return {'id': -100, 'type': 'channel', 'title': 'Channel', 'username': 'channel'}
+        if method == 'getFile':
+            return {'file_id': params['file_id'], 'file_unique_id': 'unique', 'file_path': 'documents/file'}
+        return True
+
+    def test_chat_username(self):
+        for chat_id in ('@channel', '@channel', -100, '-100', -100):
+            self.assertEqual(self.bot.get_chat(chat_id).uid, -100)
+        # the updates only refresh the chats they carry the id of, a username is not cached
+        self.assertEqual([params['chat_id'] for params in self.api.params('getChat')], ['@channel', '@channel', -100])
+
+    def test_reply(self):
+        self.bot.get_chat(-100)
+        self.bot.get_file('file')
+        self.assertIsInstance(self.bot.reply.get_chat(-100), utils.DeferredCall)
+        self.assertIsInstance(self.bot.reply.get_file('file'), utils.DeferredCall)
+        self.assertEqual(self.api.methods(), ['getChat', 'getFile'])
+
+
+class TestDownload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'file')
+        with open(self.path, 'wb') as f:
+            f.write(b'old')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def content(self):
+        self.assertEqual(os.listdir(self.directory.name), ['file'])
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def short_body_server(self):
+        """
+        Serves one response that ends before its Content-Length, returns the api url of the server
+        """
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+
+        def serve():
+            connection, _ = server.accept()
+            with connection:
+                while not connection.recv(65536).endswith(b'\r\n\r\n'):
+                    pass
+                connection.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc')
+            server.close()
+
+        threading.Thread(target=serve, daemon=True).start()
+        return f'http://127.0.0.1:{server.getsockname()[1]}/botTOKEN'
+
+    def test_not_found(self):
+        api = FakeApi(lambda method, params: error(404, 'Not Found'))
+        try:
+            for session in (utils.Session(), utils.AsyncSession()):
+                with self.assertRaises(utils.TelegramAPIError):
+                    download = utils.download_file(session, f'{api.url}TOKEN', 'documents/file', self.path)
+                    if asyncio.iscoroutine(download):
+                        asyncio.run(download)
+                self.assertEqual(self.content(), b'old')
+        finally:
+            api.close()
+
+    def test_short_body(self):
+        with self.assertRaises(EOFError):
+            utils.download_file(utils.Session(), self.short_body_server(), 'documents/file', self.path)
+        self.assertEqual(self.content(), b'old')
+
+        with self.assertRaises(EOFError):
+            asyncio.run(utils.download_file(utils.AsyncSession(), self.short_body_server(), 'documents/file',
+                                            self.path))
+        self.assertEqual(self.content(), b'old')
+
+
+class TestAsyncSession(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi(responder)
+
+    def tearDown(self):
+        self.api.close()
+
+    def request(self, session, params=None):
+        return session.request('post', f'{self.api.url}TOKEN/getMe', params, None)
+
+    def pooled(self, session):
+        return sum(len(connections) for connections in session._AsyncSession__connections.values())
+
+    def test_keep_alive(self):
+        async def main():
+            session = utils.AsyncSession()
+            for _ in range(3):
+                self.assertEqual((await self.request(session))['result'], ME)
+            await session.close()
+
+        asyncio.run(main())
+        self.assertEqual(len({client for method, params, client in self.api.calls}), 1)
+
+    def test_proxy(self):
+        async def main():
+            proxy = self.api.url.rsplit('/', 1)[0].replace('http://', 'http://user:secret@')
+            session = utils.AsyncSession(proxies={'http': proxy})
+            # the proxy is the fake api, the host of the url is never resolved
+            result = await session.request('post', 'http://api.telegram.invalid/botTOKEN/getMe', None, None)
+            await session.close()
+            return result
+
+        self.assertEqual(asyncio.run(main())['result'], ME)
+        self.assertRaises(ValueError, utils.AsyncSession, proxies={'https': 'socks5://127.0.0.1:1080'})
+
+    def test_read_timeout(self):
+        async def main():
+            session = utils.AsyncSession(read_timeout=.1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.request(session, {'delay': .5})
+            self.assertEqual(self.pooled(session), 0)
+            # the long polling timeout of a call is added to the read timeout
+            self.assertEqual((await self.request(session, {'delay': .3, 'timeout': 1}))['result'], ME)
+            await session.close()
+
+        asyncio.run(main())
+
+    def test_cancel(self):
+        async def main():
+            session = utils.AsyncSession()
+            task = asyncio.ensure_future(self.request(session, {'delay': .5}))
+            await asyncio.sleep(.1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(self.pooled(session), 0)
+            await session.close()
+
+        asyncio.run(main())
+
+
+class TestAioBot(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi(responder)
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_methods(self):
+        async def main():
+            bot = AioBot('TOKEN', based_url=self.api.url)
+            me, message = await asyncio.gather(bot.get_me(), bot.send_message(chat_id=10, text='Hi'))
+            return bot, me, message
+
+        bot, me, message = asyncio.run(main())
+        self.assertEqual(me.username, 'TestBot')
+        self.assertEqual(message.text, 'Hi')
+        self.assertIsInstance(bot._Bot__session, utils.AsyncSession)
+
+    def test_handlers(self):
+        async def main():
+            bot = AioBot('TOKEN', based_url=self.api.url)
+            loop = asyncio.get_running_loop()
+            replies = []
+            done = asyncio.Event()
+
+            @bot.update_handler(bot_command='/async')
+            async def coroutine_handler(message):
+                replies.append(await bot.send_message(chat_id=message.chat.uid, text='async'))
+                done.set()
+
+            @bot.update_handler(bot_command='/sync')
+            def thread_handler(message):
+                # runs on a worker thread, the call runs on the event loop and returns its result
+                replies.append(bot.send_message(chat_id=message.chat.uid, text='sync'))
+                loop.call_soon_threadsafe(done.set)
+
+            self.assertEqual(bot._Bot__worker_pool.workers, [])
+            for update_id, text in enumerate(('/async', '/sync')):
+                done.clear()
+                entities = [{'type': 'bot_command', 'offset': 0, 'length': len(text)}]
+                message = dict(MESSAGE, text=text, entities=entities)
+                bot.process_new_updates([types.Update.de_json({'update_id': update_id, 'message': message})])
+                await asyncio.wait_for(done.wait(), 5)
+            return replies
+
+        replies = asyncio.run(main())
+        self.assertEqual([reply.text for reply in replies], ['async', 'sync'])
+
+    def test_webhook(self):
+        async def main():
+            bot = AioBot('TOKEN', based_url=self.api.url)
+            loop = asyncio.get_running_loop()
+            handled = asyncio.Queue()
+
+            @bot.update_handler(bot_command='/async')
+            async def coroutine_handler(message):
+                handled.put_nowait(message.text)
+
+            @bot.update_handler(bot_command='/sync')
+            def thread_handler(message):
+                loop.call_soon_threadsafe(handled.put_nowait, message.text)
+
+            with socket.socket() as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            webhook = asyncio.ensure_future(bot.webhook(listen='127.0.0.1', port=port))
+
+            def post(text):
+                entities = [{'type': 'bot_command', 'offset': 0, 'length': len(text)}]
+                body = utils.codec.dumps({'update_id': 1, 'message': dict(MESSAGE, text=text, entities=entities)})
+                for _ in range(50):
+                    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+                    try:
+                        connection.request('POST', '/', body)
+                        return connection.getresponse().status
+                    except ConnectionRefusedError:
+                        time.sleep(.02)
+                    finally:
+                        connection.close()
+
+            self.assertEqual(await loop.run_in_executor(None, post, '/async'), 200)
+            self.assertEqual(await asyncio.wait_for(handled.get(), 5), '/async')
+            self.assertEqual(await loop.run_in_executor(None, post, '/sync'), 200)
+            self.assertEqual(await asyncio.wait_for(handled.get(), 5), '/sync')
+            await loop.run_in_executor(None, bot.stop_webhook)
+            await asyncio.wait_for(webhook, 5)
+            return bot
+
+        bot = asyncio.run(main())
+        self.assertEqual(bot.username, 'TestBot')
+
+    def polling_bot(self, *texts):
+        def updates(method, params):
+            if method != 'getUpdates':
+                return responder(method, params)
+            if int(params['offset']) > len(texts):
+                time.sleep(0.05)
+                return []
+            entities = [{'type': 'bot_command', 'offset': 0, 'length': 5}]
+            return [{'update_id': update_id, 'message': dict(MESSAGE, text=text, entities=entities)}
+                    for update_id, text in enumerate(texts, 1)]
+
+        self.api.close()
+        self.api = FakeApi(updates)
+        return AioBot('TOKEN', based_url=self.api.url, max_workers=1)
+
+    def test_handler_exceptions(self):
+        async def main():
+            bot = self.polling_bot('/fail', '/next')
+            handled = threading.Event()
+
+            @bot.update_handler(bot_command='/fail')
+            def fail(message):
+                raise ValueError('handler failed')
+
+            @bot.update_handler(bot_command='/next')
+            def next_update(message):
+                handled.set()
+
+            polling = asyncio.ensure_future(bot.polling(stop=False))
+            # the only worker logs the exception and takes the next update
+            self.assertTrue(await asyncio.get_running_loop().run_in_executor(None, handled.wait, 5))
+            self.assertFalse(polling.done())
+            polling.cancel()
+
+        with self.assertLogs('tgbotapi', 'ERROR'):
+            asyncio.run(main())
+
+    def test_coalesced_edits(self):
+        async def main():
+            bot = self.polling_bot()
+            polling = asyncio.ensure_future(bot.polling())
+            edits = bot.coalesce_edits(rate=2)
+            results = [edits.edit_message_text(text, chat_id=10, message_id=2) for text in ('50%', '100%')]
+            await asyncio.sleep(.1)
+            polling.cancel()
+            # the polling coroutine sends the edits still queued before it stops
+            with self.assertRaises(asyncio.CancelledError):
+                await polling
+            self.assertTrue(all(result.done() for result in results))
+
+        asyncio.run(main())
+        self.assertEqual(self.api.params('editMessageText')[-1]['text'], '100%')
+
+    def test_handler_exceptions_stop(self):
+        async def main():
+            bot = self.polling_bot('/fail')
+
+            @bot.update_handler(bot_command='/fail')
+            def fail(message):
+                raise ValueError('handler failed')
+
+            await asyncio.wait_for(bot.polling(), 5)
+
+        with self.assertLogs('tgbotapi', 'ERROR'):
+            asyncio.run(main())
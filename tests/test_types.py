@@ -1014,6 +1014,11 @@ class TestInlineKeyboardMarkup(unittest.TestCase):
         self.assertEqual(button.callback_game, None)
         self.assertEqual(button.pay, True)
 
+    def test_inline_keyboard_rows(self):
+        markup = types.InlineKeyboardMarkup.de_json({'inline_keyboard': [[{'text': 'a'}, {'text': 'b'}],
+                                                                         [{'text': 'c'}]]})
+        self.assertEqual([[button.text for button in row] for row in markup.inline_keyboard], [['a', 'b'], ['c']])
+
 
 class TestInlineKeyboardButton(unittest.TestCase):
     with open("schema/InlineKeyboardButton.json") as f:
@@ -1106,3 +1111,35 @@ class TestSentWebAppMessage(unittest.TestCase):
     def test_sent_web_app_message(self):
         sent_web_app = self.object
         self.assertEqual(sent_web_app.inline_message_id, "SentWebAppMessage inline message id")
+
+
+class TestLazyUpdate(unittest.TestCase):
+    with open("schema/LazyUpdate.json") as f:
+        data = f.read()
+
+    object = types.LazyUpdate.de_json(data)
+    expected = types.Update.de_json(data)
+
+    def test_lazy_update(self):
+        update = self.object
+        self.assertEqual(update.update_id, 523905383)
+        self.assertIsInstance(update.message, types.LazyMessage)
+        self.assertEqual(update.edited_message, None)
+        self.assertEqual(update.callback_query, None)
+
+    def test_lazy_message(self):
+        msg, expected = self.object.message, self.expected.message
+        for name in ('message_id', 'date', 'text', 'caption', 'photo', 'is_automatic_forward', 'delete_chat_photo'):
+            self.assertEqual(getattr(msg, name), getattr(expected, name), name)
+        self.assertEqual(msg.ffrom.uid, 987654321)
+        self.assertEqual(msg.chat.uid, -1001234567890)
+        self.assertEqual(msg.chat.ttype, "supergroup")
+        self.assertEqual(msg.entities[0].ttype, "bot_command")
+        self.assertEqual(msg.entities[0].length, 15)
+
+    def test_lazy_reply_to_message(self):
+        reply = self.object.message.reply_to_message
+        self.assertIsInstance(reply, types.LazyMessage)
+        self.assertEqual(reply.message_id, 1234567889)
+        self.assertEqual(reply.text, "hello")
+        self.assertIs(self.object.message.reply_to_message, reply)
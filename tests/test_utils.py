@@ -0,0 +1,517 @@
+# -*- coding: utf-8 -*-
+
+"""
+test_utils.py
+~~~~~~~~~~~~~
+This module contains tests for the tgbotapi utils module.
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+
+import queue
+import threading
+import time
+import unittest
+from tgbotapi import types, utils
+
+
+class TestJsonCodec(unittest.TestCase):
+    markup = types.InlineKeyboardMarkup([[types.InlineKeyboardButton('yes', callback_data='vote:yes')]])
+
+    def test_backends(self):
+        expected = {'inline_keyboard': [[{'text': 'yes', 'callback_data': 'vote:yes'}]]}
+        for backend in utils.JsonCodec.backends:
+            try:
+                codec = utils.JsonCodec(backend)
+            except ValueError:
+                continue
+            self.assertEqual(codec.loads(codec.dumps(self.markup)), expected, backend)
+            self.assertEqual(codec.loads(codec.dumpb(self.markup)), expected, backend)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, utils.JsonCodec, 'simplejson')
+
+
+class TestMultipartEncoder(unittest.TestCase):
+    content = bytes(range(256)) * 1000
+
+    def test_length(self):
+        chunks = (self.content[i:i + 1000] for i in range(0, len(self.content), 1000))
+        files = {'photo': self.content, 'document': utils.FilePart(chunks, length=len(self.content), filename='a.pdf')}
+        body = utils.MultipartEncoder({'chat_id': 1, 'caption': 'hi'}, files, chunk_size=4096)
+        data = b''.join(body)
+        self.assertEqual(len(body), len(data))
+        self.assertTrue(body.content_type.endswith(body.boundary))
+        self.assertIn(b'filename="a.pdf"\r\nContent-Type: application/pdf\r\n\r\n' + self.content + b'\r\n', data)
+        self.assertEqual(body.read(), b'')
+
+    def test_rewind(self):
+        with open(__file__, 'rb') as f:
+            body = utils.MultipartEncoder(None, {'document': f})
+            data = body.read(len(body))
+            body.rewind()
+            self.assertEqual(b''.join(body), data)
+            self.assertIn(b'filename="test_types.py"', data)
+
+    def test_unknown_length(self):
+        self.assertRaises(ValueError, utils.FilePart, iter([self.content]))
+
+
+class TestUploadCache(unittest.TestCase):
+    content = b'\xff\xd8' + bytes(range(256)) * 100
+
+    def test_resolve(self):
+        cache = utils.UploadCache()
+        params, files, keys = cache.resolve({'chat_id': 1}, {'photo': self.content})
+        self.assertEqual(files, {'photo': self.content})
+        cache.update(keys, {'message_id': 1, 'photo': [{'file_id': 'small'}, {'file_id': 'large'}]})
+        params, files, keys = cache.resolve({'chat_id': 1}, {'photo': self.content})
+        self.assertEqual(params, {'chat_id': 1, 'photo': 'large'})
+        self.assertEqual(files, {})
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.discard(keys)
+        self.assertEqual(len(cache), 0)
+
+    def test_file_key(self):
+        cache = utils.UploadCache()
+        with open(__file__, 'rb') as f:
+            key = cache.file_key('document', f)
+            self.assertEqual(f.tell(), 0)
+            self.assertEqual(key, cache.file_key('document', f.read()))
+        self.assertNotEqual(cache.file_key('photo', self.content), cache.file_key('document', self.content))
+        self.assertIsNone(cache.file_key('photo', utils.FilePart(iter([self.content]), length=len(self.content))))
+
+
+class TestFileSink(unittest.TestCase):
+    def test_file_url(self):
+        self.assertEqual(utils.api_download.file_url('https://api.telegram.org/bot123:abc', 'photos/file_1.jpg'),
+                         'https://api.telegram.org/file/bot123:abc/photos/file_1.jpg')
+
+    def test_resume(self):
+        import io
+        f = io.BytesIO(b'partial')
+        sink = utils.FileSink(f, resume=True)
+        self.assertEqual(sink.offset, 7)
+        sink.write(b' file')
+        self.assertEqual(f.getvalue(), b'partial file')
+        sink.restart()
+        sink.write(b'whole')
+        self.assertEqual((f.getvalue(), sink.offset), (b'whole', 5))
+
+    def test_memoryview(self):
+        view = bytearray(8)
+        sink = utils.FileSink(memoryview(view))
+        sink.write(b'abcd')
+        sink.write(b'efgh')
+        self.assertEqual(view, b'abcdefgh')
+        self.assertRaises(ValueError, sink.write, b'i')
+
+    def test_path(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'file')
+            with open(path, 'wb') as f:
+                f.write(b'old')
+            # the path keeps its file until the download completes, a failed one leaves it as it was
+            for completed in (False, True):
+                sink = utils.FileSink(path)
+                sink.write(b'new file')
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(), b'old')
+                sink.close(completed)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b'new file')
+            self.assertEqual(os.listdir(directory), ['file'])
+
+    def test_path_resume(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'file')
+            with open(path, 'wb') as f:
+                f.write(b'partial')
+            sink = utils.FileSink(path, resume=True)
+            self.assertEqual(sink.offset, 7)
+            sink.write(b' file')
+            sink.close(False)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b'partial file')
+
+            # the server sent the whole file instead of the range
+            sink = utils.FileSink(path, resume=True)
+            sink.restart()
+            sink.write(b'whole')
+            sink.close()
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b'whole')
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_lru(self):
+        cache = utils.TTLCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertEqual((cache.get('a'), cache.get('b'), cache.get('c')), (1, None, 3))
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_ttl(self):
+        cache = utils.TTLCache(ttl=60)
+        cache.set('a', 1, ttl=0)
+        cache.set('b', 2)
+        self.assertNotIn('a', cache)
+        self.assertIn('b', cache)
+        self.assertEqual(cache.pop('b'), 2)
+        self.assertEqual(len(cache), 0)
+
+
+class TestBroadcast(unittest.TestCase):
+    @staticmethod
+    def send(chat_id):
+        if chat_id == 2:
+            raise utils.TelegramAPIError('Forbidden', None, 403, 'Forbidden: bot was blocked by the user')
+        if chat_id == 3:
+            raise utils.TelegramAPIError('Bad Request', None, 400, 'Bad Request: chat not found')
+        if chat_id == 4:
+            raise utils.TelegramAPIError('Bad Request', None, 400, 'Bad Request: group chat was upgraded',
+                                         types.ResponseParameters(-1004, None))
+
+    def test_report(self):
+        report = utils.Broadcast(self.send, range(1, 6), rate=1000, max_workers=2).run()
+        self.assertEqual(report.total, 5)
+        self.assertEqual(report.sent, 3)
+        self.assertEqual(report.migrated, {4: -1004})
+        self.assertEqual(report.failed, {'blocked': [2], 'not_found': [3]})
+
+    def test_checkpoint(self):
+        import os
+        import tempfile
+        sent = []
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, 'broadcast')
+            utils.Broadcast(self.send, range(1, 4), checkpoint, rate=1000).run()
+            report = utils.Broadcast(sent.append, range(1, 6), checkpoint, rate=1000).run()
+        self.assertEqual(sorted(sent), [4, 5])
+        self.assertEqual(report.total, 5)
+        self.assertEqual(report.failed, {'blocked': [2], 'not_found': [3]})
+
+
+class TestChatCache(unittest.TestCase):
+    chat = {'id': -100, 'type': 'supergroup', 'title': 'Guard Bot'}
+    user = {'id': 7, 'is_bot': False, 'first_name': 'Mustafa'}
+
+    def test_member_updated(self):
+        cache = utils.ChatCache()
+        cache.admins.set(-100, [])
+        admin = {'status': 'administrator', 'user': self.user, 'can_be_edited': False, 'is_anonymous': False,
+                 'can_manage_chat': True, 'can_delete_messages': True, 'can_manage_video_chats': True,
+                 'can_restrict_members': True, 'can_promote_members': False, 'can_change_info': True,
+                 'can_invite_users': True}
+        member = {'chat': self.chat, 'from': self.user, 'date': 0, 'old_chat_member': admin,
+                  'new_chat_member': {'status': 'kicked', 'user': self.user, 'until_date': 0}}
+        cache.process_update(types.Update.de_json({'update_id': 1, 'chat_member': member}))
+        self.assertEqual(cache.members.get((-100, 7)).status, 'kicked')
+        self.assertNotIn(-100, cache.admins)
+
+    def test_service_message(self):
+        cache = utils.ChatCache()
+        cache.chats.set(-100, types.Chat.de_json(self.chat))
+        cache.members.set((-100, 7), 'member')
+        text = {'message_id': 1, 'date': 0, 'chat': self.chat, 'text': 'hello'}
+        cache.process_update(types.Update.de_json({'update_id': 1, 'message': text}))
+        self.assertIn(-100, cache.chats)
+        left = {'message_id': 2, 'date': 0, 'chat': self.chat, 'left_chat_member': self.user}
+        cache.process_update(types.Update.de_json({'update_id': 2, 'message': left}))
+        self.assertNotIn((-100, 7), cache.members)
+        title = {'message_id': 3, 'date': 0, 'chat': self.chat, 'new_chat_title': 'Guard'}
+        cache.process_update(types.Update.de_json({'update_id': 3, 'message': title}))
+        self.assertNotIn(-100, cache.chats)
+
+
+class TestEditCoalescer(unittest.TestCase):
+    class Session(object):
+        rate_limiter = None
+        retry_policy = None
+        upload_cache = None
+
+        def __init__(self):
+            self.texts = []
+
+        def request(self, method, url, params, files):
+            if self.texts and self.texts[-1] == params['text']:
+                return {'ok': False, 'error_code': 400, 'description': 'Bad Request: message is not modified'}
+            self.texts.append(params['text'])
+            return {'ok': True, 'result': True}
+
+    @staticmethod
+    def edit(text):
+        return utils.DeferredCall('post', 'https://api.telegram.org/botTOKEN/editMessageText',
+                                  {'chat_id': -100, 'message_id': 1, 'text': text}, None)
+
+    def test_coalesce(self):
+        session = self.Session()
+        edits = utils.EditCoalescer(None, session, rate=5)
+        futures = [edits.submit(self.edit(f'{percent}%')) for percent in range(0, 101, 10)]
+        edits.close()
+        # the first edit may be sent before the others are queued, the rest wait and only the last is sent
+        self.assertIn(session.texts, (['100%'], ['0%', '100%']))
+        self.assertTrue(all(future.result() is True for future in futures))
+        self.assertEqual(edits.coalesced + len(session.texts), 11)
+
+    def test_identical_edits(self):
+        session = self.Session()
+        edits = utils.EditCoalescer(None, session, rate=1000)
+        for _ in range(3):
+            self.assertTrue(edits.submit(self.edit('Done')).result())
+        session.texts.append('Done, again')
+        self.assertTrue(edits.submit(self.edit('Done, again')).result())
+        edits.close()
+        self.assertEqual(session.texts, ['Done', 'Done, again'])
+        self.assertEqual(edits.dropped, 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst(self):
+        bucket = utils.api_limiter.TokenBucket(rate=2, capacity=3)
+        times = []
+        for _ in range(5):
+            at = bucket.allowed_at(10.0)
+            bucket.consume(at)
+            times.append(at)
+        # three at once, then one every half second
+        self.assertEqual(times, [10.0, 10.0, 10.0, 10.5, 11.0])
+        self.assertEqual(bucket.allowed_at(20.0), 20.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def delays(self, limiter, api_method, chat_ids):
+        return [round(limiter.reserve(api_method, {'chat_id': chat_id})[0], 1) for chat_id in chat_ids]
+
+    def test_private_chat(self):
+        limiter = utils.RateLimiter()
+        # chat 2 is not held up by the calls queued for chat 1
+        self.assertEqual(self.delays(limiter, 'sendMessage', [1, 1, 1, 2]), [0, 1, 2, 0])
+        self.assertEqual(limiter.queue_depth, 2)
+        self.assertEqual(limiter.chat_queue_depth(1), 2)
+        limiter.release(1)
+        self.assertEqual(limiter.chat_queue_depth(1), 1)
+
+    def test_group_chat(self):
+        limiter = utils.RateLimiter(overall=1000)
+        delays = self.delays(limiter, 'sendPhoto', [-100] * 22)
+        self.assertEqual(delays[:20], [0] * 20)
+        self.assertEqual(delays[20:], [3, 6])
+
+    def test_overall(self):
+        limiter = utils.RateLimiter(overall=10)
+        delays = self.delays(limiter, 'copyMessage', range(1, 13))
+        self.assertEqual(delays[:10], [0] * 10)
+        self.assertEqual(delays[10:], [.1, .2])
+
+    def test_unlimited_methods(self):
+        limiter = utils.RateLimiter()
+        self.assertEqual(self.delays(limiter, 'getChat', [1] * 5), [0] * 5)
+        self.assertEqual(limiter.queue_depth, 0)
+
+    def test_overall_hot_chat(self):
+        limiter = utils.RateLimiter(overall=8, private_chat=4)
+        sent = {}
+
+        def send(chat_id, index):
+            limiter.wait('sendMessage', {'chat_id': chat_id})
+            sent[chat_id, index] = time.monotonic()
+
+        calls = [(1, index) for index in range(10)] + [(chat_id, 0) for chat_id in range(2, 22)]
+        threads = [threading.Thread(target=send, args=call) for call in calls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # any 8 + n calls span at least n intervals of the bot wide limit, a little less for the sleep jitter
+        times = sorted(sent.values())
+        for start in range(len(times)):
+            for end in range(start + 8, len(times)):
+                self.assertGreaterEqual(times[end] - times[start], (end - start - 7) / 8 - 0.05)
+        # the calls queued for chat 1 do not hold up the other chats
+        self.assertLess(max(sent[chat_id, 0] for chat_id in range(2, 22)), sent[1, 9])
+        self.assertEqual(limiter.queue_depth, 0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def error(self, error_code, **parameters):
+        return utils.TelegramAPIError('error', error_code=error_code,
+                                      parameters=types.ResponseParameters.de_json(parameters) if parameters else None)
+
+    def test_retry_after(self):
+        policy = utils.RetryPolicy(max_retry_after=10)
+        self.assertEqual(policy.delay(self.error(429, retry_after=3), 0), 3)
+        self.assertIsNone(policy.delay(self.error(429, retry_after=11), 0))
+        self.assertIsNone(policy.delay(self.error(429, retry_after=3), policy.max_retries))
+
+    def test_server_error(self):
+        policy = utils.RetryPolicy(backoff=1, max_backoff=3)
+        for attempt, bound in ((0, 1), (1, 2), (2, 3)):
+            for _ in range(20):
+                self.assertTrue(0 <= policy.delay(self.error(502), attempt) <= bound)
+        self.assertIsNone(policy.delay(self.error(400), 0))
+        self.assertIsNone(policy.delay(self.error(403), 0))
+
+    def test_migrate(self):
+        error = self.error(400, migrate_to_chat_id=-1001)
+        self.assertEqual(utils.RetryPolicy().delay(error, 0), 0)
+        self.assertIsNone(utils.RetryPolicy(migrate=False).delay(error, 0))
+
+
+class TestTaskQueue(unittest.TestCase):
+    def test_key_order(self):
+        tasks = utils.TaskQueue(shards=2)
+        for item, key in (('a1', 0), ('b1', 1), ('a2', 0), ('b2', 1)):
+            tasks.put(item, key)
+        self.assertEqual(tasks.get(0, block=False), (0, 'a1'))
+        # a2 waits until a1 is done, even on the same shard
+        self.assertRaises(queue.Empty, tasks.get, 0, block=False)
+        self.assertEqual(tasks.get(1, block=False), (1, 'b1'))
+        tasks.task_done(0)
+        self.assertEqual(tasks.get(0, block=False), (0, 'a2'))
+        self.assertEqual(tasks.qsize(), 1)
+
+    def test_hot_key(self):
+        tasks = utils.TaskQueue()
+        for item in range(1000):
+            tasks.put(('hot', item), 'hot', lane='message')
+        tasks.put(('cold', 0), 'cold', lane='callback_query')
+        tasks.put(('free', 0), lane='message')
+        self.assertEqual(tasks.get(block=False), ('hot', ('hot', 0)))
+        # the tasks queued behind the running key are skipped
+        self.assertEqual({tasks.get(block=False)[1] for _ in range(2)}, {('cold', 0), ('free', 0)})
+        self.assertRaises(queue.Empty, tasks.get, block=False)
+        tasks.task_done('cold')
+        self.assertRaises(queue.Empty, tasks.get, block=False)
+        # the key runs again in order
+        taken = []
+        for _ in range(999):
+            tasks.task_done('hot')
+            taken.append(tasks.get(block=False)[1][1])
+        self.assertEqual(taken, list(range(1, 1000)))
+        self.assertEqual(tasks.qsize(), 0)
+
+    def test_round_robin(self):
+        tasks = utils.TaskQueue(shards=3)
+        for item in range(6):
+            tasks.put(item)
+        self.assertEqual([tasks.get(index % 3, block=False)[1] for index in range(6)], [0, 1, 2, 3, 4, 5])
+
+    def test_work_stealing(self):
+        for work_stealing in (False, True):
+            tasks = utils.TaskQueue(shards=2, work_stealing=work_stealing)
+            tasks.put('a', 1)
+            tasks.put('b', 3)
+            if not work_stealing:
+                self.assertRaises(queue.Empty, tasks.get, 0, timeout=.05)
+                continue
+            # the idle worker of shard 0 takes the tasks of shard 1, still one at a time per key
+            self.assertEqual(tasks.get(0, block=False), (1, 'a'))
+            self.assertEqual(tasks.get(0, block=False), (3, 'b'))
+            tasks.put('c', 1)
+            self.assertRaises(queue.Empty, tasks.get, 0, block=False)
+            tasks.task_done(1)
+            self.assertEqual(tasks.get(0, block=False), (1, 'c'))
+
+    def test_blocking_get(self):
+        tasks = utils.TaskQueue()
+        threading.Timer(.05, tasks.put, ('late',)).start()
+        self.assertEqual(tasks.get(timeout=5), (None, 'late'))
+
+
+class TestLanes(unittest.TestCase):
+    def test_weights(self):
+        tasks = utils.TaskQueue(lanes={'callback_query': 3})
+        for item in range(8):
+            tasks.put(('message', item), lane='message')
+            tasks.put(('callback_query', item), lane='callback_query')
+        lanes = [tasks.get(block=False)[1][0] for _ in range(16)]
+        # three callback queries for each message, and the message lane is never starved
+        self.assertEqual(lanes[:8].count('callback_query'), 6)
+        self.assertIn('message', lanes[:4])
+        self.assertEqual(lanes.count('message'), 8)
+        self.assertEqual(set(tasks.queue_wait()), {'message', 'callback_query'})
+        self.assertEqual(tasks.queue_wait()['message'].count, 8)
+
+    def test_order_in_lane(self):
+        tasks = utils.TaskQueue(lanes={'message': 2})
+        for item in range(5):
+            tasks.put(item, lane='message')
+        self.assertEqual([tasks.get(block=False)[1] for _ in range(5)], [0, 1, 2, 3, 4])
+
+
+class TestLaneStats(unittest.TestCase):
+    def test_stats(self):
+        stats = utils.LaneStats(samples=10)
+        self.assertEqual((stats.mean, stats.percentile(95)), (0.0, 0.0))
+        for wait in range(20):
+            stats.add(wait / 10)
+        self.assertEqual(stats.count, 20)
+        self.assertAlmostEqual(stats.mean, .95)
+        self.assertEqual(stats.maximum, 1.9)
+        # percentiles are of the 10 most recent waits
+        self.assertEqual(stats.percentile(0), 1.0)
+        self.assertEqual(stats.percentile(50), 1.5)
+        self.assertEqual(stats.percentile(100), 1.9)
+
+
+class TestOverflow(unittest.TestCase):
+    def test_block(self):
+        tasks = utils.TaskQueue(maxsize=1)
+        tasks.put('a')
+        threading.Timer(.1, tasks.get).start()
+        started = time.monotonic()
+        self.assertTrue(tasks.put('b'))
+        self.assertGreaterEqual(time.monotonic() - started, .05)
+        self.assertEqual(tasks.get(block=False), (None, 'b'))
+
+    def test_drop_oldest(self):
+        tasks = utils.TaskQueue(maxsize=3, overflow='drop_oldest', ordered=False)
+        for item, key in (('a', 1), ('b', 2), ('c', 2)):
+            tasks.put(item, key)
+        # the oldest task of the same key is dropped, not the oldest of all
+        tasks.put('d', 2)
+        self.assertEqual(tasks.shed[None], 1)
+        # a key with no task waiting drops the oldest of all
+        tasks.put('e', 3)
+        self.assertEqual([tasks.get(block=False)[1] for _ in range(3)], ['c', 'd', 'e'])
+        self.assertEqual(tasks.shed[None], 2)
+
+    def test_drop_lanes(self):
+        tasks = utils.TaskQueue(maxsize=2, overflow='drop_lanes', shed_lanes=['message'])
+        tasks.put('m1', lane='message')
+        tasks.put('q1', lane='callback_query')
+        self.assertTrue(tasks.put('q2', lane='callback_query'))
+        self.assertFalse(tasks.put('m2', lane='message'))
+        self.assertEqual(tasks.shed['message'], 2)
+        self.assertEqual([tasks.get(block=False)[1] for _ in range(2)], ['q1', 'q2'])
+
+    def test_spill(self):
+        tasks = utils.TaskQueue(maxsize=2, overflow='spill', loader=lambda data: ('loaded', data))
+        lock = threading.Lock()
+        for item in range(5):
+            # the task holds a lock and can not be pickled, its data is spilled instead
+            tasks.put((lock, item), data=item)
+        self.assertEqual(tasks.spill_size(), 3)
+        self.assertEqual(tasks.spilled[None], 3)
+        items = [tasks.get(block=False)[1] for _ in range(5)]
+        self.assertEqual(items, [(lock, 0), (lock, 1), ('loaded', 2), ('loaded', 3), ('loaded', 4)])
+        self.assertEqual(tasks.spill_size(), 0)
+        tasks.close()
+
+    def test_spill_unpicklable(self):
+        tasks = utils.TaskQueue(maxsize=1, overflow='spill')
+        tasks.put('a')
+        threading.Timer(.1, tasks.get).start()
+        with self.assertLogs('tgbotapi', 'WARNING') as logs:
+            self.assertTrue(tasks.put(threading.Lock()))
+        self.assertIn('can not be spilled', logs.output[0])
+        self.assertEqual(tasks.spill_size(), 0)
+        tasks.close()
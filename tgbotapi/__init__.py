@@ -10,6 +10,7 @@ This module contains the Python API client to the Telegram Bot API.
 """
 
 from .__version__ import *
+from .aiobot import AioBot
 from .asyncbot import AsyncBot
 from .bot import Bot
 from .types import *
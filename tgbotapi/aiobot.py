@@ -0,0 +1,767 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.aiobot - Asyncio Telegram Bot
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module provides an asyncio bot client instance to implement all telegram bot api methods and types,
+every api method is a coroutine and update handlers may be declared with `async def`.
+for example:
+    >>> import asyncio
+    >>> import tgbotapi
+    >>> # Note: Make sure to actually replace TOKEN with your own API token
+    >>> bot = tgbotapi.AioBot(access_token="TOKEN")
+    >>>
+    >>>
+    >>> # Update handlers are registered the same way as with Bot,
+    >>> # coroutine handlers run on the event loop, so api methods must be awaited.
+    >>> @bot.update_handler(update_type='message', bot_command=['/start', '/help'])
+    >>> async def send_welcome(msg):
+    >>>     await bot.send_message(chat_id=msg.chat.uid, text="Howdy, how are you doing?")
+    >>>
+    >>>
+    >>> # Non-coroutine handlers run on worker threads, their api calls run on the event loop and return results.
+    >>> @bot.update_handler(update_type='message', regexp='report')
+    >>> def send_report(msg):
+    >>>     bot.send_document(chat_id=msg.chat.uid, document=build_report())
+    >>>
+    >>>
+    >>> # Finally, we run the long polling coroutine
+    >>> asyncio.run(bot.polling())
+
+:copyright: (c) 2022 by Mustafa Asaad.
+:license: GPLv2, see LICENSE for more details.
+"""
+import asyncio
+import copy
+import functools
+import inspect
+import threading
+import traceback
+
+from . import methods
+from . import types
+from . import utils
+from .bot import Bot
+
+
+class AioBot(Bot):
+    def __init__(self, access_token, max_workers=2, based_url=None, pool_size=100, rate_limiter=None,
+                 retry_policy=None, sharded=False, work_stealing=False, max_queue=0, overflow='block', shed_types=None,
+                 lazy_updates=False, upload_cache=None,
+                 file_cache=None, chat_cache=None, proxies=None):
+        """
+        Use this class to create an asyncio bot instance
+        :param str access_token: Telegram Bot Access Token
+        :param int max_workers: Number of thread workers to process non-coroutine update handlers, default 2
+        :param str based_url: Required, The API url with Bot token
+        :param int pool_size: Maximum number of simultaneous connections to the API, default 100
+        :param utils.RateLimiter or None rate_limiter: Queues outbound calls under the Telegram flood limits
+        :param utils.RetryPolicy or None retry_policy: Retries calls that failed with 429, 5xx or a chat migration
+        :param bool sharded: Pass True to run the updates of one chat in order on the non-coroutine handlers workers
+        :param bool work_stealing: Pass True to let idle workers take the updates of busy shards, needs sharded
+        :param int max_queue: Maximum number of updates waiting for a worker, default 0 for unbounded
+        :param str overflow: What to do with updates beyond max_queue, one of block, drop_oldest, drop_lanes, spill
+        :param list[str] or None shed_types: Update types the drop_lanes overflow may drop, like ['message']
+        :param bool lazy_updates: Pass True to decode the fields of updates and messages the first time they are read
+        :param utils.UploadCache or None upload_cache: Sends files uploaded before as their file_id instead
+        :param utils.TTLCache or None file_cache: Keeps the File of get_file, by file_id and file_unique_id
+        :param utils.ChatCache or None chat_cache: Keeps chats, members and administrators, updates refresh them
+        :param dict or None proxies: Dictionary mapping protocol to the URL of an HTTP proxy
+        """
+        self.__session = utils.AsyncSession(pool_size, rate_limiter, retry_policy, upload_cache, proxies)
+        Bot.__init__(self, access_token, max_workers, based_url, sharded=sharded, work_stealing=work_stealing,
+                     max_queue=max_queue, overflow=overflow, shed_types=shed_types, lazy_updates=lazy_updates,
+                     file_cache=file_cache, chat_cache=chat_cache, session=self.__session)
+
+        self.__based_url = "https://api.telegram.org/bot" if based_url is None else based_url
+        self.__api_url = f'{self.__based_url}{access_token}'
+        self.__file_cache = file_cache
+        self.__chat_cache = chat_cache
+
+        self.__loop = None
+        self.__in_handler = threading.local()
+        self.__last_update_id = 0
+        self.__update_class = types.LazyUpdate if lazy_updates else types.Update
+
+    def _exec_task(self, task, update, lane=None):
+        """
+        Schedules coroutine update handlers on the event loop, other handlers go to the worker pool
+        :param function task: the update handler
+        :param any update: update content, like Message or CallbackQuery
+        :param str or None lane: the worker pool lane, the update type
+        """
+        if self.__loop is None:
+            self.__loop = asyncio.get_event_loop()
+        if not asyncio.iscoroutinefunction(task):
+            return Bot._exec_task(self, task, update, lane)
+
+        reply = self._webhook_reply()
+        future = asyncio.run_coroutine_threadsafe(self.__run_task(task, update, reply), self.__loop)
+        future.add_done_callback(self.__on_task_done)
+        if reply is not None:
+            reply.bound = True
+
+    async def __run_task(self, task, update, reply):
+        """
+        Awaits a coroutine update handler, and sends the deferred call it returns in the webhook response or by itself
+        :param function task: the update handler
+        :param any update: update content, like Message or CallbackQuery
+        :param utils.WebhookReply or None reply: the webhook response waiting for the handler
+        """
+        result = None
+        try:
+            result = await task(update)
+        finally:
+            call = result if isinstance(result, utils.DeferredCall) else None
+            replied = reply is not None and reply.offer(None if call is None or call.files else call)
+            if call is not None and (call.files or not replied):
+                await call.send(self.__session)
+
+    def _run_handler(self, task, update):
+        """
+        Runs a non-coroutine update handler on a worker thread, the api methods it calls wait for their results
+        """
+        self.__in_handler.active = True
+        try:
+            return task(update)
+        finally:
+            self.__in_handler.active = False
+
+    def _send_call(self, call):
+        return asyncio.run_coroutine_threadsafe(call.send(self.__session), self.__loop).result()
+
+    def _resolve(self, coroutine):
+        """
+        Returns the coroutine of an api method, or runs it on the event loop and returns its result when the method
+        was called by a non-coroutine update handler, which has no event loop to await it
+        :param coroutine: the api call
+        """
+        if getattr(self.__in_handler, 'active', False):
+            return asyncio.run_coroutine_threadsafe(coroutine, self.__loop).result()
+        return coroutine
+
+    @staticmethod
+    def __on_task_done(future):
+        if not future.cancelled() and future.exception():
+            e = future.exception()
+            utils.logger.error('TASK FAILED', exc_info=(type(e), e, e.__traceback__))
+
+    async def polling(self, stop=True, skip_pending=False, offset=1, limit=100, timeout=5, allowed_updates=None):
+        """
+        This coroutine starts long polling on the running event loop,
+        and allows the bot to retrieve Updates automatically and notify update handlers accordingly
+        Warning: Do not call this function more than once
+        :param bool stop: Stop polling when an ApiException occurs or a non-coroutine update handler raises,
+                          otherwise the exceptions of handlers are logged
+        :param bool skip_pending: Pass True to drop all pending Updates
+        :param int offset: Identifier of the first update to be returned, default 1
+        :param int limit: Limits the number of updates to be retrieved, default 100 updates
+        :param int timeout: Timeout in seconds for long polling, default 5 seconds
+        :param list[str] or None allowed_updates: A JSON-serialized list of the update types you want your bot to
+                                                  receive, For example, specify [“message”, “edited_channel_post”,
+                                                  “callback_query”] to only receive updates of these types
+        """
+        self.__loop = asyncio.get_running_loop()
+        if self.username is None:
+            await self.get_me()
+        utils.logger.info('POLLING STARTED')
+        self._watch_workers(stop)
+        error_interval = 0.25
+
+        try:
+            while True:
+                try:
+                    self._raise_worker_exceptions()
+                except Exception:
+                    utils.logger.info("Exception Occurred, STOPPING")
+                    break
+                try:
+                    data = await methods.get_updates(self.__api_url, self.__session, self.__last_update_id + offset,
+                                                     limit, timeout, allowed_updates)
+                except Exception as e:
+                    utils.logger.error(f'{e} \n {traceback.format_exc()}')
+                    if stop:
+                        utils.logger.info("Exception Occurred, STOPPING")
+                        break
+                    utils.logger.info(f"Waiting for {error_interval} seconds until retry")
+                    await asyncio.sleep(error_interval)
+                    error_interval *= 2
+                    continue
+
+                error_interval = 0.25
+                updates = [self.__update_class.de_json(x) for x in data]
+                for update in updates:
+                    if update.update_id > self.__last_update_id:
+                        self.__last_update_id = update.update_id
+
+                if skip_pending:
+                    utils.logger.info(f'SKIPPED {len(updates)} PENDING MESSAGES')
+                    skip_pending = False
+                    continue
+                self.process_new_updates(updates)
+        finally:
+            # the coalescers send their queued edits on the loop, so they are closed from another thread
+            await asyncio.get_running_loop().run_in_executor(None, self._close_coalescers)
+            await self.__session.close()
+            utils.logger.info('POLLING STOPPED')
+
+    async def webhook(self, listen='0.0.0.0', port=8443, url_path='/', certificate=None, private_key=None,
+                      max_connections=40, reply_timeout=0):
+        """
+        This coroutine serves the webhook of Bot.webhook on a thread until stop_webhook is called,
+        Coroutine update handlers run on the running event loop, the others on the worker threads
+        :param str listen: The address to listen on, default all interfaces
+        :param int port: The port to listen on, Telegram posts to ports 443, 80, 88 and 8443, default 8443
+        :param str url_path: The path of the webhook url, default '/'
+        :param str or None certificate: Path of the certificate file to serve HTTPS, or None behind a HTTPS proxy
+        :param str or None private_key: Path of the private key file of the certificate
+        :param int max_connections: Maximum number of connections served at once, same as in set_webhook, default 40
+        :param float reply_timeout: Seconds the response waits for the update handler to return a call of bot.reply,
+                                    which is then sent in the response body, default 0 to answer at once
+        """
+        self.__loop = asyncio.get_running_loop()
+        if self.username is None:
+            await self.get_me()
+        try:
+            await self.__loop.run_in_executor(None, functools.partial(
+                Bot.webhook, self, listen, port, url_path, certificate, private_key, max_connections, reply_timeout))
+        finally:
+            await self.__session.close()
+
+    async def set_webhook(self, url, certificate=None, ip_address=None, max_connections=40, allowed_updates=None,
+                          drop_pending_updates=False):
+        data = await methods.set_webhook(self.__api_url, self.__session, url, certificate, ip_address, max_connections,
+                                         allowed_updates, drop_pending_updates)
+        return data
+
+    async def delete_webhook(self, drop_pending_updates=False):
+        return await methods.delete_webhook(self.__api_url, self.__session, drop_pending_updates)
+
+    async def get_webhook_info(self):
+        return types.WebhookInfo.de_json(await methods.get_webhook_info(self.__api_url, self.__session))
+
+    async def get_me(self):
+        me = types.User.de_json(await methods.get_me(self.__api_url, self.__session))
+        self.username = me.username
+        return me
+
+    async def log_out(self):
+        return await methods.log_out(self.__api_url, self.__session)
+
+    async def close(self):
+        return await methods.close(self.__api_url, self.__session)
+
+    async def send_message(self, chat_id, text, parse_mode=None, entities=None, disable_web_page_preview=False,
+                           disable_notification=False, protect_content=False, reply_to_message_id=None,
+                           allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_message(self.__api_url, self.__session, chat_id, text, parse_mode, entities,
+                                       disable_web_page_preview, disable_notification, protect_content,
+                                       reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def forward_message(self, chat_id, from_chat_id, message_id, disable_notification=False,
+                              protect_content=False):
+        return types.Message.de_json(
+            await methods.forward_message(self.__api_url, self.__session, chat_id, from_chat_id, message_id,
+                                          disable_notification, protect_content))
+
+    async def copy_message(self, chat_id, from_chat_id, message_id, caption=None, parse_mode=None,
+                           caption_entities=None, disable_notification=False, protect_content=False,
+                           reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.MessageId.de_json(
+            await methods.copy_message(self.__api_url, self.__session, chat_id, from_chat_id, message_id, caption,
+                                       parse_mode, caption_entities, disable_notification, protect_content,
+                                       reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def send_photo(self, chat_id, photo, caption=None, parse_mode=None, caption_entities=None,
+                         disable_notification=False, protect_content=False, reply_to_message_id=None,
+                         allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_photo(self.__api_url, self.__session, chat_id, photo, caption, parse_mode,
+                                     caption_entities, disable_notification, protect_content, reply_to_message_id,
+                                     allow_sending_without_reply, reply_markup))
+
+    async def send_audio(self, chat_id, audio, caption=None, parse_mode=None, caption_entities=None, duration=None,
+                         performer=None, title=None, thumb=None, disable_notification=False, protect_content=False,
+                         reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_audio(self.__api_url, self.__session, chat_id, audio, caption, parse_mode,
+                                     caption_entities, duration, performer, title, thumb, disable_notification,
+                                     protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def send_document(self, chat_id, document, thumb=None, caption=None, parse_mode=None, caption_entities=None,
+                            disable_content_type_detection=False, disable_notification=False, protect_content=False,
+                            reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_document(self.__api_url, self.__session, chat_id, document, thumb, caption, parse_mode,
+                                        caption_entities, disable_content_type_detection, disable_notification,
+                                        protect_content, reply_to_message_id, allow_sending_without_reply,
+                                        reply_markup))
+
+    async def send_video(self, chat_id, video, duration=None, width=None, height=None, thumb=None, caption=None,
+                         parse_mode=None, caption_entities=None, supports_streaming=None, disable_notification=False,
+                         protect_content=False, reply_to_message_id=None, allow_sending_without_reply=False,
+                         reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_video(self.__api_url, self.__session, chat_id, video, duration, width, height, thumb,
+                                     caption, parse_mode, caption_entities, supports_streaming, disable_notification,
+                                     protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def send_animation(self, chat_id, animation, duration=None, width=None, height=None, thumb=None, caption=None,
+                             parse_mode=None, caption_entities=None, disable_notification=False, protect_content=False,
+                             reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_animation(self.__api_url, self.__session, chat_id, animation, duration, width, height,
+                                         thumb, caption, parse_mode, caption_entities, disable_notification,
+                                         protect_content, reply_to_message_id, allow_sending_without_reply,
+                                         reply_markup))
+
+    async def send_voice(self, chat_id, voice, caption=None, parse_mode=None, caption_entities=None, duration=None,
+                         disable_notification=False, protect_content=False, reply_to_message_id=None,
+                         allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_voice(self.__api_url, self.__session, chat_id, voice, caption, parse_mode,
+                                     caption_entities, duration, disable_notification, protect_content,
+                                     reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def send_video_note(self, chat_id, video_note, duration=None, length=None, thumb=None,
+                              disable_notification=False, protect_content=False, reply_to_message_id=None,
+                              allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_video_note(self.__api_url, self.__session, chat_id, video_note, duration, length, thumb,
+                                          disable_notification, protect_content, reply_to_message_id,
+                                          allow_sending_without_reply, reply_markup))
+
+    async def send_media_group(self, chat_id, media, disable_notification=False, protect_content=False,
+                               reply_to_message_id=None, allow_sending_without_reply=False):
+        resp = await methods.send_media_group(self.__api_url, self.__session, chat_id, media, disable_notification,
+                                              protect_content, reply_to_message_id, allow_sending_without_reply)
+        result = []
+        for x in resp:
+            result.append(types.Message.de_json(x))
+        return result
+
+    async def send_location(self, chat_id, latitude, longitude, horizontal_accuracy=None, live_period=None,
+                            heading=None, proximity_alert_radius=None, disable_notification=False,
+                            protect_content=False, reply_to_message_id=None, allow_sending_without_reply=False,
+                            reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_location(self.__api_url, self.__session, chat_id, latitude, longitude,
+                                        horizontal_accuracy, live_period, heading, proximity_alert_radius,
+                                        disable_notification, protect_content, reply_to_message_id,
+                                        allow_sending_without_reply, reply_markup))
+
+    async def edit_message_live_location(self, latitude, longitude, horizontal_accuracy=None, heading=None,
+                                         proximity_alert_radius=None, chat_id=None, message_id=None,
+                                         inline_message_id=None, reply_markup=None):
+        result = await methods.edit_message_live_location(self.__api_url, self.__session, latitude, longitude,
+                                                          horizontal_accuracy, heading, proximity_alert_radius, chat_id,
+                                                          message_id, inline_message_id, reply_markup)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def stop_message_live_location(self, chat_id=None, message_id=None, inline_message_id=None,
+                                         reply_markup=None):
+        result = await methods.stop_message_live_location(self.__api_url, self.__session, chat_id, message_id,
+                                                          inline_message_id, reply_markup)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def send_venue(self, chat_id, latitude, longitude, title, address, foursquare_id=None, foursquare_type=None,
+                         google_place_id=None, google_place_type=None, disable_notification=False,
+                         protect_content=False, reply_to_message_id=None, allow_sending_without_reply=False,
+                         reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_venue(self.__api_url, self.__session, chat_id, latitude, longitude, title, address,
+                                     foursquare_id, foursquare_type, google_place_id, google_place_type,
+                                     disable_notification, protect_content, reply_to_message_id,
+                                     allow_sending_without_reply, reply_markup))
+
+    async def send_contact(self, chat_id, phone_number, first_name, last_name=None, vcard=None,
+                           disable_notification=False, protect_content=False, reply_to_message_id=None,
+                           allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_contact(self.__api_url, self.__session, chat_id, phone_number, first_name, last_name,
+                                       vcard, disable_notification, protect_content, reply_to_message_id,
+                                       allow_sending_without_reply, reply_markup))
+
+    async def send_poll(self, chat_id, question, options, is_anonymous=True, ttype='regular',
+                        allows_multiple_answers=False, correct_option_id=None, explanation=None,
+                        explanation_parse_mode=None, explanation_entities=None, open_period=None, close_date=None,
+                        is_closed=True, disable_notifications=False, protect_content=False, reply_to_message_id=None,
+                        allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_poll(self.__api_url, self.__session, chat_id, question, options, is_anonymous, ttype,
+                                    allows_multiple_answers, correct_option_id, explanation, explanation_parse_mode,
+                                    explanation_entities, open_period, close_date, is_closed, disable_notifications,
+                                    protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def send_dice(self, chat_id, emoji='🎲', disable_notification=False, protect_content=False,
+                        reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_dice(self.__api_url, self.__session, chat_id, emoji, disable_notification,
+                                    protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def send_chat_action(self, chat_id, action):
+        return await methods.send_chat_action(self.__api_url, self.__session, chat_id, action)
+
+    async def get_user_profile_photos(self, user_id, offset=None, limit=100):
+        return types.UserProfilePhotos.de_json(
+            await methods.get_user_profile_photos(self.__api_url, self.__session, user_id, offset, limit))
+
+    async def get_file(self, file_id):
+        cache = self.__file_cache
+        if cache is not None:
+            file = cache.get(file_id)
+            if file is not None:
+                return file
+        file = types.File.de_json(await methods.get_file(self.__api_url, self.__session, file_id))
+        if cache is not None:
+            cache.set(file_id, file)
+            cache.set(file.file_unique_id, file)
+        return file
+
+    async def download_file(self, file, destination, resume=False, chunk_size=65536):
+        cache = self.__file_cache
+        if not isinstance(file, str) and getattr(file, 'file_path', None) is None:
+            file = (cache.get(file.file_unique_id) if cache is not None else None) or file.file_id
+        if isinstance(file, str):
+            file = await self.get_file(file)
+        try:
+            return await utils.download_file(self.__session, self.__api_url, file.file_path, destination, resume,
+                                             chunk_size)
+        except utils.TelegramAPIError as e:
+            if e.error_code != 404 or cache is None or cache.pop(file.file_id) is None:
+                raise
+        cache.pop(file.file_unique_id)
+        file = await self.get_file(file.file_id)
+        return await utils.download_file(self.__session, self.__api_url, file.file_path, destination, resume,
+                                         chunk_size)
+
+    async def download_files(self, downloads, max_workers=4, resume=False):
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def download(file, destination):
+            async with semaphore:
+                return await self.download_file(file, destination, resume)
+
+        return list(await asyncio.gather(*[download(file, destination) for file, destination in downloads]))
+
+    async def broadcast(self, chat_ids, method='send_message', checkpoint=None, rate=30, max_workers=16, **params):
+        bot = copy.copy(self)
+        bot.__session = copy.copy(self.__session)
+        bot.__session.retry_policy = None
+        send = getattr(bot, method)
+        return await utils.Broadcast(lambda chat_id: send(chat_id=chat_id, **params), chat_ids, checkpoint, rate,
+                                     max_workers).run_async()
+
+    def coalesce_edits(self, rate=1.0, max_workers=4):
+        # called from the running loop, each edit returns an asyncio future
+        return self._keep_coalescer(utils.EditCoalescer(self.reply, self.__session, rate, max_workers,
+                                                        asyncio.get_running_loop()))
+
+    async def ban_chat_member(self, chat_id, user_id, until_date=None, revoke_messages=False):
+        return await methods.ban_chat_member(self.__api_url, self.__session, chat_id, user_id, until_date,
+                                             revoke_messages)
+
+    async def unban_chat_member(self, chat_id, user_id, only_if_banned=False):
+        return await methods.unban_chat_member(self.__api_url, self.__session, chat_id, user_id, only_if_banned)
+
+    async def restrict_chat_member(self, chat_id, user_id, permissions, until_date=None):
+        return await methods.restrict_chat_member(self.__api_url, self.__session, chat_id, user_id, permissions,
+                                                  until_date)
+
+    async def promote_chat_member(self, chat_id, user_id, is_anonymous=False, can_manage_chat=False,
+                                  can_change_info=False, can_post_messages=False, can_edit_messages=False,
+                                  can_delete_messages=False, can_manage_video_chats=False, can_invite_users=False,
+                                  can_restrict_members=False, can_pin_messages=False, can_promote_members=False):
+        return await methods.promote_chat_member(self.__api_url, self.__session, chat_id, user_id, is_anonymous,
+                                                 can_manage_chat, can_change_info, can_post_messages, can_edit_messages,
+                                                 can_delete_messages, can_manage_video_chats, can_invite_users,
+                                                 can_restrict_members, can_pin_messages, can_promote_members)
+
+    async def set_chat_administrator_custom_title(self, chat_id, user_id, custom_title):
+        return await methods.set_chat_administrator_custom_title(self.__api_url, self.__session, chat_id, user_id,
+                                                                 custom_title)
+
+    async def ban_chat_sender_chat(self, chat_id, sender_chat_id):
+        return await methods.ban_chat_sender_chat(self.__api_url, self.__session, chat_id, sender_chat_id)
+
+    async def unban_chat_sender_chat(self, chat_id, sender_chat_id):
+        return await methods.unban_chat_sender_chat(self.__api_url, self.__session, chat_id, sender_chat_id)
+
+    async def set_chat_permissions(self, chat_id, permissions):
+        return await methods.set_chat_permissions(self.__api_url, self.__session, chat_id, permissions)
+
+    async def export_chat_invite_link(self, chat_id):
+        return await methods.export_chat_invite_link(self.__api_url, self.__session, chat_id)
+
+    async def create_chat_invite_link(self, chat_id, name=None, expire_date=None, member_limit=None,
+                                      creates_join_request=False):
+        return types.ChatInviteLink.de_json(
+            await methods.create_chat_invite_link(self.__api_url, self.__session, chat_id, name, expire_date,
+                                                  member_limit, creates_join_request))
+
+    async def edit_chat_invite_link(self, chat_id, invite_link, name=None, expire_date=None, member_limit=None,
+                                    creates_join_request=False):
+        return types.ChatInviteLink.de_json(
+            await methods.edit_chat_invite_link(self.__api_url, self.__session, chat_id, invite_link, name, expire_date,
+                                                member_limit, creates_join_request))
+
+    async def revoke_chat_invite_link(self, chat_id, invite_link):
+        return types.ChatInviteLink.de_json(
+            await methods.revoke_chat_invite_link(self.__api_url, self.__session, chat_id, invite_link))
+
+    async def approve_chat_join_request(self, chat_id, user_id):
+        return await methods.approve_chat_join_request(self.__api_url, self.__session, chat_id, user_id)
+
+    async def decline_chat_join_request(self, chat_id, user_id):
+        return await methods.decline_chat_join_request(self.__api_url, self.__session, chat_id, user_id)
+
+    async def set_chat_photo(self, chat_id, photo):
+        return await methods.set_chat_photo(self.__api_url, self.__session, chat_id, photo)
+
+    async def delete_chat_photo(self, chat_id):
+        return await methods.delete_chat_photo(self.__api_url, self.__session, chat_id)
+
+    async def set_chat_title(self, chat_id, title):
+        return await methods.set_chat_title(self.__api_url, self.__session, chat_id, title)
+
+    async def set_chat_description(self, chat_id, description):
+        return await methods.set_chat_description(self.__api_url, self.__session, chat_id, description)
+
+    async def pin_chat_message(self, chat_id, message_id, disable_notification=False):
+        return await methods.pin_chat_message(self.__api_url, self.__session, chat_id, message_id, disable_notification)
+
+    async def unpin_chat_message(self, chat_id, message_id=None):
+        return await methods.unpin_chat_message(self.__api_url, self.__session, chat_id, message_id)
+
+    async def unpin_all_chat_message(self, chat_id):
+        return await methods.unpin_all_chat_message(self.__api_url, self.__session, chat_id)
+
+    async def leave_chat(self, chat_id):
+        return await methods.leave_chat(self.__api_url, self.__session, chat_id)
+
+    async def get_chat(self, chat_id):
+        cache = self.__chat_cache
+        key = cache.key(chat_id) if cache is not None else None
+        chat = cache.chats.get(key) if key is not None else None
+        if chat is None:
+            chat = types.Chat.de_json(await methods.get_chat(self.__api_url, self.__session, chat_id))
+            if key is not None:
+                cache.chats.set(key, chat)
+        return chat
+
+    async def get_chat_administrators(self, chat_id):
+        cache = self.__chat_cache
+        key = cache.key(chat_id) if cache is not None else None
+        ret = cache.admins.get(key) if key is not None else None
+        if ret is None:
+            result = await methods.get_chat_administrators(self.__api_url, self.__session, chat_id)
+            ret = []
+            for r in result:
+                ret.append(types.ChatMember.de_json(r))
+            if key is not None:
+                cache.admins.set(key, ret)
+        return list(ret)
+
+    async def get_chat_member_count(self, chat_id):
+        return await methods.get_chat_member_count(self.__api_url, self.__session, chat_id)
+
+    async def get_chat_member(self, chat_id, user_id):
+        cache = self.__chat_cache
+        key = cache.key(chat_id) if cache is not None else None
+        member = cache.members.get((key, user_id)) if key is not None else None
+        if member is None:
+            member = types.ChatMember.de_json(await methods.get_chat_member(self.__api_url, self.__session, chat_id,
+                                                                            user_id))
+            if key is not None:
+                cache.members.set((key, user_id), member)
+        return member
+
+    async def set_chat_sticker_set(self, chat_id, sticker_set_name):
+        return await methods.set_chat_sticker_set(self.__api_url, self.__session, chat_id, sticker_set_name)
+
+    async def delete_chat_sticker_set(self, chat_id):
+        return await methods.delete_chat_sticker_set(self.__api_url, self.__session, chat_id)
+
+    async def answer_callback_query(self, callback_query_id, text=None, show_alert=False, url=None, cache_time=None):
+        return await methods.answer_callback_query(self.__api_url, self.__session, callback_query_id, text, show_alert,
+                                                   url, cache_time)
+
+    async def set_my_commands(self, commands, scope=None, language_code=None):
+        return await methods.set_my_commands(self.__api_url, self.__session, commands, scope, language_code)
+
+    async def delete_my_commands(self, scope=None, language_code=None):
+        return await methods.delete_my_commands(self.__api_url, self.__session, scope, language_code)
+
+    async def get_my_commands(self, scope=None, language_code=None):
+        resp = await methods.get_my_commands(self.__api_url, self.__session, scope, language_code)
+        result = []
+        for x in resp:
+            result.append(types.BotCommand.de_json(x))
+        return result
+
+    async def set_chat_menu_button(self, chat_id=None, menu_button=None):
+        data = await methods.set_chat_menu_button(self.__api_url, self.__session, chat_id, menu_button)
+        return data
+
+    async def get_chat_menu_button(self, chat_id=None):
+        data = await methods.get_chat_menu_button(self.__api_url, self.__session, chat_id)
+        return types.MenuButton.de_json(data)
+
+    async def set_my_default_administrator_rights(self, rights=None, for_channel=False):
+        data = await methods.set_my_default_administrator_rights(self.__api_url, self.__session, rights, for_channel)
+        return data
+
+    async def get_my_default_administrator_rights(self, for_channel=False):
+        data = await methods.get_my_default_administrator_rights(self.__api_url, self.__session, for_channel)
+        return types.ChatAdministratorRights.de_json(data)
+
+    async def edit_message_text(self, text, chat_id=None, message_id=None, inline_message_id=None, parse_mode=None,
+                                entities=None, disable_web_page_preview=False, reply_markup=None):
+        result = await methods.edit_message_text(self.__api_url, self.__session, text, chat_id, message_id,
+                                                 inline_message_id, parse_mode, entities, disable_web_page_preview,
+                                                 reply_markup)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def edit_message_caption(self, chat_id=None, message_id=None, inline_message_id=None, caption=None,
+                                   parse_mode=None, caption_entities=None, reply_markup=None):
+        result = await methods.edit_message_caption(self.__api_url, self.__session, chat_id, message_id,
+                                                    inline_message_id, caption, parse_mode, caption_entities,
+                                                    reply_markup)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def edit_message_media(self, media, chat_id=None, message_id=None, inline_message_id=None, reply_markup=None):
+        result = await methods.edit_message_media(self.__api_url, self.__session, media, chat_id, message_id,
+                                                  inline_message_id, reply_markup)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def edit_message_reply_markup(self, chat_id=None, message_id=None, inline_message_id=None, reply_markup=None):
+        result = await methods.edit_message_reply_markup(self.__api_url, self.__session, chat_id, message_id,
+                                                         inline_message_id, reply_markup)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def stop_poll(self, chat_id, message_id, reply_markup=None):
+        return types.Poll.de_json(
+            await methods.stop_poll(self.__api_url, self.__session, chat_id, message_id, reply_markup))
+
+    async def delete_message(self, chat_id, message_id):
+        return await methods.delete_message(self.__api_url, self.__session, chat_id, message_id)
+
+    async def send_sticker(self, chat_id, sticker, disable_notification=False, protect_content=False,
+                           reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_sticker(self.__api_url, self.__session, chat_id, sticker, disable_notification,
+                                       protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def get_sticker_set(self, name):
+        return types.StickerSet.de_json(await methods.get_sticker_set(self.__api_url, self.__session, name))
+
+    async def upload_sticker_file(self, user_id, png_sticker):
+        return types.File.de_json(
+            await methods.upload_sticker_file(self.__api_url, self.__session, user_id, png_sticker))
+
+    async def create_new_sticker_set(self, user_id, name, title, emojis=None, png_sticker=None, tgs_sticker=None,
+                                     webm_sticker=None, contains_masks=False, mask_position=None):
+        return await methods.create_new_sticker_set(self.__api_url, self.__session, user_id, name, title, png_sticker,
+                                                    tgs_sticker, webm_sticker, emojis, contains_masks, mask_position)
+
+    async def add_sticker_to_set(self, user_id, name, emojis, png_sticker=None, tgs_sticker=None, webm_sticker=None,
+                                 mask_position=None):
+        return await methods.add_sticker_to_set(self.__api_url, self.__session, user_id, name, png_sticker, tgs_sticker,
+                                                webm_sticker, emojis, mask_position)
+
+    async def set_sticker_position_in_set(self, sticker, position):
+        return await methods.set_sticker_position_in_set(self.__api_url, self.__session, sticker, position)
+
+    async def delete_sticker_from_set(self, sticker):
+        return await methods.delete_sticker_from_set(self.__api_url, self.__session, sticker)
+
+    async def set_sticker_set_thumb(self, name, user_id, thumb=None):
+        return await methods.set_sticker_set_thumb(self.__api_url, self.__session, name, user_id, thumb)
+
+    async def answer_inline_query(self, inline_query_id, results, cache_time=300, is_personal=False, next_offset=None,
+                                  switch_pm_text=None, switch_pm_parameter=None):
+        return await methods.answer_inline_query(self.__api_url, self.__session, inline_query_id, results, cache_time,
+                                                 is_personal, next_offset, switch_pm_text, switch_pm_parameter)
+
+    async def answer_web_app_query(self, web_app_query_id, result):
+        data = await methods.answer_web_app_query(self.__api_url, self.__session, web_app_query_id, result)
+        return types.SentWebAppMessage.de_json(data)
+
+    async def send_invoice(self, chat_id, title, description, payload, provider_token, currency, prices,
+                           max_tip_amount=None, suggested_tip_amounts=None, start_parameter=None, provider_data=None,
+                           photo_url=None, photo_size=None, photo_width=None, photo_height=None, need_name=False,
+                           need_phone_number=False, need_email=False, need_shipping_address=False,
+                           send_phone_number_to_provider=False, send_email_to_provider=False, is_flexible=False,
+                           disable_notification=False, protect_content=False, reply_to_message_id=None,
+                           allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_invoice(self.__api_url, self.__session, chat_id, title, description, payload,
+                                       provider_token, currency, prices, max_tip_amount, suggested_tip_amounts,
+                                       start_parameter, provider_data, photo_url, photo_size, photo_width, photo_height,
+                                       need_name, need_phone_number, need_email, need_shipping_address,
+                                       send_phone_number_to_provider, send_email_to_provider, is_flexible,
+                                       disable_notification, protect_content, reply_to_message_id,
+                                       allow_sending_without_reply, reply_markup))
+
+    async def answer_shipping_query(self, shipping_query_id, ok, shipping_options=None, error_message=None):
+        return await methods.answer_shipping_query(self.__api_url, self.__session, shipping_query_id, ok,
+                                                   shipping_options, error_message)
+
+    async def answer_pre_checkout_query(self, pre_checkout_query_id, ok, error_message=None):
+        return await methods.answer_pre_checkout_query(self.__api_url, self.__session, pre_checkout_query_id, ok,
+                                                       error_message)
+
+    async def set_passport_data_errors(self, user_id, errors):
+        return await methods.set_passport_data_errors(self.__api_url, self.__session, user_id, errors)
+
+    async def send_game(self, chat_id, game_short_name, disable_notification=False, protect_content=False,
+                        reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
+        return types.Message.de_json(
+            await methods.send_game(self.__api_url, self.__session, chat_id, game_short_name, disable_notification,
+                                    protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
+
+    async def set_game_score(self, user_id, score, force=False, disable_edit_message=False, chat_id=None,
+                             message_id=None, inline_message_id=None):
+        result = await methods.set_game_score(self.__api_url, self.__session, user_id, score, force,
+                                              disable_edit_message, chat_id, message_id, inline_message_id)
+        if type(result) is bool:
+            return result
+        return types.Message.de_json(result)
+
+    async def get_game_high_scores(self, user_id, chat_id=None, message_id=None, inline_message_id=None):
+        resp = await methods.get_game_high_scores(self.__api_url, self.__session, user_id, chat_id, message_id,
+                                                  inline_message_id)
+        result = []
+        for x in resp:
+            result.append(types.GameHighScore.de_json(x))
+        return result
+
+
+def _handler_aware(method):
+    """
+    Wraps an api coroutine method of AioBot, see AioBot._resolve
+    """
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        return self._resolve(method(self, *args, **kwargs))
+
+    return call
+
+
+for _name, _method in list(vars(AioBot).items()):
+    if not _name.startswith('_') and inspect.iscoroutinefunction(_method):
+        setattr(AioBot, _name, _handler_aware(_method))
+del _name, _method
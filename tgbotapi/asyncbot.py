@@ -97,8 +97,13 @@ def async_handler():
 
 
 class AsyncBot(Bot):
-    def __init__(self, access_token, max_workers=2, based_url=None, proxies=None):
-        Bot.__init__(self, access_token, max_workers, based_url, proxies)
+    def __init__(self, access_token, max_workers=2, based_url=None, proxies=None, rate_limiter=None,
+                 retry_policy=None, sharded=False, work_stealing=False, max_queue=0, overflow='block', shed_types=None,
+                 lazy_updates=False, upload_cache=None,
+                 file_cache=None, chat_cache=None):
+        Bot.__init__(self, access_token, max_workers, based_url, proxies, rate_limiter, retry_policy, sharded,
+                     work_stealing, max_queue, overflow, shed_types, lazy_updates, upload_cache,
+                     file_cache, chat_cache)
 
     @async_handler()
     def set_webhook(self, url, certificate=None, ip_address=None, max_connections=40, allowed_updates=None,
@@ -270,6 +275,18 @@ class AsyncBot(Bot):
     def get_file(self, file_id):
         return Bot.get_file(self, file_id)
 
+    @async_handler()
+    def download_file(self, file, destination, resume=False, chunk_size=65536):
+        return Bot.download_file(self, file, destination, resume, chunk_size)
+
+    @async_handler()
+    def download_files(self, downloads, max_workers=4, resume=False):
+        return Bot.download_files(self, downloads, max_workers, resume)
+
+    @async_handler()
+    def broadcast(self, chat_ids, method='send_message', checkpoint=None, rate=30, max_workers=16, **params):
+        return Bot.broadcast(self, chat_ids, method, checkpoint, rate, max_workers, **params)
+
     @async_handler()
     def ban_chat_member(self, chat_id, user_id, until_date, revoke_messages):
         return Bot.ban_chat_member(self, chat_id, user_id, until_date, revoke_messages)
@@ -39,7 +39,11 @@ for example:
 :license: GPLv2, see LICENSE for more details.
 """
 
-import re
+import concurrent.futures
+import copy
+import inspect
+import queue
+import ssl
 import threading
 import time
 
@@ -47,41 +51,78 @@ from . import methods
 from . import types
 from . import utils
 
+UPDATE_TYPES = tuple(name for name in inspect.signature(types.Update).parameters if name != 'update_id')
+UPDATE_TYPE_ALIASES = {'chosen_inline': 'chosen_inline_result', 'pre_check_query': 'pre_checkout_query'}
+UPDATE_FILTERS = {
+    'message': ('chat_type', 'bot_command', 'regexp', 'func'),
+    'edited_message': ('chat_type', 'bot_command', 'regexp', 'func'),
+    'channel_post': ('regexp', 'func'),
+    'edited_channel_post': ('regexp', 'func'),
+    'my_chat_member': ('chat_type', 'func'),
+    'chat_member': ('chat_type', 'func'),
+    'chat_join_request': ('chat_type', 'func'),
+}
+
 
 class Bot:
-    def __init__(self, access_token, max_workers=2, based_url=None, proxies=None):
+    def __init__(self, access_token, max_workers=2, based_url=None, proxies=None, rate_limiter=None,
+                 retry_policy=None, sharded=False, work_stealing=False, max_queue=0, overflow='block', shed_types=None,
+                 lazy_updates=False, upload_cache=None,
+                 file_cache=None, chat_cache=None, session=None):
         """
         Use this class to create bot instance
         :param str access_token: Telegram Bot Access Token
         :param int max_workers: Number of thread workers to process incoming tasks, default 2
         :param str based_url: Required, The API url with Bot token
         :param dict or None proxies: Dictionary mapping protocol to the URL of the proxy
+        :param utils.RateLimiter or None rate_limiter: Queues outbound calls under the Telegram flood limits
+        :param utils.RetryPolicy or None retry_policy: Retries calls that failed with 429, 5xx or a chat migration
+        :param bool sharded: Pass True to run the updates of one chat in order, while other chats run in parallel
+        :param bool work_stealing: Pass True to let idle workers take the updates of busy shards, needs sharded
+        :param int max_queue: Maximum number of updates waiting for a worker, default 0 for unbounded
+        :param str overflow: What to do with updates beyond max_queue, 'block' pauses fetching, 'drop_oldest' drops
+                             the oldest update of the same chat, 'drop_lanes' drops the oldest of shed_types and
+                             'spill' keeps them in a temporary file
+        :param list[str] or None shed_types: Update types the drop_lanes overflow may drop, like ['message']
+        :param bool lazy_updates: Pass True to decode the fields of updates and messages the first time they are read
+        :param utils.UploadCache or None upload_cache: Sends files uploaded before as their file_id instead
+        :param utils.TTLCache or None file_cache: Keeps the File of get_file, by file_id and file_unique_id
+        :param utils.ChatCache or None chat_cache: Keeps chats, members and administrators, updates refresh them
+        :param utils.Session or None session: The session calls are sent through, default a new one made of proxies,
+                                              rate_limiter, retry_policy and upload_cache
         """
 
         self.__based_url = "https://api.telegram.org/bot" if based_url is None else based_url
         self.__api_url = f'{self.__based_url}{access_token}'
-        self.__proxies = proxies
-
-        self.__worker_pool = utils.ThreadPool(max_workers)
+        if session is None:
+            session = utils.Session(max_workers + 1, proxies, rate_limiter, retry_policy, upload_cache)
+        self.__session = session
+        self.__file_cache = file_cache
+        self.__chat_cache = chat_cache
+
+        self.__worker_pool = utils.ThreadPool(max_workers, sharded=sharded, work_stealing=work_stealing,
+                                              maxsize=max_queue, overflow=overflow, shed_lanes=shed_types,
+                                              loader=self.__load_task)
+        # the chat of an update orders its tasks when sharded, and tells drop_oldest which update to drop
+        self.__keyed = self.__worker_pool.sharded or (bool(max_queue) and overflow == 'drop_oldest')
+        self.__spills = bool(max_queue) and overflow == 'spill'
+        self.__tasks = []
         self.__skip_pending = False
         self.__stop_polling = threading.Event()
+        self.__update_queue = None
+        self.__webhook_server = None
+        self.__coalescers = []
+        self.__webhook_reply = threading.local()
+        self.__reply_timeout = 0
+        self.__deferred = None
         self.__allowed_updates = None
         self.__last_update_id = 0
+        self.__update_class = types.LazyUpdate if lazy_updates else types.Update
 
-        self.__message_handlers = []
-        self.__edited_message_handlers = []
-        self.__channel_post_handlers = []
-        self.__edited_channel_post_handlers = []
-        self.__inline_query_handlers = []
-        self.__chosen_inline_handlers = []
-        self.__callback_query_handlers = []
-        self.__shipping_query_handlers = []
-        self.__pre_checkout_query_handlers = []
-        self.__poll_handlers = []
-        self.__poll_answer_handlers = []
-        self.__my_chat_member_handlers = []
-        self.__chat_member_handlers = []
-        self.__chat_join_request_handlers = []
+        self.__update_handlers = {update_type: utils.UpdateRoute() for update_type in UPDATE_TYPES}
+        self.__routes = []
+        # commands addressed to another bot, like /start@OtherBot, are not routed to command handlers
+        self.username = None
 
     @staticmethod
     def __build_handler_dict(handler, **filters):
@@ -102,7 +143,7 @@ class Bot:
                                               these updates ['message', 'edited_message', 'channel_post',
                                               'edited_channel_post','my_chat_member','chat_member','chat_join_request']
         :param str or list or None bot_command: Bot Commands like (/start, /help)
-        :param str or None regexp: Sequence of characters that define a search pattern
+        :param str or re.Pattern or None regexp: Sequence of characters that define a search pattern
         :param function or None func: any python function that return True On success like (lambda)
         :return: filtered Update
         """
@@ -112,76 +153,207 @@ class Bot:
             else:
                 update_type = self.__allowed_updates
 
+        update_types = [update_type] if isinstance(update_type, str) else list(update_type)
+        for i, ttype in enumerate(update_types):
+            ttype = UPDATE_TYPE_ALIASES.get(ttype, ttype)
+            if ttype not in self.__update_handlers:
+                raise ValueError(f"update_type should be one of {', '.join(UPDATE_TYPES)}, not '{ttype}'")
+            update_types[i] = ttype
+
+        filters = {'chat_type': chat_type, 'regexp': regexp, 'func': func}
+        commands = [bot_command] if isinstance(bot_command, str) else bot_command
+
         def decorator(handler):
-            if 'message' in update_type:
-                self.__message_handlers.append(self.__build_handler_dict(handler, chat_type=chat_type,
-                                                                         bot_command=bot_command, regexp=regexp,
-                                                                         func=func))
-            elif 'edited_message' in update_type:
-                self.__edited_message_handlers.append(self.__build_handler_dict(handler, chat_type=chat_type,
-                                                                                bot_command=bot_command, regexp=regexp,
-                                                                                func=func))
-            elif 'channel_post' in update_type:
-                self.__channel_post_handlers.append(self.__build_handler_dict(handler, regexp=regexp, func=func))
-            elif 'edited_channel_post' in update_type:
-                self.__edited_channel_post_handlers.append(self.__build_handler_dict(handler, regexp=regexp, func=func))
-            elif 'inline_query' in update_type:
-                self.__inline_query_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'chosen_inline' in update_type:
-                self.__chosen_inline_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'callback_query' in update_type:
-                self.__callback_query_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'shipping_query' in update_type:
-                self.__shipping_query_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'pre_check_query' in update_type:
-                self.__pre_checkout_query_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'poll' in update_type:
-                self.__poll_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'poll_answer' in update_type:
-                self.__poll_answer_handlers.append(self.__build_handler_dict(handler, func=func))
-            elif 'my_chat_member' in update_type:
-                self.__my_chat_member_handlers.append(self.__build_handler_dict(handler, chat_type=chat_type,
-                                                                                func=func))
-            elif 'chat_member' in update_type:
-                self.__chat_member_handlers.append(self.__build_handler_dict(handler, chat_type=chat_type,
-                                                                             func=func))
-            elif 'chat_join_request' in update_type:
-                self.__chat_join_request_handlers.append(self.__build_handler_dict(handler, chat_type=chat_type,
-                                                                                   func=func))
-            else:
-                self.__message_handlers.append(self.__build_handler_dict(handler, chat_type=chat_type,
-                                                                         bot_command=bot_command, regexp=regexp,
-                                                                         func=func))
+            if handler not in self.__tasks:
+                self.__tasks.append(handler)
+            for ttype in update_types:
+                allowed = UPDATE_FILTERS.get(ttype, ('func',))
+                self.__update_handlers[ttype].add(
+                    self.__build_handler_dict(handler, **{k: v for k, v in filters.items() if k in allowed}),
+                    commands if 'bot_command' in allowed else None)
+            self.__routes = [(k, v) for k, v in self.__update_handlers.items() if v.handlers]
             return handler
 
         return decorator
 
-    def __exec_task(self, task, *args, **kwargs):
-        self.__worker_pool.put(task, *args, **kwargs)
+    def _exec_task(self, task, update, lane=None):
+        """
+        Hands a matched update handler over to the worker pool
+        :param function task: the update handler
+        :param any update: update content, like Message or CallbackQuery
+        :param str or None lane: the worker pool lane, the update type
+        """
+        key = self.__update_key(update) if self.__keyed else None
+        # a spilled update is kept as the position of its handler and the update, the bot itself can not be pickled
+        data = (self.__tasks.index(task), update) if self.__spills else None
+        reply = self._webhook_reply()
+        queued = self.__worker_pool.put_task(self.__run_task, (task, update, reply), None, key, lane, data)
+        if reply is not None:
+            reply.bound = queued
+
+    def _webhook_reply(self):
+        """
+        Returns the webhook response waiting for the update being dispatched, if any
+        :rtype: utils.WebhookReply or None
+        """
+        return getattr(self.__webhook_reply, 'slot', None)
+
+    def __load_task(self, data):
+        """
+        Rebuilds the worker pool task of an update that was spilled to disk
+        :param tuple data: the position of the update handler and the update content
+        :return: the task
+        :rtype: tuple
+        """
+        index, update = data
+        return self.__run_task, (self.__tasks[index], update, None), {}
+
+    def __run_task(self, task, update, reply):
+        """
+        Runs an update handler, and sends the deferred call it returns in the webhook response or by itself
+        :param function task: the update handler
+        :param any update: update content, like Message or CallbackQuery
+        :param utils.WebhookReply or None reply: the webhook response waiting for the handler
+        """
+        result = None
+        try:
+            result = self._run_handler(task, update)
+        finally:
+            call = result if isinstance(result, utils.DeferredCall) else None
+            replied = reply is not None and reply.offer(None if call is None or call.files else call)
+            if call is not None and (call.files or not replied):
+                self._send_call(call)
+
+    def _watch_workers(self, halt):
+        """
+        Sets what a worker does after an update handler raised, it waits for _raise_worker_exceptions when halt,
+        otherwise the exception is only logged and the worker takes the next update at once
+        :param bool halt: Pass True to stop on the exceptions of update handlers
+        """
+        self.__worker_pool.halt_on_exception = halt
+
+    def _raise_worker_exceptions(self):
+        """
+        Raises the exception of an update handler that failed on a halted worker
+        """
+        self.__worker_pool.raise_exceptions()
+
+    def _run_handler(self, task, update):
+        """
+        Runs an update handler on a worker thread
+        :param function task: the update handler
+        :param any update: update content, like Message or CallbackQuery
+        :return: what the handler returned
+        """
+        return task(update)
+
+    def _send_call(self, call):
+        """
+        Sends a deferred call from a worker thread
+        :param utils.DeferredCall call: the call
+        :return: JSON DICT FORMAT
+        :rtype: dict
+        """
+        return call.send(self.__session)
+
+    @property
+    def reply(self):
+        """
+        The api methods of the bot as deferred calls, an update handler can return one to reply,
+        like `return bot.reply.send_message(chat_id=message.chat.uid, text='Hi')`,
+        Under the webhook the call is sent in the HTTP response, saving a request, otherwise it is sent as usual,
+        Either way its result is not available to the handler
+        :rtype: utils.DeferredMethods
+        """
+        if self.__deferred is None:
+            deferred = copy.copy(self)
+            deferred.__session = utils.DeferredSession()
+            # a cache hit would return its entry instead of the deferred call
+            deferred.__chat_cache = deferred.__file_cache = None
+            self.__deferred = utils.DeferredMethods(deferred, Bot)
+        return self.__deferred
+
+    def coalesce_edits(self, rate=1.0, max_workers=4):
+        """
+        Returns the edit methods of the bot with the edits of each message coalesced, for messages edited often
+        like a progress bar, `edits = bot.coalesce_edits()` then `edits.edit_message_text(text, chat_id, message_id)`,
+        At most rate edits per second are sent to a message, the newest replacing the ones waiting, and an edit equal
+        to the last one sent is dropped, Each call returns a concurrent.futures.Future of its result,
+        The bot closes it once polling or the webhook stops, after sending the queued edits, otherwise call its close
+        :param float rate: edits per second of each message, default 1
+        :param int max_workers: number of edits in flight at once
+        :rtype: utils.EditCoalescer
+        """
+        return self._keep_coalescer(utils.EditCoalescer(self.reply, self.__session, rate, max_workers))
+
+    def _keep_coalescer(self, coalescer):
+        """
+        Keeps an edit coalescer until the bot stops
+        :param utils.EditCoalescer coalescer: the coalescer
+        :rtype: utils.EditCoalescer
+        """
+        self.__coalescers.append(coalescer)
+        return coalescer
+
+    def _close_coalescers(self):
+        """
+        Closes the edit coalescers of the bot, once their queued edits are sent
+        """
+        while self.__coalescers:
+            self.__coalescers.pop().close()
+
+    def queue_wait(self):
+        """
+        Returns how long the updates of each type waited for a worker
+        :rtype: dict[str, utils.LaneStats]
+        """
+        return self.__worker_pool.queue_wait()
+
+    def shed_updates(self):
+        """
+        Returns how many updates of each type the overflow policy dropped
+        :rtype: dict[str, int]
+        """
+        return self.__worker_pool.shed()
+
+    @staticmethod
+    def __update_key(update):
+        """
+        Returns the chat an update belongs to, or its user for updates outside a chat like inline queries
+        :param any update: update content, like Message or CallbackQuery
+        :rtype: int or None
+        """
+        chat = getattr(update, 'chat', None) or getattr(getattr(update, 'message', None), 'chat', None)
+        if chat is not None:
+            return chat.uid
+        user = getattr(update, 'from_user', None) or getattr(update, 'user', None)
+        return None if user is None else user.uid
 
-    def __check_update_handler(self, update_handler, update):
+    def __check_update_handler(self, update_handler, update, matches):
         """
         check update handler
         :param update_handler:
         :param update:
+        :param set[str] matches: regexp filters that match the update text
         :return:
         """
         for filters, filter_value in update_handler['filters'].items():
             if filter_value is None:
                 continue
 
-            if not self.__check_filter(filters, filter_value, update):
+            if not self.__check_filter(filters, filter_value, update, matches):
                 return False
 
         return True
 
     @staticmethod
-    def __check_filter(filters, filter_value, update):
+    def __check_filter(filters, filter_value, update, matches):
         """
         check filters if filter_value in update
         :param str filters: filter name
         :param any filter_value: filter value
         :param any update: class object
+        :param set[str] matches: regexp filters that match the update text
         :return: True on Success
         :rtype: bool
         """
@@ -193,150 +365,41 @@ class Bot:
 
             return ttype in filter_value
         elif filters == 'regexp':
-            return update.text and re.search(filter_value, update.text, re.IGNORECASE)
+            return filter_value in matches
         elif filters == 'func':
             return filter_value(update)
-        elif filters == 'bot_command':
-            entity = update.entities
-            if entity:
-                return entity[0].ttype == 'bot_command' and update.text in filter_value
-            else:
-                return False
         else:
             return False
 
-    def __notify_update_handlers(self, handlers, new_updates):
+    def __notify_update_handlers(self, update_type, route, update):
         """
-        Notifies command handlers
-        :param handlers:
-        :param new_updates:
-        :return:
+        Notifies the first update handler whose filters match the update
+        :param str update_type: the update type
+        :param utils.UpdateRoute route: update handlers registered for the update type
+        :param any update: update content, like Message or CallbackQuery
         """
-        for update_type in new_updates:
-            for update_handler in handlers:
-                if self.__check_update_handler(update_handler, update_type):
-                    self.__exec_task(update_handler['function'], update_type)
-                    break
-
-    def __process_new_messages(self, new_messages):
-        self.__notify_update_handlers(self.__message_handlers, new_messages)
-
-    def __process_new_edited_messages(self, edited_message):
-        self.__notify_update_handlers(self.__edited_message_handlers, edited_message)
-
-    def __process_new_channel_posts(self, channel_post):
-        self.__notify_update_handlers(self.__channel_post_handlers, channel_post)
-
-    def __process_new_edited_channel_posts(self, edited_channel_post):
-        self.__notify_update_handlers(self.__edited_channel_post_handlers, edited_channel_post)
-
-    def __process_new_inline_query(self, new_inline_queries):
-        self.__notify_update_handlers(self.__inline_query_handlers, new_inline_queries)
-
-    def __process_new_chosen_inline_query(self, new_chosen_inline_queries):
-        self.__notify_update_handlers(self.__chosen_inline_handlers, new_chosen_inline_queries)
-
-    def __process_new_callback_query(self, new_callback_queries):
-        self.__notify_update_handlers(self.__callback_query_handlers, new_callback_queries)
-
-    def __process_new_shipping_query(self, new_shipping_queries):
-        self.__notify_update_handlers(self.__shipping_query_handlers, new_shipping_queries)
-
-    def __process_new_pre_checkout_query(self, pre_checkout_queries):
-        self.__notify_update_handlers(self.__pre_checkout_query_handlers, pre_checkout_queries)
-
-    def __process_new_poll(self, poll):
-        self.__notify_update_handlers(self.__poll_handlers, poll)
-
-    def __process_new_poll_answer(self, poll_answer):
-        self.__notify_update_handlers(self.__poll_answer_handlers, poll_answer)
-
-    def __process_new_my_chat_member(self, my_chat_member):
-        self.__notify_update_handlers(self.__my_chat_member_handlers, my_chat_member)
-
-    def __process_new_chat_member(self, chat_member):
-        self.__notify_update_handlers(self.__chat_member_handlers, chat_member)
-
-    def __process_new_chat_join_request(self, chat_join_request):
-        self.__notify_update_handlers(self.__chat_join_request_handlers, chat_join_request)
-
-    def __process_new_updates(self, updates):
-        new_messages = []
-        new_edited_messages = []
-        new_channel_posts = []
-        new_edited_channel_posts = []
-        new_inline_queries = []
-        new_chosen_inline_results = []
-        new_callback_queries = []
-        new_shipping_queries = []
-        new_pre_checkout_queries = []
-        new_polls = []
-        new_poll_answers = []
-        new_my_chat_member = []
-        new_chat_member = []
-        new_chat_join_request = []
+        matches = route.search(update)
+        for update_handler in route.candidates(update, matches, self.username):
+            if self.__check_update_handler(update_handler, update, matches):
+                self._exec_task(update_handler['function'], update, update_type)
+                break
 
+    def process_new_updates(self, updates):
+        """
+        Notifies the registered update handlers about new updates
+        :param list[types.Update] updates: incoming updates
+        """
+        routes = self.__routes
+        chat_cache = self.__chat_cache
         for update in updates:
             if update.update_id > self.__last_update_id:
                 self.__last_update_id = update.update_id
-            if update.message:
-                new_messages.append(update.message)
-            if update.edited_message:
-                new_edited_messages.append(update.edited_message)
-            if update.channel_post:
-                new_channel_posts.append(update.channel_post)
-            if update.edited_channel_post:
-                new_edited_channel_posts.append(update.edited_channel_post)
-            if update.inline_query:
-                new_inline_queries.append(update.inline_query)
-            if update.chosen_inline_result:
-                new_chosen_inline_results.append(update.chosen_inline_result)
-            if update.callback_query:
-                new_callback_queries.append(update.callback_query)
-            if update.shipping_query:
-                new_shipping_queries.append(update.shipping_query)
-            if update.pre_checkout_query:
-                new_pre_checkout_queries.append(update.pre_checkout_query)
-            if update.poll:
-                new_polls.append(update.poll)
-            if update.poll_answer:
-                new_poll_answers.append(update.poll_answer)
-            if update.my_chat_member:
-                new_my_chat_member.append(update.my_chat_member)
-            if update.chat_member:
-                new_chat_member.append(update.chat_member)
-            if update.chat_join_request:
-                new_chat_join_request.append(update.chat_join_request)
-
-        if len(updates) > 0:
-            if len(new_messages) > 0:
-                self.__process_new_messages(new_messages)
-            if len(new_edited_messages) > 0:
-                self.__process_new_edited_messages(new_edited_messages)
-            if len(new_channel_posts) > 0:
-                self.__process_new_channel_posts(new_channel_posts)
-            if len(new_edited_channel_posts) > 0:
-                self.__process_new_edited_channel_posts(new_edited_channel_posts)
-            if len(new_inline_queries) > 0:
-                self.__process_new_inline_query(new_inline_queries)
-            if len(new_chosen_inline_results) > 0:
-                self.__process_new_chosen_inline_query(new_chosen_inline_results)
-            if len(new_callback_queries) > 0:
-                self.__process_new_callback_query(new_callback_queries)
-            if len(new_pre_checkout_queries) > 0:
-                self.__process_new_pre_checkout_query(new_pre_checkout_queries)
-            if len(new_shipping_queries) > 0:
-                self.__process_new_shipping_query(new_shipping_queries)
-            if len(new_polls) > 0:
-                self.__process_new_poll(new_polls)
-            if len(new_poll_answers) > 0:
-                self.__process_new_poll_answer(new_poll_answers)
-            if len(new_my_chat_member) > 0:
-                self.__process_new_my_chat_member(new_my_chat_member)
-            if len(new_chat_member) > 0:
-                self.__process_new_chat_member(new_chat_member)
-            if len(new_chat_join_request) > 0:
-                self.__process_new_chat_join_request(new_chat_join_request)
+            if chat_cache is not None:
+                chat_cache.process_update(update)
+            for update_type, route in routes:
+                content = getattr(update, update_type)
+                if content is not None:
+                    self.__notify_update_handlers(update_type, route, content)
 
     def __get_updates(self, offset, limit, timeout, allowed_updates):
         """
@@ -352,24 +415,39 @@ class Bot:
         offset = (self.__last_update_id + offset)
 
         updates = []
-        for data in methods.get_updates(self.__api_url, self.__proxies, offset, limit, timeout, allowed_updates):
-            updates.append(types.Update.de_json(data))
+        for data in methods.get_updates(self.__api_url, self.__session, offset, limit, timeout, allowed_updates):
+            updates.append(self.__update_class.de_json(data))
+
+        for update in updates:
+            if update.update_id > self.__last_update_id:
+                self.__last_update_id = update.update_id
 
-        total = 0
         if self.__skip_pending:
-            while updates:
-                total += len(updates)
-                for update in updates:
-                    if update.update_id > self.__last_update_id:
-                        self.__last_update_id = update.update_id
-                    updates.pop()
-
-            utils.logger.info(f'SKIPPED {total} PENDING MESSAGES')
+            utils.logger.info(f'SKIPPED {len(updates)} PENDING MESSAGES')
             self.__skip_pending = False
+            updates = []
 
-        self.__process_new_updates(updates)
+        return updates
 
-    def polling(self, stop=True, skip_pending=False, offset=1, limit=100, timeout=5, allowed_updates=None):
+    def __fetch_updates(self, offset, limit, timeout, allowed_updates):
+        """
+        Keeps a long poll in flight while earlier batches wait in the update queue to be dispatched,
+        The next offset is known as soon as a batch is decoded, so fetching never waits for the handlers,
+        A batch is always handed to the queue, even once polling stops, the next getUpdates confirms it to Telegram
+        """
+        while self.__stop_polling.is_set():
+            updates = self.__get_updates(offset, limit, timeout, allowed_updates)
+            if not updates:
+                continue
+            while True:
+                try:
+                    self.__update_queue.put(updates, block=True, timeout=.5)
+                    break
+                except queue.Full:
+                    pass
+
+    def polling(self, stop=True, skip_pending=False, offset=1, limit=100, timeout=5, allowed_updates=None,
+                prefetch=2, lanes=None):
         """
         This method starts a new polling thread,
         and allows the bot to retrieve Updates automatically and notify listeners and message handlers accordingly
@@ -382,6 +460,9 @@ class Bot:
         :param list[str] or None allowed_updates: A JSON-serialized list of the update types you want your bot to
                                                   receive, For example, specify [“message”, “edited_channel_post”,
                                                   “callback_query”] to only receive updates of these types
+        :param int prefetch: Number of fetched batches waiting to be dispatched before fetching pauses, default 2
+        :param dict or None lanes: Update type weights for the worker pool, like {'callback_query': 8}, so a type
+                                   with weight 8 gets 8 updates through for each update of a type with weight 1
         """
         if skip_pending:
             self.__skip_pending = True
@@ -389,19 +470,27 @@ class Bot:
         if allowed_updates:
             self.__allowed_updates = allowed_updates
 
+        if lanes:
+            self.__worker_pool.set_lanes(lanes)
+
+        if self.username is None:
+            Bot.get_me(self)
+
         utils.logger.info('POLLING STARTED')
+        self._watch_workers(True)
         self.__stop_polling.set()
+        self.__update_queue = queue.Queue(maxsize=prefetch)
         error_interval = 0.25
 
         polling_thread = utils.ThreadWorker(name="PollingThread")
-        event = utils.events_handler(polling_thread.event_completed, polling_thread.event_exception,
-                                     self.__worker_pool.event_exception)
+        polling_thread.put(self.__fetch_updates, offset, limit, timeout, allowed_updates)
 
         while self.__stop_polling.is_set():
-            event.clear()
             try:
-                polling_thread.put(self.__get_updates, offset, limit, timeout, allowed_updates)
-                event.wait()  # wait for polling thread finish, polling thread error or thread pool error
+                try:
+                    self.process_new_updates(self.__update_queue.get(block=True, timeout=.5))
+                except queue.Empty:
+                    pass
                 polling_thread.raise_exceptions()
                 self.__worker_pool.raise_exceptions()
             except KeyboardInterrupt:
@@ -413,15 +502,96 @@ class Bot:
                     self.__stop_polling.clear()
                     utils.logger.info("Exception Occurred, STOPPING")
                 else:
-                    polling_thread.clear_exceptions()
-                    self.__worker_pool.clear_exceptions()
                     utils.logger.info(f"Waiting for {error_interval} seconds until retry")
                     time.sleep(error_interval)
                     error_interval *= 2
+                    if polling_thread.event_exception.is_set():
+                        polling_thread.clear_exceptions()
+                        polling_thread.put(self.__fetch_updates, offset, limit, timeout, allowed_updates)
+                    self.__worker_pool.clear_exceptions()
+
+        # the batches still queued were confirmed by the long poll that followed them, dispatch them before leaving
+        while not (polling_thread.event_completed.is_set() or polling_thread.event_exception.is_set()) \
+                or not self.__update_queue.empty():
+            try:
+                self.process_new_updates(self.__update_queue.get(block=True, timeout=.5))
+            except queue.Empty:
+                pass
 
         polling_thread.stop()
+        self._close_coalescers()
         utils.logger.info('POLLING STOPPED')
 
+    def webhook(self, listen='0.0.0.0', port=8443, url_path='/', certificate=None, private_key=None,
+                max_connections=40, reply_timeout=0):
+        """
+        This method starts a webhook server, it receives the Updates that Telegram posts to the url given to
+        set_webhook and notifies listeners and message handlers accordingly, until stop_webhook is called,
+        The exceptions of update handlers are logged and the webhook goes on
+        :param str listen: The address to listen on, default all interfaces
+        :param int port: The port to listen on, Telegram posts to ports 443, 80, 88 and 8443, default 8443
+        :param str url_path: The path of the webhook url, default '/'
+        :param str or None certificate: Path of the certificate file to serve HTTPS, or None behind a HTTPS proxy
+        :param str or None private_key: Path of the private key file of the certificate
+        :param int max_connections: Maximum number of connections served at once, same as in set_webhook, default 40
+        :param float reply_timeout: Seconds the response waits for the update handler to return a call of bot.reply,
+                                    which is then sent in the response body, default 0 to answer at once
+        """
+        if self.username is None:
+            Bot.get_me(self)
+
+        self.__reply_timeout = reply_timeout
+        self._watch_workers(False)
+        ssl_context = None
+        if certificate:
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(certificate, private_key)
+
+        self.__webhook_server = utils.WebhookServer(self.__on_webhook_update, listen, port, url_path, max_connections,
+                                                    ssl_context)
+        utils.logger.info(f'WEBHOOK STARTED ON {listen}:{self.__webhook_server.server_address[1]}{url_path}')
+        try:
+            self.__webhook_server.serve_forever()
+        except KeyboardInterrupt:
+            utils.logger.info("KeyboardInterrupt Occurred, STOPPING")
+        finally:
+            self.__webhook_server.server_close()
+            self._close_coalescers()
+            utils.logger.info('WEBHOOK STOPPED')
+
+    def stop_webhook(self):
+        """
+        Stops the webhook server started by webhook
+        """
+        if self.__webhook_server is not None:
+            self.__webhook_server.shutdown()
+
+    def __on_webhook_update(self, data):
+        """
+        Notifies the update handlers about an update received by the webhook server
+        :param dict data: the decoded update
+        :return: the response body, a deferred call returned by the update handler
+        :rtype: bytes or None
+        """
+        update = self.__update_class.de_json(data)
+        if not self.__reply_timeout:
+            self.process_new_updates([update])
+            return None
+
+        reply = self.__webhook_reply.slot = utils.WebhookReply()
+        try:
+            self.process_new_updates([update])
+        finally:
+            self.__webhook_reply.slot = None
+        call = reply.wait(self.__reply_timeout if reply.bound else 0)
+        if call is None:
+            return None
+        try:
+            return utils.codec.dumpb(call.to_dict())
+        except (TypeError, ValueError):
+            self._send_call(call)
+            return None
+
     def set_webhook(self, url, certificate=None, ip_address=None, max_connections=40, allowed_updates=None,
                     drop_pending_updates=False):
         """
@@ -435,7 +605,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        data = methods.set_webhook(self.__api_url, self.__proxies, url, certificate, ip_address, max_connections,
+        data = methods.set_webhook(self.__api_url, self.__session, url, certificate, ip_address, max_connections,
                                    allowed_updates, drop_pending_updates)
         return data
 
@@ -446,7 +616,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.delete_webhook(self.__api_url, self.__proxies, drop_pending_updates)
+        return methods.delete_webhook(self.__api_url, self.__session, drop_pending_updates)
 
     def get_webhook_info(self):
         """
@@ -454,15 +624,17 @@ class Bot:
         :return: a WebhookInfo object, otherwise an object with the url field empty
         :rtype: types.WebhookInfo
         """
-        return types.WebhookInfo.de_json(methods.get_webhook_info(self.__api_url, self.__proxies))
+        return types.WebhookInfo.de_json(methods.get_webhook_info(self.__api_url, self.__session))
 
     def get_me(self):
         """
-        A simple method for testing your bots auth token
+        A simple method for testing your bots auth token, the username of the bot is kept in username
         :return: a User object
         :rtype: types.User
         """
-        return types.User.de_json(methods.get_me(self.__api_url, self.__proxies))
+        me = types.User.de_json(methods.get_me(self.__api_url, self.__session))
+        self.username = me.username
+        return me
 
     def log_out(self):
         """
@@ -470,7 +642,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        return methods.log_out(self.__api_url, self.__proxies)
+        return methods.log_out(self.__api_url, self.__session)
 
     def close(self):
         """
@@ -478,7 +650,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        return types.User.de_json(methods.close(self.__api_url, self.__proxies))
+        return methods.close(self.__api_url, self.__session)
 
     def send_message(self, chat_id, text, parse_mode=None, entities=None, disable_web_page_preview=False,
                      disable_notification=False, protect_content=False, reply_to_message_id=None,
@@ -499,7 +671,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_message(self.__api_url, self.__proxies, chat_id, text, parse_mode, entities,
+            methods.send_message(self.__api_url, self.__session, chat_id, text, parse_mode, entities,
                                  disable_web_page_preview,
                                  disable_notification, protect_content, reply_to_message_id,
                                  allow_sending_without_reply, reply_markup))
@@ -516,7 +688,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.forward_message(self.__api_url, self.__proxies, chat_id, from_chat_id, message_id,
+            methods.forward_message(self.__api_url, self.__session, chat_id, from_chat_id, message_id,
                                     disable_notification, protect_content))
 
     def copy_message(self, chat_id, from_chat_id, message_id, caption=None, parse_mode=None, caption_entities=None,
@@ -539,7 +711,7 @@ class Bot:
         :rtype: types.MessageId
         """
         return types.MessageId.de_json(
-            methods.copy_message(self.__api_url, self.__proxies, chat_id, from_chat_id, message_id, caption,
+            methods.copy_message(self.__api_url, self.__session, chat_id, from_chat_id, message_id, caption,
                                  parse_mode, caption_entities, disable_notification, protect_content,
                                  reply_to_message_id, allow_sending_without_reply, reply_markup))
 
@@ -563,7 +735,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_photo(self.__api_url, self.__proxies, chat_id, photo, caption, parse_mode, caption_entities,
+            methods.send_photo(self.__api_url, self.__session, chat_id, photo, caption, parse_mode, caption_entities,
                                disable_notification, protect_content, reply_to_message_id, allow_sending_without_reply,
                                reply_markup))
 
@@ -590,7 +762,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_audio(self.__api_url, self.__proxies, chat_id, audio, caption, parse_mode, caption_entities,
+            methods.send_audio(self.__api_url, self.__session, chat_id, audio, caption, parse_mode, caption_entities,
                                duration, performer, title, thumb, disable_notification, protect_content,
                                reply_to_message_id, allow_sending_without_reply, reply_markup))
 
@@ -615,7 +787,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_document(self.__api_url, self.__proxies, chat_id, document, thumb, caption, parse_mode,
+            methods.send_document(self.__api_url, self.__session, chat_id, document, thumb, caption, parse_mode,
                                   caption_entities, disable_content_type_detection, disable_notification,
                                   protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
 
@@ -644,7 +816,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_video(self.__api_url, self.__proxies, chat_id, video, duration, width, height, thumb,
+            methods.send_video(self.__api_url, self.__session, chat_id, video, duration, width, height, thumb,
                                caption, parse_mode, caption_entities, supports_streaming, disable_notification,
                                protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
 
@@ -671,7 +843,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_animation(self.__api_url, self.__proxies, chat_id, animation, duration, width, height, thumb,
+            methods.send_animation(self.__api_url, self.__session, chat_id, animation, duration, width, height, thumb,
                                    caption, parse_mode, caption_entities, disable_notification, protect_content,
                                    reply_to_message_id, allow_sending_without_reply, reply_markup))
 
@@ -695,7 +867,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_voice(self.__api_url, self.__proxies, chat_id, voice, caption, parse_mode, caption_entities,
+            methods.send_voice(self.__api_url, self.__session, chat_id, voice, caption, parse_mode, caption_entities,
                                duration, disable_notification, protect_content, reply_to_message_id,
                                allow_sending_without_reply, reply_markup))
 
@@ -718,7 +890,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_video_note(self.__api_url, self.__proxies, chat_id, video_note, duration, length, thumb,
+            methods.send_video_note(self.__api_url, self.__session, chat_id, video_note, duration, length, thumb,
                                     disable_notification, protect_content, reply_to_message_id,
                                     allow_sending_without_reply, reply_markup))
 
@@ -736,7 +908,7 @@ class Bot:
         :return: On success, an array of Messages that were sent is returned
         :rtype: list[types.Message]
         """
-        resp = methods.send_media_group(self.__api_url, self.__proxies, chat_id, media, disable_notification,
+        resp = methods.send_media_group(self.__api_url, self.__session, chat_id, media, disable_notification,
                                         protect_content, reply_to_message_id, allow_sending_without_reply)
         result = []
         for x in resp:
@@ -764,7 +936,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_location(self.__api_url, self.__proxies, chat_id, latitude, longitude, horizontal_accuracy,
+            methods.send_location(self.__api_url, self.__session, chat_id, latitude, longitude, horizontal_accuracy,
                                   live_period, heading, proximity_alert_radius, disable_notification, protect_content,
                                   reply_to_message_id, allow_sending_without_reply, reply_markup))
 
@@ -785,7 +957,7 @@ class Bot:
         :return: a Message object, otherwise True
         :rtype: types.Message or bool
         """
-        result = methods.edit_message_live_location(self.__api_url, self.__proxies, latitude, longitude,
+        result = methods.edit_message_live_location(self.__api_url, self.__session, latitude, longitude,
                                                     horizontal_accuracy, heading, proximity_alert_radius, chat_id,
                                                     message_id, inline_message_id, reply_markup)
         if type(result) is bool:
@@ -802,7 +974,7 @@ class Bot:
         :return: a Message object, otherwise True
         :rtype: types.Message or bool
         """
-        result = methods.stop_message_live_location(self.__api_url, self.__proxies, chat_id, message_id,
+        result = methods.stop_message_live_location(self.__api_url, self.__session, chat_id, message_id,
                                                     inline_message_id, reply_markup)
         if type(result) is bool:
             return result
@@ -830,7 +1002,7 @@ class Bot:
         :return: a Message object
         :rtype: types.Message
         """
-        return types.Message.de_json(methods.send_venue(self.__api_url, self.__proxies, chat_id, latitude, longitude,
+        return types.Message.de_json(methods.send_venue(self.__api_url, self.__session, chat_id, latitude, longitude,
                                                         title, address, foursquare_id, foursquare_type,
                                                         google_place_id, google_place_type, disable_notification,
                                                         protect_content, reply_to_message_id,
@@ -855,7 +1027,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_contact(self.__api_url, self.__proxies, chat_id, phone_number, first_name, last_name, vcard,
+            methods.send_contact(self.__api_url, self.__session, chat_id, phone_number, first_name, last_name, vcard,
                                  disable_notification, protect_content, reply_to_message_id,
                                  allow_sending_without_reply, reply_markup))
 
@@ -895,7 +1067,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_poll(self.__api_url, self.__proxies, chat_id, question, options, is_anonymous, ttype,
+            methods.send_poll(self.__api_url, self.__session, chat_id, question, options, is_anonymous, ttype,
                               allows_multiple_answers, correct_option_id, explanation, explanation_parse_mode,
                               explanation_entities,
                               open_period, close_date, is_closed, disable_notifications, protect_content,
@@ -919,7 +1091,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_dice(self.__api_url, self.__proxies, chat_id, emoji, disable_notification, protect_content,
+            methods.send_dice(self.__api_url, self.__session, chat_id, emoji, disable_notification, protect_content,
                               reply_to_message_id, allow_sending_without_reply, reply_markup))
 
     def send_chat_action(self, chat_id, action):
@@ -934,7 +1106,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.send_chat_action(self.__api_url, self.__proxies, chat_id, action)
+        return methods.send_chat_action(self.__api_url, self.__session, chat_id, action)
 
     def get_user_profile_photos(self, user_id, offset=None, limit=100):
         """
@@ -948,7 +1120,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.UserProfilePhotos.de_json(
-            methods.get_user_profile_photos(self.__api_url, self.__proxies, user_id, offset, limit))
+            methods.get_user_profile_photos(self.__api_url, self.__session, user_id, offset, limit))
 
     def get_file(self, file_id):
         """
@@ -957,7 +1129,78 @@ class Bot:
         :return: a File object
         :rtype: types.File
         """
-        return types.File.de_json(methods.get_file(self.__api_url, self.__proxies, file_id))
+        cache = self.__file_cache
+        if cache is not None:
+            file = cache.get(file_id)
+            if file is not None:
+                return file
+        file = types.File.de_json(methods.get_file(self.__api_url, self.__session, file_id))
+        if cache is not None:
+            cache.set(file_id, file)
+            cache.set(file.file_unique_id, file)
+        return file
+
+    def download_file(self, file, destination, resume=False, chunk_size=65536):
+        """
+        Use this method to download a file, it is streamed in chunks to a path, a file object or a memoryview,
+        The files of a local Bot API server running with --local are copied from its disk
+        :param types.File or types.PhotoSize or types.Document or str file: a File returned by get_file, any object
+                                                                            with a file_id, or a file_id
+        :param str or BinaryIO or memoryview destination: where the file is written
+        :param bool resume: Pass True to continue a partial download of destination with an HTTP Range request
+        :param int chunk_size: the size of the chunks read from the connection
+        :return: the size of the file
+        :rtype: int
+        """
+        cache = self.__file_cache
+        if not isinstance(file, str) and getattr(file, 'file_path', None) is None:
+            file = (cache.get(file.file_unique_id) if cache is not None else None) or file.file_id
+        if isinstance(file, str):
+            file = Bot.get_file(self, file)
+        try:
+            return utils.download_file(self.__session, self.__api_url, file.file_path, destination, resume,
+                                       chunk_size)
+        except utils.TelegramAPIError as e:
+            if e.error_code != 404 or cache is None or cache.pop(file.file_id) is None:
+                raise
+        # the cached file_path expired before the cache entry
+        cache.pop(file.file_unique_id)
+        file = Bot.get_file(self, file.file_id)
+        return utils.download_file(self.__session, self.__api_url, file.file_path, destination, resume, chunk_size)
+
+    def download_files(self, downloads, max_workers=4, resume=False):
+        """
+        Use this method to download several files in parallel
+        :param list[tuple] downloads: pairs of a file and its destination, as accepted by download_file
+        :param int max_workers: maximum number of files downloaded at the same time
+        :param bool resume: Pass True to continue partial downloads
+        :return: the size of each file, in the order of downloads
+        :rtype: list[int]
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(lambda download: Bot.download_file(self, *download, resume=resume), downloads))
+
+    def broadcast(self, chat_ids, method='send_message', checkpoint=None, rate=30, max_workers=16, **params):
+        """
+        Use this method to send the same message to many chats, at rate messages per second from max_workers threads,
+        The chats done are appended to checkpoint, a broadcast that stopped resumes where it was when run again,
+        The sends are not retried by the retry_policy of the bot, a 429 pauses every worker and migrations are reported
+        :param Iterable chat_ids: Unique identifiers of the target chats
+        :param str method: the method sending the message, like send_message, send_photo or copy_message
+        :param str or None checkpoint: the file recording the chats done, default None keeps no record
+        :param float rate: messages per second, default 30, the Telegram limit of a bot
+        :param int max_workers: number of messages in flight at once
+        :param params: the other parameters of method, like text for send_message
+        :return: the number of chats of each status, the chats that blocked the bot, were deactivated or failed
+        :rtype: utils.BroadcastReport
+        """
+        # a 429 pauses every worker and a migration is reported, so the session of the sends does not retry them
+        bot = copy.copy(self)
+        bot.__session = copy.copy(self.__session)
+        bot.__session.retry_policy = None
+        send = getattr(Bot, method)
+        return utils.Broadcast(lambda chat_id: send(bot, chat_id=chat_id, **params), chat_ids, checkpoint, rate,
+                               max_workers).run()
 
     def ban_chat_member(self, chat_id, user_id, until_date=None, revoke_messages=False):
         """
@@ -971,7 +1214,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.ban_chat_member(self.__api_url, self.__proxies, chat_id, user_id, until_date, revoke_messages)
+        return methods.ban_chat_member(self.__api_url, self.__session, chat_id, user_id, until_date, revoke_messages)
 
     def unban_chat_member(self, chat_id, user_id, only_if_banned=False):
         """
@@ -982,7 +1225,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.unban_chat_member(self.__api_url, self.__proxies, chat_id, user_id, only_if_banned)
+        return methods.unban_chat_member(self.__api_url, self.__session, chat_id, user_id, only_if_banned)
 
     def restrict_chat_member(self, chat_id, user_id, permissions, until_date=None):
         """
@@ -994,7 +1237,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.restrict_chat_member(self.__api_url, self.__proxies, chat_id, user_id, permissions, until_date)
+        return methods.restrict_chat_member(self.__api_url, self.__session, chat_id, user_id, permissions, until_date)
 
     def promote_chat_member(self, chat_id, user_id, is_anonymous=False, can_manage_chat=False, can_change_info=False,
                             can_post_messages=False, can_edit_messages=False, can_delete_messages=False,
@@ -1023,7 +1266,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.promote_chat_member(self.__api_url, self.__proxies, chat_id, user_id, is_anonymous,
+        return methods.promote_chat_member(self.__api_url, self.__session, chat_id, user_id, is_anonymous,
                                            can_manage_chat, can_change_info, can_post_messages, can_edit_messages,
                                            can_delete_messages, can_manage_video_chats, can_invite_users,
                                            can_restrict_members, can_pin_messages, can_promote_members)
@@ -1037,7 +1280,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_chat_administrator_custom_title(self.__api_url, self.__proxies, chat_id, user_id,
+        return methods.set_chat_administrator_custom_title(self.__api_url, self.__session, chat_id, user_id,
                                                            custom_title)
 
     def ban_chat_sender_chat(self, chat_id, sender_chat_id):
@@ -1052,7 +1295,7 @@ class Bot:
         :return: Returns True on success
         :rtype: bool
         """
-        return methods.ban_chat_sender_chat(self.__api_url, self.__proxies, chat_id, sender_chat_id)
+        return methods.ban_chat_sender_chat(self.__api_url, self.__session, chat_id, sender_chat_id)
 
     def unban_chat_sender_chat(self, chat_id, sender_chat_id):
         """
@@ -1064,7 +1307,7 @@ class Bot:
         :return: Returns True on success
         :rtype: bool
         """
-        return methods.unban_chat_sender_chat(self.__api_url, self.__proxies, chat_id, sender_chat_id)
+        return methods.unban_chat_sender_chat(self.__api_url, self.__session, chat_id, sender_chat_id)
 
     def set_chat_permissions(self, chat_id, permissions):
         """
@@ -1074,7 +1317,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_chat_permissions(self.__api_url, self.__proxies, chat_id, permissions)
+        return methods.set_chat_permissions(self.__api_url, self.__session, chat_id, permissions)
 
     def export_chat_invite_link(self, chat_id):
         """
@@ -1083,7 +1326,7 @@ class Bot:
         :return: new link as String on success
         :rtype: str
         """
-        return methods.export_chat_invite_link(self.__api_url, self.__proxies, chat_id)
+        return methods.export_chat_invite_link(self.__api_url, self.__session, chat_id)
 
     def create_chat_invite_link(self, chat_id, name=None, expire_date=None, member_limit=None,
                                 creates_join_request=False):
@@ -1099,7 +1342,7 @@ class Bot:
         :return: Returns the new invite link as ChatInviteLink object
         :rtype: types.ChatInviteLink
         """
-        return types.ChatInviteLink.de_json(methods.create_chat_invite_link(self.__api_url, self.__proxies, chat_id,
+        return types.ChatInviteLink.de_json(methods.create_chat_invite_link(self.__api_url, self.__session, chat_id,
                                                                             name, expire_date, member_limit,
                                                                             creates_join_request))
 
@@ -1118,7 +1361,7 @@ class Bot:
         :return: Returns the new invite link as ChatInviteLink object
         :rtype: types.ChatInviteLink
         """
-        return types.ChatInviteLink.de_json(methods.edit_chat_invite_link(self.__api_url, self.__proxies, chat_id,
+        return types.ChatInviteLink.de_json(methods.edit_chat_invite_link(self.__api_url, self.__session, chat_id,
                                                                           invite_link, name, expire_date, member_limit,
                                                                           creates_join_request))
 
@@ -1130,7 +1373,7 @@ class Bot:
         :return: Returns the revoked invite link as ChatInviteLink object
         :rtype: types.ChatInviteLink
         """
-        return types.ChatInviteLink.de_json(methods.revoke_chat_invite_link(self.__api_url, self.__proxies, chat_id,
+        return types.ChatInviteLink.de_json(methods.revoke_chat_invite_link(self.__api_url, self.__session, chat_id,
                                                                             invite_link))
 
     def approve_chat_join_request(self, chat_id, user_id):
@@ -1144,7 +1387,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        return methods.approve_chat_join_request(self.__api_url, self.__proxies, chat_id, user_id)
+        return methods.approve_chat_join_request(self.__api_url, self.__session, chat_id, user_id)
 
     def decline_chat_join_request(self, chat_id, user_id):
         """
@@ -1157,7 +1400,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        return methods.decline_chat_join_request(self.__api_url, self.__proxies, chat_id, user_id)
+        return methods.decline_chat_join_request(self.__api_url, self.__session, chat_id, user_id)
 
     def set_chat_photo(self, chat_id, photo):
         """
@@ -1167,7 +1410,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_chat_photo(self.__api_url, self.__proxies, chat_id, photo)
+        return methods.set_chat_photo(self.__api_url, self.__session, chat_id, photo)
 
     def delete_chat_photo(self, chat_id):
         """
@@ -1176,7 +1419,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.delete_chat_photo(self.__api_url, self.__proxies, chat_id)
+        return methods.delete_chat_photo(self.__api_url, self.__session, chat_id)
 
     def set_chat_title(self, chat_id, title):
         """
@@ -1186,7 +1429,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_chat_title(self.__api_url, self.__proxies, chat_id, title)
+        return methods.set_chat_title(self.__api_url, self.__session, chat_id, title)
 
     def set_chat_description(self, chat_id, description):
         """
@@ -1196,7 +1439,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_chat_description(self.__api_url, self.__proxies, chat_id, description)
+        return methods.set_chat_description(self.__api_url, self.__session, chat_id, description)
 
     def pin_chat_message(self, chat_id, message_id, disable_notification=False):
         """
@@ -1207,7 +1450,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.pin_chat_message(self.__api_url, self.__proxies, chat_id, message_id, disable_notification)
+        return methods.pin_chat_message(self.__api_url, self.__session, chat_id, message_id, disable_notification)
 
     def unpin_chat_message(self, chat_id, message_id=None):
         """
@@ -1218,7 +1461,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.unpin_chat_message(self.__api_url, self.__proxies, chat_id, message_id)
+        return methods.unpin_chat_message(self.__api_url, self.__session, chat_id, message_id)
 
     def unpin_all_chat_message(self, chat_id):
         """
@@ -1227,7 +1470,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.unpin_all_chat_message(self.__api_url, self.__proxies, chat_id)
+        return methods.unpin_all_chat_message(self.__api_url, self.__session, chat_id)
 
     def leave_chat(self, chat_id):
         """
@@ -1236,7 +1479,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.leave_chat(self.__api_url, self.__proxies, chat_id)
+        return methods.leave_chat(self.__api_url, self.__session, chat_id)
 
     def get_chat(self, chat_id):
         """
@@ -1245,7 +1488,14 @@ class Bot:
         :return: a Chat object
         :rtype: types.Chat
         """
-        return types.Chat.de_json(methods.get_chat(self.__api_url, self.__proxies, chat_id))
+        cache = self.__chat_cache
+        key = cache.key(chat_id) if cache is not None else None
+        chat = cache.chats.get(key) if key is not None else None
+        if chat is None:
+            chat = types.Chat.de_json(methods.get_chat(self.__api_url, self.__session, chat_id))
+            if key is not None:
+                cache.chats.set(key, chat)
+        return chat
 
     def get_chat_administrators(self, chat_id):
         """
@@ -1254,12 +1504,18 @@ class Bot:
         :return: an Array of ChatMember object
         :rtype: list[types.ChatMember]
         """
-        result = methods.get_chat_administrators(
-            self.__api_url, self.__proxies, chat_id)
-        ret = []
-        for r in result:
-            ret.append(types.ChatMember.de_json(r))
-        return ret
+        cache = self.__chat_cache
+        key = cache.key(chat_id) if cache is not None else None
+        ret = cache.admins.get(key) if key is not None else None
+        if ret is None:
+            result = methods.get_chat_administrators(
+                self.__api_url, self.__session, chat_id)
+            ret = []
+            for r in result:
+                ret.append(types.ChatMember.de_json(r))
+            if key is not None:
+                cache.admins.set(key, ret)
+        return list(ret)
 
     def get_chat_member_count(self, chat_id):
         """
@@ -1268,7 +1524,7 @@ class Bot:
         :return: Integer On success
         :rtype: int
         """
-        return methods.get_chat_member_count(self.__api_url, self.__proxies, chat_id)
+        return methods.get_chat_member_count(self.__api_url, self.__session, chat_id)
 
     def get_chat_member(self, chat_id, user_id):
         """
@@ -1278,7 +1534,14 @@ class Bot:
         :return: a ChatMember object On success
         :rtype: types.ChatMember
         """
-        return types.ChatMember.de_json(methods.get_chat_member(self.__api_url, self.__proxies, chat_id, user_id))
+        cache = self.__chat_cache
+        key = cache.key(chat_id) if cache is not None else None
+        member = cache.members.get((key, user_id)) if key is not None else None
+        if member is None:
+            member = types.ChatMember.de_json(methods.get_chat_member(self.__api_url, self.__session, chat_id, user_id))
+            if key is not None:
+                cache.members.set((key, user_id), member)
+        return member
 
     def set_chat_sticker_set(self, chat_id, sticker_set_name):
         """
@@ -1288,7 +1551,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_chat_sticker_set(self.__api_url, self.__proxies, chat_id, sticker_set_name)
+        return methods.set_chat_sticker_set(self.__api_url, self.__session, chat_id, sticker_set_name)
 
     def delete_chat_sticker_set(self, chat_id):
         """
@@ -1297,7 +1560,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.delete_chat_sticker_set(self.__api_url, self.__proxies, chat_id)
+        return methods.delete_chat_sticker_set(self.__api_url, self.__session, chat_id)
 
     def answer_callback_query(self, callback_query_id, text=None, show_alert=False, url=None, cache_time=None):
         """
@@ -1313,7 +1576,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.answer_callback_query(self.__api_url, self.__proxies, callback_query_id, text, show_alert, url,
+        return methods.answer_callback_query(self.__api_url, self.__session, callback_query_id, text, show_alert, url,
                                              cache_time)
 
     def set_my_commands(self, commands, scope=None, language_code=None):
@@ -1329,7 +1592,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_my_commands(self.__api_url, self.__proxies, commands, scope, language_code)
+        return methods.set_my_commands(self.__api_url, self.__session, commands, scope, language_code)
 
     def delete_my_commands(self, scope=None, language_code=None):
         """
@@ -1341,7 +1604,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        return methods.delete_my_commands(self.__api_url, self.__proxies, scope, language_code)
+        return methods.delete_my_commands(self.__api_url, self.__session, scope, language_code)
 
     def get_my_commands(self, scope=None, language_code=None):
         """
@@ -1352,7 +1615,7 @@ class Bot:
         :return: Array of BotCommand On success
         :rtype: list[tgbotapi.types.BotCommand]
         """
-        resp = methods.get_my_commands(self.__api_url, self.__proxies, scope, language_code)
+        resp = methods.get_my_commands(self.__api_url, self.__session, scope, language_code)
         result = []
         for x in resp:
             result.append(types.BotCommand.de_json(x))
@@ -1368,7 +1631,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        data = methods.set_chat_menu_button(self.__api_url, self.__proxies, chat_id, menu_button)
+        data = methods.set_chat_menu_button(self.__api_url, self.__session, chat_id, menu_button)
         return data
 
     def get_chat_menu_button(self, chat_id=None):
@@ -1380,7 +1643,7 @@ class Bot:
         :return: MenuButton on success
         :rtype: types.MenuButton
         """
-        data = methods.get_chat_menu_button(self.__api_url, self.__proxies, chat_id)
+        data = methods.get_chat_menu_button(self.__api_url, self.__session, chat_id)
         return types.MenuButton.de_json(data)
 
     def set_my_default_administrator_rights(self, rights=None, for_channel=False):
@@ -1397,7 +1660,7 @@ class Bot:
         :return: True on success
         :rtype: bool
         """
-        data = methods.set_my_default_administrator_rights(self.__api_url, self.__proxies, rights, for_channel)
+        data = methods.set_my_default_administrator_rights(self.__api_url, self.__session, rights, for_channel)
         return data
 
     def get_my_default_administrator_rights(self, for_channel=False):
@@ -1410,7 +1673,7 @@ class Bot:
         :return: ChatAdministratorRights on success
         :rtype: types.ChatAdministratorRights
         """
-        data = methods.get_my_default_administrator_rights(self.__api_url, self.__proxies, for_channel)
+        data = methods.get_my_default_administrator_rights(self.__api_url, self.__session, for_channel)
         return types.ChatAdministratorRights.de_json(data)
 
     def edit_message_text(self, text, chat_id=None, message_id=None, inline_message_id=None, parse_mode=None,
@@ -1428,7 +1691,7 @@ class Bot:
         :return: a Message object On success, otherwise True
         :rtype: types.Message or bool
         """
-        result = methods.edit_message_text(self.__api_url, self.__proxies, text, chat_id, message_id,
+        result = methods.edit_message_text(self.__api_url, self.__session, text, chat_id, message_id,
                                            inline_message_id, parse_mode, entities, disable_web_page_preview,
                                            reply_markup)
         if type(result) is bool:
@@ -1450,7 +1713,7 @@ class Bot:
         :return: a Message object On success, otherwise True
         :rtype: types.Message or bool
         """
-        result = methods.edit_message_caption(self.__api_url, self.__proxies, chat_id, message_id,
+        result = methods.edit_message_caption(self.__api_url, self.__session, chat_id, message_id,
                                               inline_message_id,
                                               caption, parse_mode,
                                               caption_entities,
@@ -1471,7 +1734,7 @@ class Bot:
         :rtype: types.Message or bool
         """
         result = methods.edit_message_media(
-            self.__api_url, self.__proxies, media, chat_id, message_id, inline_message_id, reply_markup)
+            self.__api_url, self.__session, media, chat_id, message_id, inline_message_id, reply_markup)
         if type(result) is bool:
             return result
         return types.Message.de_json(result)
@@ -1487,7 +1750,7 @@ class Bot:
         :rtype: types.Message or bool
         """
         result = methods.edit_message_reply_markup(
-            self.__api_url, self.__proxies, chat_id, message_id, inline_message_id, reply_markup)
+            self.__api_url, self.__session, chat_id, message_id, inline_message_id, reply_markup)
         if type(result) is bool:
             return result
         return types.Message.de_json(result)
@@ -1501,7 +1764,7 @@ class Bot:
         :return: a Poll object On success
         :rtype: types.Poll
         """
-        return types.Poll.de_json(methods.stop_poll(self.__api_url, self.__proxies, chat_id, message_id,
+        return types.Poll.de_json(methods.stop_poll(self.__api_url, self.__session, chat_id, message_id,
                                                     reply_markup))
 
     def delete_message(self, chat_id, message_id):
@@ -1519,7 +1782,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.delete_message(self.__api_url, self.__proxies, chat_id, message_id)
+        return methods.delete_message(self.__api_url, self.__session, chat_id, message_id)
 
     def send_sticker(self, chat_id, sticker, disable_notification=False, protect_content=False,
                      reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
@@ -1536,7 +1799,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_sticker(self.__api_url, self.__proxies, chat_id, sticker, disable_notification,
+            methods.send_sticker(self.__api_url, self.__session, chat_id, sticker, disable_notification,
                                  protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
 
     def get_sticker_set(self, name):
@@ -1546,7 +1809,7 @@ class Bot:
         :return: a StickerSet object On success
         :rtype: types.StickerSet
         """
-        return types.StickerSet.de_json(methods.get_sticker_set(self.__api_url, self.__proxies, name))
+        return types.StickerSet.de_json(methods.get_sticker_set(self.__api_url, self.__session, name))
 
     def upload_sticker_file(self, user_id, png_sticker):
         """
@@ -1556,7 +1819,7 @@ class Bot:
         :return: a File object On success
         :rtype: types.File
         """
-        return types.File.de_json(methods.upload_sticker_file(self.__api_url, self.__proxies, user_id, png_sticker))
+        return types.File.de_json(methods.upload_sticker_file(self.__api_url, self.__session, user_id, png_sticker))
 
     def create_new_sticker_set(self, user_id, name, title, emojis=None, png_sticker=None, tgs_sticker=None,
                                webm_sticker=None, contains_masks=False, mask_position=None):
@@ -1577,7 +1840,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.create_new_sticker_set(self.__api_url, self.__proxies, user_id, name, title, png_sticker,
+        return methods.create_new_sticker_set(self.__api_url, self.__session, user_id, name, title, png_sticker,
                                               tgs_sticker, webm_sticker, emojis, contains_masks, mask_position)
 
     def add_sticker_to_set(self, user_id, name, emojis, png_sticker=None, tgs_sticker=None, webm_sticker=None,
@@ -1597,7 +1860,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.add_sticker_to_set(self.__api_url, self.__proxies, user_id, name, png_sticker, tgs_sticker,
+        return methods.add_sticker_to_set(self.__api_url, self.__session, user_id, name, png_sticker, tgs_sticker,
                                           webm_sticker, emojis, mask_position)
 
     def set_sticker_position_in_set(self, sticker, position):
@@ -1608,7 +1871,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_sticker_position_in_set(self.__api_url, self.__proxies, sticker, position)
+        return methods.set_sticker_position_in_set(self.__api_url, self.__session, sticker, position)
 
     def delete_sticker_from_set(self, sticker):
         """
@@ -1617,7 +1880,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.delete_sticker_from_set(self.__api_url, self.__proxies, sticker)
+        return methods.delete_sticker_from_set(self.__api_url, self.__session, sticker)
 
     def set_sticker_set_thumb(self, name, user_id, thumb=None):
         """
@@ -1628,7 +1891,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_sticker_set_thumb(self.__api_url, self.__proxies, name, user_id, thumb)
+        return methods.set_sticker_set_thumb(self.__api_url, self.__session, name, user_id, thumb)
 
     def answer_inline_query(self, inline_query_id, results, cache_time=300, is_personal=False, next_offset=None,
                             switch_pm_text=None, switch_pm_parameter=None):
@@ -1644,7 +1907,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.answer_inline_query(self.__api_url, self.__proxies, inline_query_id, results, cache_time,
+        return methods.answer_inline_query(self.__api_url, self.__session, inline_query_id, results, cache_time,
                                            is_personal, next_offset,
                                            switch_pm_text, switch_pm_parameter)
 
@@ -1656,7 +1919,7 @@ class Bot:
         :param str web_app_query_id: Unique identifier for the query
         :param types.InlineQueryResult result: The result of the query
         """
-        data = methods.answer_web_app_query(self.__based_url, self.__proxies, web_app_query_id, result)
+        data = methods.answer_web_app_query(self.__api_url, self.__session, web_app_query_id, result)
         return types.SentWebAppMessage.de_json(data)
 
     def send_invoice(self, chat_id, title, description, payload, provider_token, currency, prices, max_tip_amount=None,
@@ -1700,7 +1963,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_invoice(self.__api_url, self.__proxies, chat_id, title, description, payload, provider_token,
+            methods.send_invoice(self.__api_url, self.__session, chat_id, title, description, payload, provider_token,
                                  currency, prices, max_tip_amount, suggested_tip_amounts, start_parameter,
                                  provider_data, photo_url, photo_size, photo_width, photo_height, need_name,
                                  need_phone_number, need_email, need_shipping_address, send_phone_number_to_provider,
@@ -1720,7 +1983,7 @@ class Bot:
         :return: True, On success
         :rtype: bool
         """
-        return methods.answer_shipping_query(self.__api_url, self.__proxies, shipping_query_id, ok, shipping_options,
+        return methods.answer_shipping_query(self.__api_url, self.__session, shipping_query_id, ok, shipping_options,
                                              error_message)
 
     def answer_pre_checkout_query(self, pre_checkout_query_id, ok, error_message=None):
@@ -1732,7 +1995,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.answer_pre_checkout_query(self.__api_url, self.__proxies, pre_checkout_query_id, ok,
+        return methods.answer_pre_checkout_query(self.__api_url, self.__session, pre_checkout_query_id, ok,
                                                  error_message)
 
     def set_passport_data_errors(self, user_id, errors):
@@ -1744,7 +2007,7 @@ class Bot:
         :return: True On success
         :rtype: bool
         """
-        return methods.set_passport_data_errors(self.__api_url, self.__proxies, user_id, errors)
+        return methods.set_passport_data_errors(self.__api_url, self.__session, user_id, errors)
 
     def send_game(self, chat_id, game_short_name, disable_notification=False, protect_content=False,
                   reply_to_message_id=None, allow_sending_without_reply=False, reply_markup=None):
@@ -1761,7 +2024,7 @@ class Bot:
         :rtype: types.Message
         """
         return types.Message.de_json(
-            methods.send_game(self.__api_url, self.__proxies, chat_id, game_short_name, disable_notification,
+            methods.send_game(self.__api_url, self.__session, chat_id, game_short_name, disable_notification,
                               protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup))
 
     def set_game_score(self, user_id, score, force=False, disable_edit_message=False, chat_id=None, message_id=None,
@@ -1778,7 +2041,7 @@ class Bot:
         :return: On success a Message object, otherwise returns True
         :rtype: types.Message or bool
         """
-        result = methods.set_game_score(self.__api_url, self.__proxies, user_id, score, force, disable_edit_message,
+        result = methods.set_game_score(self.__api_url, self.__session, user_id, score, force, disable_edit_message,
                                         chat_id, message_id,
                                         inline_message_id)
         if type(result) is bool:
@@ -1795,7 +2058,7 @@ class Bot:
         :return: an Array of GameHighScore objects
         :rtype: list[types.GameHighScore]
         """
-        resp = methods.get_game_high_scores(self.__api_url, self.__proxies, user_id, chat_id, message_id,
+        resp = methods.get_game_high_scores(self.__api_url, self.__session, user_id, chat_id, message_id,
                                             inline_message_id)
         result = []
         for x in resp:
@@ -13,11 +13,11 @@ The names of the methods changed to be more Pythonic.
 from .utils import make_request
 
 
-def get_updates(based_url, proxies, offset, limit, timeout, allowed_updates):
+def get_updates(based_url, session, offset, limit, timeout, allowed_updates):
     """
     Use this method to receive incoming updates using long polling
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type offset: int or None
     :type limit: int or None
     :type timeout: int or None
@@ -37,15 +37,15 @@ def get_updates(based_url, proxies, offset, limit, timeout, allowed_updates):
         params['timeout'] = timeout
     if allowed_updates:
         params['allowed_updates'] = allowed_updates
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_webhook(based_url, proxies, url, certificate, ip_address, max_connections, allowed_updates,
+def set_webhook(based_url, session, url, certificate, ip_address, max_connections, allowed_updates,
                 drop_pending_updates):
     """
     Use this method to specify an url and receive incoming updates via an outgoing webhook
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type url: str
     :type certificate: BinaryIO or None
     :type ip_address: str or None
@@ -69,14 +69,14 @@ def set_webhook(based_url, proxies, url, certificate, ip_address, max_connection
         params['allowed_updates'] = allowed_updates
     if drop_pending_updates:
         params['drop_pending_updates'] = drop_pending_updates
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def delete_webhook(based_url, proxies, drop_pending_updates):
+def delete_webhook(based_url, session, drop_pending_updates):
     """
     Use this method to remove webhook integration if you decide to switch back to getUpdates
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type drop_pending_updates: bool
     :rtype: dict
     """
@@ -87,14 +87,14 @@ def delete_webhook(based_url, proxies, drop_pending_updates):
     params = {}
     if drop_pending_updates:
         params['drop_pending_updates'] = drop_pending_updates
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_webhook_info(based_url, proxies):
+def get_webhook_info(based_url, session):
     """
     Use this method to get current webhook status
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :rtype: dict
     """
     method = r'get'
@@ -102,14 +102,14 @@ def get_webhook_info(based_url, proxies):
     api_url = based_url + '/' + api_method
     files = None
     params = None
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_me(based_url, proxies):
+def get_me(based_url, session):
     """
     A simple method for testing your bots auth token
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :rtype: dict
     """
     method = r'get'
@@ -117,14 +117,14 @@ def get_me(based_url, proxies):
     api_url = based_url + '/' + api_method
     files = None
     params = None
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def log_out(based_url, proxies):
+def log_out(based_url, session):
     """
     Use this method to log out from the cloud Bot API server before launching the bot locally
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :rtype: dict
     """
     method = r'post'
@@ -132,14 +132,14 @@ def log_out(based_url, proxies):
     api_url = based_url + '/' + api_method
     files = None
     params = None
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def close(based_url, proxies):
+def close(based_url, session):
     """
     Use this method to close the bot instance before moving it from one local server to another
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :rtype: dict
     """
     method = r'post'
@@ -147,15 +147,15 @@ def close(based_url, proxies):
     api_url = based_url + '/' + api_method
     files = None
     params = None
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_message(based_url, proxies, chat_id, text, parse_mode, entities, disable_web_page_preview,
+def send_message(based_url, session, chat_id, text, parse_mode, entities, disable_web_page_preview,
                  disable_notification, protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup):
     """
     Use this method to send text messages. On success, send Message is returned
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type text: str
     :type parse_mode: str or None
@@ -189,14 +189,14 @@ def send_message(based_url, proxies, chat_id, text, parse_mode, entities, disabl
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def forward_message(based_url, proxies, chat_id, from_chat_id, message_id, disable_notification, protect_content):
+def forward_message(based_url, session, chat_id, from_chat_id, message_id, disable_notification, protect_content):
     """
     Use this method to forward messages of any kind
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type from_chat_id: int or str
     :type disable_notification: bool
@@ -213,15 +213,15 @@ def forward_message(based_url, proxies, chat_id, from_chat_id, message_id, disab
         params['disable_notification'] = disable_notification
     if protect_content:
         params['protect_content'] = protect_content
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def copy_message(based_url, proxies, chat_id, from_chat_id, message_id, caption, parse_mode, caption_entities,
+def copy_message(based_url, session, chat_id, from_chat_id, message_id, caption, parse_mode, caption_entities,
                  disable_notification, protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup):
     """ 
     Use this method to copy messages of any kind
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type from_chat_id: int or str
     :type message_id: int
@@ -257,15 +257,15 @@ def copy_message(based_url, proxies, chat_id, from_chat_id, message_id, caption,
     if reply_markup:
         params['reply_markup'] = reply_markup
 
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_photo(based_url, proxies, chat_id, photo, caption, parse_mode, caption_entities, disable_notification,
+def send_photo(based_url, session, chat_id, photo, caption, parse_mode, caption_entities, disable_notification,
                protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup):
     """
     Use this method to send photos
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type photo: BinaryIO or str
     :type caption: str or None
@@ -303,16 +303,16 @@ def send_photo(based_url, proxies, chat_id, photo, caption, parse_mode, caption_
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_audio(based_url, proxies, chat_id, audio, caption, parse_mode, caption_entities, duration, performer, title,
+def send_audio(based_url, session, chat_id, audio, caption, parse_mode, caption_entities, duration, performer, title,
                thumb, disable_notification, protect_content, reply_to_message_id, allow_sending_without_reply,
                reply_markup):
     """
     Use this method to send audio files
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type audio: BinaryIO or str
     :type caption: str or None
@@ -362,16 +362,16 @@ def send_audio(based_url, proxies, chat_id, audio, caption, parse_mode, caption_
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_document(based_url, proxies, chat_id, document, thumb, caption, parse_mode, caption_entities,
+def send_document(based_url, session, chat_id, document, thumb, caption, parse_mode, caption_entities,
                   disable_content_type_detection, disable_notification, protect_content, reply_to_message_id,
                   allow_sending_without_reply, reply_markup):
     """
     Use this method to send general files
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type document: BinaryIO or str
     :type thumb: BinaryIO or None
@@ -415,16 +415,16 @@ def send_document(based_url, proxies, chat_id, document, thumb, caption, parse_m
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_video(based_url, proxies, chat_id, video, duration, width, height, thumb, caption, parse_mode,
+def send_video(based_url, session, chat_id, video, duration, width, height, thumb, caption, parse_mode,
                caption_entities, supports_streaming, disable_notification, protect_content, reply_to_message_id,
                allow_sending_without_reply, reply_markup):
     """
     Use this method to send video files
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type video: BinaryIO or str
     :type duration: int or None
@@ -477,16 +477,16 @@ def send_video(based_url, proxies, chat_id, video, duration, width, height, thum
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_animation(based_url, proxies, chat_id, animation, duration, width, height, thumb, caption, parse_mode,
+def send_animation(based_url, session, chat_id, animation, duration, width, height, thumb, caption, parse_mode,
                    caption_entities, disable_notification, protect_content, reply_to_message_id,
                    allow_sending_without_reply, reply_markup):
     """
     Use this method to send animation files
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type animation: BinaryIO or str
     :type duration: int or None
@@ -536,15 +536,15 @@ def send_animation(based_url, proxies, chat_id, animation, duration, width, heig
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_voice(based_url, proxies, chat_id, voice, caption, parse_mode, caption_entities, duration,
+def send_voice(based_url, session, chat_id, voice, caption, parse_mode, caption_entities, duration,
                disable_notification, protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup):
     """
     Use this method to send audio files
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type voice: BinaryIO or str
     :type caption: str or None
@@ -585,15 +585,15 @@ def send_voice(based_url, proxies, chat_id, voice, caption, parse_mode, caption_
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_video_note(based_url, proxies, chat_id, video_note, duration, length, thumb, disable_notification,
+def send_video_note(based_url, session, chat_id, video_note, duration, length, thumb, disable_notification,
                     protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup):
     """
     Use this method to send video messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type video_note: BinaryIO or str
     :type duration: int or None
@@ -631,15 +631,15 @@ def send_video_note(based_url, proxies, chat_id, video_note, duration, length, t
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_media_group(based_url, proxies, chat_id, media, disable_notification, protect_content, reply_to_message_id,
+def send_media_group(based_url, session, chat_id, media, disable_notification, protect_content, reply_to_message_id,
                      allow_sending_without_reply):
     """
     Use this method to send a group of photos or videos as an album
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type media: list
     :type disable_notification: bool
@@ -665,16 +665,16 @@ def send_media_group(based_url, proxies, chat_id, media, disable_notification, p
         params['reply_to_message_id'] = reply_to_message_id
     if allow_sending_without_reply:
         params['allow_sending_without_reply'] = allow_sending_without_reply
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_location(based_url, proxies, chat_id, latitude, longitude, horizontal_accuracy, live_period, heading,
+def send_location(based_url, session, chat_id, latitude, longitude, horizontal_accuracy, live_period, heading,
                   proximity_alert_radius, disable_notification, protect_content, reply_to_message_id,
                   allow_sending_without_reply, reply_markup):
     """
     Use this method to send point on the map
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type latitude: float
     :type longitude: float
@@ -713,16 +713,16 @@ def send_location(based_url, proxies, chat_id, latitude, longitude, horizontal_a
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def edit_message_live_location(based_url, proxies, latitude, longitude, horizontal_accuracy, heading,
+def edit_message_live_location(based_url, session, latitude, longitude, horizontal_accuracy, heading,
                                proximity_alert_radius, chat_id, message_id, inline_message_id,
                                reply_markup):
     """
     Use this method to edit live location messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type inline_message_id: int or None
@@ -753,14 +753,14 @@ def edit_message_live_location(based_url, proxies, latitude, longitude, horizont
         params['inline_message_id'] = inline_message_id
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def stop_message_live_location(based_url, proxies, chat_id, message_id, inline_message_id, reply_markup):
+def stop_message_live_location(based_url, session, chat_id, message_id, inline_message_id, reply_markup):
     """
     Use this method to stop updating a live location message before live_period expires
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type inline_message_id: int or None
@@ -780,16 +780,16 @@ def stop_message_live_location(based_url, proxies, chat_id, message_id, inline_m
         params['inline_message_id'] = inline_message_id
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_venue(based_url, proxies, chat_id, latitude, longitude, title, address, foursquare_id, foursquare_type,
+def send_venue(based_url, session, chat_id, latitude, longitude, title, address, foursquare_id, foursquare_type,
                google_place_id, google_place_type, disable_notification, protect_content, reply_to_message_id,
                allow_sending_without_reply, reply_markup):
     """
     Use this method to send information about a venue
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type latitude: float
     :type longitude: float
@@ -829,15 +829,15 @@ def send_venue(based_url, proxies, chat_id, latitude, longitude, title, address,
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_contact(based_url, proxies, chat_id, phone_number, first_name, last_name, vcard, disable_notification,
+def send_contact(based_url, session, chat_id, phone_number, first_name, last_name, vcard, disable_notification,
                  protect_content, reply_to_message_id, allow_sending_without_reply, reply_markup):
     """
     Use this method to send phone contacts
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or
     :type phone_number: str
     :type first_name: str
@@ -870,17 +870,17 @@ def send_contact(based_url, proxies, chat_id, phone_number, first_name, last_nam
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_poll(based_url, proxies, chat_id, question, options, is_anonymous, ttype, allows_multiple_answers,
+def send_poll(based_url, session, chat_id, question, options, is_anonymous, ttype, allows_multiple_answers,
               correct_option_id, explanation, explanation_parse_mode, explanation_entities, open_period, close_date,
               is_closed, disable_notifications, protect_content, reply_to_message_id, allow_sending_without_reply,
               reply_markup):
     """
     Use this method to send a native poll
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type question: str
     :type options: list
@@ -936,15 +936,15 @@ def send_poll(based_url, proxies, chat_id, question, options, is_anonymous, ttyp
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_dice(based_url, proxies, chat_id, emoji, disable_notification, protect_content, reply_to_message_id,
+def send_dice(based_url, session, chat_id, emoji, disable_notification, protect_content, reply_to_message_id,
               allow_sending_without_reply, reply_markup):
     """
     Use this method to send a dice
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type emoji: str or None
     :type disable_notification: bool
@@ -969,14 +969,14 @@ def send_dice(based_url, proxies, chat_id, emoji, disable_notification, protect_
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_chat_action(based_url, proxies, chat_id, action):
+def send_chat_action(based_url, session, chat_id, action):
     """
     Use this method when you need to tell the user that something is happening on the bots side
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type action: str
     :rtype: bool
@@ -986,14 +986,14 @@ def send_chat_action(based_url, proxies, chat_id, action):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'action': action}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_user_profile_photos(based_url, proxies, user_id, offset, limit):
+def get_user_profile_photos(based_url, session, user_id, offset, limit):
     """
     Use this method to get a list of profile pictures for a user
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int or str
     :type offset: int or None
     :type limit: int or None
@@ -1008,14 +1008,14 @@ def get_user_profile_photos(based_url, proxies, user_id, offset, limit):
         params['offset'] = offset
     if limit:
         params['limit'] = limit
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_file(based_url, proxies, file_id):
+def get_file(based_url, session, file_id):
     """
     Use this method to get basic info about a file and prepare it for downloading
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type file_id: str
     :rtype: dict
     """
@@ -1024,14 +1024,14 @@ def get_file(based_url, proxies, file_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'file_id': file_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def ban_chat_member(based_url, proxies, chat_id, user_id, until_date, revoke_messages):
+def ban_chat_member(based_url, session, chat_id, user_id, until_date, revoke_messages):
     """
     Use this method to ban a user in a group, a supergroup or a channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id: int
     :type until_date: int or None
@@ -1047,14 +1047,14 @@ def ban_chat_member(based_url, proxies, chat_id, user_id, until_date, revoke_mes
         params['until_date'] = until_date
     if revoke_messages:
         params['revoke_messages'] = revoke_messages
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def unban_chat_member(based_url, proxies, chat_id, user_id, only_if_banned):
+def unban_chat_member(based_url, session, chat_id, user_id, only_if_banned):
     """
     Use this method to unban a previously banned user in a supergroup or channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id: int
     :type only_if_banned: bool
@@ -1067,14 +1067,14 @@ def unban_chat_member(based_url, proxies, chat_id, user_id, only_if_banned):
     params = {'chat_id': chat_id, 'user_id': user_id}
     if only_if_banned:
         params['only_if_banned'] = only_if_banned
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def restrict_chat_member(based_url, proxies, chat_id, user_id, permissions, until_date):
+def restrict_chat_member(based_url, session, chat_id, user_id, permissions, until_date):
     """
     Use this method to restrict a user in a supergroup
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id: int
     :type permissions: dict
@@ -1088,16 +1088,16 @@ def restrict_chat_member(based_url, proxies, chat_id, user_id, permissions, unti
     params = {'chat_id': chat_id, 'user_id': user_id, 'permissions': permissions}
     if until_date:
         params['until_date'] = until_date
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def promote_chat_member(based_url, proxies, chat_id, user_id, is_anonymous, can_manage_chat, can_change_info,
+def promote_chat_member(based_url, session, chat_id, user_id, is_anonymous, can_manage_chat, can_change_info,
                         can_post_messages, can_edit_messages, can_delete_messages, can_manage_video_chats,
                         can_invite_users, can_restrict_members, can_pin_messages, can_promote_members):
     """
     Use this method to promote or demote a user in a supergroup or a channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id: int
     :type is_anonymous: bool
@@ -1140,14 +1140,14 @@ def promote_chat_member(based_url, proxies, chat_id, user_id, is_anonymous, can_
         params['can_pin_messages'] = can_pin_messages
     if can_promote_members:
         params['can_promote_members'] = can_promote_members
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_administrator_custom_title(based_url, proxies, chat_id, user_id, custom_title):
+def set_chat_administrator_custom_title(based_url, session, chat_id, user_id, custom_title):
     """
     Use this method to set a custom title for an administrator in a supergroup promoted by the bot
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id: int
     :type custom_title: str\
@@ -1158,14 +1158,14 @@ def set_chat_administrator_custom_title(based_url, proxies, chat_id, user_id, cu
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'user_id': user_id, 'custom_title': custom_title}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def ban_chat_sender_chat(based_url, proxies, chat_id, sender_chat_id):
+def ban_chat_sender_chat(based_url, session, chat_id, sender_chat_id):
     """
     Use this method to ban a channel chat in a supergroup or a channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type sender_chat_id:
     :rtype: bool
@@ -1175,14 +1175,14 @@ def ban_chat_sender_chat(based_url, proxies, chat_id, sender_chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'sender_chat_id': sender_chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def unban_chat_sender_chat(based_url, proxies, chat_id, sender_chat_id):
+def unban_chat_sender_chat(based_url, session, chat_id, sender_chat_id):
     """
     Use this method to unban a previously banned channel chat in a supergroup or channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type sender_chat_id:
     :rtype: bool
@@ -1192,14 +1192,14 @@ def unban_chat_sender_chat(based_url, proxies, chat_id, sender_chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'sender_chat_id': sender_chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_permissions(based_url, proxies, chat_id, permissions):
+def set_chat_permissions(based_url, session, chat_id, permissions):
     """
     Use this method to set default chat permissions for all members
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type permissions: dict
     :rtype: bool
@@ -1209,14 +1209,14 @@ def set_chat_permissions(based_url, proxies, chat_id, permissions):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'permissions': permissions}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def export_chat_invite_link(based_url, proxies, chat_id):
+def export_chat_invite_link(based_url, session, chat_id):
     """
     Use this method to generate a new invite link for a chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: str
     """
@@ -1225,14 +1225,14 @@ def export_chat_invite_link(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def create_chat_invite_link(based_url, proxies, chat_id, name, expire_date, member_limit, creates_join_request):
+def create_chat_invite_link(based_url, session, chat_id, name, expire_date, member_limit, creates_join_request):
     """
     Use this method to create an additional invite link for a chat
     :type based_url: str
-    :type proxies: list or None
+    :type session: Session
     :type chat_id: int or str
     :type name: str or None
     :type expire_date: int or None
@@ -1253,15 +1253,15 @@ def create_chat_invite_link(based_url, proxies, chat_id, name, expire_date, memb
         params['member_limit'] = member_limit
     if creates_join_request:
         params['creates_join_request'] = creates_join_request
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def edit_chat_invite_link(based_url, proxies, chat_id, invite_link, name, expire_date, member_limit,
+def edit_chat_invite_link(based_url, session, chat_id, invite_link, name, expire_date, member_limit,
                           creates_join_request):
     """
     Use this method to edit a non-primary invite link created by the bot
     :type based_url: str
-    :type proxies: list or None
+    :type session: Session
     :type chat_id: int or str
     :type invite_link: str
     :type name: str or None
@@ -1283,14 +1283,14 @@ def edit_chat_invite_link(based_url, proxies, chat_id, invite_link, name, expire
         params['member_limit'] = member_limit
     if creates_join_request:
         params['creates_join_request'] = creates_join_request
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def revoke_chat_invite_link(based_url, proxies, chat_id, invite_link, ):
+def revoke_chat_invite_link(based_url, session, chat_id, invite_link, ):
     """
     Use this method to revoke an invitation link created by the bot
     :type based_url: str
-    :type proxies: list or None
+    :type session: Session
     :type chat_id: int or str
     :type invite_link: str
     :rtype: dict
@@ -1300,14 +1300,14 @@ def revoke_chat_invite_link(based_url, proxies, chat_id, invite_link, ):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'invite_link': invite_link}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def approve_chat_join_request(based_url, proxies, chat_id, user_id):
+def approve_chat_join_request(based_url, session, chat_id, user_id):
     """
     Use this method to approve a chat join request
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id:
     :rtype: bool
@@ -1317,15 +1317,15 @@ def approve_chat_join_request(based_url, proxies, chat_id, user_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'user_id': user_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def decline_chat_join_request(based_url, proxies, chat_id, user_id):
+def decline_chat_join_request(based_url, session, chat_id, user_id):
     """
     Use this method to decline a chat join request,
     The bot must be an administrator in the chat for this to work and must have the can_invite_users administrator right
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id:
     :rtype: bool
@@ -1335,14 +1335,14 @@ def decline_chat_join_request(based_url, proxies, chat_id, user_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'user_id': user_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_photo(based_url, proxies, chat_id, photo):
+def set_chat_photo(based_url, session, chat_id, photo):
     """
     Use this method to set a new profile photo for the chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type photo: BinaryIO
     :rtype: bool
@@ -1356,14 +1356,14 @@ def set_chat_photo(based_url, proxies, chat_id, photo):
         files = {'photo': photo}
     else:
         params['photo'] = photo
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def delete_chat_photo(based_url, proxies, chat_id):
+def delete_chat_photo(based_url, session, chat_id):
     """
     Use this method to delete a chat photo
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: bool
     """
@@ -1372,14 +1372,14 @@ def delete_chat_photo(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_title(based_url, proxies, chat_id, title):
+def set_chat_title(based_url, session, chat_id, title):
     """
     Use this method to change the title of a chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type title: str
     :rtype: bool
@@ -1389,14 +1389,14 @@ def set_chat_title(based_url, proxies, chat_id, title):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'title': title}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_description(based_url, proxies, chat_id, description):
+def set_chat_description(based_url, session, chat_id, description):
     """
     Use this method to change the description of a group, a supergroup or a channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type description: str or None
     :rtype: bool
@@ -1408,14 +1408,14 @@ def set_chat_description(based_url, proxies, chat_id, description):
     params = {'chat_id': chat_id}
     if description:
         params['description'] = description
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def pin_chat_message(based_url, proxies, chat_id, message_id, disable_notification):
+def pin_chat_message(based_url, session, chat_id, message_id, disable_notification):
     """
     Use this method to pin a message in a group, a supergroup, or a channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int
     :type disable_notification: bool
@@ -1428,14 +1428,14 @@ def pin_chat_message(based_url, proxies, chat_id, message_id, disable_notificati
     params = {'chat_id': chat_id, 'message_id': message_id}
     if disable_notification:
         params['disable_notification'] = disable_notification
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def unpin_chat_message(based_url, proxies, chat_id, message_id):
+def unpin_chat_message(based_url, session, chat_id, message_id):
     """
     Use this method to unpin a message in a group, a supergroup, or a channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: str or None
     :rtype: bool
@@ -1447,14 +1447,14 @@ def unpin_chat_message(based_url, proxies, chat_id, message_id):
     params = {'chat_id': chat_id}
     if message_id:
         params['message_id'] = message_id
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def unpin_all_chat_message(based_url, proxies, chat_id):
+def unpin_all_chat_message(based_url, session, chat_id):
     """
     Use this method to clear the list of pinned messages in a chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: bool
     """
@@ -1463,14 +1463,14 @@ def unpin_all_chat_message(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def leave_chat(based_url, proxies, chat_id):
+def leave_chat(based_url, session, chat_id):
     """
     Use this method for your bot to leave a group, supergroup or channel
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: dict
     """
@@ -1479,14 +1479,14 @@ def leave_chat(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_chat(based_url, proxies, chat_id):
+def get_chat(based_url, session, chat_id):
     """
     Use this method to get up-to-date information about the chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: dict
     """
@@ -1495,14 +1495,14 @@ def get_chat(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_chat_administrators(based_url, proxies, chat_id):
+def get_chat_administrators(based_url, session, chat_id):
     """
     Use this method to get a list of administrators in a chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: list
     """
@@ -1511,14 +1511,14 @@ def get_chat_administrators(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_chat_member_count(based_url, proxies, chat_id):
+def get_chat_member_count(based_url, session, chat_id):
     """
     Use this method to get the number of members in a chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: int
     """
@@ -1527,14 +1527,14 @@ def get_chat_member_count(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_chat_member(based_url, proxies, chat_id, user_id):
+def get_chat_member(based_url, session, chat_id, user_id):
     """
     Use this method to get information about a member of a chat
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type user_id: int
     :rtype: dict
@@ -1544,14 +1544,14 @@ def get_chat_member(based_url, proxies, chat_id, user_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'user_id': user_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_sticker_set(based_url, proxies, chat_id, sticker_set_name):
+def set_chat_sticker_set(based_url, session, chat_id, sticker_set_name):
     """
     Use this method to set a new group sticker set for a supergroup
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type sticker_set_name: str
     :rtype: bool
@@ -1561,14 +1561,14 @@ def set_chat_sticker_set(based_url, proxies, chat_id, sticker_set_name):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'sticker_set_name': sticker_set_name}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def delete_chat_sticker_set(based_url, proxies, chat_id):
+def delete_chat_sticker_set(based_url, session, chat_id):
     """
     Use this method to delete a group sticker set from a supergroup
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :rtype: bool
     """
@@ -1577,14 +1577,14 @@ def delete_chat_sticker_set(based_url, proxies, chat_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def answer_callback_query(based_url, proxies, callback_query_id, text, show_alert, url, cache_time):
+def answer_callback_query(based_url, session, callback_query_id, text, show_alert, url, cache_time):
     """
     Use this method to send answers to callback queries sent from inline keyboards
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type callback_query_id: str
     :type text: str or None
     :type show_alert: bool
@@ -1605,14 +1605,14 @@ def answer_callback_query(based_url, proxies, callback_query_id, text, show_aler
         params['url'] = url
     if cache_time is not None:
         params['cache_time'] = cache_time
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_my_commands(based_url, proxies, commands, scope, language_code):
+def set_my_commands(based_url, session, commands, scope, language_code):
     """
     Use this method to change the list of the bots commands
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type commands: list
     :type scope: dict or None
     :type language_code: str or None
@@ -1627,14 +1627,14 @@ def set_my_commands(based_url, proxies, commands, scope, language_code):
         params['scope'] = scope
     if language_code:
         params['language_code'] = language_code
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def delete_my_commands(based_url, proxies, scope, language_code):
+def delete_my_commands(based_url, session, scope, language_code):
     """
     Use this method to delete the list of the bots commands for the given scope and user language
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type scope: dict or None
     :type language_code: str or None
     :rtype: bool
@@ -1648,14 +1648,14 @@ def delete_my_commands(based_url, proxies, scope, language_code):
         params['scope'] = scope
     if language_code:
         params['language_code'] = language_code
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_my_commands(based_url, proxies, scope, language_code):
+def get_my_commands(based_url, session, scope, language_code):
     """
     Use this method to get the current list of the bots commands
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type scope: dict or None
     :type language_code: str or None
     :rtype: list
@@ -1669,14 +1669,14 @@ def get_my_commands(based_url, proxies, scope, language_code):
         params['scope'] = scope
     if language_code:
         params['language_code'] = language_code
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_chat_menu_button(based_url, proxies, chat_id, menu_button):
+def set_chat_menu_button(based_url, session, chat_id, menu_button):
     """
     Use this method to change the bots' menu button in a private chat, or the default menu button
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or None
     :type menu_button: object or None
     :rtype: bool
@@ -1690,14 +1690,14 @@ def set_chat_menu_button(based_url, proxies, chat_id, menu_button):
         params['chat_id'] = chat_id
     if menu_button:
         params['menu_button'] = menu_button
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_chat_menu_button(based_url, proxies, chat_id):
+def get_chat_menu_button(based_url, session, chat_id):
     """
     Use this method to get the current value of the bots' menu button in a private chat, or the default menu button
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or None
     :rtype: dict
     """
@@ -1708,16 +1708,16 @@ def get_chat_menu_button(based_url, proxies, chat_id):
     params = {}
     if chat_id:
         params['chat_id'] = chat_id
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_my_default_administrator_rights(based_url, proxies, rights, for_channel=False):
+def set_my_default_administrator_rights(based_url, session, rights, for_channel=False):
     """
     Use this method to change the default administrator rights requested by the bot when it's added as an administrator
     to groups or channels. These rights will be suggested to users,
     but they are free to modify the list before adding the bot. Returns True on success
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type rights: object or None
     :type for_channel: bool
     :rtype: bool
@@ -1731,15 +1731,15 @@ def set_my_default_administrator_rights(based_url, proxies, rights, for_channel=
         params['rights'] = rights
     if for_channel:
         params['for_channel'] = True
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_my_default_administrator_rights(based_url, proxies, for_channel=False):
+def get_my_default_administrator_rights(based_url, session, for_channel=False):
     """
     Use this method to get the current default administrator rights of the bot.
     Returns ChatAdministratorRights on success
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type for_channel: bool
     :rtype: dict
     """
@@ -1750,16 +1750,16 @@ def get_my_default_administrator_rights(based_url, proxies, for_channel=False):
     params = {}
     if for_channel:
         params['for_channel'] = True
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def edit_message_text(based_url, proxies, text, chat_id, message_id, inline_message_id, parse_mode, entities,
+def edit_message_text(based_url, session, text, chat_id, message_id, inline_message_id, parse_mode, entities,
                       disable_web_page_preview,
                       reply_markup):
     """
     Use this method to edit text and game messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type inline_message_id: str or None
@@ -1789,15 +1789,15 @@ def edit_message_text(based_url, proxies, text, chat_id, message_id, inline_mess
         params['disable_web_page_preview'] = disable_web_page_preview
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def edit_message_caption(based_url, proxies, caption, chat_id, message_id, inline_message_id, parse_mode,
+def edit_message_caption(based_url, session, caption, chat_id, message_id, inline_message_id, parse_mode,
                          caption_entities, reply_markup):
     """
     Use this method to edit captions of messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type inline_message_id: str or None
@@ -1824,14 +1824,14 @@ def edit_message_caption(based_url, proxies, caption, chat_id, message_id, inlin
         params['caption_entities'] = caption_entities
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def edit_message_media(based_url, proxies, media, chat_id, message_id, inline_message_id, reply_markup):
+def edit_message_media(based_url, session, media, chat_id, message_id, inline_message_id, reply_markup):
     """
     Use this method to edit animation, audio, document, photo, or video messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type inline_message_id: str or None
@@ -1856,14 +1856,14 @@ def edit_message_media(based_url, proxies, media, chat_id, message_id, inline_me
         params['inline_message_id'] = inline_message_id
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def edit_message_reply_markup(based_url, proxies, chat_id, message_id, inline_message_id, reply_markup):
+def edit_message_reply_markup(based_url, session, chat_id, message_id, inline_message_id, reply_markup):
     """
     Use this method to edit only the reply markup of messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type inline_message_id: str or None
@@ -1883,14 +1883,14 @@ def edit_message_reply_markup(based_url, proxies, chat_id, message_id, inline_me
         params['inline_message_id'] = inline_message_id
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def stop_poll(based_url, proxies, chat_id, message_id, reply_markup):
+def stop_poll(based_url, session, chat_id, message_id, reply_markup):
     """
     Use this method to stop a poll which was sent by the bot
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :type reply_markup: dict or None
@@ -1903,14 +1903,14 @@ def stop_poll(based_url, proxies, chat_id, message_id, reply_markup):
     params = {'chat_id': chat_id, 'message_id': message_id}
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def delete_message(based_url, proxies, chat_id, message_id):
+def delete_message(based_url, session, chat_id, message_id):
     """
     Use this method to delete a message, including service messages
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type message_id: int or None
     :rtype: bool
@@ -1920,15 +1920,15 @@ def delete_message(based_url, proxies, chat_id, message_id):
     api_url = based_url + '/' + api_method
     files = None
     params = {'chat_id': chat_id, 'message_id': message_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_sticker(based_url, proxies, chat_id, sticker, protect_content, disable_notification, reply_to_message_id,
+def send_sticker(based_url, session, chat_id, sticker, protect_content, disable_notification, reply_to_message_id,
                  allow_sending_without_reply, reply_markup):
     """
     Use this method to send static .WEBP or animated .TGS stickers
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type sticker: BinaryIO
     :type disable_notification: bool
@@ -1957,14 +1957,14 @@ def send_sticker(based_url, proxies, chat_id, sticker, protect_content, disable_
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_sticker_set(based_url, proxies, name):
+def get_sticker_set(based_url, session, name):
     """
     Use this method to get a sticker set
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type name: str
     :rtype: dict
     """
@@ -1973,14 +1973,14 @@ def get_sticker_set(based_url, proxies, name):
     api_url = based_url + '/' + api_method
     files = None
     params = {'name': name}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def upload_sticker_file(based_url, proxies, user_id, png_sticker):
+def upload_sticker_file(based_url, session, user_id, png_sticker):
     """
     Use this method to upload a .PNG file with a sticker
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int
     :type png_sticker: BinaryIO
     :rtype: dict
@@ -1990,15 +1990,15 @@ def upload_sticker_file(based_url, proxies, user_id, png_sticker):
     api_url = based_url + '/' + api_method
     files = {'png_sticker': png_sticker}
     params = {'user_id': user_id}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def create_new_sticker_set(based_url, proxies, user_id, name, title, png_sticker, tgs_sticker, webm_sticker, emojis,
+def create_new_sticker_set(based_url, session, user_id, name, title, png_sticker, tgs_sticker, webm_sticker, emojis,
                            contains_masks, mask_position):
     """
     Use this method to create a new sticker set owned by a user
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int
     :type name: str
     :type title: str
@@ -2027,15 +2027,15 @@ def create_new_sticker_set(based_url, proxies, user_id, name, title, png_sticker
         params['contains_masks'] = contains_masks
     if mask_position:
         params['mask_position'] = mask_position
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def add_sticker_to_set(based_url, proxies, user_id, name, png_sticker, tgs_sticker, webm_sticker,
+def add_sticker_to_set(based_url, session, user_id, name, png_sticker, tgs_sticker, webm_sticker,
                        emojis, mask_position):
     """
     Use this method to add a new sticker to a set created by the bot
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int
     :type name: str
     :type png_sticker: BinaryIO or str or None
@@ -2060,14 +2060,14 @@ def add_sticker_to_set(based_url, proxies, user_id, name, png_sticker, tgs_stick
         files = {'webm_sticker', webm_sticker}
     if mask_position:
         params['mask_position'] = mask_position
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_sticker_position_in_set(based_url, proxies, sticker, position):
+def set_sticker_position_in_set(based_url, session, sticker, position):
     """
     Use this method to move a sticker in a set created by the bot to a specific position
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type sticker: str
     :type position: int
     :rtype: bool
@@ -2077,14 +2077,14 @@ def set_sticker_position_in_set(based_url, proxies, sticker, position):
     api_url = based_url + '/' + api_method
     files = None
     params = {'sticker': sticker, 'position': position}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def delete_sticker_from_set(based_url, proxies, sticker):
+def delete_sticker_from_set(based_url, session, sticker):
     """
     Use this method to delete a sticker from a set created by the bot
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type sticker: str
     :rtype: bool
     """
@@ -2093,14 +2093,14 @@ def delete_sticker_from_set(based_url, proxies, sticker):
     api_url = based_url + '/' + api_method
     files = None
     params = {'sticker': sticker}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_sticker_set_thumb(based_url, proxies, name, user_id, thumb):
+def set_sticker_set_thumb(based_url, session, name, user_id, thumb):
     """
     Use this method to set the thumbnail of a sticker set
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type name: str
     :type user_id: int
     :type thumb: BinaryIO or None
@@ -2113,15 +2113,15 @@ def set_sticker_set_thumb(based_url, proxies, name, user_id, thumb):
     params = {'name': name, 'user_id': user_id}
     if thumb:
         params['thumb'] = thumb
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def answer_inline_query(based_url, proxies, inline_query_id, results, cache_time, is_personal, next_offset,
+def answer_inline_query(based_url, session, inline_query_id, results, cache_time, is_personal, next_offset,
                         switch_pm_text, switch_pm_parameter):
     """
     Use this method to send answers to an inline query
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type inline_query_id: str
     :type results: list[dict]
     :type cache_time: int or None
@@ -2146,15 +2146,15 @@ def answer_inline_query(based_url, proxies, inline_query_id, results, cache_time
         params['switch_pm_text'] = switch_pm_text
     if switch_pm_parameter:
         params['switch_pm_parameter'] = switch_pm_parameter
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def answer_web_app_query(based_url, proxies, web_app_query_id, result):
+def answer_web_app_query(based_url, session, web_app_query_id, result):
     """
     Use this method to set the result of an interaction with a Web App and send a corresponding message,
     On behalf of the user to the chat from which the query originated
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type web_app_query_id: str
     :type result: object
     :rtype: dict
@@ -2164,10 +2164,10 @@ def answer_web_app_query(based_url, proxies, web_app_query_id, result):
     api_url = based_url + '/' + api_method
     files = None
     params = {'web_app_query_id': web_app_query_id, 'result': result}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_invoice(based_url, proxies, chat_id, title, description, payload, provider_token, currency, prices,
+def send_invoice(based_url, session, chat_id, title, description, payload, provider_token, currency, prices,
                  max_tip_amount, suggested_tip_amounts, start_parameter, provider_data, photo_url, photo_size,
                  photo_width, photo_height, need_name, need_phone_number, need_email, need_shipping_address,
                  send_phone_number_to_provider, send_email_to_provider, is_flexible, disable_notification,
@@ -2175,7 +2175,7 @@ def send_invoice(based_url, proxies, chat_id, title, description, payload, provi
     """
     Use this method to send invoices. On success, the sent Message is returned
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int
     :type title: str
     :type description: str
@@ -2257,14 +2257,14 @@ def send_invoice(based_url, proxies, chat_id, title, description, payload, provi
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def answer_shipping_query(based_url, proxies, shipping_query_id, ok, shipping_options, error_message):
+def answer_shipping_query(based_url, session, shipping_query_id, ok, shipping_options, error_message):
     """
     Use this method to reply to shipping queries
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type shipping_query_id: str
     :type ok: bool
     :type shipping_options: list or None
@@ -2280,14 +2280,14 @@ def answer_shipping_query(based_url, proxies, shipping_query_id, ok, shipping_op
         params['shipping_options'] = shipping_options
     if error_message:
         params['error_message'] = error_message
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def answer_pre_checkout_query(based_url, proxies, pre_checkout_query_id, ok, error_message):
+def answer_pre_checkout_query(based_url, session, pre_checkout_query_id, ok, error_message):
     """
     Use this method to respond to such pre-checkout queries
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type pre_checkout_query_id: str
     :type ok: bool
     :type error_message: str or None
@@ -2300,14 +2300,14 @@ def answer_pre_checkout_query(based_url, proxies, pre_checkout_query_id, ok, err
     params = {'pre_checkout_query_id': pre_checkout_query_id, 'ok': ok}
     if error_message:
         params['error_message'] = error_message
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_passport_data_errors(based_url, proxies, user_id, errors):
+def set_passport_data_errors(based_url, session, user_id, errors):
     """
     Use this if the data submitted by the user doesn't satisfy the standards your service requires for any reason
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int
     :type errors: list
     :rtype: bool
@@ -2317,15 +2317,15 @@ def set_passport_data_errors(based_url, proxies, user_id, errors):
     api_url = based_url + '/' + api_method
     files = None
     params = {'user_id': user_id, 'errors': errors}
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def send_game(based_url, proxies, chat_id, game_short_name, disable_notification, protect_content, reply_to_message_id,
+def send_game(based_url, session, chat_id, game_short_name, disable_notification, protect_content, reply_to_message_id,
               allow_sending_without_reply, reply_markup):
     """
     Use this method to send a game
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type chat_id: int or str
     :type game_short_name: str
     :type disable_notification: bool
@@ -2350,16 +2350,16 @@ def send_game(based_url, proxies, chat_id, game_short_name, disable_notification
         params['allow_sending_without_reply'] = allow_sending_without_reply
     if reply_markup:
         params['reply_markup'] = reply_markup
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def set_game_score(based_url, proxies, user_id, score, force, disable_edit_message, chat_id,
+def set_game_score(based_url, session, user_id, score, force, disable_edit_message, chat_id,
                    message_id,
                    inline_message_id):
     """
     Use this method to set the score of the specified user in a game
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int
     :type score: int
     :type force: bool
@@ -2384,14 +2384,14 @@ def set_game_score(based_url, proxies, user_id, score, force, disable_edit_messa
         params['inline_message_id'] = inline_message_id
     if disable_edit_message:
         params['disable_edit_message'] = disable_edit_message
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
 
 
-def get_game_high_scores(based_url, proxies, user_id, chat_id, message_id, inline_message_id):
+def get_game_high_scores(based_url, session, user_id, chat_id, message_id, inline_message_id):
     """
     Use this method to get data for high score tables
     :type based_url: str
-    :type proxies: dict or None
+    :type session: Session
     :type user_id: int
     :type chat_id: int or None
     :type message_id: int or None
@@ -2409,4 +2409,4 @@ def get_game_high_scores(based_url, proxies, user_id, chat_id, message_id, inlin
         params['message_id'] = message_id
     if inline_message_id:
         params['inline_message_id'] = inline_message_id
-    return make_request(method, api_url, api_method, files, params, proxies)
+    return make_request(method, api_url, api_method, files, params, session)
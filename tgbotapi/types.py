@@ -9,13 +9,33 @@ such as Update, Message, etc.
 :copyright: (c) 2022 by Mustafa Asaad.
 :license: GPLv2, see LICENSE for more details.
 """
-from .utils import JsonDeserializable, JsonSerializable
+from .utils import Field, JsonDeserializable, JsonSerializable, lazy_decoders
 
 
 class Update(JsonDeserializable):
     """
     This object represents an incoming update
     """
+    __slots__ = ('update_id', 'message', 'edited_message', 'channel_post', 'edited_channel_post', 'inline_query',
+                 'chosen_inline_result', 'callback_query', 'shipping_query', 'pre_checkout_query', 'poll',
+                 'poll_answer', 'my_chat_member', 'chat_member', 'chat_join_request')
+    fields = (
+        Field('update_id', required=True),
+        Field('message', ttype='Message'),
+        Field('edited_message', ttype='Message'),
+        Field('channel_post', ttype='Message'),
+        Field('edited_channel_post', ttype='Message'),
+        Field('inline_query', ttype='InlineQuery'),
+        Field('chosen_inline_result', ttype='ChosenInlineResult'),
+        Field('callback_query', ttype='CallbackQuery'),
+        Field('shipping_query', ttype='ShippingQuery'),
+        Field('pre_checkout_query', ttype='PreCheckoutQuery'),
+        Field('poll', ttype='Poll'),
+        Field('poll_answer', ttype='PollAnswer'),
+        Field('my_chat_member', ttype='ChatMemberUpdated'),
+        Field('chat_member', ttype='ChatMemberUpdated'),
+        Field('chat_join_request', ttype='ChatJoinRequest'),
+    )
 
     def __init__(self, update_id, message, edited_message, channel_post, edited_channel_post, inline_query,
                  chosen_inline_result, callback_query, shipping_query, pre_checkout_query, poll, poll_answer,
@@ -36,59 +56,22 @@ class Update(JsonDeserializable):
         self.chat_member = chat_member
         self.chat_join_request = chat_join_request
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        update_id = obj['update_id']
-        message = None
-        if 'message' in obj:
-            message = Message.de_json(obj['message'])
-        edited_message = None
-        if 'edited_message' in obj:
-            edited_message = Message.de_json(obj['edited_message'])
-        channel_post = None
-        if 'channel_post' in obj:
-            channel_post = Message.de_json(obj['channel_post'])
-        edited_channel_post = None
-        if 'edited_channel_post' in obj:
-            edited_channel_post = Message.de_json(obj['edited_channel_post'])
-        inline_query = None
-        if 'inline_query' in obj:
-            inline_query = InlineQuery.de_json(obj['inline_query'])
-        chosen_inline_result = None
-        if 'chosen_inline_result' in obj:
-            chosen_inline_result = ChosenInlineResult.de_json(
-                obj['chosen_inline_result'])
-        callback_query = None
-        if 'callback_query' in obj:
-            callback_query = CallbackQuery.de_json(obj['callback_query'])
-        shipping_query = None
-        if 'shipping_query' in obj:
-            shipping_query = ShippingQuery.de_json(obj['shipping_query'])
-        pre_checkout_query = None
-        if 'pre_checkout_query' in obj:
-            pre_checkout_query = PreCheckoutQuery.de_json(obj['pre_checkout_query'])
-        poll = None
-        if 'poll' in obj:
-            poll = Poll.de_json(obj['poll'])
-        poll_answer = None
-        if 'poll_answer' in obj:
-            poll_answer = PollAnswer.de_json(obj['poll_answer'])
-        my_chat_member = None
-        if 'my_chat_member' in obj:
-            my_chat_member = ChatMemberUpdated.de_json(obj['my_chat_member'])
-        chat_member = None
-        if 'chat_member' in obj:
-            chat_member = ChatMemberUpdated.de_json(obj['chat_member'])
-        chat_join_request = None
-        if 'chat_join_request' in obj:
-            chat_join_request = ChatJoinRequest.de_json(obj['chat_join_request'])
-        return cls(update_id, message, edited_message, channel_post, edited_channel_post, inline_query,
-                   chosen_inline_result, callback_query, shipping_query, pre_checkout_query, poll, poll_answer,
-                   my_chat_member, chat_member, chat_join_request)
-
 
 class WebhookInfo(JsonDeserializable):
+    __slots__ = ('url', 'has_custom_certificate', 'pending_update_count', 'ip_address', 'last_error_date',
+                 'last_error_message', 'last_synchronization_error_date', 'max_connections', 'allowed_updates')
+    fields = (
+        Field('url', required=True),
+        Field('has_custom_certificate', default=False),
+        Field('pending_update_count', required=True),
+        Field('ip_address'),
+        Field('last_error_date'),
+        Field('last_error_message'),
+        Field('last_synchronization_error_date'),
+        Field('max_connections'),
+        Field('allowed_updates'),
+    )
+
     def __init__(self, url, has_custom_certificate, pending_update_count, ip_address, last_error_date,
                  last_error_message, last_synchronization_error_date, max_connections, allowed_updates):
         """
@@ -104,37 +87,22 @@ class WebhookInfo(JsonDeserializable):
         self.max_connections = max_connections
         self.allowed_updates = allowed_updates
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        url = obj['url']
-        has_custom_certificate = False
-        if 'has_custom_certificate' in obj:
-            has_custom_certificate = obj['has_custom_certificate']
-        pending_update_count = obj['pending_update_count']
-        ip_address = None
-        if 'ip_address' in obj:
-            ip_address = obj['ip_address']
-        last_error_date = None
-        if 'last_error_message' in obj:
-            last_error_date = obj['last_error_date']
-        last_error_message = None
-        if 'last_error_message' in obj:
-            last_error_message = obj['last_error_message']
-        last_synchronization_error_date = None
-        if 'last_synchronization_error_date' in obj:
-            last_synchronization_error_date = obj['last_synchronization_error_date']
-        max_connections = None
-        if 'max_connections' in obj:
-            max_connections = obj['max_connections']
-        allowed_updates = None
-        if 'allowed_updates' in obj:
-            allowed_updates = obj['allowed_updates']
-        return cls(url, has_custom_certificate, pending_update_count, ip_address, last_error_date, last_error_message,
-                   last_synchronization_error_date, max_connections, allowed_updates)
-
 
 class User(JsonDeserializable):
+    __slots__ = ('uid', 'is_bot', 'first_name', 'username', 'last_name', 'language_code', 'can_join_groups',
+                 'can_read_all_group_messages', 'supports_inline_queries')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('is_bot', required=True),
+        Field('first_name', required=True),
+        Field('last_name'),
+        Field('username'),
+        Field('language_code'),
+        Field('can_join_groups', default=False),
+        Field('can_read_all_group_messages', default=False),
+        Field('supports_inline_queries', default=False),
+    )
+
     def __init__(self, uid, is_bot, first_name, last_name, username, language_code, can_join_groups,
                  can_read_all_group_messages, supports_inline_queries):
         """
@@ -150,35 +118,35 @@ class User(JsonDeserializable):
         self.can_read_all_group_messages = can_read_all_group_messages
         self.supports_inline_queries = supports_inline_queries
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        is_bot = obj['is_bot']
-        first_name = obj['first_name']
-        last_name = None
-        if 'last_name' in obj:
-            last_name = obj['last_name']
-        username = None
-        if 'username' in obj:
-            username = obj['username']
-        language_code = None
-        if 'language_code' in obj:
-            language_code = obj['language_code']
-        can_join_groups = False
-        if 'can_join_groups' in obj:
-            can_join_groups = obj['can_join_groups']
-        can_read_all_group_messages = False
-        if 'can_read_all_group_messages' in obj:
-            can_read_all_group_messages = obj['can_read_all_group_messages']
-        supports_inline_queries = False
-        if 'supports_inline_queries' in obj:
-            supports_inline_queries = obj['supports_inline_queries']
-        return cls(uid, is_bot, first_name, last_name, username, language_code, can_join_groups,
-                   can_read_all_group_messages, supports_inline_queries)
-
 
 class Chat(JsonDeserializable):
+    __slots__ = ('uid', 'ttype', 'title', 'username', 'first_name', 'last_name', 'photo', 'bio', 'has_private_forwards',
+                 'description', 'invite_link', 'pinned_message', 'permissions', 'slow_mode_delay',
+                 'message_auto_delete_time', 'has_protected_content', 'sticker_set_name', 'can_set_sticker_set',
+                 'linked_chat_id', 'location')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('ttype', 'type', required=True),
+        Field('title'),
+        Field('username'),
+        Field('first_name'),
+        Field('last_name'),
+        Field('photo', ttype='ChatPhoto'),
+        Field('bio'),
+        Field('has_private_forwards', default=False),
+        Field('description'),
+        Field('invite_link'),
+        Field('pinned_message', ttype='Message'),
+        Field('permissions', ttype='ChatPermissions'),
+        Field('slow_mode_delay'),
+        Field('message_auto_delete_time'),
+        Field('has_protected_content', default=False),
+        Field('sticker_set_name'),
+        Field('can_set_sticker_set', default=False),
+        Field('linked_chat_id'),
+        Field('location', ttype='ChatLocation'),
+    )
+
     def __init__(self, uid, ttype, title, username, first_name, last_name, photo, bio, has_private_forwards,
                  description, invite_link, pinned_message, permissions, slow_mode_delay, message_auto_delete_time,
                  has_protected_content, sticker_set_name, can_set_sticker_set, linked_chat_id, location):
@@ -206,305 +174,129 @@ class Chat(JsonDeserializable):
         self.linked_chat_id = linked_chat_id
         self.location = location
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        ttype = obj['type']
-        title = None
-        if 'title' in obj:
-            title = obj['title']
-        username = None
-        if 'username' in obj:
-            username = obj['username']
-        first_name = None
-        if 'first_name' in obj:
-            first_name = obj['first_name']
-        last_name = None
-        if 'last_name' in obj:
-            last_name = obj['last_name']
-        photo = None
-        if 'photo' in obj:
-            photo = ChatPhoto.de_json(obj['photo'])
-        bio = None
-        if 'bio' in obj:
-            bio = obj['bio']
-        has_private_forwards = False
-        if 'has_private_forwards' in obj:
-            has_private_forwards = obj['has_private_forwards']
-        description = None
-        if 'description' in obj:
-            description = obj['description']
-        invite_link = None
-        if 'invite_link' in obj:
-            invite_link = obj['invite_link']
-        pinned_message = None
-        if 'pinned_message' in obj:
-            pinned_message = Message.de_json(obj['pinned_message'])
-        permissions = None
-        if 'permissions' in obj:
-            permissions = ChatPermissions.de_json(obj['permissions'])
-        slow_mode_delay = None
-        if 'slow_mode_delay' in obj:
-            slow_mode_delay = obj['slow_mode_delay']
-        message_auto_delete_time = None
-        if 'message_auto_delete_time' in obj:
-            message_auto_delete_time = obj['message_auto_delete_time']
-        has_protected_content = False
-        if 'has_protected_content' in obj:
-            has_protected_content = obj['has_protected_content']
-        sticker_set_name = None
-        if 'sticker_set_name' in obj:
-            sticker_set_name = obj['sticker_set_name']
-        can_set_sticker_set = False
-        if 'can_set_sticker_set' in obj:
-            can_set_sticker_set = obj['can_set_sticker_set']
-        linked_chat_id = None
-        if 'linked_chat_id' in obj:
-            linked_chat_id = obj['linked_chat_id']
-        location = None
-        if 'location' in obj:
-            location = ChatLocation.de_json(obj['location'])
-        return cls(uid, ttype, title, username, first_name, last_name, photo, bio, has_private_forwards, description,
-                   invite_link, pinned_message, permissions, slow_mode_delay, message_auto_delete_time,
-                   has_protected_content, sticker_set_name, can_set_sticker_set, linked_chat_id, location)
-
 
 class Message(JsonDeserializable):
     """
     This object represents a message
     """
+    __slots__ = ('message_id', 'ffrom', 'sender_chat', 'date', 'chat', 'forward_from', 'forward_from_chat',
+                 'forward_from_message_id', 'forward_signature', 'forward_sender_name', 'forward_date',
+                 'is_automatic_forward', 'reply_to_message', 'via_bot', 'edit_date', 'has_protected_content',
+                 'media_group_id', 'author_signature', 'text', 'entities', 'animation', 'audio', 'document', 'photo',
+                 'sticker', 'video', 'video_note', 'voice', 'caption', 'caption_entities', 'contact', 'dice', 'game',
+                 'poll', 'venue', 'location', 'new_chat_members', 'left_chat_member', 'new_chat_title',
+                 'new_chat_photo', 'delete_chat_photo', 'group_chat_created', 'supergroup_chat_created',
+                 'channel_chat_created', 'message_auto_delete_timer_changed', 'migrate_to_chat_id',
+                 'migrate_from_chat_id', 'pinned_message', 'invoice', 'successful_payment', 'connected_website',
+                 'passport_data', 'proximity_alert_triggered', 'video_chat_scheduled', 'video_chat_started',
+                 'video_chat_ended', 'video_chat_participants_invited', 'web_app_data', 'reply_markup')
+    fields = (
+        Field('message_id', required=True),
+        Field('ffrom', 'from', ttype='User'),
+        Field('sender_chat', ttype='Chat'),
+        Field('date'),
+        Field('chat', ttype='Chat'),
+        Field('forward_from', ttype='User'),
+        Field('forward_from_chat', ttype='Chat'),
+        Field('forward_from_message_id'),
+        Field('forward_signature'),
+        Field('forward_sender_name'),
+        Field('forward_date'),
+        Field('is_automatic_forward', default=False),
+        Field('reply_to_message', ttype='Message'),
+        Field('via_bot', ttype='User'),
+        Field('edit_date'),
+        Field('has_protected_content', default=False),
+        Field('media_group_id'),
+        Field('author_signature'),
+        Field('text'),
+        Field('entities', ttype='MessageEntity', depth=1),
+        Field('animation', ttype='Animation'),
+        Field('audio', ttype='Audio'),
+        Field('document', ttype='Document'),
+        Field('photo', ttype='PhotoSize', depth=1),
+        Field('sticker', ttype='Sticker'),
+        Field('video', ttype='Video'),
+        Field('video_note', ttype='VideoNote'),
+        Field('voice', ttype='Voice'),
+        Field('caption'),
+        Field('caption_entities', ttype='MessageEntity', depth=1),
+        Field('contact', ttype='Contact'),
+        Field('dice', ttype='Dice'),
+        Field('game', ttype='Game'),
+        Field('poll', ttype='Poll'),
+        Field('venue', ttype='Venue'),
+        Field('location', ttype='Location'),
+        Field('new_chat_members', ttype='User', depth=1),
+        Field('left_chat_member', ttype='User'),
+        Field('new_chat_title'),
+        Field('new_chat_photo', ttype='PhotoSize', depth=1),
+        Field('delete_chat_photo', default=False),
+        Field('group_chat_created', default=False),
+        Field('supergroup_chat_created', default=False),
+        Field('channel_chat_created', default=False),
+        Field('message_auto_delete_timer_changed', ttype='MessageAutoDeleteTimerChanged'),
+        Field('migrate_to_chat_id'),
+        Field('migrate_from_chat_id'),
+        Field('pinned_message', ttype='Message'),
+        Field('invoice', ttype='Invoice'),
+        Field('successful_payment', ttype='SuccessfulPayment'),
+        Field('connected_website'),
+        Field('passport_data', ttype='PassportData'),
+        Field('proximity_alert_triggered', ttype='ProximityAlertTriggered'),
+        Field('video_chat_scheduled', ttype='VideoChatScheduled'),
+        Field('video_chat_started', ttype='VideoChatStarted'),
+        Field('video_chat_ended', ttype='VideoChatEnded'),
+        Field('video_chat_participants_invited', ttype='VideoChatParticipantsInvited'),
+        Field('web_app_data', ttype='WebAppData'),
+        Field('reply_markup', ttype='InlineKeyboardMarkup'),
+    )
+    defaults = {field.name: field.default for field in fields}
 
     def __init__(self, message_id, attrs):
         """
-        Initializes a Message object
+        Initializes a Message object, the fields missing from attrs keep their class level defaults
         :param int message_id: Unique message identifier
+        :param dict attrs: the fields present in the message
         """
         self.message_id = message_id
-        self.ffrom = None
-        self.sender_chat = None
-        self.date = None
-        self.chat = None
-        self.forward_from = None
-        self.forward_from_chat = None
-        self.forward_from_message_id = None
-        self.forward_signature = None
-        self.forward_sender_name = None
-        self.forward_date = None
-        self.is_automatic_forward = False
-        self.reply_to_message = None
-        self.via_bot = None
-        self.edit_date = None
-        self.has_protected_content = False
-        self.media_group_id = None
-        self.author_signature = None
-        self.text = None
-        self.entities = None
-        self.animation = None
-        self.audio = None
-        self.document = None
-        self.photo = None
-        self.sticker = None
-        self.video = None
-        self.video_note = None
-        self.voice = None
-        self.caption = None
-        self.caption_entities = None
-        self.contact = None
-        self.dice = None
-        self.game = None
-        self.poll = None
-        self.venue = None
-        self.location = None
-        self.new_chat_members = None
-        self.left_chat_member = None
-        self.new_chat_title = None
-        self.new_chat_photo = None
-        self.delete_chat_photo = False
-        self.group_chat_created = False
-        self.supergroup_chat_created = False
-        self.channel_chat_created = False
-        self.message_auto_delete_timer_changed = None
-        self.migrate_to_chat_id = None
-        self.migrate_from_chat_id = None
-        self.pinned_message = None
-        self.invoice = None
-        self.successful_payment = None
-        self.connected_website = None
-        self.passport_data = None
-        self.proximity_alert_triggered = None
-        self.video_chat_scheduled = None
-        self.video_chat_started = None
-        self.video_chat_ended = None
-        self.video_chat_participants_invited = None
-        self.web_app_data = None
-        self.reply_markup = None
         for key in attrs:
             setattr(self, key, attrs[key])
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        message_id = obj['message_id']
-        attrs = {}
-        if 'from' in obj:
-            attrs['ffrom'] = User.de_json(obj['from'])
-        if 'sender_chat' in obj:
-            attrs['sender_chat'] = Chat.de_json(obj['sender_chat'])
-        if 'data' in obj:
-            attrs['date'] = obj['data']
-        if 'chat' in obj:
-            attrs['chat'] = Chat.de_json(obj['chat'])
-        if 'forward_from' in obj:
-            attrs['forward_from'] = User.de_json(obj['forward_from'])
-        if 'forward_from_chat' in obj:
-            attrs['forward_from_chat'] = Chat.de_json(obj['forward_from_chat'])
-        if 'forward_from_message_id' in obj:
-            attrs['forward_from_message_id'] = obj['forward_from_message_id']
-        if 'forward_signature' in obj:
-            attrs['forward_signature'] = obj['forward_signature']
-        if 'forward_sender_name' in obj:
-            attrs['forward_sender_name'] = obj['forward_sender_name']
-        if 'forward_date' in obj:
-            attrs['forward_date'] = obj['forward_date']
-        if 'is_automatic_forward' in obj:
-            attrs['is_automatic_forward'] = obj['is_automatic_forward']
-        if 'reply_to_message' in obj:
-            attrs['reply_to_message'] = Message.de_json(obj['reply_to_message'])
-        if 'via_bot' in obj:
-            attrs['via_bot'] = User.de_json(obj['via_bot'])
-        if 'edit_date' in obj:
-            attrs['edit_date'] = obj['edit_date']
-        if 'has_protected_content' in obj:
-            attrs['has_protected_content'] = obj['has_protected_content']
-        if 'media_group_id' in obj:
-            attrs['media_group_id'] = obj['media_group_id']
-        if 'author_signature' in obj:
-            attrs['author_signature'] = obj['author_signature']
-        if 'text' in obj:
-            attrs['text'] = obj['text']
-        if 'entities' in obj:
-            attrs['entities'] = Message.parse_entities(obj['entities'])
-        if 'animation' in obj:
-            attrs['animation'] = Animation.de_json(obj['animation'])
-        if 'audio' in obj:
-            attrs['audio'] = Audio.de_json(obj['audio'])
-        if 'document' in obj:
-            attrs['document'] = Document.de_json(obj['document'])
-        if 'photo' in obj:
-            attrs['photo'] = Message.parse_photo(obj['photo'])
-        if 'sticker' in obj:
-            attrs['sticker'] = Sticker.de_json(obj['sticker'])
-        if 'video' in obj:
-            attrs['video'] = Video.de_json(obj['video'])
-        if 'video_note' in obj:
-            attrs['video_note'] = VideoNote.de_json(obj['video_note'])
-        if 'voice' in obj:
-            attrs['voice'] = Audio.de_json(obj['voice'])
-        if 'caption' in obj:
-            attrs['caption'] = obj['caption']
-        if 'caption_entities' in obj:
-            attrs['caption_entities'] = Message.parse_entities(obj['caption_entities'])
-        if 'contact' in obj:
-            attrs['contact'] = Contact.de_json(obj['contact'])
-        if 'dice' in obj:
-            attrs['dice'] = Dice.de_json(obj['dice'])
-        if 'game' in obj:
-            attrs['game'] = Game.de_json(obj['game'])
-        if 'poll' in obj:
-            attrs['poll'] = Poll.de_json(obj['poll'])
-        if 'venue' in obj:
-            attrs['venue'] = Venue.de_json(obj['venue'])
-        if 'location' in obj:
-            attrs['location'] = Location.de_json(obj['location'])
-        if 'new_chat_members' in obj:
-            attrs['new_chat_members'] = Message.parse_users(obj['new_chat_members'])
-        if 'left_chat_member' in obj:
-            attrs['left_chat_member'] = User.de_json(obj['left_chat_member'])
-        if 'new_chat_title' in obj:
-            attrs['new_chat_title'] = obj['new_chat_title']
-        if 'new_chat_photo' in obj:
-            attrs['new_chat_photo'] = Message.parse_photo(obj['new_chat_photo'])
-        if 'delete_chat_photo' in obj:
-            attrs['delete_chat_photo'] = obj['delete_chat_photo']
-        if 'group_chat_created' in obj:
-            attrs['group_chat_created'] = obj['group_chat_created']
-        if 'supergroup_chat_created' in obj:
-            attrs['supergroup_chat_created'] = obj['supergroup_chat_created']
-        if 'channel_chat_created' in obj:
-            attrs['channel_chat_created'] = obj['channel_chat_created']
-        if 'message_auto_delete_timer_changed' in obj:
-            attrs['message_auto_delete_timer_changed'] = MessageAutoDeleteTimerChanged.de_json(
-                obj['message_auto_delete_timer_changed'])
-        if 'migrate_to_chat_id' in obj:
-            attrs['migrate_to_chat_id'] = obj['migrate_to_chat_id']
-        if 'migrate_from_chat_id' in obj:
-            attrs['migrate_from_chat_id'] = obj['migrate_from_chat_id']
-        if 'pinned_message' in obj:
-            attrs['pinned_message'] = Message.de_json(obj['pinned_message'])
-        if 'invoice' in obj:
-            attrs['invoice'] = Invoice.de_json(obj['invoice'])
-        if 'successful_payment' in obj:
-            attrs['successful_payment'] = SuccessfulPayment.de_json(obj['successful_payment'])
-        if 'connected_website' in obj:
-            attrs['connected_website'] = obj['connected_website']
-        if 'passport_data' in obj:
-            attrs['passport_data'] = obj['passport_data']
-        if 'proximity_alert_triggered' in obj:
-            attrs['proximity_alert_triggered'] = ProximityAlertTriggered.de_json(obj['proximity_alert_triggered'])
-        if 'video_chat_scheduled' in obj:
-            attrs['video_chat_scheduled'] = VideoChatScheduled.de_json(obj['video_chat_scheduled'])
-        if 'video_chat_started' in obj:
-            attrs['video_chat_started'] = VideoChatStarted.de_json(obj['video_chat_started'])
-        if 'video_chat_ended' in obj:
-            attrs['video_chat_ended'] = VideoChatEnded.de_json(obj['video_chat_ended'])
-        if 'video_chat_participants_invited' in obj:
-            attrs['video_chat_participants_invited'] = VideoChatParticipantsInvited.de_json(
-                obj['video_chat_participants_invited'])
-        if 'web_app_data' in obj:
-            attrs['web_app_data'] = obj['web_app_data']
-        if 'reply_markup' in obj:
-            attrs['reply_markup'] = InlineKeyboardMarkup.de_json(obj['reply_markup'])
-        return cls(message_id, attrs)
-
-    @classmethod
-    def parse_photo(cls, obj):
-        photos = []
-        for x in obj:
-            photos.append(PhotoSize.de_json(x))
-        return photos
-
-    @classmethod
-    def parse_entities(cls, obj):
-        entities = []
-        for x in obj:
-            entities.append(MessageEntity.de_json(x))
-        return entities
-
-    @classmethod
-    def parse_users(cls, obj):
-        users = []
-        for x in obj:
-            users.append(User.de_json(x))
-        return users
+    def __getattr__(self, name):
+        """
+        Returns the default of a field that was not set, it is only reached when the slot is empty
+        """
+        try:
+            return Message.defaults[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
 
 
 class MessageId(JsonDeserializable):
     """
     This object represents a unique message identifier.
     """
+    __slots__ = ('message_id',)
+    fields = (
+        Field('message_id', required=True),
+    )
 
     def __init__(self, message_id):
         self.message_id = message_id
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        message_id = obj['message_id']
-        return cls(message_id)
-
 
 class MessageEntity(JsonSerializable, JsonDeserializable):
+    __slots__ = ('ttype', 'offset', 'length', 'url', 'user', 'language')
+    fields = (
+        Field('ttype', 'type', required=True),
+        Field('offset', required=True),
+        Field('length', required=True),
+        Field('url'),
+        Field('user', ttype='User'),
+        Field('language'),
+    )
+
     def __init__(self, ttype, offset, length, url, user, language):
         """
         This object represents one special entity in a text message. For example, hashtags, usernames, URLs, etc.
@@ -540,25 +332,17 @@ class MessageEntity(JsonSerializable, JsonDeserializable):
             obj['language'] = self.language
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        ttype = obj['type']
-        offset = obj['offset']
-        length = obj['length']
-        url = None
-        if 'url' in obj:
-            url = obj['url']
-        user = None
-        if 'user' in obj:
-            user = User.de_json(obj['user'])
-        language = None
-        if 'language' in obj:
-            language = obj['language']
-        return cls(ttype, offset, length, url, user, language)
-
 
 class PhotoSize(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('width', required=True),
+        Field('height', required=True),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, file_size):
         """
         This object represents one size of a photo or a file / sticker thumbnail
@@ -569,20 +353,22 @@ class PhotoSize(JsonDeserializable):
         self.height = height
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        width = obj['width']
-        height = obj['height']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, width, height, file_size)
-
 
 class Animation(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type',
+                 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('width', required=True),
+        Field('height', required=True),
+        Field('duration', required=True),
+        Field('thumb', ttype='PhotoSize'),
+        Field('file_name'),
+        Field('mime_type'),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, duration, thumb, file_name, mime_type, file_size):
         """
         This object represents an animation file (GIF or H.264/MPEG-4 AVC video without sound)
@@ -597,30 +383,22 @@ class Animation(JsonDeserializable):
         self.mime_type = mime_type
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        width = obj['width']
-        height = obj['height']
-        duration = obj['duration']
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        file_name = None
-        if 'file_name' in obj:
-            file_name = obj['file_name']
-        mime_type = None
-        if 'mime_type' in obj:
-            mime_type = obj['mime_type']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, width, height, duration, thumb, file_name, mime_type, file_size)
-
 
 class Audio(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'performer', 'title', 'file_name', 'mime_type', 'file_size',
+                 'thumb')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('duration', required=True),
+        Field('performer'),
+        Field('title'),
+        Field('file_name'),
+        Field('mime_type'),
+        Field('file_size'),
+        Field('thumb', ttype='PhotoSize'),
+    )
+
     def __init__(self, file_id, file_unique_id, duration, performer, title, file_name, mime_type, file_size, thumb):
         """
         This object represents an audio file to be treated as music by the Telegram clients
@@ -635,34 +413,18 @@ class Audio(JsonDeserializable):
         self.file_size = file_size
         self.thumb = thumb
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        duration = obj['duration']
-        performer = None
-        if 'performer' in obj:
-            performer = obj['performer']
-        title = None
-        if 'title' in obj:
-            title = obj['title']
-        file_name = None
-        if 'file_name' in obj:
-            file_name = obj['file_name']
-        mime_type = None
-        if 'mime_type' in obj:
-            mime_type = obj['mime_type']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        return cls(file_id, file_unique_id, duration, performer, title, file_name, mime_type, file_size, thumb)
-
 
 class Document(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'thumb', 'file_name', 'mime_type', 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('thumb', ttype='PhotoSize'),
+        Field('file_name'),
+        Field('mime_type'),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, thumb, file_name, mime_type, file_size):
         """
         This object represents a general file
@@ -674,27 +436,22 @@ class Document(JsonDeserializable):
         self.mime_type = mime_type
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        file_name = None
-        if 'file_name' in obj:
-            file_name = obj['file_name']
-        mime_type = None
-        if 'mime_type' in obj:
-            mime_type = obj['mime_type']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, thumb, file_name, mime_type, file_size)
-
 
 class Video(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name', 'mime_type',
+                 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('width', required=True),
+        Field('height', required=True),
+        Field('duration', required=True),
+        Field('thumb', ttype='PhotoSize'),
+        Field('file_name'),
+        Field('mime_type'),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, duration, thumb, file_name, mime_type, file_size):
         """
         This object represents a video file
@@ -709,30 +466,18 @@ class Video(JsonDeserializable):
         self.mime_type = mime_type
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        width = obj['width']
-        height = obj['height']
-        duration = obj['duration']
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        file_name = None
-        if 'file_name' in obj:
-            file_name = obj['file_name']
-        mime_type = None
-        if 'mime_type' in obj:
-            mime_type = obj['mime_type']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, width, height, duration, thumb, file_name, mime_type, file_size)
-
 
 class VideoNote(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'length', 'duration', 'thumb', 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('length', required=True),
+        Field('duration', required=True),
+        Field('thumb', ttype='PhotoSize'),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, length, duration, thumb, file_size):
         """
         This object represents a video message
@@ -744,23 +489,17 @@ class VideoNote(JsonDeserializable):
         self.thumb = thumb
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        length = obj['length']
-        duration = obj['duration']
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, length, duration, thumb, file_size)
-
 
 class Voice(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'mime_type', 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('duration', required=True),
+        Field('mime_type'),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, duration, mime_type, file_size):
         """
         This object represents a voice note
@@ -771,22 +510,17 @@ class Voice(JsonDeserializable):
         self.mime_type = mime_type
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        duration = obj['duration']
-        mime_type = None
-        if 'mime_type' in obj:
-            mime_type = obj['mime_type']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, duration, mime_type, file_size)
-
 
 class Contact(JsonDeserializable):
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'user_id', 'vcard')
+    fields = (
+        Field('phone_number', required=True),
+        Field('first_name', required=True),
+        Field('last_name'),
+        Field('user_id'),
+        Field('vcard'),
+    )
+
     def __init__(self, phone_number, first_name, last_name, user_id, vcard):
         """
         This object represents a phone contact
@@ -797,24 +531,14 @@ class Contact(JsonDeserializable):
         self.user_id = user_id
         self.vcard = vcard
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        phone_number = obj['phone_number']
-        first_name = obj['first_name']
-        last_name = None
-        if 'last_name' in obj:
-            last_name = obj['last_name']
-        user_id = None
-        if 'user_id' in obj:
-            user_id = obj['user_id']
-        vcard = None
-        if 'vcard' in obj:
-            vcard = obj['vcard']
-        return cls(phone_number, first_name, last_name, user_id, vcard)
-
 
 class Dice(JsonDeserializable):
+    __slots__ = ('emoji', 'value')
+    fields = (
+        Field('emoji', required=True),
+        Field('value', required=True),
+    )
+
     def __init__(self, emoji, value):
         """
         This object represents a dice with random value
@@ -822,15 +546,14 @@ class Dice(JsonDeserializable):
         self.emoji = emoji
         self.value = value
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        emoji = obj['emoji']
-        value = obj['value']
-        return cls(emoji, value)
-
 
 class PollOption(JsonDeserializable):
+    __slots__ = ('text', 'voter_count')
+    fields = (
+        Field('text', required=True),
+        Field('voter_count', required=True),
+    )
+
     def __init__(self, text, voter_count):
         """
         This object contains information about one answer option in a poll
@@ -838,15 +561,15 @@ class PollOption(JsonDeserializable):
         self.text = text
         self.voter_count = voter_count
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        text = obj['text']
-        voter_count = obj['voter_count']
-        return cls(text, voter_count)
-
 
 class PollAnswer(JsonDeserializable):
+    __slots__ = ('poll_id', 'user', 'option_ids')
+    fields = (
+        Field('poll_id', required=True),
+        Field('user', ttype='User', required=True),
+        Field('option_ids'),
+    )
+
     def __init__(self, poll_id, user, option_ids):
         """
         This object represents an answer of a user in a non-anonymous poll
@@ -855,18 +578,27 @@ class PollAnswer(JsonDeserializable):
         self.user = user
         self.option_ids = option_ids
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        poll_id = obj['poll_id']
-        user = User.de_json(obj['user'])
-        option_ids = None
-        if 'option_ids' in obj:
-            option_ids = obj['option_ids']
-        return cls(poll_id, user, option_ids)
-
 
 class Poll(JsonDeserializable):
+    __slots__ = ('uid', 'question', 'options', 'total_voter_count', 'is_closed', 'is_anonymous', 'ttype',
+                 'allows_multiple_answers', 'correct_option_id', 'explanation', 'explanation_entities', 'open_period',
+                 'close_date')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('question', required=True),
+        Field('options', ttype='PollOption', depth=1, required=True),
+        Field('total_voter_count', required=True),
+        Field('is_closed', required=True),
+        Field('is_anonymous', required=True),
+        Field('ttype', 'type', required=True),
+        Field('allows_multiple_answers', default=True),
+        Field('correct_option_id'),
+        Field('explanation'),
+        Field('explanation_entities', ttype='MessageEntity', depth=1),
+        Field('open_period'),
+        Field('close_date'),
+    )
+
     def __init__(self, uid, question, options, total_voter_count, is_closed, is_anonymous, ttype,
                  allows_multiple_answers, correct_option_id, explanation, explanation_entities, open_period,
                  close_date):
@@ -887,53 +619,18 @@ class Poll(JsonDeserializable):
         self.open_period = open_period
         self.close_date = close_date
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        question = obj['question']
-        options = Poll.parse_options(obj['options'])
-        total_voter_count = obj['total_voter_count']
-        is_closed = obj['is_closed']
-        is_anonymous = obj['is_anonymous']
-        ttype = obj['type']
-        allows_multiple_answers = True
-        if 'allows_multiple_answers' in obj:
-            allows_multiple_answers = obj['allows_multiple_answers']
-        correct_option_id = None
-        if 'correct_option_id' in obj:
-            correct_option_id = obj['correct_option_id']
-        explanation = None
-        if 'explanation' in obj:
-            explanation = obj['explanation']
-        explanation_entities = None
-        if 'explanation_entities' in obj:
-            explanation_entities = Poll.parse_explanation_entities(obj['explanation_entities'])
-        open_period = None
-        if 'open_period' in obj:
-            open_period = obj['open_period']
-        close_date = None
-        if 'close_date' in obj:
-            close_date = obj['close_date']
-        return cls(uid, question, options, total_voter_count, is_closed, is_anonymous, ttype, allows_multiple_answers,
-                   correct_option_id, explanation, explanation_entities, open_period, close_date)
-
-    @classmethod
-    def parse_options(cls, obj):
-        options = []
-        for x in obj:
-            options.append(PollOption.de_json(x))
-        return options
-
-    @classmethod
-    def parse_explanation_entities(cls, obj):
-        explanation_entities = []
-        for x in obj:
-            explanation_entities.append(MessageEntity.de_json(x))
-        return explanation_entities
-
 
 class Location(JsonDeserializable):
+    __slots__ = ('longitude', 'latitude', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius')
+    fields = (
+        Field('longitude', required=True),
+        Field('latitude', required=True),
+        Field('horizontal_accuracy'),
+        Field('live_period'),
+        Field('heading'),
+        Field('proximity_alert_radius'),
+    )
+
     def __init__(self, longitude, latitude, horizontal_accuracy, live_period, heading, proximity_alert_radius):
         """
         This object represents a point on the map
@@ -945,27 +642,20 @@ class Location(JsonDeserializable):
         self.heading = heading
         self.proximity_alert_radius = proximity_alert_radius
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        longitude = obj['longitude']
-        latitude = obj['latitude']
-        horizontal_accuracy = None
-        if 'horizontal_accuracy' in obj:
-            horizontal_accuracy = obj['horizontal_accuracy']
-        live_period = None
-        if 'live_period' in obj:
-            live_period = obj['live_period']
-        heading = None
-        if 'heading' in obj:
-            heading = obj['heading']
-        proximity_alert_radius = None
-        if 'proximity_alert_radius' in obj:
-            proximity_alert_radius = obj['proximity_alert_radius']
-        return cls(longitude, latitude, horizontal_accuracy, live_period, heading, proximity_alert_radius)
-
 
 class Venue(JsonDeserializable):
+    __slots__ = ('location', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id',
+                 'google_place_type')
+    fields = (
+        Field('location', ttype='Location', required=True),
+        Field('title', required=True),
+        Field('address', required=True),
+        Field('foursquare_id'),
+        Field('foursquare_type'),
+        Field('google_place_id'),
+        Field('google_place_type'),
+    )
+
     def __init__(self, location, title, address, foursquare_id, foursquare_type, google_place_id, google_place_type):
         """
         This object represents a venue
@@ -978,31 +668,16 @@ class Venue(JsonDeserializable):
         self.google_place_id = google_place_id
         self.google_place_type = google_place_type
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        location = Location.de_json(obj['location'])
-        title = obj['title']
-        address = obj['address']
-        foursquare_id = None
-        if 'foursquare_id' in obj:
-            foursquare_id = obj['foursquare_id']
-        foursquare_type = None
-        if 'foursquare_type' in obj:
-            foursquare_type = obj['foursquare_type']
-        google_place_id = None
-        if 'google_place_id' in obj:
-            google_place_id = obj['google_place_id']
-        google_place_type = None
-        if 'google_place_type' in obj:
-            google_place_type = obj['google_place_type']
-        return cls(location, title, address, foursquare_id, foursquare_type, google_place_id, google_place_type)
-
 
 class WebAppData(JsonDeserializable):
     """
     Contains data sent from a Web App to the bot.
     """
+    __slots__ = ('data', 'button_text')
+    fields = (
+        Field('data', required=True),
+        Field('button_text', required=True),
+    )
 
     def __init__(self, data, button_text):
         """
@@ -1013,15 +688,15 @@ class WebAppData(JsonDeserializable):
         self.data = data
         self.button_text = button_text
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        data = obj['data']
-        button_text = obj['button_text']
-        return cls(data, button_text)
-
 
 class ProximityAlertTriggered(JsonDeserializable):
+    __slots__ = ('traveler', 'watcher', 'distance')
+    fields = (
+        Field('traveler', ttype='User', required=True),
+        Field('watcher', ttype='User', required=True),
+        Field('distance', required=True),
+    )
+
     def __init__(self, traveler, watcher, distance):
         """
         This object represents the content of a service message,
@@ -1031,44 +706,36 @@ class ProximityAlertTriggered(JsonDeserializable):
         self.watcher = watcher
         self.distance = distance
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        traveler = User.de_json(obj['traveler'])
-        watcher = User.de_json(obj['watcher'])
-        distance = obj['distance']
-        return cls(traveler, watcher, distance)
-
 
 class MessageAutoDeleteTimerChanged(JsonDeserializable):
+    __slots__ = ('message_auto_delete_time',)
+    fields = (
+        Field('message_auto_delete_time', required=True),
+    )
+
     def __init__(self, message_auto_delete_time):
         """
         This object represents a service message about a change in auto-delete timer settings
         """
         self.message_auto_delete_time = message_auto_delete_time
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        message_auto_delete_time = obj['message_auto_delete_time']
-        return cls(message_auto_delete_time)
-
 
 class VideoChatScheduled(JsonDeserializable):
+    __slots__ = ('start_date',)
+    fields = (
+        Field('start_date', required=True),
+    )
+
     def __init__(self, start_date):
         """
         This object represents a service message about a voice chat scheduled in the chat
         """
         self.start_date = start_date
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        start_date = obj['start_date']
-        return cls(start_date)
-
 
 class VideoChatStarted(JsonDeserializable):
+    __slots__ = ('field',)
+
     def __init__(self, field):
         """
         This object represents a service message about a voice chat started in the chat
@@ -1085,43 +752,38 @@ class VideoChatStarted(JsonDeserializable):
 
 
 class VideoChatEnded(JsonDeserializable):
+    __slots__ = ('duration',)
+    fields = (
+        Field('duration', required=True),
+    )
+
     def __init__(self, duration):
         """
         This object represents a service message about a voice chat ended in the chat
         """
         self.duration = duration
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        duration = obj['duration']
-        return cls(duration)
-
 
 class VideoChatParticipantsInvited(JsonDeserializable):
+    __slots__ = ('users',)
+    fields = (
+        Field('users', ttype='User', depth=1),
+    )
+
     def __init__(self, users):
         """
         This object represents a service message about new members invited to a voice chat
         """
         self.users = users
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        users = None
-        if 'users' in obj:
-            users = VideoChatParticipantsInvited.parse_users(obj['users'])
-        return cls(users)
-
-    @classmethod
-    def parse_users(cls, obj):
-        users = []
-        for x in obj:
-            users.append(User.de_json(x))
-        return users
-
 
 class UserProfilePhotos(JsonDeserializable):
+    __slots__ = ('total_count', 'photos')
+    fields = (
+        Field('total_count', required=True),
+        Field('photos', ttype='PhotoSize', depth=2, required=True),
+    )
+
     def __init__(self, total_count, photos):
         """
         This object represents one size of a photo or a file / sticker thumbnail
@@ -1129,20 +791,16 @@ class UserProfilePhotos(JsonDeserializable):
         self.total_count = total_count
         self.photos = photos
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        total_count = obj['total_count']
-        photos = UserProfilePhotos.parse_photos(obj['photos'])
-        return cls(total_count, photos)
-
-    @classmethod
-    def parse_photos(cls, obj):
-        photos = [[PhotoSize.de_json(y) for y in x] for x in obj]
-        return photos
-
 
 class File(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_path')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('file_size'),
+        Field('file_path'),
+    )
+
     def __init__(self, file_id, file_unique_id, file_size, file_path):
         """
         This object represents a file ready to be downloaded.
@@ -1152,24 +810,15 @@ class File(JsonDeserializable):
         self.file_size = file_size
         self.file_path = file_path
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        file_path = None
-        if 'file_path' in obj:
-            file_path = obj['file_path']
-        return cls(file_id, file_unique_id, file_size, file_path)
-
 
 class WebAppInfo(JsonDeserializable):
     """
     Contains information about a Web App
     """
+    __slots__ = ('url',)
+    fields = (
+        Field('url', required=True),
+    )
 
     def __init__(self, url):
         """
@@ -1177,14 +826,17 @@ class WebAppInfo(JsonDeserializable):
         """
         self.url = url
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        url = obj['url']
-        return cls(url)
-
 
 class ReplyKeyboardMarkup(JsonSerializable, JsonDeserializable):
+    __slots__ = ('keyboard', 'resize_keyboard', 'one_time_keyboard', 'input_field_placeholder', 'selective')
+    fields = (
+        Field('keyboard', ttype='KeyboardButton', depth=2, required=True),
+        Field('resize_keyboard', 'one_time_keyboard', default=False),
+        Field('one_time_keyboard', 'resize_keyboard', default=False),
+        Field('input_field_placeholder'),
+        Field('selective', default=False),
+    )
+
     def __init__(self, keyboard, resize_keyboard=False, one_time_keyboard=False, input_field_placeholder=None,
                  selective=False):
         """
@@ -1215,36 +867,17 @@ class ReplyKeyboardMarkup(JsonSerializable, JsonDeserializable):
             obj['selective'] = self.selective
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        keyboard = ReplyKeyboardMarkup.parse_keyboard_button(obj['keyboard'])
-        one_time_keyboard = False
-        if 'one_time_keyboard' in obj:
-            one_time_keyboard = obj['one_time_keyboard']
-        resize_keyboard = False
-        if 'resize_keyboard' in obj:
-            resize_keyboard = obj['resize_keyboard']
-        input_field_placeholder = None
-        if 'input_field_placeholder' in obj:
-            input_field_placeholder = obj['input_field_placeholder']
-        selective = False
-        if 'selective' in obj:
-            selective = obj['selective']
-        return cls(keyboard, one_time_keyboard, resize_keyboard, input_field_placeholder, selective)
-
-    @classmethod
-    def parse_keyboard_button(cls, obj):
-        row = []
-        column = []
-        for x in obj:
-            for y in x:
-                column.append(KeyboardButton.de_json(y))
-            row.append(column)
-        return row
-
 
 class KeyboardButton(JsonSerializable, JsonDeserializable):
+    __slots__ = ('text', 'request_contact', 'request_location', 'request_poll', 'web_app')
+    fields = (
+        Field('text', required=True),
+        Field('request_contact', default=False),
+        Field('request_location', default=False),
+        Field('request_poll', ttype='KeyboardButtonPollType'),
+        Field('web_app', ttype='WebAppInfo'),
+    )
+
     def __init__(self, text, request_contact=False, request_location=False, request_poll=None, web_app=None):
         """
         This object represents one button of the reply keyboard
@@ -1278,26 +911,13 @@ class KeyboardButton(JsonSerializable, JsonDeserializable):
             obj['web_app'] = self.web_app
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        text = obj['text']
-        request_contact = False
-        if 'request_contact' in obj:
-            request_contact = obj['request_contact']
-        request_location = False
-        if 'request_location' in obj:
-            request_location = obj['request_location']
-        request_poll = None
-        if 'request_poll' in obj:
-            request_poll = KeyboardButtonPollType.de_json(obj['request_poll'])
-        web_app = None
-        if 'web_app' in obj:
-            web_app = WebAppInfo.de_json(obj['web_app'])
-        return cls(text, request_contact, request_location, request_poll, web_app)
-
 
 class KeyboardButtonPollType(JsonSerializable, JsonDeserializable):
+    __slots__ = ('ttype',)
+    fields = (
+        Field('ttype', 'type', required=True),
+    )
+
     def __init__(self, ttype):
         """
         This object represents ttype of poll,
@@ -1309,14 +929,10 @@ class KeyboardButtonPollType(JsonSerializable, JsonDeserializable):
         obj = {'type': self.ttype}
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        ttype = obj['type']
-        return cls(ttype)
-
 
 class ReplyKeyboardRemove(JsonSerializable):
+    __slots__ = ('remove_keyboard', 'selective')
+
     def __init__(self, remove_keyboard=True, selective=False):
         """
         Upon receiving a message with this object,
@@ -1333,6 +949,11 @@ class ReplyKeyboardRemove(JsonSerializable):
 
 
 class InlineKeyboardMarkup(JsonSerializable, JsonDeserializable):
+    __slots__ = ('inline_keyboard',)
+    fields = (
+        Field('inline_keyboard', ttype='InlineKeyboardButton', depth=2, required=True),
+    )
+
     def __init__(self, inline_keyboard):
         """
         This object represents an inline keyboard that appears right next to the message it belongs to
@@ -1346,24 +967,22 @@ class InlineKeyboardMarkup(JsonSerializable, JsonDeserializable):
         obj = {'inline_keyboard': self.inline_keyboard}
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        inline_keyboard = InlineKeyboardMarkup.parse_keyboard_button(obj['inline_keyboard'])
-        return cls(inline_keyboard)
-
-    @classmethod
-    def parse_keyboard_button(cls, obj):
-        row = []
-        column = []
-        for x in obj:
-            for y in x:
-                column.append(InlineKeyboardButton.de_json(y))
-            row.append(column)
-        return row
-
 
 class InlineKeyboardButton(JsonSerializable, JsonDeserializable):
+    __slots__ = ('text', 'url', 'login_url', 'callback_data', 'web_app', 'switch_inline_query',
+                 'switch_inline_query_current_chat', 'callback_game', 'pay')
+    fields = (
+        Field('text', required=True),
+        Field('url'),
+        Field('login_url', ttype='LoginUrl'),
+        Field('callback_data'),
+        Field('web_app', ttype='WebAppInfo'),
+        Field('switch_inline_query'),
+        Field('switch_inline_query_current_chat'),
+        Field('callback_game'),
+        Field('pay', default=False),
+    )
+
     def __init__(self, text, url=None, login_url=None, callback_data=None, web_app=None, switch_inline_query=None,
                  switch_inline_query_current_chat=None, callback_game=None, pay=False):
         """
@@ -1421,39 +1040,16 @@ class InlineKeyboardButton(JsonSerializable, JsonDeserializable):
             obj['pay'] = self.pay
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        text = obj['text']
-        url = None
-        if 'url' in obj:
-            url = obj['url']
-        login_url = None
-        if 'login_url' in obj:
-            login_url = LoginUrl.de_json(obj['login_url'])
-        callback_data = None
-        if 'callback_data' in obj:
-            callback_data = obj['callback_data']
-        web_app = None
-        if 'web_app' in obj:
-            web_app = WebAppInfo.de_json(obj['web_app'])
-        switch_inline_query = None
-        if 'switch_inline_query' in obj:
-            switch_inline_query = obj['switch_inline_query']
-        switch_inline_query_current_chat = None
-        if 'switch_inline_query_current_chat' in obj:
-            switch_inline_query_current_chat = obj['switch_inline_query_current_chat']
-        callback_game = None
-        if 'callback_game' in obj:
-            callback_game = obj['callback_game']
-        pay = False
-        if 'pay' in obj:
-            pay = obj['pay']
-        return cls(text, url, login_url, callback_data, web_app, switch_inline_query, switch_inline_query_current_chat,
-                   callback_game, pay)
-
 
 class LoginUrl(JsonSerializable, JsonDeserializable):
+    __slots__ = ('url', 'forward_text', 'bot_username', 'request_write_access')
+    fields = (
+        Field('url', required=True),
+        Field('forward_text'),
+        Field('bot_username'),
+        Field('request_write_access'),
+    )
+
     def __init__(self, url, forward_text=None, bot_username=None, request_write_access=False):
         """
         This object represents a parameter of the inline keyboard button used to automatically authorize a user,
@@ -1481,23 +1077,19 @@ class LoginUrl(JsonSerializable, JsonDeserializable):
             obj['request_write_access'] = self.request_write_access
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        url = obj['url']
-        forward_text = None
-        if 'forward_text' in obj:
-            forward_text = obj['forward_text']
-        bot_username = None
-        if 'bot_username' in obj:
-            bot_username = obj['bot_username']
-        request_write_access = None
-        if 'request_write_access' in obj:
-            request_write_access = obj['request_write_access']
-        return cls(url, forward_text, bot_username, request_write_access)
-
 
 class CallbackQuery(JsonDeserializable):
+    __slots__ = ('uid', 'from_user', 'message', 'inline_message_id', 'chat_instance', 'data', 'game_short_name')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('from_user', 'from', ttype='User', required=True),
+        Field('data'),
+        Field('chat_instance', required=True),
+        Field('message', ttype='Message'),
+        Field('inline_message_id'),
+        Field('game_short_name'),
+    )
+
     def __init__(self, uid, from_user, data, chat_instance, message, inline_message_id, game_short_name):
         """
         This object represents an incoming callback query from a callback button in an inline keyboard
@@ -1510,28 +1102,10 @@ class CallbackQuery(JsonDeserializable):
         self.data = data
         self.game_short_name = game_short_name
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        from_user = User.de_json(obj['from'])
-        message = None
-        if 'message' in obj:
-            message = Message.de_json(obj['message'])
-        inline_message_id = None
-        if 'inline_message_id' in obj:
-            inline_message_id = obj['inline_message_id']
-        chat_instance = obj['chat_instance']
-        data = None
-        if 'data' in obj:
-            data = obj['data']
-        game_short_name = None
-        if 'game_short_name' in obj:
-            game_short_name = obj['game_short_name']
-        return cls(uid, from_user, data, chat_instance, message, inline_message_id, game_short_name)
-
 
 class ForceReply(JsonSerializable):
+    __slots__ = ('force_reply', 'input_field_placeholder', 'selective')
+
     def __init__(self, force_reply=True, input_field_placeholder=None, selective=False):
         """
         Upon receiving a message with this object,
@@ -1554,6 +1128,14 @@ class ForceReply(JsonSerializable):
 
 
 class ChatPhoto(JsonDeserializable):
+    __slots__ = ('small_file_id', 'small_file_unique_id', 'big_file_id', 'big_file_unique_id')
+    fields = (
+        Field('small_file_id', required=True),
+        Field('small_file_unique_id', required=True),
+        Field('big_file_id', required=True),
+        Field('big_file_unique_id', required=True),
+    )
+
     def __init__(self, small_file_id, small_file_unique_id, big_file_id, big_file_unique_id):
         """
         This object represents a chat photo
@@ -1563,17 +1145,22 @@ class ChatPhoto(JsonDeserializable):
         self.big_file_id = big_file_id
         self.big_file_unique_id = big_file_unique_id
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        small_file_id = obj['small_file_id']
-        small_file_unique_id = obj['small_file_unique_id']
-        big_file_id = obj['big_file_id']
-        big_file_unique_id = obj['big_file_unique_id']
-        return cls(small_file_id, small_file_unique_id, big_file_id, big_file_unique_id)
-
 
 class ChatInviteLink(JsonDeserializable):
+    __slots__ = ('invite_link', 'creator', 'creates_join_request', 'is_primary', 'is_revoked', 'name', 'expire_date',
+                 'member_limit', 'pending_join_request_count')
+    fields = (
+        Field('invite_link', required=True),
+        Field('creator', ttype='User', required=True),
+        Field('creates_join_request', default=False),
+        Field('is_primary', default=False),
+        Field('is_revoked', default=False),
+        Field('name'),
+        Field('expire_date'),
+        Field('member_limit'),
+        Field('pending_join_request_count'),
+    )
+
     def __init__(self, invite_link, creator, creates_join_request, is_primary, is_revoked, name, expire_date,
                  member_limit, pending_join_request_count):
         """
@@ -1589,40 +1176,28 @@ class ChatInviteLink(JsonDeserializable):
         self.member_limit = member_limit
         self.pending_join_request_count = pending_join_request_count
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        invite_link = obj['invite_link']
-        creator = User.de_json(obj['creator'])
-        creates_join_request = False
-        if 'creates_join_request' in obj:
-            creates_join_request = obj['creates_join_request']
-        is_primary = False
-        if 'is_primary' in obj:
-            is_primary = obj['is_primary']
-        is_revoked = False
-        if 'is_revoked' in obj:
-            is_revoked = obj['is_revoked']
-        name = None
-        if 'name' in obj:
-            name = obj['name']
-        expire_date = None
-        if 'expire_date' in obj:
-            expire_date = obj['expire_date']
-        member_limit = None
-        if 'member_limit' in obj:
-            member_limit = obj['member_limit']
-        pending_join_request_count = None
-        if 'pending_join_request_count' in obj:
-            pending_join_request_count = obj['pending_join_request_count']
-        return cls(invite_link, creator, creates_join_request, is_primary, is_revoked, name, expire_date, member_limit,
-                   pending_join_request_count)
-
 
 class ChatAdministratorRights(JsonDeserializable, JsonSerializable):
     """
     Represents the rights of an administrator in a chat
     """
+    __slots__ = ('is_anonymous', 'can_manage_chat', 'can_delete_messages', 'can_manage_video_chats',
+                 'can_restrict_members', 'can_promote_members', 'can_change_info', 'can_invite_users',
+                 'can_post_messages', 'can_edit_messages', 'can_pin_messages')
+    fields = (
+        Field('is_anonymous', default=False),
+        Field('can_manage_chat', default=False),
+        Field('can_delete_messages', default=False),
+        Field('can_manage_video_chats', default=False),
+        Field('can_restrict_members', default=False),
+        Field('can_promote_members', default=False),
+        Field('can_change_info', default=False),
+        Field('can_invite_users', default=False),
+        Field('can_post_messages', default=False),
+        Field('can_edit_messages', default=False),
+        Field('can_pin_messages', default=False),
+    )
+
     def __init__(self, is_anonymous=False, can_manage_chat=False, can_delete_messages=False,
                  can_manage_video_chats=False, can_restrict_members=False, can_promote_members=False,
                  can_change_info=False, can_invite_users=False, can_post_messages=False, can_edit_messages=False,
@@ -1681,46 +1256,6 @@ class ChatAdministratorRights(JsonDeserializable, JsonSerializable):
             obj['can_pin_messages'] = self.can_pin_messages
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        is_anonymous = False
-        if 'is_anonymous' in obj:
-            is_anonymous = True
-        can_manage_chat = False
-        if 'can_manage_chat' in obj:
-            can_manage_chat = True
-        can_delete_messages = False
-        if 'can_delete_messages' in obj:
-            can_delete_messages = True
-        can_manage_video_chats = False
-        if 'can_manage_video_chats' in obj:
-            can_manage_video_chats = True
-        can_restrict_members = False
-        if 'can_restrict_members' in obj:
-            can_restrict_members = True
-        can_promote_members = False
-        if 'can_promote_members' in obj:
-            can_promote_members = True
-        can_change_info = False
-        if 'can_change_info' in obj:
-            can_change_info = True
-        can_invite_users = False
-        if 'can_invite_users' in obj:
-            can_invite_users = True
-        can_post_messages = False
-        if 'can_post_messages' in obj:
-            can_post_messages = True
-        can_edit_messages = False
-        if 'can_edit_messages' in obj:
-            can_edit_messages = True
-        can_pin_messages = False
-        if 'can_pin_messages' in obj:
-            can_pin_messages = True
-        return cls(is_anonymous, can_manage_chat, can_delete_messages, can_manage_video_chats, can_restrict_members,
-                   can_promote_members, can_change_info, can_invite_users, can_post_messages, can_edit_messages,
-                   can_pin_messages)
-
 
 class ChatMember(JsonDeserializable):
     """
@@ -1733,6 +1268,7 @@ class ChatMember(JsonDeserializable):
         ChatMemberLeft
         ChatMemberBanned
     """
+    __slots__ = ('Owner', 'Administrator', 'Member', 'Restricted', 'Left', 'Banned')
 
     def __int__(self):
         self.Owner = self.__ChatMemberOwner
@@ -1760,6 +1296,14 @@ class ChatMember(JsonDeserializable):
             return cls.__ChatMemberBanned.de_json(obj_type)
 
     class __ChatMemberOwner(JsonDeserializable):
+        __slots__ = ('status', 'user', 'is_anonymous', 'custom_title')
+        fields = (
+            Field('status', required=True),
+            Field('user', ttype='User', required=True),
+            Field('is_anonymous', default=False),
+            Field('custom_title'),
+        )
+
         def __init__(self, status, user, is_anonymous, custom_title):
             """
             Represents a chat member that owns the chat and has all administrator privileges
@@ -1769,20 +1313,28 @@ class ChatMember(JsonDeserializable):
             self.is_anonymous = is_anonymous
             self.custom_title = custom_title
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            status = obj['status']
-            user = User.de_json(obj['user'])
-            is_anonymous = False
-            if 'is_anonymous' in obj:
-                is_anonymous = obj['is_anonymous']
-            custom_title = None
-            if 'custom_title' in obj:
-                custom_title = obj['custom_title']
-            return cls(status, user, is_anonymous, custom_title)
-
     class __ChatMemberAdministrator(JsonDeserializable):
+        __slots__ = ('status', 'user', 'can_be_edited', 'is_anonymous', 'can_manage_chat', 'can_delete_messages',
+                     'can_manage_video_chats', 'can_restrict_members', 'can_promote_members', 'can_change_info',
+                     'can_invite_users', 'can_post_messages', 'can_edit_messages', 'can_pin_messages', 'custom_title')
+        fields = (
+            Field('status', required=True),
+            Field('user', ttype='User', required=True),
+            Field('can_be_edited', default=False),
+            Field('is_anonymous', default=False),
+            Field('can_manage_chat', default=False),
+            Field('can_delete_messages', default=False),
+            Field('can_manage_video_chats', default=False),
+            Field('can_restrict_members', default=False),
+            Field('can_promote_members', default=False),
+            Field('can_change_info', default=False),
+            Field('can_invite_users', default=False),
+            Field('can_post_messages', default=False),
+            Field('can_edit_messages', default=False),
+            Field('can_pin_messages', default=False),
+            Field('custom_title'),
+        )
+
         def __init__(self, status, user, can_be_edited, is_anonymous, can_manage_chat, can_delete_messages,
                      can_manage_video_chats, can_restrict_members, can_promote_members, can_change_info,
                      can_invite_users, can_post_messages, can_edit_messages, can_pin_messages, custom_title):
@@ -1805,55 +1357,13 @@ class ChatMember(JsonDeserializable):
             self.can_pin_messages = can_pin_messages
             self.custom_title = custom_title
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            status = obj['status']
-            user = User.de_json(obj['user'])
-            can_be_edited = False
-            if 'can_be_edited' in obj:
-                can_be_edited = obj['can_be_edited']
-            is_anonymous = False
-            if 'is_anonymous' in obj:
-                is_anonymous = obj['is_anonymous']
-            can_manage_chat = False
-            if 'can_manage_chat' in obj:
-                can_manage_chat = obj['can_manage_chat']
-            can_delete_messages = False
-            if 'can_delete_messages' in obj:
-                can_delete_messages = obj['can_delete_messages']
-            can_manage_video_chats = False
-            if 'can_manage_video_chats' in obj:
-                can_manage_video_chats = obj['can_manage_video_chats']
-            can_restrict_members = False
-            if 'can_restrict_members' in obj:
-                can_restrict_members = obj['can_restrict_members']
-            can_promote_members = False
-            if 'can_promote_members' in obj:
-                can_promote_members = obj['can_promote_members']
-            can_change_info = False
-            if 'can_change_info' in obj:
-                can_change_info = obj['can_change_info']
-            can_invite_users = False
-            if 'can_invite_users' in obj:
-                can_invite_users = obj['can_invite_users']
-            can_post_messages = False
-            if 'can_post_messages' in obj:
-                can_post_messages = obj['can_post_messages']
-            can_edit_messages = False
-            if 'can_edit_messages' in obj:
-                can_edit_messages = obj['can_edit_messages']
-            can_pin_messages = False
-            if 'can_pin_messages' in obj:
-                can_pin_messages = obj['can_pin_messages']
-            custom_title = None
-            if 'custom_title' in obj:
-                custom_title = obj['custom_title']
-            return cls(status, user, can_be_edited, is_anonymous, can_manage_chat, can_delete_messages,
-                       can_manage_video_chats, can_restrict_members, can_promote_members, can_change_info,
-                       can_invite_users, can_post_messages, can_edit_messages, can_pin_messages, custom_title)
-
     class __ChatMemberMember(JsonDeserializable):
+        __slots__ = ('status', 'user')
+        fields = (
+            Field('status', required=True),
+            Field('user', ttype='User', required=True),
+        )
+
         def __init__(self, status, user):
             """
             Represents a chat member that has no additional privileges or restrictions
@@ -1861,14 +1371,25 @@ class ChatMember(JsonDeserializable):
             self.status = status
             self.user = user
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            status = obj['status']
-            user = User.de_json(obj['user'])
-            return cls(status, user)
-
     class __ChatMemberRestricted(JsonDeserializable):
+        __slots__ = ('status', 'user', 'is_member', 'can_change_info', 'can_invite_users', 'can_pin_messages',
+                     'can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages',
+                     'can_add_web_page_previews', 'until_date')
+        fields = (
+            Field('status', required=True),
+            Field('user', ttype='User', required=True),
+            Field('is_member', default=False),
+            Field('can_change_info', default=False),
+            Field('can_invite_users', default=False),
+            Field('can_pin_messages', default=False),
+            Field('can_send_messages', default=False),
+            Field('can_send_media_messages', default=False),
+            Field('can_send_polls', default=False),
+            Field('can_send_other_messages', default=False),
+            Field('can_add_web_page_previews', default=False),
+            Field('until_date'),
+        )
+
         def __init__(self, status, user, is_member, can_change_info, can_invite_users, can_pin_messages,
                      can_send_messages, can_send_media_messages, can_send_polls, can_send_other_messages,
                      can_add_web_page_previews, until_date):
@@ -1888,46 +1409,13 @@ class ChatMember(JsonDeserializable):
             self.can_add_web_page_previews = can_add_web_page_previews
             self.until_date = until_date
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            status = obj['status']
-            user = User.de_json(obj['user'])
-            is_member = False
-            if 'is_member' in obj:
-                is_member = obj['is_member']
-            can_change_info = False
-            if 'can_change_info' in obj:
-                can_change_info = obj['can_change_info']
-            can_invite_users = False
-            if 'can_invite_users' in obj:
-                can_invite_users = obj['can_invite_users']
-            can_pin_messages = False
-            if 'can_pin_messages' in obj:
-                can_pin_messages = obj['can_pin_messages']
-            can_send_messages = False
-            if 'can_send_messages' in obj:
-                can_send_messages = obj['can_send_messages']
-            can_send_media_messages = False
-            if 'can_send_media_messages' in obj:
-                can_send_media_messages = obj['can_send_media_messages']
-            can_send_polls = False
-            if 'can_send_polls' in obj:
-                can_send_polls = obj['can_send_polls']
-            can_send_other_messages = False
-            if 'can_send_other_messages' in obj:
-                can_send_other_messages = obj['can_send_other_messages']
-            can_add_web_page_previews = False
-            if 'can_add_web_page_previews' in obj:
-                can_add_web_page_previews = obj['can_add_web_page_previews']
-            until_date = None
-            if 'until_date' in obj:
-                until_date = obj['until_date']
-            return cls(status, user, is_member, can_change_info, can_invite_users, can_pin_messages, can_send_messages,
-                       can_send_media_messages, can_send_polls, can_send_other_messages, can_add_web_page_previews,
-                       until_date)
-
     class __ChatMemberLeft(JsonDeserializable):
+        __slots__ = ('status', 'user')
+        fields = (
+            Field('status', required=True),
+            Field('user', ttype='User', required=True),
+        )
+
         def __init__(self, status, user):
             """
             Represents a chat member that isn't currently a member of the chat, but may join it themselves
@@ -1935,14 +1423,14 @@ class ChatMember(JsonDeserializable):
             self.status = status
             self.user = user
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            status = obj['status']
-            user = User.de_json(obj['user'])
-            return cls(status, user)
-
     class __ChatMemberBanned(JsonDeserializable):
+        __slots__ = ('status', 'user', 'until_date')
+        fields = (
+            Field('status', required=True),
+            Field('user', ttype='User', required=True),
+            Field('until_date', required=True),
+        )
+
         def __init__(self, status, user, until_date):
             """
             Represents a chat member that was banned in the chat and can't return to the chat or view chat messages
@@ -1951,16 +1439,18 @@ class ChatMember(JsonDeserializable):
             self.user = user
             self.until_date = until_date
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            status = obj['status']
-            user = User.de_json(obj['user'])
-            until_date = obj['until_date']
-            return cls(status, user, until_date)
-
 
 class ChatMemberUpdated(JsonDeserializable):
+    __slots__ = ('chat', 'from_user', 'date', 'old_chat_member', 'new_chat_member', 'invite_link')
+    fields = (
+        Field('chat', ttype='Chat', required=True),
+        Field('from_user', 'from', ttype='User', required=True),
+        Field('date', required=True),
+        Field('old_chat_member', ttype='ChatMember', required=True),
+        Field('new_chat_member', ttype='ChatMember', required=True),
+        Field('invite_link', ttype='ChatInviteLink'),
+    )
+
     def __init__(self, chat, from_user, date, old_chat_member, new_chat_member, invite_link):
         """
         This object represents changes in the status of a chat member
@@ -1972,21 +1462,17 @@ class ChatMemberUpdated(JsonDeserializable):
         self.new_chat_member = new_chat_member
         self.invite_link = invite_link
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        chat = Chat.de_json(obj['chat'])
-        from_user = User.de_json(obj['from'])
-        date = obj['date']
-        old_chat_member = ChatMember.de_json(obj['old_chat_member'])
-        new_chat_member = ChatMember.de_json(obj['new_chat_member'])
-        invite_link = None
-        if 'invite_link' in obj:
-            invite_link = ChatInviteLink.de_json(obj['invite_link'])
-        return cls(chat, from_user, date, old_chat_member, new_chat_member, invite_link)
-
 
 class ChatJoinRequest(JsonSerializable, JsonDeserializable):
+    __slots__ = ('chat', 'from_user', 'date', 'bio', 'invite_link')
+    fields = (
+        Field('chat', ttype='Chat', required=True),
+        Field('from_user', 'user', ttype='User', required=True),
+        Field('date', required=True),
+        Field('bio'),
+        Field('invite_link', ttype='ChatInviteLink'),
+    )
+
     def __init__(self, chat, from_user, date, bio, invite_link):
         """
         Represents a join request sent to a chat
@@ -2014,22 +1500,21 @@ class ChatJoinRequest(JsonSerializable, JsonDeserializable):
             obj['invite_link'] = self.invite_link
         return obj
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        chat = Chat.de_json(obj['chat'])
-        from_user = User.de_json(obj['user'])
-        date = obj['date']
-        bio = None
-        if 'bio' in obj:
-            bio = obj['bio']
-        invite_link = None
-        if 'invite_link' in obj:
-            invite_link = ChatInviteLink.de_json(obj['invite_link'])
-        return cls(chat, from_user, date, bio, invite_link)
-
 
 class ChatPermissions(JsonDeserializable):
+    __slots__ = ('can_send_messages', 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages',
+                 'can_add_web_page_previews', 'can_change_info', 'can_invite_users', 'can_pin_messages')
+    fields = (
+        Field('can_send_messages', default=False),
+        Field('can_send_media_messages', default=False),
+        Field('can_send_polls', default=False),
+        Field('can_send_other_messages', default=False),
+        Field('can_add_web_page_previews', default=False),
+        Field('can_change_info', default=False),
+        Field('can_invite_users', default=False),
+        Field('can_pin_messages', default=False),
+    )
+
     def __init__(self, can_send_messages, can_send_media_messages, can_send_polls, can_send_other_messages,
                  can_add_web_page_previews, can_change_info, can_invite_users, can_pin_messages):
         """
@@ -2044,38 +1529,14 @@ class ChatPermissions(JsonDeserializable):
         self.can_invite_users = can_invite_users
         self.can_pin_messages = can_pin_messages
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        can_send_messages = False
-        if 'can_send_messages' in obj:
-            can_send_messages = obj['can_send_messages']
-        can_send_media_messages = False
-        if 'can_send_media_messages' in obj:
-            can_send_media_messages = obj['can_send_media_messages']
-        can_send_polls = False
-        if 'can_send_polls' in obj:
-            can_send_polls = obj['can_send_polls']
-        can_send_other_messages = False
-        if 'can_send_other_messages' in obj:
-            can_send_other_messages = obj['can_send_other_messages']
-        can_add_web_page_previews = False
-        if 'can_add_web_page_previews' in obj:
-            can_add_web_page_previews = obj['can_add_web_page_previews']
-        can_change_info = False
-        if 'can_change_info' in obj:
-            can_change_info = obj['can_change_info']
-        can_invite_users = False
-        if 'can_invite_users' in obj:
-            can_invite_users = obj['can_invite_users']
-        can_pin_messages = False
-        if 'can_pin_messages' in obj:
-            can_pin_messages = obj['can_pin_messages']
-        return cls(can_send_messages, can_send_media_messages, can_send_polls, can_send_other_messages,
-                   can_add_web_page_previews, can_change_info, can_invite_users, can_pin_messages)
-
 
 class ChatLocation(JsonDeserializable):
+    __slots__ = ('location', 'address')
+    fields = (
+        Field('location', ttype='Location', required=True),
+        Field('address', required=True),
+    )
+
     def __init__(self, location, address):
         """
         Represents a location to which a chat is connected
@@ -2083,15 +1544,14 @@ class ChatLocation(JsonDeserializable):
         self.location = location
         self.address = address
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        location = Location.de_json(obj['location'])
-        address = obj['address']
-        return cls(location, address)
-
 
 class BotCommand(JsonDeserializable):
+    __slots__ = ('command', 'description')
+    fields = (
+        Field('command', required=True),
+        Field('description', required=True),
+    )
+
     def __init__(self, command, description):
         """
         This object represents a bot command
@@ -2099,13 +1559,6 @@ class BotCommand(JsonDeserializable):
         self.command = command
         self.description = description
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        command = obj['command']
-        description = obj['description']
-        return cls(command, description)
-
 
 class BotCommandScope:
     """
@@ -2119,6 +1572,8 @@ class BotCommandScope:
         BotCommandScopeChatAdministrators
         BotCommandScopeChatMember
     """
+    __slots__ = ('Default', 'AllPrivateChats', 'AllGroupChats', 'AllChatAdministrators', 'Chat', 'ChatAdministrators',
+                 'ChatMember')
 
     def __init__(self):
         self.Default = self.__BotCommandScopeDefault
@@ -2133,6 +1588,8 @@ class BotCommandScope:
         return repr(self.Default())
 
     class __BotCommandScopeDefault(JsonSerializable):
+        __slots__ = ('ttype',)
+
         def __init__(self):
             """
             Represents the default scope of bot commands
@@ -2147,6 +1604,8 @@ class BotCommandScope:
             return repr(self.to_dict())
 
     class __BotCommandScopeAllPrivateChats(JsonSerializable):
+        __slots__ = ('ttype',)
+
         def __init__(self):
             """
             Represents the scope of bot commands, covering all private chats
@@ -2158,6 +1617,8 @@ class BotCommandScope:
             return obj
 
     class __BotCommandScopeAllGroupChats(JsonSerializable):
+        __slots__ = ('ttype',)
+
         def __init__(self):
             """
             Represents the scope of bot commands, covering all group and supergroup chats
@@ -2169,6 +1630,8 @@ class BotCommandScope:
             return obj
 
     class __BotCommandScopeAllChatAdministrators(JsonSerializable):
+        __slots__ = ('ttype',)
+
         def __init__(self):
             """
             Represents the scope of bot commands, covering all group and supergroup chat administrators
@@ -2180,6 +1643,8 @@ class BotCommandScope:
             return obj
 
     class __BotCommandScopeChat(JsonSerializable):
+        __slots__ = ('ttype', 'chat_id')
+
         def __init__(self, chat_id, ttype='chat'):
             """
             Represents the scope of bot commands, covering a specific chat
@@ -2195,6 +1660,8 @@ class BotCommandScope:
             return obj
 
     class __BotCommandScopeChatAdministrators(JsonSerializable):
+        __slots__ = ('ttype', 'chat_id')
+
         def __init__(self, chat_id, ttype='chat_administrator'):
             """
             Represents the scope of bot commands,
@@ -2211,6 +1678,8 @@ class BotCommandScope:
             return obj
 
     class __BotCommandScopeChatMember(JsonSerializable):
+        __slots__ = ('ttype', 'chat_id', 'user_id')
+
         def __init__(self, chat_id, user_id, ttype='chat_member'):
             """
             Represents the scope of bot commands,
@@ -2238,6 +1707,12 @@ class MenuButton(JsonDeserializable):
     If a menu button other than MenuButtonDefault is set for a private chat, then it is applied in the chat.
     Otherwise, the default menu button is applied. By default, the menu button opens the list of bot commands.
     """
+    __slots__ = ('Commands', 'WebApp', 'Default', 'type', 'text', 'web_app')
+    fields = (
+        Field('type'),
+        Field('text'),
+        Field('web_app'),
+    )
 
     def __init__(self, ttype, text, web_app):
         """
@@ -2250,24 +1725,11 @@ class MenuButton(JsonDeserializable):
         self.text = text
         self.web_app = web_app
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        ttype = None
-        if 'type' in obj:
-            ttype = obj['type']
-        text = None
-        if 'text' in obj:
-            text = obj['text']
-        web_app = None
-        if 'web_app' in obj:
-            web_app = obj['web_app']
-        return cls(ttype, text, web_app)
-
     class __MenuButtonCommands(JsonSerializable):
         """
         Represents a menu button, which opens the bots' list of commands.
         """
+        __slots__ = ('type',)
 
         def __init__(self, ttype='commands'):
             """
@@ -2284,6 +1746,7 @@ class MenuButton(JsonDeserializable):
         """
         Represents a menu button, which opens the bots' list of commands.
         """
+        __slots__ = ('type', 'text', 'web_app')
 
         def __init__(self, text, web_app, ttype='web_app'):
             """
@@ -2304,6 +1767,7 @@ class MenuButton(JsonDeserializable):
         """
         Describes that no specific value for the menu button was set.
         """
+        __slots__ = ('type',)
 
         def __init__(self, ttype='default'):
             """
@@ -2318,6 +1782,12 @@ class MenuButton(JsonDeserializable):
 
 
 class ResponseParameters(JsonDeserializable):
+    __slots__ = ('migrate_to_chat_id', 'retry_after')
+    fields = (
+        Field('migrate_to_chat_id'),
+        Field('retry_after'),
+    )
+
     def __init__(self, migrate_to_chat_id, retry_after):
         """
         Contains information about why a request was unsuccessful
@@ -2325,17 +1795,6 @@ class ResponseParameters(JsonDeserializable):
         self.migrate_to_chat_id = migrate_to_chat_id
         self.retry_after = retry_after
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        migrate_to_chat_id = None
-        if 'migrate_to_chat_id' in obj:
-            migrate_to_chat_id = obj['migrate_to_chat_id']
-        retry_after = None
-        if 'retry_after' in obj:
-            retry_after = obj['retry_after']
-        return cls(migrate_to_chat_id, retry_after)
-
 
 class InputMedia:
     """ 
@@ -2347,6 +1806,7 @@ class InputMedia:
         InputMediaPhoto
         InputMediaVideo
     """
+    __slots__ = ('Photo', 'Video', 'Animation', 'Audio', 'Document')
 
     def __init__(self):
         self.Photo = self.__InputMediaPhoto
@@ -2356,6 +1816,8 @@ class InputMedia:
         self.Document = self.__InputMediaDocument
 
     class __InputMediaPhoto(JsonSerializable):
+        __slots__ = ('ttype', 'media', 'caption', 'parse_mode', 'caption_entities')
+
         def __init__(self, ttype, media, caption=None, parse_mode=None, caption_entities=None):
             """
             Represents a photo to be sent
@@ -2388,6 +1850,9 @@ class InputMedia:
             return obj
 
     class __InputMediaVideo(JsonSerializable):
+        __slots__ = ('ttype', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities', 'width', 'height',
+                     'duration', 'supports_streaming')
+
         def __init__(self, ttype, media, thumb=None, caption=None, parse_mode=None, caption_entities=None, width=None,
                      height=None, duration=None, supports_streaming=False):
             """
@@ -2443,6 +1908,9 @@ class InputMedia:
             return obj
 
     class __InputMediaAnimation(JsonSerializable):
+        __slots__ = ('ttype', 'media', 'thumb', 'caption', 'caption_entities', 'parse_mode', 'width', 'height',
+                     'duration')
+
         def __init__(self, ttype, media, thumb=None, caption=None, parse_mode=None, caption_entities=None,
                      width=None, height=None, duration=None):
             """
@@ -2494,6 +1962,9 @@ class InputMedia:
             return obj
 
     class __InputMediaAudio(JsonSerializable):
+        __slots__ = ('ttype', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities', 'duration', 'performer',
+                     'title')
+
         def __init__(self, ttype, media, thumb=None, caption=None, parse_mode=None, caption_entities=None,
                      duration=None, performer=None, title=None):
             """
@@ -2545,6 +2016,9 @@ class InputMedia:
             return obj
 
     class __InputMediaDocument(JsonSerializable):
+        __slots__ = ('ttype', 'media', 'thumb', 'caption', 'parse_mode', 'caption_entities',
+                     'disable_content_type_detection')
+
         def __init__(self, ttype, media, thumb=None, caption=None, parse_mode=None, caption_entities=None,
                      disable_content_type_detection=False):
             """
@@ -2602,6 +2076,22 @@ class InputFile:
 
 
 class Sticker(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'is_animated', 'is_video', 'thumb', 'emoji',
+                 'set_name', 'mask_position', 'file_size')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('width', required=True),
+        Field('height', required=True),
+        Field('is_animated', default=False),
+        Field('is_video', default=False),
+        Field('thumb', ttype='PhotoSize'),
+        Field('emoji'),
+        Field('set_name'),
+        Field('mask_position', ttype='MaskPosition'),
+        Field('file_size'),
+    )
+
     def __init__(self, file_id, file_unique_id, width, height, is_animated, is_video, thumb, emoji, set_name,
                  mask_position, file_size):
         """
@@ -2619,39 +2109,19 @@ class Sticker(JsonDeserializable):
         self.mask_position = mask_position
         self.file_size = file_size
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        width = obj['width']
-        height = obj['height']
-        is_animated = False
-        if 'is_animated' in obj:
-            is_animated = obj['is_animated']
-        is_video = False
-        if 'is_video' in obj:
-            is_video = obj['is_video']
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        emoji = None
-        if 'emoji' in obj:
-            emoji = obj['emoji']
-        set_name = None
-        if 'set_name' in obj:
-            set_name = obj['set_name']
-        mask_position = None
-        if 'mask_position' in obj:
-            mask_position = MaskPosition.de_json(obj['mask_position'])
-        file_size = None
-        if 'file_size' in obj:
-            file_size = obj['file_size']
-        return cls(file_id, file_unique_id, width, height, is_animated, is_video, thumb, emoji, set_name, mask_position,
-                   file_size)
-
 
 class StickerSet(JsonDeserializable):
+    __slots__ = ('name', 'title', 'is_animated', 'is_video', 'contains_masks', 'stickers', 'thumb')
+    fields = (
+        Field('name', required=True),
+        Field('title', required=True),
+        Field('is_animated', default=False),
+        Field('is_video', default=False),
+        Field('contains_masks', default=False),
+        Field('stickers', ttype='Sticker', depth=1, required=True),
+        Field('thumb', ttype='PhotoSize'),
+    )
+
     def __init__(self, name, title, is_animated, is_video, contains_masks, stickers, thumb):
         """
         This object represents a sticker set
@@ -2664,35 +2134,16 @@ class StickerSet(JsonDeserializable):
         self.stickers = stickers
         self.thumb = thumb
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        name = obj['name']
-        title = obj['title']
-        is_animated = False
-        if 'is_animated' in obj:
-            is_animated = obj['is_animated']
-        is_video = False
-        if 'is_video' in obj:
-            is_video = obj['is_video']
-        contains_masks = False
-        if 'contains_masks' in obj:
-            contains_masks = obj['contains_masks']
-        stickers = StickerSet.parse_stickers(obj['stickers'])
-        thumb = None
-        if 'thumb' in obj:
-            thumb = PhotoSize.de_json(obj['thumb'])
-        return cls(name, title, is_animated, is_video, contains_masks, stickers, thumb)
-
-    @classmethod
-    def parse_stickers(cls, obj):
-        stickers = []
-        for sticker in obj:
-            stickers.append(Sticker.de_json(sticker))
-        return stickers
-
 
 class MaskPosition(JsonSerializable, JsonDeserializable):
+    __slots__ = ('point', 'x_shift', 'y_shift', 'scale')
+    fields = (
+        Field('point', required=True),
+        Field('x_shift', required=True),
+        Field('y_shift', required=True),
+        Field('scale', required=True),
+    )
+
     def __init__(self, point, x_shift, y_shift, scale):
         """
         This object describes the position on faces where a mask should be placed by default
@@ -2712,17 +2163,18 @@ class MaskPosition(JsonSerializable, JsonDeserializable):
     def to_dict(self):
         return {'point': self.point, 'x_shift': self.x_shift, 'y_shift': self.y_shift, 'scale': self.scale}
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        point = obj['point']
-        x_shift = obj['x_shift']
-        y_shift = obj['y_shift']
-        scale = obj['scale']
-        return cls(point, x_shift, y_shift, scale)
-
 
 class InlineQuery(JsonDeserializable):
+    __slots__ = ('uid', 'from_user', 'query', 'offset', 'chat_type', 'location')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('from_user', 'from', ttype='User', required=True),
+        Field('query', required=True),
+        Field('offset', required=True),
+        Field('chat_type'),
+        Field('location', ttype='Location'),
+    )
+
     def __init__(self, uid, from_user, query, offset, chat_type, location):
         """
         This object represents an incoming inline query,
@@ -2736,21 +2188,6 @@ class InlineQuery(JsonDeserializable):
         self.chat_type = chat_type
         self.location = location
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        from_user = User.de_json(obj['from'])
-        query = obj['query']
-        offset = obj['offset']
-        chat_type = None
-        if 'chat_type' in obj:
-            chat_type = obj['chat_type']
-        location = None
-        if 'location' in obj:
-            location = Location.de_json(obj['location'])
-        return cls(uid, from_user, query, offset, chat_type, location)
-
 
 class InlineQueryResult:
     """ This object represents one result of an inline query. 
@@ -2776,6 +2213,9 @@ class InlineQueryResult:
             InlineQueryResultVideo
             InlineQueryResultVoice
     """
+    __slots__ = ('Article', 'Audio', 'CachedAudio', 'CachedDocument', 'CachedGif', 'CachedMpeg4Gif', 'CachedPhoto',
+                 'CachedSticker', 'CachedVideo', 'CachedVoice', 'Contact', 'Game', 'Document', 'Gif', 'Location',
+                 'Mpeg4Gif', 'Photo', 'Venue', 'Video', 'Voice')
 
     def __init__(self):
         self.Article = self.__InlineQueryResultArticle
@@ -2800,6 +2240,9 @@ class InlineQueryResult:
         self.Voice = self.__InlineQueryResultVoice
 
     class __InlineQueryResultArticle(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'title', 'input_message_content', 'reply_markup', 'url', 'hide_url', 'description',
+                     'thumb_url', 'thumb_width', 'thumb_height')
+
         def __init__(self, uid, title, input_message_content, reply_markup=None, url=None, hide_url=False,
                      description=None, thumb_url=None, thumb_width=None, thumb_height=None):
             """
@@ -2847,6 +2290,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultPhoto(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'photo_url', 'photo_width', 'photo_height', 'thumb_url', 'title', 'description',
+                     'caption', 'parse_mode', 'caption_entities', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, photo_url, thumb_url, photo_width=None, photo_height=None, title=None, description=None,
                      caption=None, parse_mode=None, caption_entities=None, reply_markup=None,
                      input_message_content=None):
@@ -2905,6 +2351,10 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultGif(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'gif_url', 'gif_width', 'gif_height', 'gif_duration', 'thumb_url',
+                     'thumb_mime_type', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup',
+                     'input_message_content')
+
         def __init__(self, uid, gif_url, gif_width=None, gif_height=None, gif_duration=None, thumb_url=None,
                      thumb_mime_type=None, title=None, caption=None, parse_mode=None, caption_entities=None,
                      reply_markup=None, input_message_content=None):
@@ -2970,6 +2420,10 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultMpeg4Gif(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'mpeg4_url', 'mpeg4_width', 'mpeg4_height', 'mpeg4_duration', 'thumb_url',
+                     'thumb_mime_type', 'title', 'caption', 'parse_mode', 'caption_entities', 'reply_markup',
+                     'input_message_content')
+
         def __init__(self, uid, mpeg4_url, thumb_url, mpeg4_width=None, mpeg4_height=None, mpeg4_duration=None,
                      thumb_mime_type=None, title=None, caption=None, parse_mode=None, caption_entities=None,
                      reply_markup=None, input_message_content=None):
@@ -3034,6 +2488,10 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultVideo(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'video_url', 'mime_type', 'thumb_url', 'title', 'caption', 'parse_mode',
+                     'caption_entities', 'video_width', 'video_height', 'video_duration', 'description',
+                     'input_message_content', 'reply_markup')
+
         def __init__(self, uid, video_url, mime_type, thumb_url, title, caption=None, parse_mode=None,
                      caption_entities=None, video_width=None, video_height=None, video_duration=None, description=None,
                      reply_markup=None, input_message_content=None):
@@ -3096,6 +2554,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultAudio(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'audio_url', 'title', 'caption', 'parse_mode', 'caption_entities', 'performer',
+                     'audio_duration', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, audio_url, title, caption=None, parse_mode=None, caption_entities=None, performer=None,
                      audio_duration=None, reply_markup=None, input_message_content=None):
             """
@@ -3144,6 +2605,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultVoice(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'voice_url', 'title', 'caption', 'parse_mode', 'caption_entities',
+                     'voice_duration', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, voice_url, title, caption=None, parse_mode=None, caption_entities=None,
                      voice_duration=None, reply_markup=None, input_message_content=None):
             """
@@ -3188,6 +2652,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultDocument(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'title', 'caption', 'parse_mode', 'caption_entities', 'document_url', 'mime_type',
+                     'description', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
         def __init__(self, uid, title, document_url, mime_type, caption=None, parse_mode=None, caption_entities=None,
                      description=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None,
                      thumb_height=None):
@@ -3247,6 +2714,10 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultLocation(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'latitude', 'longitude', 'title', 'horizontal_accuracy', 'live_period', 'heading',
+                     'proximity_alert_radius', 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width',
+                     'thumb_height')
+
         def __init__(self, uid, title, latitude, longitude, horizontal_accuracy=None, live_period=None, heading=None,
                      proximity_alert_radius=None, reply_markup=None, input_message_content=None, thumb_url=None,
                      thumb_width=None, thumb_height=None):
@@ -3310,6 +2781,10 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultVenue(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type',
+                     'google_place_id', 'google_place_type', 'reply_markup', 'input_message_content', 'thumb_url',
+                     'thumb_width', 'thumb_height')
+
         def __init__(self, uid, latitude, longitude, title, address, foursquare_id=None, foursquare_type=None,
                      google_place_id=None, google_place_type=None, reply_markup=None, input_message_content=None,
                      thumb_url=None, thumb_width=None, thumb_height=None):
@@ -3375,6 +2850,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultContact(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup',
+                     'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
         def __init__(self, uid, phone_number, first_name, last_name=None, vcard=None, reply_markup=None,
                      input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
             """
@@ -3421,6 +2899,8 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultGame(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'game_short_name', 'reply_markup')
+
         def __init__(self, uid, game_short_name, reply_markup=None):
             """
             Represents a Game
@@ -3440,6 +2920,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedPhoto(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'photo_file_id', 'title', 'description', 'caption', 'parse_mode',
+                     'caption_entities', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, photo_file_id, title=None, description=None, caption=None, parse_mode=None,
                      caption_entities=None, reply_markup=None, input_message_content=None):
             """
@@ -3486,6 +2969,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedGif(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'gif_file_id', 'title', 'caption', 'parse_mode', 'caption_entities',
+                     'reply_markup', 'input_message_content')
+
         def __init__(self, uid, gif_file_id, title=None, caption=None, parse_mode=None, caption_entities=None,
                      reply_markup=None, input_message_content=None):
             """
@@ -3529,6 +3015,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedMpeg4Gif(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'mpeg4_file_id', 'title', 'caption', 'parse_mode', 'caption_entities',
+                     'reply_markup', 'input_message_content')
+
         def __init__(self, uid, mpeg4_file_id, title=None, caption=None, parse_mode=None, caption_entities=None,
                      reply_markup=None, input_message_content=None):
             """
@@ -3571,6 +3060,8 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedSticker(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'sticker_file_id', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, sticker_file_id, reply_markup=None, input_message_content=None):
             """
             Represents a link to a sticker stored on the Telegram servers
@@ -3594,6 +3085,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedDocument(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'title', 'document_file_id', 'description', 'caption', 'parse_mode',
+                     'caption_entities', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, title, document_file_id, description=None, caption=None, parse_mode=None,
                      caption_entities=None, reply_markup=None, input_message_content=None):
             """
@@ -3640,6 +3134,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedVideo(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'video_file_id', 'title', 'description', 'caption', 'parse_mode',
+                     'caption_entities', 'reply_markup', 'input_message_content')
+
         def __init__(self, uid, video_file_id, title, description=None, caption=None, parse_mode=None,
                      caption_entities=None, reply_markup=None, input_message_content=None):
             """
@@ -3686,6 +3183,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedVoice(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'voice_file_id', 'title', 'caption', 'parse_mode', 'caption_entities',
+                     'reply_markup', 'input_message_content')
+
         def __init__(self, uid, voice_file_id, title, caption=None, parse_mode=None, caption_entities=None,
                      reply_markup=None, input_message_content=None):
             """
@@ -3729,6 +3229,9 @@ class InlineQueryResult:
             return obj
 
     class __InlineQueryResultCachedAudio(JsonSerializable):
+        __slots__ = ('ttype', 'uid', 'audio_file_id', 'caption', 'parse_mode', 'caption_entities', 'reply_markup',
+                     'input_message_content')
+
         def __init__(self, uid, audio_file_id, caption=None, parse_mode=None, caption_entities=None,
                      reply_markup=None, input_message_content=None):
             """
@@ -3779,6 +3282,7 @@ class InputMessageContent:
         InputInvoiceMessageContent
 
    """
+    __slots__ = ('Text', 'Location', 'Venue', 'Contact', 'Invoice')
 
     def __init__(self):
         self.Text = self.__InputTextMessageContent
@@ -3788,6 +3292,8 @@ class InputMessageContent:
         self.Invoice = self.__InputInvoiceMessageContent
 
     class __InputTextMessageContent(JsonSerializable):
+        __slots__ = ('message_text', 'parse_mode', 'entities', 'disable_web_page_preview')
+
         def __init__(self, message_text, parse_mode=None, entities=None, disable_web_page_preview=False):
             """
             Represents the content of a text message to be sent as the result of an inline query
@@ -3813,6 +3319,8 @@ class InputMessageContent:
             return obj
 
     class __InputLocationMessageContent(JsonSerializable):
+        __slots__ = ('latitude', 'longitude', 'horizontal_accuracy', 'live_period', 'heading', 'proximity_alert_radius')
+
         def __init__(self, latitude, longitude, horizontal_accuracy=None, live_period=None, heading=None,
                      proximity_alert_radius=None):
             """
@@ -3849,6 +3357,9 @@ class InputMessageContent:
             return obj
 
     class __InputVenueMessageContent(JsonSerializable):
+        __slots__ = ('latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type', 'google_place_id',
+                     'google_place_type')
+
         def __init__(self, latitude, longitude, title, address, foursquare_id=None, foursquare_type=None,
                      google_place_id=None, google_place_type=None):
             """
@@ -3886,6 +3397,8 @@ class InputMessageContent:
             return obj
 
     class __InputContactMessageContent(JsonSerializable):
+        __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard')
+
         def __init__(self, phone_number, first_name, last_name=None, vcard=None):
             """
             Represents a result of an inline query that was chosen by the user and sent to their chat partner
@@ -3908,6 +3421,11 @@ class InputMessageContent:
             return obj
 
     class __InputInvoiceMessageContent(JsonSerializable):
+        __slots__ = ('title', 'description', 'payload', 'provider_token', 'currency', 'prices', 'max_tip_amount',
+                     'suggested_tip_amounts', 'provider_data', 'photo_url', 'photo_size', 'photo_width', 'photo_height',
+                     'need_name', 'need_phone_number', 'need_email', 'need_shipping_address',
+                     'send_phone_number_to_provider', 'send_email_to_provider', 'is_flexible')
+
         def __init__(self, title, description, payload, provider_token, currency, prices, max_tip_amount=None,
                      suggested_tip_amounts=None, provider_data=None, photo_url=None, photo_size=None, photo_width=None,
                      photo_height=None, need_name=False, need_phone_number=False, need_email=False,
@@ -4009,6 +3527,14 @@ class ChosenInlineResult(JsonDeserializable):
     """
     Represents a result of an inline query that was chosen by the user and sent to their chat partner
     """
+    __slots__ = ('result_id', 'from_user', 'query', 'location', 'inline_message_id')
+    fields = (
+        Field('result_id', required=True),
+        Field('from_user', 'from', ttype='User', required=True),
+        Field('query', required=True),
+        Field('location', ttype='Location'),
+        Field('inline_message_id', required=True),
+    )
 
     def __init__(self, result_id, from_user, query, location, inline_message_id):
         self.result_id = result_id
@@ -4017,23 +3543,15 @@ class ChosenInlineResult(JsonDeserializable):
         self.location = location
         self.inline_message_id = inline_message_id
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        result_id = obj['result_id']
-        from_user = User.de_json(obj['from'])
-        query = obj['query']
-        location = None
-        if 'location' in obj:
-            location = Location.de_json(obj['location'])
-        inline_message_id = obj['inline_message_id']
-        return cls(result_id, from_user, query, location, inline_message_id)
-
 
 class SentWebAppMessage(JsonDeserializable):
     """
     Contains information about an inline message sent by a Web App on behalf a user
     """
+    __slots__ = ('inline_message_id',)
+    fields = (
+        Field('inline_message_id'),
+    )
 
     def __init__(self, inline_message_id):
         """
@@ -4042,16 +3560,10 @@ class SentWebAppMessage(JsonDeserializable):
         """
         self.inline_message_id = inline_message_id
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        inline_message_id = None
-        if 'inline_message_id' in obj:
-            inline_message_id = obj['inline_message_id']
-        return cls(inline_message_id)
-
 
 class LabeledPrice(JsonSerializable):
+    __slots__ = ('label', 'amount')
+
     def __init__(self, label, amount):
         """
         This object represents a portion of the price for goods or services
@@ -4067,6 +3579,15 @@ class LabeledPrice(JsonSerializable):
 
 
 class Invoice(JsonDeserializable):
+    __slots__ = ('title', 'description', 'start_parameter', 'currency', 'total_amount')
+    fields = (
+        Field('title', required=True),
+        Field('description', required=True),
+        Field('start_parameter', required=True),
+        Field('currency', required=True),
+        Field('total_amount', required=True),
+    )
+
     def __init__(self, title, description, start_parameter, currency, total_amount):
         """
         This object contains basic information about an invoice
@@ -4077,18 +3598,18 @@ class Invoice(JsonDeserializable):
         self.currency = currency
         self.total_amount = total_amount
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        title = obj['title']
-        description = obj['description']
-        start_parameter = obj['start_parameter']
-        currency = obj['currency']
-        total_amount = obj['total_amount']
-        return cls(title, description, start_parameter, currency, total_amount)
-
 
 class ShippingAddress(JsonDeserializable):
+    __slots__ = ('country_code', 'state', 'city', 'street_line1', 'street_line2', 'post_code')
+    fields = (
+        Field('country_code', required=True),
+        Field('state', required=True),
+        Field('city', required=True),
+        Field('street_line1', required=True),
+        Field('street_line2', required=True),
+        Field('post_code', required=True),
+    )
+
     def __init__(self, country_code, state, city, street_line1, street_line2, post_code):
         """
         This object represents a shipping address
@@ -4100,19 +3621,16 @@ class ShippingAddress(JsonDeserializable):
         self.street_line2 = street_line2
         self.post_code = post_code
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        country_code = obj['country_code']
-        state = obj['state']
-        city = obj['city']
-        street_line1 = obj['street_line1']
-        street_line2 = obj['street_line2']
-        post_code = obj['post_code']
-        return cls(country_code, state, city, street_line1, street_line2, post_code)
-
 
 class OrderInfo(JsonDeserializable):
+    __slots__ = ('name', 'phone_number', 'email', 'shipping_address')
+    fields = (
+        Field('name'),
+        Field('phone_number'),
+        Field('email'),
+        Field('shipping_address', ttype='ShippingAddress'),
+    )
+
     def __init__(self, name, phone_number, email, shipping_address):
         """
         This object represents information about an order
@@ -4122,25 +3640,10 @@ class OrderInfo(JsonDeserializable):
         self.email = email
         self.shipping_address = shipping_address
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        name = None
-        if 'name' in obj:
-            name = obj['name']
-        phone_number = None
-        if 'phone_number' in obj:
-            phone_number = obj['phone_number']
-        email = None
-        if 'email' in obj:
-            email = obj['email']
-        shipping_address = None
-        if 'shipping_address' in obj:
-            shipping_address = ShippingAddress.de_json(obj['shipping_address'])
-        return cls(name, phone_number, email, shipping_address)
-
 
 class ShippingOption(JsonSerializable):
+    __slots__ = ('uid', 'title', 'prices')
+
     def __init__(self, uid, title, prices):
         """
         This object represents one shipping option
@@ -4158,6 +3661,18 @@ class ShippingOption(JsonSerializable):
 
 
 class SuccessfulPayment(JsonDeserializable):
+    __slots__ = ('currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info',
+                 'telegram_payment_charge_id', 'provider_payment_charge_id')
+    fields = (
+        Field('currency', required=True),
+        Field('total_amount', required=True),
+        Field('invoice_payload', required=True),
+        Field('shipping_option_id'),
+        Field('order_info', ttype='OrderInfo'),
+        Field('telegram_payment_charge_id', required=True),
+        Field('provider_payment_charge_id', required=True),
+    )
+
     def __init__(self, currency, total_amount, invoice_payload, shipping_option_id, order_info,
                  telegram_payment_charge_id, provider_payment_charge_id):
         """
@@ -4171,25 +3686,16 @@ class SuccessfulPayment(JsonDeserializable):
         self.telegram_payment_charge_id = telegram_payment_charge_id
         self.provider_payment_charge_id = provider_payment_charge_id
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        currency = obj['currency']
-        total_amount = obj['total_amount']
-        invoice_payload = obj['invoice_payload']
-        shipping_option_id = None
-        if 'shipping_option_id' in obj:
-            shipping_option_id = obj['shipping_option_id']
-        order_info = None
-        if 'order_info' in obj:
-            order_info = OrderInfo.de_json(obj['order_info'])
-        telegram_payment_charge_id = obj['telegram_payment_charge_id']
-        provider_payment_charge_id = obj['provider_payment_charge_id']
-        return cls(currency, total_amount, invoice_payload, shipping_option_id, order_info,
-                   telegram_payment_charge_id, provider_payment_charge_id)
-
 
 class ShippingQuery(JsonDeserializable):
+    __slots__ = ('uid', 'from_user', 'invoice_payload', 'shipping_address')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('from_user', 'from', ttype='User', required=True),
+        Field('invoice_payload', required=True),
+        Field('shipping_address', ttype='ShippingAddress', required=True),
+    )
+
     def __init__(self, uid, from_user, invoice_payload, shipping_address):
         """
         This object contains information about an incoming shipping query
@@ -4199,17 +3705,19 @@ class ShippingQuery(JsonDeserializable):
         self.invoice_payload = invoice_payload
         self.shipping_address = shipping_address
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        from_user = User.de_json(obj['from'])
-        invoice_payload = obj['invoice_payload']
-        shipping_address = ShippingAddress.de_json(obj['shipping_address'])
-        return cls(uid, from_user, invoice_payload, shipping_address)
-
 
 class PreCheckoutQuery(JsonDeserializable):
+    __slots__ = ('uid', 'from_user', 'currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info')
+    fields = (
+        Field('uid', 'id', required=True),
+        Field('from_user', 'from', ttype='User', required=True),
+        Field('currency', required=True),
+        Field('total_amount', required=True),
+        Field('invoice_payload', required=True),
+        Field('shipping_option_id'),
+        Field('order_info', ttype='OrderInfo'),
+    )
+
     def __init__(self, uid, from_user, currency, total_amount, invoice_payload, shipping_option_id, order_info):
         """
         This object contains information about an incoming pre-checkout query
@@ -4222,24 +3730,14 @@ class PreCheckoutQuery(JsonDeserializable):
         self.shipping_option_id = shipping_option_id
         self.order_info = order_info
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        uid = obj['id']
-        from_user = User.de_json(obj['from'])
-        currency = obj['currency']
-        total_amount = obj['total_amount']
-        invoice_payload = obj['invoice_payload']
-        shipping_option_id = None
-        if 'shipping_option_id' in obj:
-            shipping_option_id = obj['shipping_option_id']
-        order_info = None
-        if 'order_info' in obj:
-            order_info = OrderInfo.de_json(obj['order_info'])
-        return cls(uid, from_user, currency, total_amount, invoice_payload, shipping_option_id, order_info)
-
 
 class PassportData(JsonDeserializable):
+    __slots__ = ('data', 'credentials')
+    fields = (
+        Field('data', ttype='EncryptedPassportElement', depth=1, required=True),
+        Field('credentials', ttype='EncryptedCredentials', required=True),
+    )
+
     def __init__(self, data, credentials):
         """
         Contains information about Telegram Passport data shared with the bot by the user
@@ -4247,15 +3745,16 @@ class PassportData(JsonDeserializable):
         self.data = data
         self.credentials = credentials
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        data = obj['EncryptedPassportElement']
-        credentials = obj['EncryptedCredentials']
-        return cls(data, credentials)
-
 
 class PassportFile(JsonDeserializable):
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_date')
+    fields = (
+        Field('file_id', required=True),
+        Field('file_unique_id', required=True),
+        Field('file_size', required=True),
+        Field('file_date', required=True),
+    )
+
     def __init__(self, file_id, file_unique_id, file_size, file_date):
         """
         This object represents a file uploaded to Telegram Passport
@@ -4265,17 +3764,22 @@ class PassportFile(JsonDeserializable):
         self.file_size = file_size
         self.file_date = file_date
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        file_id = obj['file_id']
-        file_unique_id = obj['file_unique_id']
-        file_size = obj['file_size']
-        file_date = obj['file_date']
-        return cls(file_id, file_unique_id, file_size, file_date)
-
 
 class EncryptedPassportElement(JsonDeserializable):
+    __slots__ = ('ttype', 'data', 'phone_number', 'files', 'front_side', 'reverse_side', 'selfie', 'translation',
+                 'hashes')
+    fields = (
+        Field('ttype', 'type', required=True),
+        Field('data'),
+        Field('phone_number'),
+        Field('files', ttype='PassportFile', depth=1),
+        Field('front_side', ttype='PassportFile'),
+        Field('reverse_side', ttype='PassportFile'),
+        Field('selfie', ttype='PassportFile'),
+        Field('translation', ttype='PassportFile', depth=1),
+        Field('hashes', 'hash', required=True),
+    )
+
     def __init__(self, ttype, data, phone_number, files, front_side, reverse_side, selfie, translation, hashes):
         """
         Contains information about documents or other Telegram Passport elements shared with the bot by the user
@@ -4290,53 +3794,15 @@ class EncryptedPassportElement(JsonDeserializable):
         self.translation = translation
         self.hashes = hashes
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        ttype = obj['type']
-        data = None
-        if 'data' in obj:
-            data = obj['data']
-        phone_number = None
-        if 'phone_number' in obj:
-            phone_number = obj['phone_number']
-        files = None
-        if 'files' in obj:
-            files = EncryptedPassportElement.parse_files(obj['files'])
-        front_side = None
-        if 'front_side' in obj:
-            front_side = PassportFile.de_json(obj['front_side'])
-        reverse_side = None
-        if 'reverse_side' in obj:
-            reverse_side = PassportFile.de_json(obj['reverse_side'])
-        selfie = None
-        if 'selfie' in obj:
-            selfie = PassportFile.de_json(obj['selfie'])
-        translation = None
-        if 'translation' in obj:
-            translation = EncryptedPassportElement.parse_translation(
-                obj['translation'])
-        hashes = obj['hash']
-        return cls(ttype, data, phone_number, files, front_side, reverse_side, selfie, translation, hashes)
-
-    @classmethod
-    def parse_files(cls, obj):
-        files = []
-        for x in obj:
-            file = PassportFile.de_json(x)
-            files.append(file)
-        return files
-
-    @classmethod
-    def parse_translation(cls, obj):
-        translations = []
-        for x in obj:
-            translation = PassportFile.de_json(x)
-            translations.append(translation)
-        return translations
-
 
 class EncryptedCredentials(JsonDeserializable):
+    __slots__ = ('data', 'hashes', 'secret')
+    fields = (
+        Field('data', required=True),
+        Field('hashes', 'hash', required=True),
+        Field('secret', required=True),
+    )
+
     def __init__(self, data, hashes, secret):
         """
         Contains data required for decrypting and authenticating EncryptedPassportElement.
@@ -4347,14 +3813,6 @@ class EncryptedCredentials(JsonDeserializable):
         self.hashes = hashes
         self.secret = secret
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        data = obj['data']
-        hashes = obj['hash']
-        secret = obj['secret']
-        return cls(data, hashes, secret)
-
 
 class PassportElementError(JsonDeserializable):
     """
@@ -4371,6 +3829,8 @@ class PassportElementError(JsonDeserializable):
         PassportElementErrorTranslationFiles
         PassportElementErrorUnspecified
     """
+    __slots__ = ('DataField', 'FrontSide', 'ReverseSide', 'Selfie', 'File', 'Files', 'TranslationFile',
+                 'TranslationFiles', 'Unspecified')
 
     def __init__(self):
         self.DataField = self.__PassportElementErrorDataField
@@ -4412,6 +3872,15 @@ class PassportElementError(JsonDeserializable):
             return None
 
     class __PassportElementErrorDataField(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'field_name', 'data_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('field_name', required=True),
+            Field('data_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, field_name, data_hash, message):
             """
             Represents an issue in one of the data fields that was provided by the user
@@ -4422,17 +3891,15 @@ class PassportElementError(JsonDeserializable):
             self.data_hash = data_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be data
-            ttype = obj['type']
-            field_name = obj['field_name']
-            data_hash = obj['data_hash']
-            message = obj['message']
-            return cls(source, ttype, field_name, data_hash, message)
-
     class __PassportElementErrorFrontSide(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hash, message):
             """
             Represents an issue with the front side of a document
@@ -4442,16 +3909,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hash = file_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be front_side
-            ttype = obj['type']
-            file_hash = obj['file_hash']
-            message = obj['message']
-            return cls(source, ttype, file_hash, message)
-
     class __PassportElementErrorFile(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hash, message):
             """
             Represents an issue with a document scan
@@ -4461,16 +3927,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hash = file_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be filed
-            ttype = obj['type']
-            file_hash = obj['file_hash']
-            message = obj['message']
-            return cls(source, ttype, file_hash, message)
-
     class __PassportElementErrorFiles(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hashes', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hashes', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hashes, message):
             """
             Represents an issue with a list of scans
@@ -4480,16 +3945,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hashes = file_hashes
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be files
-            ttype = obj['type']
-            file_hashes = obj['file_hashes']
-            message = obj['message']
-            return cls(source, ttype, file_hashes, message)
-
     class __PassportElementErrorReverseSide(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hash, message):
             """
             Represents an issue with the reverse side of a document
@@ -4499,16 +3963,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hash = file_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be reverse_side
-            ttype = obj['type']
-            file_hash = obj['file_hash']
-            message = obj['message']
-            return cls(source, ttype, file_hash, message)
-
     class __PassportElementErrorSelfie(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hash, message):
             """
             Represents an issue with the selfie with a document
@@ -4518,16 +3981,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hash = file_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be selfie
-            ttype = obj['type']
-            file_hash = obj['file_hash']
-            message = obj['message']
-            return cls(source, ttype, file_hash, message)
-
     class __PassportElementErrorTranslationFile(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hash, message):
             """
             Represents an issue with one of the files that constitute the translation of a document
@@ -4537,16 +3999,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hash = file_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be translation_file
-            ttype = obj['type']
-            file_hash = obj['file_hash']
-            message = obj['message']
-            return cls(source, ttype, file_hash, message)
-
     class __PassportElementErrorTranslationFiles(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'file_hashes', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('file_hashes', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, file_hashes, message):
             """
             Represents an issue with the translated version of a document
@@ -4556,16 +4017,15 @@ class PassportElementError(JsonDeserializable):
             self.file_hashes = file_hashes
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be translation_files
-            ttype = obj['type']
-            file_hashes = obj['file_hashes']
-            message = obj['message']
-            return cls(source, ttype, file_hashes, message)
-
     class __PassportElementErrorUnspecified(JsonDeserializable):
+        __slots__ = ('source', 'ttype', 'element_hash', 'message')
+        fields = (
+            Field('source', required=True),
+            Field('ttype', 'type', required=True),
+            Field('element_hash', required=True),
+            Field('message', required=True),
+        )
+
         def __init__(self, source, ttype, element_hash, message):
             """
             Represents an issue in an unspecified place
@@ -4575,17 +4035,18 @@ class PassportElementError(JsonDeserializable):
             self.element_hash = element_hash
             self.message = message
 
-        @classmethod
-        def de_json(cls, obj_type):
-            obj = cls.check_type(obj_type)
-            source = obj['source']  # Error source, must be unspecified
-            ttype = obj['type']
-            element_hash = obj['element_hash']
-            message = obj['message']
-            return cls(source, ttype, element_hash, message)
-
 
 class Game(JsonDeserializable):
+    __slots__ = ('title', 'description', 'photo', 'text', 'text_entities', 'animation')
+    fields = (
+        Field('title', required=True),
+        Field('description', required=True),
+        Field('photo', ttype='PhotoSize', depth=1, required=True),
+        Field('text', required=True),
+        Field('text_entities', ttype='MessageEntity', depth=1),
+        Field('animation', ttype='Animation'),
+    )
+
     def __init__(self, title, description, photo, text, text_entities, animation):
         """
         This object represents a game
@@ -4597,44 +4058,22 @@ class Game(JsonDeserializable):
         self.text_entities = text_entities
         self.animation = animation
 
-    @classmethod
-    def de_json(cls, obj_type):
-        obj = cls.check_type(obj_type)
-        title = obj['title']
-        description = obj['description']
-        photo = Game.parse_photo(obj['photo'])
-        text = obj['text']
-        text_entities = None
-        if 'text_entities' in obj:
-            text_entities = Game.parse_entities(obj['text_entities'])
-        animation = None
-        if 'animation' in obj:
-            animation = Animation.de_json(obj['animation'])
-        return cls(title, description, photo, text, text_entities, animation)
-
-    @classmethod
-    def parse_photo(cls, obj):
-        photos = []
-        for x in obj:
-            photos.append(PhotoSize.de_json(x))
-        return photos
-
-    @classmethod
-    def parse_entities(cls, obj):
-        entities = []
-        for x in obj:
-            entities.append(MessageEntity.de_json(x))
-        return entities
-
 
 class CallbackGame:
     """
     A placeholder, currently holds no information
     """
-    pass
+    __slots__ = ()
 
 
 class GameHighScore(JsonDeserializable):
+    __slots__ = ('position', 'user', 'score')
+    fields = (
+        Field('position', required=True),
+        Field('user', ttype='User', required=True),
+        Field('score', required=True),
+    )
+
     def __init__(self, position, user, score):
         """
         This object represents one row of the high scores' table for a game
@@ -4643,10 +4082,68 @@ class GameHighScore(JsonDeserializable):
         self.user = user
         self.score = score
 
+
+class LazyMessage(Message):
+    """
+    This object represents a message that is decoded on access, with the same attributes as Message
+    """
+    __slots__ = ('raw',)
+    decoders = lazy_decoders(Message.fields, __name__, {'Message': 'LazyMessage'})
+
+    def __init__(self, message_id, raw):
+        """
+        Initializes a LazyMessage object
+        :param int message_id: Unique message identifier
+        :param dict raw: the json dict of the message
+        """
+        self.message_id = message_id
+        self.raw = raw
+
     @classmethod
     def de_json(cls, obj_type):
         obj = cls.check_type(obj_type)
-        position = obj['position']
-        user = User.de_json(obj['user'])
-        score = obj['score']
-        return cls(position, user, score)
+        return cls(obj['message_id'], obj)
+
+    def __getattr__(self, name):
+        """
+        Decodes a field on its first read and keeps it in its slot
+        """
+        decode = LazyMessage.decoders.get(name)
+        if decode is None:
+            return Message.__getattr__(self, name)
+        value = decode(self.raw)
+        setattr(self, name, value)
+        return value
+
+
+class LazyUpdate(Update):
+    """
+    This object represents an incoming update that is decoded on access, the update content is a LazyMessage
+    """
+    __slots__ = ('raw',)
+    decoders = lazy_decoders(Update.fields, __name__, {'Message': 'LazyMessage'})
+
+    def __init__(self, update_id, raw):
+        """
+        Initializes a LazyUpdate object
+        :param int update_id: The update's unique identifier
+        :param dict raw: the json dict of the update
+        """
+        self.update_id = update_id
+        self.raw = raw
+
+    @classmethod
+    def de_json(cls, obj_type):
+        obj = cls.check_type(obj_type)
+        return cls(obj['update_id'], obj)
+
+    def __getattr__(self, name):
+        """
+        Decodes a field on its first read and keeps it in its slot
+        """
+        decode = LazyUpdate.decoders.get(name)
+        if decode is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = decode(self.raw)
+        setattr(self, name, value)
+        return value
@@ -10,8 +10,18 @@ by the other modules of tgbotapi.
 :license: GPLv2, see LICENSE for more details.
 """
 
+from .api_broadcast import Broadcast, BroadcastReport
+from .api_cache import ChatCache, TTLCache
+from .api_coalescer import EditCoalescer
+from .api_download import FileSink, download_file
 from .api_exceptions import *
-from .api_handler import make_request
-from .api_worker import ThreadWorker, ThreadPool, events_handler
-from .json_helper import JsonDeserializable, JsonSerializable
+from .api_handler import Session, AsyncSession, DeferredCall, DeferredSession, DeferredMethods, make_request
+from .api_multipart import FilePart, MultipartEncoder
+from .api_limiter import RateLimiter
+from .api_retry import RetryPolicy
+from .api_router import UpdateRoute
+from .api_uploads import UploadCache
+from .api_webhook import WebhookServer, WebhookReply
+from .api_worker import ThreadWorker, ThreadPool, TaskQueue, LaneStats, events_handler
+from .json_helper import Field, JsonCodec, JsonDeserializable, JsonSerializable, codec, lazy_decoders
 from .logger import logger
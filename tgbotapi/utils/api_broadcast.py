@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_broadcast
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the broadcast engine that is consumed internally by bot.py
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+from .api_exceptions import TelegramAPIError
+from .api_limiter import TokenBucket
+
+
+class BroadcastReport(object):
+    """
+    This class represents the outcome of a broadcast, the number of chats of each status,
+    The chats that did not get the message by status, the migrated chats and the errors.
+    """
+    statuses = ('sent', 'migrated', 'blocked', 'deactivated', 'kicked', 'not_found', 'error')
+
+    def __init__(self):
+        """
+        Initializes a new BroadcastReport
+        """
+        self.counts = dict.fromkeys(self.statuses, 0)
+        self.failed = {}
+        self.migrated = {}
+        self.errors = {}
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        counts = ', '.join(f'{status}={count}' for status, count in self.counts.items() if count)
+        return f'<BroadcastReport {counts or "empty"} in {self.elapsed:.1f}s>'
+
+    @property
+    def sent(self):
+        """
+        Number of chats that got the message, migrated groups included
+        :rtype: int
+        """
+        return self.counts['sent'] + self.counts['migrated']
+
+    @property
+    def total(self):
+        """
+        Number of chats done
+        :rtype: int
+        """
+        return sum(self.counts.values())
+
+    def add(self, chat_id, status, detail=None):
+        """
+        Records the outcome of a chat
+        :param int or str chat_id: the chat
+        :param str status: one of statuses
+        :param any detail: the new chat of a migrated group, the description of an error
+        """
+        self.counts[status] += 1
+        if status == 'migrated':
+            self.migrated[chat_id] = detail
+        elif status != 'sent':
+            self.failed.setdefault(status, []).append(chat_id)
+            if status == 'error':
+                self.errors[chat_id] = detail
+
+
+class Broadcast(object):
+    """
+    This class sends one message to many chats at the highest allowed rate from a pool of workers,
+    Every chat done is appended to a checkpoint file, so a broadcast that stopped can run again and skip them.
+    """
+
+    def __init__(self, send, chat_ids, checkpoint=None, rate=30, max_workers=16, max_retries=5):
+        """
+        Initializes a new Broadcast
+        :param function send: sends the message to the chat_id it takes, a coroutine function for run_async
+        :param Iterable chat_ids: the chats, a generator is read once and lazily
+        :param str or None checkpoint: the file recording the chats done, None keeps no record
+        :param float rate: messages per second for the whole broadcast, default 30, the Telegram limit of a bot
+        :param int max_workers: number of messages in flight at once
+        :param int max_retries: times a chat is tried again after a 429, a failed chat is reported as error
+        """
+        self.send = send
+        self.chat_ids = chat_ids
+        self.checkpoint = checkpoint
+        self.rate = rate
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.report = BroadcastReport()
+
+        self.__lock = threading.Lock()
+        self.__bucket = TokenBucket(rate, max(int(rate), 1))
+        self.__paused_until = 0.0
+        self.__stopped = threading.Event()
+        self.__done = set()
+        self.__attempts = {}
+        self.__log = None
+
+    def stop(self):
+        """
+        Stops a running broadcast after the messages in flight, run it again to resume
+        """
+        self.__stopped.set()
+
+    def run(self):
+        """
+        Runs the broadcast on worker threads until every chat is done or stop is called
+        :rtype: BroadcastReport
+        """
+        chats = self.__open()
+        lock = threading.Lock()
+
+        def work():
+            while not self.__stopped.is_set():
+                with lock:
+                    chat_id = next(chats, None)
+                if chat_id is None:
+                    return
+                target = chat_id
+                while target is not None:
+                    delay = self.__reserve()
+                    if delay > 0:
+                        time.sleep(delay)
+                    try:
+                        self.send(target)
+                    except Exception as e:
+                        target = self.__failed(chat_id, target, e)
+                    else:
+                        target = self.__sent(chat_id, target)
+
+        started = time.monotonic()
+        workers = [threading.Thread(target=work, name=f'broadcast-{i}') for i in range(self.max_workers)]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            self.__close(started)
+        return self.report
+
+    async def run_async(self):
+        """
+        Runs the broadcast on the running event loop until every chat is done or stop is called
+        :rtype: BroadcastReport
+        """
+        chats = self.__open()
+
+        async def work():
+            for chat_id in chats:
+                if self.__stopped.is_set():
+                    return
+                target = chat_id
+                while target is not None:
+                    delay = self.__reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    try:
+                        await self.send(target)
+                    except Exception as e:
+                        target = self.__failed(chat_id, target, e)
+                    else:
+                        target = self.__sent(chat_id, target)
+
+        started = time.monotonic()
+        try:
+            await asyncio.gather(*[work() for _ in range(self.max_workers)])
+        finally:
+            self.__close(started)
+        return self.report
+
+    def __open(self):
+        """
+        Reads the checkpoint into the report, returns the chats left
+        """
+        self.__stopped.clear()
+        # the chats that failed with an error are tried again
+        self.report.counts['error'] = 0
+        self.report.failed.pop('error', None)
+        self.report.errors.clear()
+        if self.checkpoint is not None:
+            if os.path.exists(self.checkpoint):
+                with open(self.checkpoint, encoding='utf-8') as f:
+                    for line in f:
+                        fields = line.rstrip('\n').split('\t')
+                        if len(fields) != 3 or fields[1] not in self.report.statuses:
+                            # a line cut short by a crash
+                            continue
+                        chat_id, status, detail = fields
+                        if status == 'error' or chat_id in self.__done:
+                            continue
+                        self.__done.add(chat_id)
+                        self.report.add(_chat_id(chat_id), status, _chat_id(detail) if detail else None)
+            self.__log = open(self.checkpoint, 'a', buffering=1, encoding='utf-8')
+        return (chat_id for chat_id in self.chat_ids if str(chat_id) not in self.__done)
+
+    def __close(self, started):
+        self.report.elapsed += time.monotonic() - started
+        if self.__log is not None:
+            self.__log.close()
+            self.__log = None
+
+    def __reserve(self):
+        """
+        Reserves the next slot of the broadcast rate, returns the seconds to wait for it
+        """
+        with self.__lock:
+            now = time.monotonic()
+            at = max(self.__bucket.allowed_at(now), self.__paused_until)
+            self.__bucket.consume(at)
+            return at - now
+
+    def __sent(self, chat_id, target):
+        """
+        Records a chat that got the message, returns None as there is nothing left to send
+        """
+        if target == chat_id:
+            self.__record(chat_id, 'sent')
+        else:
+            self.__record(chat_id, 'migrated', target)
+        return None
+
+    def __failed(self, chat_id, target, error):
+        """
+        Classifies a failed send, returns the chat to send it again to, None when the chat is done
+        """
+        parameters = error.parameters if isinstance(error, TelegramAPIError) else None
+        if parameters and parameters.retry_after is not None:
+            with self.__lock:
+                attempt = self.__attempts[chat_id] = self.__attempts.get(chat_id, 0) + 1
+                if attempt <= self.max_retries:
+                    # the whole bot is over the limit, every worker waits
+                    self.__paused_until = max(self.__paused_until, time.monotonic() + parameters.retry_after)
+                    return target
+            self.__record(chat_id, 'error', error.description)
+            return None
+        if parameters and parameters.migrate_to_chat_id is not None and target == chat_id:
+            # the group was upgraded to a supergroup
+            return parameters.migrate_to_chat_id
+        self.__record(chat_id, *classify(error))
+        return None
+
+    def __record(self, chat_id, status, detail=None):
+        with self.__lock:
+            self.__attempts.pop(chat_id, None)
+            self.report.add(chat_id, status, detail)
+            if status != 'error':
+                self.__done.add(str(chat_id))
+            if self.__log is not None:
+                detail = '' if detail is None else ' '.join(str(detail).split())
+                self.__log.write(f'{chat_id}\t{status}\t{detail}\n')
+
+
+def classify(error):
+    """
+    Returns the broadcast status of a failed send and its detail
+    :param Exception error: the error raised by the send
+    :rtype: tuple
+    """
+    if not isinstance(error, TelegramAPIError):
+        return 'error', repr(error)
+    description = (error.description or '').lower()
+    if error.error_code == 403:
+        if 'deactivated' in description:
+            return 'deactivated', None
+        if 'kicked' in description or 'not a member' in description:
+            return 'kicked', None
+        return 'blocked', None
+    if error.error_code == 400 and 'not found' in description:
+        return 'not_found', None
+    return 'error', error.description
+
+
+def _chat_id(value):
+    """
+    Returns the chat_id of a checkpoint, numbers as int and usernames as str
+    """
+    return int(value) if value.lstrip('-').isdigit() else value
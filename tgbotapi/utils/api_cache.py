@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_cache
+~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the in memory caches that are consumed internally by bot.py
+"""
+
+import collections
+import threading
+import time
+
+
+class TTLCache(object):
+    """
+    This class is a bounded least recently used cache whose entries expire ttl seconds after they were set,
+    hits and misses count the lookups that found an entry and the ones that did not.
+    """
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        """
+        Initializes a new TTLCache
+        :param int maxsize: maximum number of entries, the least recently used entry is dropped beyond it
+        :param float ttl: seconds an entry stays valid, default one hour
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+    def __contains__(self, key):
+        return self.get(key, count=False) is not None
+
+    def get(self, key, count=True):
+        """
+        Returns the value of a key, None when it is missing or expired
+        :param any key: the key
+        :param bool count: Pass False to leave hits and misses as they are
+        :rtype: any
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        """
+        Sets the value of a key
+        :param any key: the key
+        :param any value: the value, None is not cached
+        :param float or None ttl: seconds the entry stays valid, default the ttl of the cache
+        """
+        if value is None:
+            return
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def pop(self, key):
+        """
+        Removes a key, returns its value
+        :param any key: the key
+        :rtype: any
+        """
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+        return None if entry is None else entry[1]
+
+    def clear(self):
+        """
+        Removes all the entries
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+
+class ChatCache(object):
+    """
+    This class keeps the results of getChat, getChatMember and getChatAdministrators for a while,
+    The updates seen by the bot drop or refresh the entries they change, so cached data stays up to date.
+    """
+    # the service messages that change what getChat returns
+    chat_changes = ('new_chat_title', 'new_chat_photo', 'delete_chat_photo', 'pinned_message',
+                    'message_auto_delete_timer_changed', 'migrate_to_chat_id')
+    admin_statuses = ('creator', 'administrator')
+
+    def __init__(self, maxsize=10000, chat_ttl=300, member_ttl=60, admins_ttl=300):
+        """
+        Initializes a new ChatCache
+        :param int maxsize: maximum number of chats, members and administrator lists, each
+        :param float chat_ttl: seconds a Chat is kept, default 5 minutes
+        :param float member_ttl: seconds a ChatMember is kept, default 1 minute
+        :param float admins_ttl: seconds the administrators of a chat are kept, default 5 minutes
+        """
+        self.chats = TTLCache(maxsize, chat_ttl)
+        self.members = TTLCache(maxsize, member_ttl)
+        self.admins = TTLCache(maxsize, admins_ttl)
+
+    @property
+    def hits(self):
+        """
+        Number of lookups that found an entry
+        :rtype: int
+        """
+        return self.chats.hits + self.members.hits + self.admins.hits
+
+    @property
+    def misses(self):
+        """
+        Number of lookups that did not find an entry
+        :rtype: int
+        """
+        return self.chats.misses + self.members.misses + self.admins.misses
+
+    @staticmethod
+    def key(chat_id):
+        """
+        Returns the key of a chat, None for the username of a channel, which is not cached since the updates that
+        refresh the entries only carry the ids of the chats
+        :param int or str chat_id: Unique identifier for the target chat or username of the target channel
+        :rtype: int or None
+        """
+        try:
+            return int(chat_id)
+        except (TypeError, ValueError):
+            return None
+
+    def process_update(self, update):
+        """
+        Drops or refreshes the entries an incoming update changes
+        :param types.Update update: the update
+        """
+        for member_updated in (update.my_chat_member, update.chat_member):
+            if member_updated is not None:
+                self.member_updated(member_updated)
+        for message in (update.message, update.channel_post):
+            if message is not None:
+                self.service_message(message)
+
+    def member_updated(self, member_updated):
+        """
+        Keeps the new status of a chat member, a promoted or demoted member drops the administrators of the chat
+        :param types.ChatMemberUpdated member_updated: the change
+        """
+        chat_id = member_updated.chat.uid
+        member = member_updated.new_chat_member
+        self.members.set((chat_id, member.user.uid), member)
+        if member_updated.old_chat_member.status in self.admin_statuses or member.status in self.admin_statuses:
+            self.admins.pop(chat_id)
+        if member.user.is_bot and member.status in ('left', 'kicked'):
+            self.chats.pop(chat_id)
+            self.admins.pop(chat_id)
+
+    def service_message(self, message):
+        """
+        Drops the members that joined or left a chat, and the chat when its title, photo or pinned message changed
+        :param types.Message message: the message
+        """
+        if message.text is not None or message.chat.ttype == 'private':
+            # a service message has no text, and private chats have none of those
+            return
+        chat_id = message.chat.uid
+        for user in message.new_chat_members or ():
+            self.members.pop((chat_id, user.uid))
+        if message.left_chat_member is not None:
+            self.members.pop((chat_id, message.left_chat_member.uid))
+            self.admins.pop(chat_id)
+        for change in self.chat_changes:
+            if getattr(message, change):
+                self.chats.pop(chat_id)
+                self.admins.pop(chat_id)
+                break
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_coalescer
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the edit coalescer that is consumed internally by bot.py
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+
+from .api_exceptions import TelegramAPIError
+from .json_helper import codec
+
+
+class EditCoalescer(object):
+    """
+    This class queues the edits of messages and sends at most rate edits per second to each message,
+    An edit queued while an older one of the same message waits replaces it, and an edit equal to the last one
+    sent is not sent at all, Every edit returns a future of its result, replaced edits share the one that was sent.
+    """
+    methods = ('edit_message_text', 'edit_message_caption', 'edit_message_reply_markup', 'edit_message_live_location')
+
+    def __init__(self, deferred, session, rate=1.0, max_workers=4, loop=None, maxsize=10000):
+        """
+        Initializes a new EditCoalescer
+        :param DeferredMethods deferred: the api methods of the bot as deferred calls, like bot.reply
+        :param Session or AsyncSession session: The session to send the edits through
+        :param float rate: edits per second of each message, default 1
+        :param int max_workers: number of edits in flight at once
+        :param asyncio.AbstractEventLoop or None loop: the loop of an AsyncSession, the edits return asyncio futures
+        :param int maxsize: number of messages whose last edit is remembered
+        """
+        self.rate = rate
+        self.max_workers = max_workers
+        self.maxsize = maxsize
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+        self.__deferred = deferred
+        self.__session = session
+        self.__loop = loop
+        self.__condition = threading.Condition()
+        self.__pending = {}
+        self.__queue = []
+        self.__sequence = itertools.count()
+        self.__in_flight = set()
+        self.__last = collections.OrderedDict()
+        self.__workers = []
+        self.__closed = False
+
+    def __getattr__(self, name):
+        if name not in self.methods:
+            raise AttributeError(f'{name} is not an edit method that can be coalesced')
+        method = getattr(self.__deferred, name)
+
+        def coalesced(*args, **kwargs):
+            return self.submit(method(*args, **kwargs))
+
+        coalesced.__name__ = name
+        coalesced.__doc__ = method.__doc__
+        return coalesced
+
+    def submit(self, call):
+        """
+        Queues an edit recorded as a DeferredCall
+        :param DeferredCall call: the edit
+        :return: the future of its result, a Message or True
+        :rtype: concurrent.futures.Future or asyncio.Future
+        """
+        params = call.params or {}
+        key = (call.api_method, params.get('chat_id'), params.get('message_id'), params.get('inline_message_id'))
+        signature = _signature(call)
+        future = concurrent.futures.Future()
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError('The edit coalescer is closed')
+            pending = self.__pending.get(key)
+            last = self.__last.get(key)
+            if pending is not None:
+                self.coalesced += 1
+                pending[0], pending[1] = call, signature
+                pending[2].append(future)
+            elif last is not None and last[1] == signature and key not in self.__in_flight:
+                self.dropped += 1
+                future.set_result(last[2])
+            else:
+                due = time.monotonic() if last is None else last[0] + 1.0 / self.rate
+                self.__pending[key] = [call, signature, [future]]
+                self.__schedule(due, key)
+                self.__start()
+        return future if self.__loop is None else asyncio.wrap_future(future, loop=self.__loop)
+
+    def close(self, wait=True):
+        """
+        Stops the workers once the queued edits are sent, edits cannot be queued afterwards
+        :param bool wait: Pass False to return without waiting for the queued edits
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        if wait:
+            for worker in self.__workers:
+                worker.join()
+
+    def __schedule(self, due, key):
+        heapq.heappush(self.__queue, (due, next(self.__sequence), key))
+        self.__condition.notify()
+
+    def __start(self):
+        if len(self.__workers) < min(self.max_workers, len(self.__pending)):
+            worker = threading.Thread(target=self.__work, name=f'edits-{len(self.__workers)}', daemon=True)
+            self.__workers.append(worker)
+            worker.start()
+
+    def __next(self):
+        """
+        Waits for the next edit that is due, returns its key and entry, None once closed and empty
+        """
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+                if self.__queue and self.__queue[0][0] <= now:
+                    due, _, key = heapq.heappop(self.__queue)
+                    last = self.__last.get(key)
+                    not_before = 0.0 if last is None else last[0] + 1.0 / self.rate
+                    if key in self.__in_flight:
+                        # the previous edit of the message is not done yet
+                        not_before = now + 1.0 / self.rate
+                    if not_before > now:
+                        self.__schedule(not_before, key)
+                        continue
+                    call, signature, futures = self.__pending.pop(key)
+                    if last is not None and last[1] == signature:
+                        self.dropped += 1
+                        for future in futures:
+                            future.set_result(last[2])
+                        continue
+                    self.__in_flight.add(key)
+                    return key, call, signature, futures
+                if self.__closed and not self.__queue:
+                    return None
+                self.__condition.wait(self.__queue[0][0] - now if self.__queue else None)
+
+    def __work(self):
+        while True:
+            entry = self.__next()
+            if entry is None:
+                return
+            key, call, signature, futures = entry
+            started = time.monotonic()
+            try:
+                result = self.__send(call)
+            except TelegramAPIError as e:
+                result = e
+                description = (e.description or '').lower()
+                if e.error_code == 400 and 'message is not modified' in description:
+                    # the message already shows this edit
+                    result = True
+                elif e.parameters is not None and e.parameters.retry_after is not None:
+                    self.__retry(key, call, signature, futures, e.parameters.retry_after)
+                    continue
+            except Exception as e:
+                result = e
+
+            with self.__condition:
+                self.__in_flight.discard(key)
+                self.sent += 1
+                if isinstance(result, Exception):
+                    # a failed edit is not known to be shown, the next one is sent even if equal
+                    self.__remember(key, started, None, None)
+                else:
+                    self.__remember(key, started, signature, result)
+            for future in futures:
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def __retry(self, key, call, signature, futures, retry_after):
+        """
+        Queues an edit refused with 429 again after retry_after, unless a newer edit replaced it meanwhile
+        """
+        with self.__condition:
+            self.__in_flight.discard(key)
+            self.sent += 1
+            # the next edit of the message is not sent before retry_after
+            self.__remember(key, time.monotonic() + retry_after - 1.0 / self.rate, None, None)
+            pending = self.__pending.get(key)
+            if pending is not None:
+                pending[2][:0] = futures
+                return
+            self.__pending[key] = [call, signature, futures]
+            self.__schedule(time.monotonic() + retry_after, key)
+
+    def __remember(self, key, sent_at, signature, result):
+        self.__last[key] = (sent_at, signature, result)
+        self.__last.move_to_end(key)
+        while len(self.__last) > self.maxsize:
+            self.__last.popitem(last=False)
+
+    def __send(self, call):
+        if self.__loop is None:
+            result = call.send(self.__session)
+        else:
+            result = asyncio.run_coroutine_threadsafe(call.send(self.__session), self.__loop).result()
+        if isinstance(result, dict):
+            from ..types import Message
+            return Message.de_json(result)
+        return result
+
+
+def _signature(call):
+    """
+    Returns what tells two edits of a message apart
+    """
+    try:
+        return codec.dumps(call.params)
+    except (TypeError, ValueError):
+        return repr(call.params)
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_download
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the file download functions that are consumed internally by bot.py
+"""
+
+import asyncio
+import os
+import shutil
+
+from .api_exceptions import TelegramAPIError
+from .api_handler import AsyncSession
+from .api_multipart import CHUNK_SIZE
+from .json_helper import codec
+
+
+class FileSink(object):
+    """
+    This class represents the destination of a download, a path, a file object or a writable memoryview,
+    offset is the number of bytes already written.
+    A path is opened on the first write, once the response was accepted, and a whole file is written to a .part file
+    next to it that replaces it when the download completes, so a failed download leaves the path as it was.
+    """
+
+    def __init__(self, destination, resume=False):
+        """
+        Initializes a new FileSink
+        :param str or os.PathLike or BinaryIO or memoryview or bytearray destination: where the file is written
+        :param bool resume: Pass True to keep what destination already holds and continue after it
+        """
+        self.__file = None
+        self.__view = None
+        self.__path = None
+        self.__temp = None
+        self.__start = 0
+        self.offset = 0
+
+        if isinstance(destination, (str, os.PathLike)):
+            self.__path = os.fspath(destination)
+            if resume and os.path.isfile(self.__path):
+                self.offset = os.path.getsize(self.__path)
+        elif isinstance(destination, (memoryview, bytearray)):
+            self.__view = memoryview(destination).cast('B')
+        elif hasattr(destination, 'write'):
+            self.__file = destination
+            if hasattr(destination, 'seek') and (not hasattr(destination, 'seekable') or destination.seekable()):
+                self.__start = destination.tell()
+                if resume:
+                    self.offset = destination.seek(0, os.SEEK_END) - self.__start
+        else:
+            raise TypeError(f'Cannot download to an object of type {type(destination).__name__}')
+
+    def write(self, chunk):
+        """
+        Writes the next chunk of the file
+        :param bytes chunk: the chunk
+        """
+        if self.__view is not None:
+            if self.offset + len(chunk) > len(self.__view):
+                raise ValueError(f'The file does not fit in a memoryview of {len(self.__view)} bytes')
+            self.__view[self.offset:self.offset + len(chunk)] = chunk
+        else:
+            self.__open().write(chunk)
+        self.offset += len(chunk)
+
+    def restart(self):
+        """
+        Drops what was written, the file is written again from its beginning
+        """
+        if self.__path is not None and self.__temp is None:
+            # the whole file goes to the .part file, the partial file is replaced once it completes
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+        elif self.__file is not None and self.offset:
+            self.__file.seek(self.__start)
+            self.__file.truncate()
+        self.offset = 0
+
+    def copy(self, path):
+        """
+        Copies a local file from the sink offset on, on the kernel side when both ends are files
+        :param str path: the absolute path of the file
+        """
+        with open(path, 'rb') as source:
+            size = os.fstat(source.fileno()).st_size
+            if self.offset > size:
+                self.restart()
+            if self.__view is not None:
+                if size > len(self.__view):
+                    raise ValueError(f'The file does not fit in a memoryview of {len(self.__view)} bytes')
+                source.seek(self.offset)
+                while self.offset < size:
+                    read = source.readinto(self.__view[self.offset:size])
+                    if not read:
+                        break
+                    self.offset += read
+            else:
+                file = self.__open()
+                file.flush()
+                try:
+                    out = file.fileno()
+                except (AttributeError, OSError):
+                    out = None
+                if out is not None and hasattr(os, 'sendfile'):
+                    while self.offset < size:
+                        sent = os.sendfile(out, source.fileno(), self.offset, size - self.offset)
+                        if not sent:
+                            break
+                        self.offset += sent
+                    # the file object does not know the kernel moved its position
+                    file.seek(self.__start + self.offset)
+                else:
+                    source.seek(self.offset)
+                    shutil.copyfileobj(source, file)
+                    self.offset = size
+            if self.offset < size:
+                raise EOFError(f'{path} ended after {self.offset} of {size} bytes')
+
+    def close(self, completed=True):
+        """
+        Closes the destination when the sink opened it, a completed whole file replaces the path
+        :param bool completed: Pass False when the download failed, a whole file written so far is deleted
+        """
+        if self.__path is None:
+            return
+        if completed and self.__file is None and not self.offset:
+            # an empty file was downloaded
+            self.__open()
+        if self.__file is not None:
+            self.__file.close()
+        if self.__temp is not None:
+            if completed:
+                os.replace(self.__temp, self.__path)
+            else:
+                os.unlink(self.__temp)
+
+    def __open(self):
+        """
+        Returns the file written to, a path is opened by the first write
+        """
+        if self.__file is None:
+            if self.offset:
+                self.__file = open(self.__path, 'ab')
+            else:
+                self.__temp = f'{self.__path}.part'
+                self.__file = open(self.__temp, 'wb')
+        return self.__file
+
+
+def file_url(api_url, file_path):
+    """
+    Returns the download URL of a file, https://api.telegram.org/file/bot<token>/<file_path>
+    :param str api_url: The API url with Bot token
+    :param str file_path: the file_path of a File
+    :rtype: str
+    """
+    based_url, _, token = api_url.rpartition('/bot')
+    return f'{based_url}/file/bot{token}/{file_path}'
+
+
+def download_file(session, api_url, file_path, destination, resume=False, chunk_size=CHUNK_SIZE):
+    """
+    This method downloads a file in chunks, a file_path on the local disk, like the ones of a Bot API server
+    running with --local, is copied from it without HTTP,
+    When session is an AsyncSession a coroutine is returned which must be awaited
+    :param Session or AsyncSession session: The session to send the request through
+    :param str api_url: The API url with Bot token
+    :param str file_path: the file_path of a File
+    :param str or os.PathLike or BinaryIO or memoryview or bytearray destination: where the file is written
+    :param bool resume: Pass True to continue a partial download of destination with an HTTP Range request
+    :param int chunk_size: The size of the chunks read from the connection
+    :return: the size of the file
+    :rtype: int
+    :raise EOFError: when the response or the local file ends before the whole file was written
+    """
+    if isinstance(session, AsyncSession):
+        return _download_file_async(session, api_url, file_path, destination, resume, chunk_size)
+    sink = FileSink(destination, resume)
+    try:
+        if os.path.isabs(file_path) and os.path.isfile(file_path):
+            sink.copy(file_path)
+        else:
+            _check_download(sink, *session.download(file_url(api_url, file_path), sink, chunk_size))
+    except BaseException:
+        sink.close(False)
+        raise
+    sink.close()
+    return sink.offset
+
+
+async def _download_file_async(session, api_url, file_path, destination, resume, chunk_size):
+    sink = FileSink(destination, resume)
+    try:
+        if os.path.isabs(file_path) and os.path.isfile(file_path):
+            await asyncio.get_running_loop().run_in_executor(None, sink.copy, file_path)
+        else:
+            _check_download(sink, *await session.download(file_url(api_url, file_path), sink, chunk_size))
+    except BaseException:
+        sink.close(False)
+        raise
+    sink.close()
+    return sink.offset
+
+
+def _check_download(sink, status, content):
+    """
+    Raises TelegramAPIError for an unsuccessful download
+    """
+    if status in (200, 206) or (status == 416 and sink.offset):
+        # 416 means a resumed download was already complete
+        return
+    try:
+        description = codec.loads(content).get('description')
+    except (ValueError, AttributeError):
+        description = None
+    raise TelegramAPIError(f'Download failed: {status} {description or ""}'.strip(), None, status, description)
@@ -20,6 +20,16 @@ class TelegramAPIError(Exception):
     """
     This class represents an Exception thrown when a call to the Telegram API fails.
     """
-    def __init__(self, message, result=None):
+    def __init__(self, message, result=None, error_code=None, description=None, parameters=None):
+        """
+        :param str message: the error message
+        :param any result: the API result, if any
+        :param int or None error_code: The error code returned by the Telegram API
+        :param str or None description: The API description
+        :param types.ResponseParameters or None parameters: why the request was unsuccessful
+        """
         super(TelegramAPIError, self).__init__(f"{message}")
         self.result = result
+        self.error_code = error_code
+        self.description = description
+        self.parameters = parameters
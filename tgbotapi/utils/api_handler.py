@@ -6,31 +6,46 @@ tgbotapi.utils.api_handler
 This module contains the api handler functions that are consumed internally by methods.py
 """
 
+import asyncio
+import base64
+import socket
+import ssl
+import time
+import urllib.parse
+import zlib
+
 import requests
 
 from tgbotapi import __version__
 from .api_exceptions import TelegramAPIError
-from .json_helper import JsonDeserializable
+from .api_multipart import CHUNK_SIZE, MultipartEncoder
+from .json_helper import JsonDeserializable, codec
 from .logger import logger
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# descriptions of the 400 errors that mean a file_id is not valid anymore, like 'wrong file identifier/HTTP URL'
+FILE_ID_ERRORS = ('file identifier', 'file reference', 'file_reference')
+
 
 class Response(JsonDeserializable):
     """
     This class represents a Telegram API response.
     """
 
-    def __init__(self, ok, result, error_code, description):
+    def __init__(self, ok, result, error_code, description, parameters):
         """
         This method initializes a Response instance
         :param bool ok: True if the request was successful
         :param str or list or dict result: The API result
         :param int error_code: The error code returned by the Telegram API
         :param str description: The API description
+        :param dict parameters: The API ResponseParameters
         """
         self.ok = ok
         self.result = result
         self.error_code = error_code
         self.description = description
+        self.parameters = parameters
 
     @classmethod
     def de_json(cls, obj_type):
@@ -45,46 +60,690 @@ class Response(JsonDeserializable):
         description = None
         if 'description' in obj:
             description = obj['description']
-        return cls(ok, result, error_code, description)
+        parameters = None
+        if 'parameters' in obj:
+            parameters = obj['parameters']
+        return cls(ok, result, error_code, description, parameters)
+
+
+class Session(object):
+    """
+    This class represents a persistent HTTP session to the Telegram API,
+    Connections are kept alive and reused by every request made through the same session.
+    """
+
+    def __init__(self, pool_size=10, proxies=None, rate_limiter=None, retry_policy=None, upload_cache=None):
+        """
+        This method initializes a Session instance
+        :param int pool_size: Maximum number of keep-alive connections kept in the pool
+        :param dict or None proxies: Dictionary mapping protocol to the URL of the proxy
+        :param RateLimiter or None rate_limiter: Scheduler that queues calls under the Telegram flood limits
+        :param RetryPolicy or None retry_policy: Decides whether failed calls are sent again
+        :param UploadCache or None upload_cache: Sends the file_id of files that were uploaded before
+        """
+        self.pool_size = pool_size
+        self.proxies = proxies
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.upload_cache = upload_cache
+
+        self.__session = requests.Session()
+        self.__session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Charset': 'utf-8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Language': 'en-US,en;q=0.8',
+            'Connection': 'keep-alive',
+            'User-Agent': f'tgbotapi v{__version__}'
+        })
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.__session.mount('https://', adapter)
+        self.__session.mount('http://', adapter)
+
+    def request(self, method, url, params, files):
+        """
+        This method sends a request over one of the pooled connections,
+        The params of a call without files are sent as a JSON body, an upload is streamed as a multipart body.
+        :param str method: HTTP method ['get', 'post']
+        :param str url: The URL to send the request to
+        :param dict or None params: Should be a dictionary with key-value pairs
+        :param any files: files content's a data to be uploaded with request
+        :return: The decoded JSON response
+        :rtype: dict
+        """
+        if files:
+            body = MultipartEncoder(params, files)
+            try:
+                reqs = self.__session.request('post', url, data=body, headers={'Content-Type': body.content_type},
+                                              proxies=self.proxies)
+            finally:
+                # a retried call sends the files again from where they started
+                body.rewind()
+        elif params:
+            reqs = self.__session.request('post', url, data=codec.dumpb(params), headers=JSON_HEADERS,
+                                          proxies=self.proxies)
+        else:
+            reqs = self.__session.request(method, url, proxies=self.proxies)
+        try:
+            return codec.loads(reqs.content)
+        except ValueError:
+            return {'ok': False, 'error_code': reqs.status_code, 'description': reqs.reason}
+
+    def download(self, url, sink, chunk_size=CHUNK_SIZE):
+        """
+        This method streams a file over one of the pooled connections, from the sink offset on
+        :param str url: The URL of the file
+        :param FileSink sink: Where the file is written
+        :param int chunk_size: The size of the chunks read from the connection
+        :return: The HTTP status code and the body of an unsuccessful response
+        :rtype: tuple
+        """
+        headers = {'Accept-Encoding': 'identity'}
+        if sink.offset:
+            headers['Range'] = f'bytes={sink.offset}-'
+        with self.__session.get(url, headers=headers, stream=True, proxies=self.proxies) as reqs:
+            if reqs.status_code not in (200, 206):
+                return reqs.status_code, reqs.content
+            if reqs.status_code == 200:
+                # the server sent the whole file instead of the range
+                sink.restart()
+            start, length = sink.offset, reqs.headers.get('Content-Length')
+            try:
+                for chunk in reqs.iter_content(chunk_size):
+                    sink.write(chunk)
+            except requests.exceptions.ChunkedEncodingError as e:
+                raise EOFError(f'The download broke off after {sink.offset - start} bytes') from e
+            if length is not None and sink.offset - start < int(length):
+                raise EOFError(f'The download ended after {sink.offset - start} of {length} bytes')
+        return reqs.status_code, b''
+
+    def close(self):
+        """
+        This method closes all the pooled connections
+        """
+        self.__session.close()
 
 
-def make_request(method, url, api_method, files, params, proxies):
+class AsyncSession(object):
+    """
+    This class represents a persistent asyncio HTTP session to the Telegram API,
+    Requests are sent over pooled keep-alive connections without blocking the event loop.
     """
-    This method makes a request to the Telegram API
+
+    def __init__(self, pool_size=100, rate_limiter=None, retry_policy=None, upload_cache=None, proxies=None,
+                 connect_timeout=10, read_timeout=60):
+        """
+        This method initializes an AsyncSession instance
+        :param int pool_size: Maximum number of connections open at the same time
+        :param RateLimiter or None rate_limiter: Scheduler that queues calls under the Telegram flood limits
+        :param RetryPolicy or None retry_policy: Decides whether failed calls are sent again
+        :param UploadCache or None upload_cache: Sends the file_id of files that were uploaded before
+        :param dict or None proxies: Dictionary mapping protocol to the URL of an HTTP proxy, like requests takes
+        :param float or None connect_timeout: Seconds to wait for a connection, None waits forever
+        :param float or None read_timeout: Seconds to wait for each read of a response, the long polling timeout of
+                                           getUpdates is added to it, None waits forever
+        """
+        for proxy in (proxies or {}).values():
+            if proxy and urllib.parse.urlsplit(proxy).scheme != 'http':
+                raise ValueError(f'Only http proxies are supported, not {proxy}')
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.upload_cache = upload_cache
+        self.proxies = proxies
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self.__headers = {
+            'Accept': 'application/json',
+            'Accept-Charset': 'utf-8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Language': 'en-US,en;q=0.8',
+            'Connection': 'keep-alive',
+            'User-Agent': f'tgbotapi v{__version__}'
+        }
+        self.__connections = {}
+        self.__semaphore = None
+
+    async def request(self, method, url, params, files):
+        """
+        This method sends a request over one of the pooled connections,
+        The params of a call without files are sent as a JSON body, an upload is streamed as a multipart body.
+        :param str method: HTTP method ['get', 'post']
+        :param str url: The URL to send the request to
+        :param dict or None params: Should be a dictionary with key-value pairs
+        :param any files: files content's a data to be uploaded with request
+        :return: The decoded JSON response
+        :rtype: dict
+        """
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.pool_size)
+
+        upload = None
+        if files:
+            upload = MultipartEncoder(params, files)
+            prepared = requests.Request('POST', url, headers=dict(self.__headers,
+                                                                  **{'Content-Type': upload.content_type})).prepare()
+        elif params:
+            prepared = requests.Request('POST', url, headers=dict(self.__headers, **JSON_HEADERS),
+                                        data=codec.dumpb(params)).prepare()
+        else:
+            prepared = requests.Request(method.upper(), url, headers=self.__headers).prepare()
+        address = urllib.parse.urlsplit(prepared.url)
+        body = prepared.body or b''
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        head = [f'{prepared.method} {self.__target(address)} HTTP/1.1', f'Host: {address.netloc}']
+        head += [f'{key}: {value}' for key, value in prepared.headers.items() if key != 'Content-Length']
+        head += self.__proxy_headers(address)
+        head.append(f'Content-Length: {len(upload) if upload else len(body)}')
+        data = ('\r\n'.join(head) + '\r\n\r\n').encode('utf-8') + body
+        timeout = self.read_timeout
+        if timeout is not None and params and params.get('timeout'):
+            # getUpdates answers after its long polling timeout
+            timeout += params['timeout']
+
+        async with self.__semaphore:
+            reused, reader, writer = await self.__acquire(address)
+            try:
+                try:
+                    await self.__send(writer, data, upload)
+                    status, keep_alive, content = await self.__read_response(reader, timeout=timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if not reused:
+                        raise
+                    # the server dropped an idle keep-alive connection, retry once on a fresh one
+                    reused, reader, writer = await self.__acquire(address, fresh=True)
+                    await self.__send(writer, data, upload)
+                    status, keep_alive, content = await self.__read_response(reader, timeout=timeout)
+            except BaseException:
+                # cancelled or timed out in the middle of the exchange, the connection can not be reused
+                writer.close()
+                raise
+            finally:
+                if upload:
+                    upload.rewind()
+
+            if keep_alive:
+                self.__connections.setdefault(self.__key(address), []).append((reader, writer))
+            else:
+                writer.close()
+        try:
+            return codec.loads(content)
+        except ValueError:
+            status = status.decode('latin-1').split(' ', 2)
+            return {'ok': False, 'error_code': int(status[1]), 'description': status[-1].strip()}
+
+    async def download(self, url, sink, chunk_size=CHUNK_SIZE):
+        """
+        This method streams a file over one of the pooled connections, from the sink offset on
+        :param str url: The URL of the file
+        :param FileSink sink: Where the file is written
+        :param int chunk_size: The size of the chunks read from the connection
+        :return: The HTTP status code and the body of an unsuccessful response
+        :rtype: tuple
+        """
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.pool_size)
+
+        address = urllib.parse.urlsplit(url)
+        path = self.__target(address)
+
+        def request_head():
+            head = [f'GET {path} HTTP/1.1', f'Host: {address.netloc}']
+            head += [f'{key}: {value}' for key, value in self.__headers.items() if key != 'Accept-Encoding']
+            head += self.__proxy_headers(address)
+            head.append('Accept-Encoding: identity')
+            if sink.offset:
+                head.append(f'Range: bytes={sink.offset}-')
+            return ('\r\n'.join(head) + '\r\n\r\n').encode('utf-8')
+
+        async with self.__semaphore:
+            reused, reader, writer = await self.__acquire(address)
+            try:
+                await self.__send(writer, request_head(), None)
+                status, keep_alive, content = await self.__read_response(reader, sink, chunk_size, self.read_timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if not reused:
+                    raise
+                # the server dropped an idle keep-alive connection, resume once on a fresh one
+                reused, reader, writer = await self.__acquire(address, fresh=True)
+                await self.__send(writer, request_head(), None)
+                status, keep_alive, content = await self.__read_response(reader, sink, chunk_size, self.read_timeout)
+            except BaseException:
+                # the sink failed, the download was cancelled or timed out in the middle of the body,
+                # the connection cannot be reused
+                writer.close()
+                raise
+
+            if keep_alive:
+                self.__connections.setdefault(self.__key(address), []).append((reader, writer))
+            else:
+                writer.close()
+        return int(status.split(b' ', 2)[1]), content
+
+    async def close(self):
+        """
+        This method closes all the pooled connections
+        """
+        for connections in self.__connections.values():
+            for _, writer in connections:
+                writer.close()
+        self.__connections.clear()
+
+    @staticmethod
+    def __key(address):
+        return address.scheme, address.hostname, address.port
+
+    def __proxy(self, address):
+        """
+        Returns the address of the proxy of a request, None to connect directly
+        """
+        proxy = (self.proxies or {}).get(address.scheme)
+        return urllib.parse.urlsplit(proxy) if proxy else None
+
+    def __target(self, address):
+        """
+        Returns the request target, an absolute url for a plain http request sent through a proxy
+        """
+        path = (address.path or '/') + (f'?{address.query}' if address.query else '')
+        if address.scheme == 'http' and self.__proxy(address) is not None:
+            return f'http://{address.netloc}{path}'
+        return path
+
+    def __proxy_headers(self, address):
+        """
+        Returns the proxy credentials header of a plain http request sent through a proxy
+        """
+        proxy = self.__proxy(address)
+        if address.scheme != 'http' or proxy is None or proxy.username is None:
+            return []
+        return [_proxy_authorization(proxy)]
+
+    async def __acquire(self, address, fresh=False):
+        """
+        Returns an idle connection from the pool, or opens a new one
+        """
+        idle = self.__connections.get(self.__key(address))
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return True, reader, writer
+            writer.close()
+
+        secure = address.scheme == 'https'
+        port = address.port or (443 if secure else 80)
+        proxy = self.__proxy(address)
+        if proxy is None:
+            connect = asyncio.open_connection(address.hostname, port,
+                                              ssl=ssl.create_default_context() if secure else None)
+        elif secure:
+            connect = self.__tunnel(proxy, address.hostname, port)
+        else:
+            connect = asyncio.open_connection(proxy.hostname, proxy.port or 80)
+        reader, writer = await asyncio.wait_for(connect, self.connect_timeout)
+        return False, reader, writer
+
+    @staticmethod
+    async def __tunnel(proxy, hostname, port):
+        """
+        Opens a TLS connection to hostname through an HTTP CONNECT tunnel of a proxy
+        """
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET6 if ':' in (proxy.hostname or '') else socket.AF_INET)
+        sock.setblocking(False)
+        try:
+            await loop.sock_connect(sock, (proxy.hostname, proxy.port or 80))
+            head = [f'CONNECT {hostname}:{port} HTTP/1.1', f'Host: {hostname}:{port}']
+            if proxy.username is not None:
+                head.append(_proxy_authorization(proxy))
+            await loop.sock_sendall(sock, ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+            response = b''
+            while b'\r\n\r\n' not in response:
+                chunk = await loop.sock_recv(sock, 4096)
+                if not chunk:
+                    raise ConnectionError('The proxy closed the connection')
+                response += chunk
+            status = response.split(b'\r\n', 1)[0].decode('latin-1')
+            if status.split(' ', 2)[1:2] != ['200']:
+                raise ConnectionError(f'The proxy refused the tunnel: {status}')
+            return await asyncio.open_connection(sock=sock, ssl=ssl.create_default_context(),
+                                                 server_hostname=hostname)
+        except BaseException:
+            sock.close()
+            raise
+
+    @staticmethod
+    async def __send(writer, data, upload):
+        """
+        Writes the request head and body, an upload is read from its files one chunk at a time
+        """
+        writer.write(data)
+        await writer.drain()
+        if upload:
+            upload.rewind()
+            for chunk in upload:
+                writer.write(chunk)
+                await writer.drain()
+
+    @staticmethod
+    async def __read_response(reader, sink=None, chunk_size=CHUNK_SIZE, timeout=None):
+        """
+        Reads an HTTP/1.1 response, returns the status line, whether the connection can be reused and the body,
+        The body of a successful download is written to its sink one chunk at a time instead,
+        Each read waits at most timeout seconds
+        """
+        if timeout is not None:
+            reader = _TimedReader(reader, timeout)
+        status = await reader.readuntil(b'\r\n')
+        version = status.split(b' ', 1)[0]
+        headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        keep_alive = version == b'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        code = status.split(b' ', 2)[1]
+        stream = sink is not None and code in (b'200', b'206')
+        if stream and code == b'200':
+            # the server sent the whole file instead of the range
+            sink.restart()
+        chunks = []
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+                if size == 0:
+                    await reader.readuntil(b'\r\n')
+                    break
+                if stream:
+                    await AsyncSession.__read_into(reader, size, sink, chunk_size)
+                else:
+                    chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+        elif 'content-length' in headers:
+            if stream:
+                await AsyncSession.__read_into(reader, int(headers['content-length']), sink, chunk_size)
+            else:
+                chunks.append(await reader.readexactly(int(headers['content-length'])))
+        else:
+            while True:
+                chunk = await reader.read(chunk_size)
+                if not chunk:
+                    break
+                if stream:
+                    sink.write(chunk)
+                else:
+                    chunks.append(chunk)
+            keep_alive = False
+        content = b''.join(chunks)
+
+        encoding = headers.get('content-encoding', '').lower()
+        if encoding == 'gzip':
+            content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            content = zlib.decompress(content)
+        return status, keep_alive, content
+
+    @staticmethod
+    async def __read_into(reader, size, sink, chunk_size):
+        """
+        Writes the next size bytes of a response body to a sink one chunk at a time
+        """
+        while size:
+            chunk = await reader.read(min(size, chunk_size))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b'', size)
+            sink.write(chunk)
+            size -= len(chunk)
+
+
+class _TimedReader(object):
+    """
+    Wraps a StreamReader, every read raises asyncio.TimeoutError when no data came for timeout seconds
+    """
+
+    def __init__(self, reader, timeout):
+        self.__reader = reader
+        self.__timeout = timeout
+
+    def read(self, n=-1):
+        return asyncio.wait_for(self.__reader.read(n), self.__timeout)
+
+    def readexactly(self, n):
+        return asyncio.wait_for(self.__reader.readexactly(n), self.__timeout)
+
+    def readuntil(self, separator=b'\n'):
+        return asyncio.wait_for(self.__reader.readuntil(separator), self.__timeout)
+
+
+def _proxy_authorization(proxy):
+    """
+    Returns the Proxy-Authorization header of the credentials in a proxy url
+    """
+    credentials = f'{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or "")}'
+    return f'Proxy-Authorization: Basic {base64.b64encode(credentials.encode("utf-8")).decode("ascii")}'
+
+
+class DeferredCall(Exception):
+    """
+    This class represents an api call that was recorded by a DeferredSession instead of being sent,
+    A webhook can send it in the body of its response, otherwise it is sent through a session later.
+    """
+
+    def __init__(self, method, url, params, files):
+        """
+        Initializes a new DeferredCall
+        :param str method: HTTP method ['get', 'post']
+        :param str url: The URL of the api method
+        :param dict or None params: Should be a dictionary with key-value pairs
+        :param any files: files content's a data to be uploaded with request
+        """
+        Exception.__init__(self, url)
+        self.method = method
+        self.url = url
+        self.api_method = url.rsplit('/', 1)[-1]
+        self.params = params
+        self.files = files
+
+    def to_dict(self):
+        """
+        Returns the webhook response body of the call
+        :rtype: dict
+        """
+        return {'method': self.api_method, **(self.params or {})}
+
+    def send(self, session):
+        """
+        Sends the call through a session
+        :param Session session: The session to send the request through
+        :return: JSON DICT FORMAT
+        :rtype: dict
+        """
+        return make_request(self.method, self.url, self.api_method, self.files, self.params, session)
+
+
+class DeferredSession(object):
+    """
+    This class records api calls instead of sending them, request raises the DeferredCall it recorded
+    """
+    rate_limiter = None
+    retry_policy = None
+    upload_cache = None
+
+    def request(self, method, url, params, files):
+        """
+        This method records a request
+        :raise DeferredCall: always
+        """
+        raise DeferredCall(method, url, params, files)
+
+
+class DeferredMethods(object):
+    """
+    This class exposes the api methods of a bot whose session is a DeferredSession,
+    Each method returns the DeferredCall it recorded instead of its result.
+    """
+
+    def __init__(self, bot, cls):
+        """
+        Initializes a new DeferredMethods
+        :param any bot: a bot instance using a DeferredSession
+        :param type cls: the class whose synchronous methods are called, like Bot
+        """
+        self.__bot = bot
+        self.__cls = cls
+
+    def __getattr__(self, name):
+        method = getattr(self.__cls, name).__get__(self.__bot)
+
+        def deferred(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except DeferredCall as call:
+                return call
+
+        deferred.__name__ = name
+        deferred.__doc__ = method.__doc__
+        return deferred
+
+
+def make_request(method, url, api_method, files, params, session):
+    """
+    This method makes a request to the Telegram API,
+    When session is an AsyncSession a coroutine is returned which must be awaited
     :param str method: HTTP method ['get', 'post']
     :param str url: The URL to send the request to
     :param str api_method: Name of the API method to be called. (E.g. 'getUpdates')
     :param any files: files content's a data to be uploaded with request
     :param dict or None params: Should be a dictionary with key-value pairs
-    :param dict or None proxies: Dictionary mapping protocol to the URL of the proxy
+    :param Session or AsyncSession session: The session to send the request through
     :return: JSON DICT FORMAT
     :rtype: dict
     """
-    logger.info(f"{api_method} -> params={params} files={files}")
-    headers = {
-        'Accept': 'application/json',
-        'Accept-Charset': 'utf-8',
-        'Accept-Encoding': 'gzip, deflate',
-        'Accept-Language': 'en-US,en;q=0.8',
-        'Connection': 'close',
-        'Content-Encoding': 'gzip',
-        'User-Agent': f'tgbotapi v{__version__}'
-    }
-    reqs = requests.request(method, url, params=params, headers=headers, files=files, proxies=proxies)
-    logger.info(f"Response <- {reqs.json()}")
-
-    response = Response.de_json(reqs.json())
+    logger.info('%s -> params=%s files=%s', api_method, params, files)
+    if isinstance(session, AsyncSession):
+        return _make_async_request(method, url, api_method, files, params, session)
+    attempt = 0
+    while True:
+        if session.rate_limiter:
+            session.rate_limiter.wait(api_method, params)
+        try:
+            if files and session.upload_cache is not None:
+                return _send_cached(method, url, params, files, session)
+            return _check_response(session.request(method, url, params, files))
+        except TelegramAPIError as e:
+            params, delay = _retry(api_method, params, session, e, attempt)
+        time.sleep(delay)
+        attempt += 1
+
+
+async def _make_async_request(method, url, api_method, files, params, session):
+    attempt = 0
+    while True:
+        if session.rate_limiter:
+            await session.rate_limiter.async_wait(api_method, params)
+        try:
+            if files and session.upload_cache is not None:
+                return await _send_cached_async(method, url, params, files, session)
+            return _check_response(await session.request(method, url, params, files))
+        except TelegramAPIError as e:
+            params, delay = _retry(api_method, params, session, e, attempt)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _send_cached(method, url, params, files, session):
+    """
+    Sends an upload through the session upload cache, the files it knows are sent as their file_id
+    """
+    cached_params, cached_files, keys = session.upload_cache.resolve(params, files)
+    try:
+        result = _check_response(session.request(method, url, cached_params, cached_files))
+    except TelegramAPIError as e:
+        if cached_files is files or not _file_id_rejected(e):
+            raise
+        # a cached file_id was not accepted, upload the files again
+        session.upload_cache.discard(keys)
+        result = _check_response(session.request(method, url, params, files))
+    session.upload_cache.update(keys, result)
+    return result
+
+
+async def _send_cached_async(method, url, params, files, session):
+    cached_params, cached_files, keys = session.upload_cache.resolve(params, files)
+    try:
+        result = _check_response(await session.request(method, url, cached_params, cached_files))
+    except TelegramAPIError as e:
+        if cached_files is files or not _file_id_rejected(e):
+            raise
+        session.upload_cache.discard(keys)
+        result = _check_response(await session.request(method, url, params, files))
+    session.upload_cache.update(keys, result)
+    return result
+
+
+def _file_id_rejected(error):
+    """
+    Tells whether the API refused a call because of a file_id, like an expired file reference,
+    Other errors of the call, like a chat that was not found, are not fixed by uploading the files again
+    :param TelegramAPIError error: the error raised by the call
+    :rtype: bool
+    """
+    description = (error.description or '').lower()
+    return error.error_code == 400 and any(reason in description for reason in FILE_ID_ERRORS)
+
+
+def _retry(api_method, params, session, error, attempt):
+    """
+    Asks the session retry policy whether a failed call is sent again, re-raises the error otherwise
+    :return: the parameters to send the call with and the seconds to wait before it
+    :rtype: tuple
+    """
+    delay = session.retry_policy.delay(error, attempt) if session.retry_policy else None
+    if delay is None:
+        raise error
+
+    migrate_to_chat_id = error.parameters.migrate_to_chat_id if error.parameters else None
+    if migrate_to_chat_id is not None and params and 'chat_id' in params:
+        logger.info(f"{api_method} -> chat {params['chat_id']} migrated to {migrate_to_chat_id}")
+        params = dict(params, chat_id=migrate_to_chat_id)
+    logger.info(f"{api_method} -> retry {attempt + 1} in {delay} seconds")
+    return params, delay
+
+
+def _check_response(data):
+    """
+    Checks the decoded JSON response, returns the API result or raises TelegramAPIError
+    :param dict data: The decoded JSON response
+    :return: The API result
+    """
+    logger.info('Response <- %s', data)
+
+    response = Response.de_json(data)
     if response.ok:
         return response.result
     else:
         logger.debug(f"The Server Responded with an Error: {response.error_code} - {response.description}")
+        parameters = None
+        if response.parameters:
+            from ..types import ResponseParameters
+            parameters = ResponseParameters.de_json(response.parameters)
+
         if response.error_code == 400:
-            raise TelegramAPIError(f'Bad Request: {response.description}')
+            message = 'Bad Request'
         elif response.error_code == 401:
-            raise TelegramAPIError(f'Unauthorized: {response.description}')
+            message = 'Unauthorized'
         elif response.error_code == 404:
-            raise TelegramAPIError(f'Invalid Bot Token: {response.description}')
+            message = 'Invalid Bot Token'
         elif response.error_code == 429:
-            raise TelegramAPIError(f'Too Many Requests: {response.description}')
+            message = 'Too Many Requests'
         else:
-            raise TelegramAPIError(f'Unknown Error: {response.description}')
+            message = 'Unknown Error'
+        raise TelegramAPIError(f'{message}: {response.description}', None, response.error_code, response.description,
+                               parameters)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_limiter
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the outbound rate limiter that is consumed internally by api_handler
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket(object):
+    """
+    This class represents a token bucket, implemented as a generic cell rate algorithm,
+    Reservations are granted in order, so a bucket can hand out start times in the future.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Initializes a new TokenBucket
+        :param float rate: tokens added per second
+        :param int capacity: maximum number of tokens that can be spent at once
+        """
+        self.interval = 1.0 / rate
+        self.tolerance = (capacity - 1) * self.interval
+        self.arrival = 0.0
+
+    def allowed_at(self, now):
+        """
+        Returns the earliest time at which a token is available
+        :param float now: current monotonic time
+        :rtype: float
+        """
+        return max(now, self.arrival - self.tolerance)
+
+    def consume(self, at):
+        """
+        Spends one token at the given time
+        :param float at: monotonic time returned by allowed_at
+        """
+        self.arrival = max(self.arrival, at) + self.interval
+
+
+class RateLimiter(object):
+    """
+    This class schedules outbound api calls under the Telegram flood limits,
+    Calls are queued until their chat and the bot as a whole are below the limits, instead of failing with 429.
+    A call waits for its chat first, and only then for the bot wide limit, so a busy chat does not hold up the others.
+    """
+    limited_methods = ('send', 'forward', 'copy', 'edit', 'stop')
+
+    def __init__(self, overall=30, private_chat=1, group_chat=20 / 60, group_burst=20):
+        """
+        Initializes a new RateLimiter
+        :param float overall: messages per second for the whole bot, default 30
+        :param float private_chat: messages per second to the same private chat, default 1
+        :param float group_chat: messages per second to the same group or channel, default 20 per minute
+        :param int group_burst: messages that can be sent to a group at once, default 20
+        """
+        self.overall = overall
+        self.private_chat = private_chat
+        self.group_chat = group_chat
+        self.group_burst = group_burst
+
+        self.__lock = threading.Lock()
+        self.__bucket = TokenBucket(overall, max(int(overall), 1))
+        self.__chats = {}
+        self.__pending = {}
+        self.__queue_depth = 0
+
+    @property
+    def queue_depth(self):
+        """
+        Number of calls currently waiting for their turn
+        :rtype: int
+        """
+        return self.__queue_depth
+
+    def chat_queue_depth(self, chat_id):
+        """
+        Number of calls to the given chat currently waiting for their turn
+        :param int or str chat_id: Unique identifier for the target chat or username of the target channel
+        :rtype: int
+        """
+        return self.__pending.get(chat_id, 0)
+
+    def reserve(self, api_method, params):
+        """
+        Reserves a slot for an api call, a call whose chat is free spends its bot wide token at once,
+        otherwise the bot wide token is spent by release, at the turn of the chat
+        :param str api_method: Name of the API method to be called. (E.g. 'sendMessage')
+        :param dict or None params: the api call parameters
+        :return: seconds to wait, and the chat the call is queued for or None when it already holds its bot wide token
+        :rtype: tuple
+        """
+        if not api_method.startswith(self.limited_methods):
+            return 0, None
+
+        chat_id = params.get('chat_id') if params else None
+        with self.__lock:
+            now = time.monotonic()
+            if chat_id is not None:
+                chat = self.__chats.get(chat_id)
+                if chat is None:
+                    if len(self.__chats) > 10000:
+                        self.__prune(now)
+                    chat = self.__chats[chat_id] = self.__chat_bucket(chat_id)
+                at = chat.allowed_at(now)
+                chat.consume(at)
+                if at > now:
+                    self.__queue_depth += 1
+                    self.__pending[chat_id] = self.__pending.get(chat_id, 0) + 1
+                    return at - now, chat_id
+
+            delay = self.__take(now)
+            if delay <= 0:
+                return 0, None
+            self.__queue_depth += 1
+            return delay, None
+
+    def release(self, chat_id):
+        """
+        Marks a waiting call as done waiting, a call that was queued for its chat spends its bot wide token now
+        :param int or str or None chat_id: the chat returned by reserve
+        :return: seconds to wait for the bot wide token
+        :rtype: float
+        """
+        with self.__lock:
+            self.__queue_depth -= 1
+            if chat_id is None:
+                return 0
+            self.__pending[chat_id] -= 1
+            if not self.__pending[chat_id]:
+                del self.__pending[chat_id]
+            return max(self.__take(time.monotonic()), 0)
+
+    def wait(self, api_method, params):
+        """
+        Blocks the calling thread until the api call can be sent
+        :param str api_method: Name of the API method to be called. (E.g. 'sendMessage')
+        :param dict or None params: the api call parameters
+        """
+        delay, chat_id = self.reserve(api_method, params)
+        if delay:
+            try:
+                time.sleep(delay)
+            finally:
+                delay = self.release(chat_id)
+            time.sleep(delay)
+
+    async def async_wait(self, api_method, params):
+        """
+        Suspends the calling coroutine until the api call can be sent
+        :param str api_method: Name of the API method to be called. (E.g. 'sendMessage')
+        :param dict or None params: the api call parameters
+        """
+        delay, chat_id = self.reserve(api_method, params)
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                delay = self.release(chat_id)
+            await asyncio.sleep(delay)
+
+    def __take(self, now):
+        """
+        Spends a bot wide token, the call is sent when it is spent, so the bot wide limit holds for the sent calls
+        :return: seconds to wait for the token
+        """
+        at = self.__bucket.allowed_at(now)
+        self.__bucket.consume(at)
+        return at - now
+
+    def __chat_bucket(self, chat_id):
+        if str(chat_id).startswith(('-', '@')):
+            return TokenBucket(self.group_chat, self.group_burst)
+        return TokenBucket(self.private_chat, 1)
+
+    def __prune(self, now):
+        """
+        Forgets chats whose buckets are full again
+        """
+        for chat_id in [k for k, v in self.__chats.items() if v.arrival <= now and k not in self.__pending]:
+            del self.__chats[chat_id]
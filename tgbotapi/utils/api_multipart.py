@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_multipart
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the streaming multipart encoder that is consumed internally by api_handler
+"""
+
+import mimetypes
+import os
+import uuid
+
+from .json_helper import JsonSerializable, codec
+
+CHUNK_SIZE = 64 * 1024
+
+
+class FilePart(object):
+    """
+    This class represents a file to be uploaded that is read in chunks while the request is sent,
+    The source can be bytes, a file object, an mmap or an iterable of bytes like a generator.
+    """
+
+    def __init__(self, source, length=None, filename=None, content_type=None):
+        """
+        Initializes a new FilePart
+        :param bytes or BinaryIO or mmap.mmap or Iterable source: the file content
+        :param int or None length: number of bytes of the source, required for iterables, measured otherwise
+        :param str or None filename: the file name sent to Telegram, default the name of the source file
+        :param str or None content_type: the MIME type, default guessed from the file name
+        """
+        self.source = source
+        self.filename = filename
+        self.content_type = content_type
+        self.length = length
+        self.__start = None
+        self.__iterator = None
+        self.__pending = b''
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.source = memoryview(source)
+            self.length = len(self.source)
+        elif hasattr(source, 'read'):
+            if self.filename is None and isinstance(getattr(source, 'name', None), str):
+                self.filename = os.path.basename(source.name)
+            if hasattr(source, 'seek') and (not hasattr(source, 'seekable') or source.seekable()):
+                self.__start = source.tell()
+                if self.length is None:
+                    source.seek(0, os.SEEK_END)
+                    self.length = source.tell() - self.__start
+                    source.seek(self.__start)
+        elif not hasattr(source, '__iter__'):
+            raise TypeError(f'Cannot upload an object of type {type(source).__name__}')
+        if self.length is None:
+            raise ValueError('The length of a stream that cannot seek must be given')
+
+    def open(self, name):
+        """
+        Starts reading the part from its beginning
+        :param str name: the form field name, the file name when the part has none
+        """
+        if self.filename is None:
+            self.filename = name
+        if self.content_type is None:
+            self.content_type = mimetypes.guess_type(self.filename)[0] or 'application/octet-stream'
+        if self.__start is not None:
+            self.source.seek(self.__start)
+        self.__iterator = None
+        self.__pending = b''
+
+    def read(self, offset, size):
+        """
+        Reads the next chunk of the part
+        :param int offset: number of bytes of the part read so far
+        :param int size: maximum number of bytes to read
+        :rtype: bytes
+        """
+        size = min(size, self.length - offset)
+        if isinstance(self.source, memoryview):
+            return self.source[offset:offset + size].tobytes()
+        if hasattr(self.source, 'read'):
+            return self.source.read(size)
+
+        if self.__iterator is None:
+            self.__iterator = iter(self.source)
+        data = self.__pending
+        while len(data) < size:
+            chunk = next(self.__iterator, None)
+            if chunk is None:
+                break
+            data += chunk
+        self.__pending = data[size:]
+        return data[:size]
+
+
+class MultipartEncoder(object):
+    """
+    This class is a file-like multipart/form-data body that streams its files, its length is known before it is read,
+    So a request with large files keeps at most one chunk of each file in memory.
+    """
+
+    def __init__(self, fields, files, chunk_size=CHUNK_SIZE):
+        """
+        Initializes a new MultipartEncoder
+        :param dict or None fields: the form fields, objects and lists are sent as JSON
+        :param dict files: the files by field name, as FilePart, a source FilePart accepts or a tuple of
+            (filename, source) or (filename, source, content_type)
+        :param int chunk_size: the size of the chunks yielded by iteration
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self.chunk_size = chunk_size
+        self.__parts = []
+
+        for name, value in (fields or {}).items():
+            if isinstance(value, (JsonSerializable, dict, list, tuple)):
+                value = codec.dumps(value)
+            head = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            self.__parts.append(f'{head}{value}\r\n'.encode('utf-8'))
+        for name, value in files.items():
+            if isinstance(value, tuple):
+                part = FilePart(value[1], filename=value[0], content_type=value[2] if len(value) > 2 else None)
+            else:
+                part = value if isinstance(value, FilePart) else FilePart(value)
+            part.open(name)
+            head = (f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                    f'filename="{part.filename}"\r\nContent-Type: {part.content_type}\r\n\r\n')
+            self.__parts += [head.encode('utf-8'), part, b'\r\n']
+        self.__parts.append(f'--{self.boundary}--\r\n'.encode('utf-8'))
+
+        self.__length = sum(part.length if isinstance(part, FilePart) else len(part) for part in self.__parts)
+        self.__index = 0
+        self.__offset = 0
+
+    def __len__(self):
+        return self.__length
+
+    def read(self, size=-1):
+        """
+        Reads the next bytes of the body
+        :param int size: maximum number of bytes to read, -1 reads up to the next file chunk
+        :return: the bytes read, empty at the end of the body
+        :rtype: bytes
+        """
+        size = self.chunk_size if size is None or size < 0 else size
+        chunks = []
+        while size > 0 and self.__index < len(self.__parts):
+            part = self.__parts[self.__index]
+            if isinstance(part, FilePart):
+                chunk = part.read(self.__offset, size)
+                if not chunk and self.__offset < part.length:
+                    raise IOError(f'The file {part.filename} ended {part.length - self.__offset} bytes early')
+            else:
+                chunk = part[self.__offset:self.__offset + size]
+            self.__offset += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+            if self.__offset >= (part.length if isinstance(part, FilePart) else len(part)):
+                self.__index += 1
+                self.__offset = 0
+        return b''.join(chunks)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def rewind(self):
+        """
+        Starts the body over, so a failed request can be sent again
+        """
+        for part in self.__parts:
+            if isinstance(part, FilePart):
+                part.open(part.filename)
+        self.__index = 0
+        self.__offset = 0
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_retry
+~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the retry policy that is consumed internally by api_handler
+"""
+
+import random
+
+
+class RetryPolicy(object):
+    """
+    This class decides whether a failed api call is sent again and how long to wait before it,
+    429 responses wait exactly retry_after seconds, server errors back off exponentially with full jitter.
+    """
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30, max_retry_after=60, migrate=True):
+        """
+        Initializes a new RetryPolicy
+        :param int max_retries: maximum number of retries for the same call, default 3
+        :param float backoff: base delay in seconds for server errors, default 0.5
+        :param float max_backoff: upper bound in seconds of a server error delay, default 30
+        :param float max_retry_after: give up when the API asks to wait longer than that, default 60 seconds
+        :param bool migrate: resend the call to migrate_to_chat_id when a group was upgraded to a supergroup
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.migrate = migrate
+
+    def delay(self, error, attempt):
+        """
+        Returns the seconds to wait before retrying a failed call, None means the error is raised
+        :param TelegramAPIError error: the error raised by the call
+        :param int attempt: number of retries already made for the call
+        :rtype: float or None
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        parameters = error.parameters
+        if parameters and parameters.retry_after is not None:
+            if parameters.retry_after > self.max_retry_after:
+                return None
+            return parameters.retry_after
+        if parameters and parameters.migrate_to_chat_id is not None:
+            return 0 if self.migrate else None
+        if error.error_code is not None and error.error_code >= 500:
+            return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        return None
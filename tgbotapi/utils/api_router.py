@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_router
+~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the update routing classes that are consumed internally by tgbotapi bots
+"""
+
+import collections
+import heapq
+import re
+import string
+
+
+def parse_command(message, username=None):
+    """
+    Returns the bot command a message starts with, '/Start@MyBot args' becomes 'start',
+    A command addressed to another bot than username returns None, like a message without a command
+    :param any message: a Message like object with text and entities
+    :param str or None username: the username of the bot, None accepts a command addressed to any bot
+    :rtype: str or None
+    """
+    entities = getattr(message, 'entities', None)
+    if not entities or entities[0].ttype != 'bot_command' or entities[0].offset != 0:
+        return None
+    command, _, addressee = message.text[:entities[0].length].lstrip('/').partition('@')
+    if addressee and username and addressee.lower() != username.lower():
+        return None
+    return command.lower()
+
+
+def normalize_command(command):
+    """
+    Normalizes a registered bot command, '/Start@MyBot' becomes 'start'
+    :param str command: bot command
+    :rtype: str
+    """
+    return command.lstrip('/').partition('@')[0].lower()
+
+
+class UpdateRoute(object):
+    """
+    This class holds the update handlers registered for one update type,
+    Handlers with a bot_command filter are indexed by command and handlers with a regexp filter by pattern,
+    so a message only visits the handlers it can match, and all the patterns are searched together once per update.
+    """
+
+    def __init__(self):
+        self.handlers = []
+        self.__generic = []
+        self.__commands = {}
+        self.__keyed = {}
+        self.__patterns = PatternMatcher()
+
+    def add(self, handler, commands=None):
+        """
+        Registers an update handler
+        :param dict handler: the handler dict, with function and filters
+        :param list[str] or None commands: bot commands the handler is restricted to
+        """
+        entry = (len(self.handlers), handler)
+        self.handlers.append(handler)
+        pattern = handler['filters'].get('regexp')
+        if pattern is not None:
+            self.__patterns.add(pattern)
+
+        if commands:
+            for command in {normalize_command(command) for command in commands}:
+                if command not in self.__commands:
+                    self.__commands[command] = list(self.__generic)
+                self.__commands[command].append(entry)
+        elif pattern is not None:
+            self.__keyed.setdefault(pattern, []).append(entry)
+        else:
+            self.__generic.append(entry)
+            for entries in self.__commands.values():
+                entries.append(entry)
+
+    def search(self, update):
+        """
+        Returns the regexp filters that match the update text
+        :param any update: update content, like Message or CallbackQuery
+        :rtype: set[str]
+        """
+        text = getattr(update, 'text', None)
+        if not self.__patterns or not text:
+            return set()
+        return self.__patterns.search(text)
+
+    def candidates(self, update, matches=(), username=None):
+        """
+        Returns the handlers that may match the update, in registration order
+        :param any update: update content, like Message or CallbackQuery
+        :param set[str] matches: regexp filters that match the update text, as returned by search
+        :param str or None username: the username of the bot, commands addressed to other bots skip command handlers
+        :rtype: collections.abc.Iterator[dict]
+        """
+        entries = self.__generic
+        if self.__commands:
+            entries = self.__commands.get(parse_command(update, username), entries)
+        keyed = [self.__keyed[pattern] for pattern in matches if pattern in self.__keyed]
+        if keyed:
+            entries = heapq.merge(entries, *keyed)
+        return (handler for _, handler in entries)
+
+
+class PatternMatcher(object):
+    """
+    This class matches many regexp filters against a text at once,
+    Literal ASCII keywords are merged into one Aho-Corasick automaton that walks the text a single time,
+    the other patterns are compiled once and searched one by one.
+    """
+    special_chars = frozenset('.^$*+?{}[]\\|()')
+    # folds the text the way re.IGNORECASE matches it against ASCII letters, including the non-ASCII letters it accepts
+    case_folding = str.maketrans(string.ascii_uppercase + '\u0130\u0131\u017f\u212a', string.ascii_lowercase + 'iisk')
+
+    def __init__(self):
+        self.patterns = []
+        self.__keywords = {}
+        self.__regexps = []
+        self.__automaton = None
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def add(self, pattern):
+        """
+        Registers a pattern, the match is case insensitive like re.IGNORECASE unless the pattern is compiled
+        :param str or re.Pattern pattern: a regular expression, a compiled one or a literal keyword
+        """
+        if pattern in self.patterns:
+            return
+        if isinstance(pattern, re.Pattern):
+            self.__regexps.append((pattern, pattern))
+        elif self.special_chars.isdisjoint(pattern) and all(char < '\x80' for char in pattern):
+            self.__keywords.setdefault(pattern.lower(), []).append(pattern)
+            self.__automaton = None
+        else:
+            self.__regexps.append((pattern, re.compile(pattern, re.IGNORECASE)))
+        self.patterns.append(pattern)
+
+    def search(self, text):
+        """
+        Returns the registered patterns found in the text
+        :param str text: the text to search
+        :rtype: set[str or re.Pattern]
+        """
+        found = set()
+        if self.__keywords:
+            if self.__automaton is None:
+                self.__automaton = self.__build_automaton()
+            goto, fail, output = self.__automaton
+            state = 0
+            for char in text.translate(self.case_folding):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                if output[state]:
+                    found.update(output[state])
+            found.update(output[0])
+        for pattern, regexp in self.__regexps:
+            if regexp.search(text):
+                found.add(pattern)
+        return found
+
+    def __build_automaton(self):
+        """
+        Builds the keyword trie with its failure links, breadth first
+        """
+        goto, fail, output = [{}], [0], [list(self.__keywords.get('', ()))]
+        for keyword, patterns in self.__keywords.items():
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    fail.append(0)
+                    output.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            if keyword:
+                output[state].extend(patterns)
+
+        states = collections.deque(goto[0].values())
+        for state in states:
+            output[state].extend(output[0])
+        while states:
+            state = states.popleft()
+            for char, child in goto[state].items():
+                states.append(child)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(char, 0)
+                output[child].extend(output[fail[child]])
+        return goto, fail, [tuple(patterns) for patterns in output]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_uploads
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the upload cache that is consumed internally by api_handler
+"""
+
+import dbm
+import hashlib
+import os
+import threading
+
+from .api_multipart import FilePart
+
+# the upload fields whose file_id is found in the result under the same name
+MEDIA_FIELDS = ('photo', 'audio', 'document', 'video', 'animation', 'voice', 'video_note', 'sticker', 'png_sticker')
+
+
+class UploadCache(object):
+    """
+    This class remembers the file_id Telegram gave to each uploaded file, later sends of the same file use it
+    instead of uploading the file again, A file is known by the hash of its content or by its path, size and mtime.
+    """
+
+    def __init__(self, path=None, key='content', chunk_size=1 << 20):
+        """
+        Initializes a new UploadCache
+        :param str or None path: the dbm file keeping the cache between runs, default None keeps it in memory
+        :param str key: 'content' knows a file by the sha256 of its content, 'stat' by its path, size and mtime
+        :param int chunk_size: the size of the chunks read while hashing a file
+        """
+        if key not in ('content', 'stat'):
+            raise ValueError(f'Unknown upload cache key {key}, expected content or stat')
+        self.path = path
+        self.key = key
+        self.chunk_size = chunk_size
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__db = {} if path is None else dbm.open(path, 'c')
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__db)
+
+    def get(self, key):
+        """
+        Returns the file_id cached for a key
+        :param str key: a key made by file_key
+        :rtype: str or None
+        """
+        with self.__lock:
+            file_id = self.__db.get(key.encode('utf-8'))
+        return None if file_id is None else file_id.decode('utf-8')
+
+    def set(self, key, file_id):
+        """
+        Caches the file_id of a key
+        :param str key: a key made by file_key
+        :param str file_id: the file_id Telegram gave to the file
+        """
+        with self.__lock:
+            self.__db[key.encode('utf-8')] = file_id.encode('utf-8')
+
+    def discard(self, keys):
+        """
+        Forgets the file_id of keys, like the ones Telegram did not accept
+        :param dict keys: the keys by upload field, as returned by resolve
+        """
+        with self.__lock:
+            for key in keys.values():
+                if key.encode('utf-8') in self.__db:
+                    del self.__db[key.encode('utf-8')]
+
+    def close(self):
+        """
+        Closes the dbm file of the cache
+        """
+        with self.__lock:
+            if self.path is not None:
+                self.__db.close()
+
+    def file_key(self, field, value):
+        """
+        Returns the key of a file to be uploaded, None for a stream that cannot be read twice
+        :param str field: the upload field, like photo
+        :param any value: the file, as accepted by MultipartEncoder
+        :rtype: str or None
+        """
+        source = value[1] if isinstance(value, tuple) else value
+        if isinstance(source, FilePart):
+            source = source.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return f'{field}:{hashlib.sha256(source).hexdigest()}'
+        if not hasattr(source, 'read') or not hasattr(source, 'seek'):
+            return None
+
+        if self.key == 'stat' and isinstance(getattr(source, 'name', None), str) and hasattr(source, 'fileno'):
+            stat = os.fstat(source.fileno())
+            return f'{field}:{os.path.abspath(source.name)}:{stat.st_size}:{stat.st_mtime_ns}'
+        start = source.tell()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: source.read(self.chunk_size), b''):
+            digest.update(chunk)
+        source.seek(start)
+        return f'{field}:{digest.hexdigest()}'
+
+    def resolve(self, params, files):
+        """
+        Replaces the files of an api call that were uploaded before with their file_id
+        :param dict or None params: the parameters of the call
+        :param dict files: the files of the call by upload field
+        :return: the parameters and files to send and the keys of the cached files by upload field
+        :rtype: tuple
+        """
+        keys = {}
+        cached = {}
+        for field, value in files.items():
+            key = self.file_key(field, value) if field in MEDIA_FIELDS else None
+            if key is None:
+                continue
+            keys[field] = key
+            file_id = self.get(key)
+            with self.__lock:
+                if file_id is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            if file_id is not None:
+                cached[field] = file_id
+        if not cached:
+            return params, files, keys
+        return dict(params or {}, **cached), {k: v for k, v in files.items() if k not in cached}, keys
+
+    def update(self, keys, result):
+        """
+        Caches the file_id of the files uploaded by an api call
+        :param dict keys: the keys by upload field, as returned by resolve
+        :param any result: the result of the call, a Message or a File
+        """
+        if not isinstance(result, dict):
+            return
+        for field, key in keys.items():
+            media = result.get(field, result if 'file_id' in result else None)
+            if isinstance(media, list) and media:
+                media = media[-1]
+            if isinstance(media, dict) and 'file_id' in media:
+                self.set(key, media['file_id'])
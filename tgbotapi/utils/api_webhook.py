@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+tgbotapi.utils.api_webhook
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains the webhook server that is consumed internally by tgbotapi bots
+"""
+
+import http.server
+import threading
+
+from .json_helper import codec
+from .logger import logger
+
+
+class WebhookHandler(http.server.BaseHTTPRequestHandler):
+    """
+    This class handles the webhook requests of one connection, Telegram keeps the connection alive between updates.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = 'tgbotapi'
+    timeout = 60
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        """
+        Decodes the update and hands it over to the server callback
+        """
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        if self.path != self.server.url_path:
+            return self.send_reply(404)
+
+        try:
+            data = codec.loads(body)
+        except ValueError:
+            return self.send_reply(400)
+
+        try:
+            reply = self.server.callback(data)
+        except Exception:
+            logger.error('WEBHOOK UPDATE FAILED', exc_info=True)
+            return self.send_reply(500)
+        self.send_reply(200, reply or b'')
+
+    def send_reply(self, status, body=b''):
+        """
+        Sends a response that keeps the connection open
+        :param int status: HTTP status code
+        :param bytes body: JSON response body
+        """
+        self.send_response(status)
+        if body:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f'WEBHOOK {self.address_string()} {format % args}')
+
+
+class WebhookReply(object):
+    """
+    This class hands the deferred call returned by an update handler over to the webhook connection waiting for it,
+    A call offered after the connection stopped waiting is refused, so the handler sends it itself.
+    """
+
+    def __init__(self):
+        self.bound = False
+        self.__lock = threading.Lock()
+        self.__offered = threading.Event()
+        self.__closed = False
+        self.__call = None
+
+    def offer(self, call):
+        """
+        Offers the result of the update handler
+        :param DeferredCall or None call: the deferred call, or None when the handler has nothing to reply
+        :return: True when the call was accepted
+        :rtype: bool
+        """
+        with self.__lock:
+            if self.__closed:
+                return False
+            self.__call = call
+            self.__offered.set()
+            return True
+
+    def wait(self, timeout):
+        """
+        Waits for the update handler and stops accepting offers
+        :param float timeout: seconds to wait
+        :return: the offered call, if any
+        :rtype: DeferredCall or None
+        """
+        self.__offered.wait(timeout)
+        with self.__lock:
+            self.__closed = True
+            return self.__call
+
+
+class WebhookServer(http.server.ThreadingHTTPServer):
+    """
+    This class receives webhook updates, every connection is served by its own thread,
+    At most max_connections connections are served at once, the others wait in the listen backlog.
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, callback, listen='0.0.0.0', port=8443, url_path='/', max_connections=40, ssl_context=None):
+        """
+        Initializes a new WebhookServer
+        :param function callback: called with the decoded JSON of every update, returns the response body or None
+        :param str listen: the address to listen on, default all interfaces
+        :param int port: the port to listen on, default 8443
+        :param str url_path: the path of the webhook url, other paths get 404
+        :param int max_connections: maximum number of connections served at once, like set_webhook, default 40
+        :param ssl.SSLContext or None ssl_context: serves HTTPS when given, otherwise plain HTTP behind a proxy
+        """
+        self.callback = callback
+        self.url_path = url_path
+        self.max_connections = max_connections
+        self.__slots = threading.BoundedSemaphore(max_connections)
+        self.__stopping = False
+
+        http.server.ThreadingHTTPServer.__init__(self, (listen, port), WebhookHandler)
+        if ssl_context is not None:
+            self.socket = ssl_context.wrap_socket(self.socket, server_side=True, do_handshake_on_connect=False)
+
+    def shutdown(self):
+        """
+        Stops serve_forever, a connection waiting for a slot is closed
+        """
+        self.__stopping = True
+        http.server.ThreadingHTTPServer.shutdown(self)
+
+    def process_request(self, request, client_address):
+        """
+        Waits for a free connection slot before starting the connection thread, or until the server shuts down
+        """
+        while not self.__slots.acquire(timeout=.5):
+            if self.__stopping:
+                self.shutdown_request(request)
+                return
+        try:
+            http.server.ThreadingHTTPServer.process_request(self, request, client_address)
+        except Exception:
+            self.__slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        """
+        Serves a connection and frees its slot
+        """
+        try:
+            http.server.ThreadingHTTPServer.process_request_thread(self, request, client_address)
+        finally:
+            self.__slots.release()
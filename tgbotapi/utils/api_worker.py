@@ -6,8 +6,15 @@ tgbotapi.utils.api_worker
 This module contains threading classes that are consumed internally by tgbotapi
 """
 
+import collections
+import heapq
+import itertools
+import pickle
 import queue
+import struct
+import tempfile
 import threading
+import time
 import traceback
 
 from .logger import logger
@@ -19,11 +26,11 @@ class ThreadWorker(threading.Thread):
     """
     count = 0
 
-    def __init__(self, name, sequence=queue.Queue(), exception_callback=None):
+    def __init__(self, name, sequence=None, exception_callback=None):
         """
         Initializes the thread
         :param str name: name of the thread
-        :param sequence: sequence to use for the thread
+        :param sequence: sequence to use for the thread, a new queue.Queue by default
         :param function exception_callback: callback for exceptions
         """
         if not name:
@@ -31,7 +38,7 @@ class ThreadWorker(threading.Thread):
             self.__class__.count += 1
 
         threading.Thread.__init__(self, name=name)
-        self.sequence = sequence
+        self.sequence = queue.Queue() if sequence is None else sequence
         self.daemon = True
 
         self.event_received = threading.Event()
@@ -58,7 +65,10 @@ class ThreadWorker(threading.Thread):
 
                 logger.info("TASK RECEIVED")
                 self.event_received.set()
-                task(*args, **kwargs)
+                try:
+                    task(*args, **kwargs)
+                finally:
+                    self.sequence.task_done()
                 self.event_completed.set()
                 logger.info("TASK COMPLETED")
 
@@ -99,6 +109,539 @@ class ThreadWorker(threading.Thread):
         Stops the thread
         """
         self._running = False
+        self.event_continue.set()
+
+
+class LaneStats(object):
+    """
+    This class holds the queue wait statistics of one lane, the seconds its tasks waited before a worker took them.
+    """
+
+    def __init__(self, samples=1000):
+        """
+        Initializes a new LaneStats
+        :param int samples: number of recent waits kept for percentiles, default 1000
+        """
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.__lock = threading.Lock()
+        self.__recent = collections.deque(maxlen=samples)
+
+    @property
+    def mean(self):
+        """
+        Mean queue wait in seconds
+        :rtype: float
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, wait):
+        """
+        Records the queue wait of a task
+        :param float wait: seconds the task waited
+        """
+        with self.__lock:
+            self.count += 1
+            self.total += wait
+            self.maximum = max(self.maximum, wait)
+            self.__recent.append(wait)
+
+    def percentile(self, percent):
+        """
+        Returns the given percentile of the recent queue waits
+        :param float percent: percentile between 0 and 100, like 95
+        :rtype: float
+        """
+        with self.__lock:
+            recent = list(self.__recent)
+        recent.sort()
+        if not recent:
+            return 0.0
+        return recent[min(len(recent) - 1, int(len(recent) * percent / 100))]
+
+
+class SpillFile(object):
+    """
+    This class is a first in first out file of pickled tasks, it holds the tasks that overflow a TaskQueue
+    """
+    header = struct.Struct('!I')
+
+    def __init__(self):
+        self.__file = tempfile.TemporaryFile(prefix='tgbotapi-spill-')
+        self.__read_at = 0
+        self.__write_at = 0
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def push(self, entry):
+        """
+        Appends an entry to the file
+        :param tuple entry: a picklable entry
+        :raise pickle.PicklingError: when the entry can not be pickled, the file is left unchanged
+        """
+        data = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+        self.__file.seek(self.__write_at)
+        self.__file.write(self.header.pack(len(data)) + data)
+        self.__write_at = self.__file.tell()
+        self.__count += 1
+
+    def pop(self):
+        """
+        Removes and returns the oldest entry of the file
+        :rtype: tuple
+        """
+        self.__file.seek(self.__read_at)
+        size, = self.header.unpack(self.__file.read(self.header.size))
+        entry = pickle.loads(self.__file.read(size))
+        self.__read_at = self.__file.tell()
+        self.__count -= 1
+        if not self.__count:
+            self.__file.truncate(0)
+            self.__read_at = self.__write_at = 0
+        return entry
+
+    def close(self):
+        """
+        Closes and deletes the file
+        """
+        self.__file.close()
+
+
+class LaneQueue(object):
+    """
+    This class holds the waiting tasks of one lane of a TaskQueue shard, in one deque per key,
+    The keys that may run are kept in a heap by the age of their first task, a key found running is put aside
+    until wake, so taking a task never walks over the tasks that wait behind a running key.
+    """
+
+    def __init__(self, ordered=True):
+        """
+        Initializes a new LaneQueue
+        :param bool ordered: Pass False to let the tasks with the same key run in parallel
+        """
+        self.ordered = ordered
+        self.__keys = {}
+        self.__ready = []
+        self.__queued = set()
+        self.__size = 0
+
+    def __len__(self):
+        return self.__size
+
+    def append(self, seq, key, item, put_at, running):
+        """
+        Appends a task
+        :param int seq: the order of the task in its TaskQueue
+        :param any key: the ordering key, None runs the task independently of the others
+        :param any item: the task
+        :param float put_at: monotonic time the task was put at
+        :param set running: the keys that are running
+        """
+        self.__size += 1
+        if key is None or not self.ordered:
+            heapq.heappush(self.__ready, (seq, key, (item, put_at)))
+            return
+        if key not in self.__keys:
+            self.__keys[key] = collections.deque()
+        self.__keys[key].append((seq, item, put_at))
+        if key not in running:
+            self.wake(key)
+
+    def wake(self, key):
+        """
+        Makes the first task of a key runnable again, once the key is done running
+        :param any key: the ordering key
+        """
+        if key in self.__keys and key not in self.__queued:
+            heapq.heappush(self.__ready, (self.__keys[key][0][0], key, None))
+            self.__queued.add(key)
+
+    def runnable(self, running):
+        """
+        Returns True when a task may run, the keys found running are put aside until wake
+        :param set running: the keys that are running
+        :rtype: bool
+        """
+        ready = self.__ready
+        while ready and ready[0][2] is None and ready[0][1] in running:
+            self.__queued.discard(heapq.heappop(ready)[1])
+        return bool(ready)
+
+    def pop(self):
+        """
+        Removes and returns the oldest task that may run, call runnable first
+        :return: the key, the task and the time it was put at
+        :rtype: tuple
+        """
+        seq, key, task = heapq.heappop(self.__ready)
+        self.__size -= 1
+        if task is not None:
+            return (key,) + task
+        self.__queued.discard(key)
+        tasks = self.__keys[key]
+        seq, item, put_at = tasks.popleft()
+        if not tasks:
+            del self.__keys[key]
+        return key, item, put_at
+
+    def oldest(self, match):
+        """
+        Returns the oldest task whose key matches, running or not
+        :param function match: called with the key of a task
+        :return: the time the task was put at, its order and its key, or None
+        :rtype: tuple or None
+        """
+        oldest = None
+        for seq, key, task in self.__ready:
+            if task is not None and match(key) and (oldest is None or seq < oldest[1]):
+                oldest = (task[1], seq, key)
+        for key, tasks in self.__keys.items():
+            seq, item, put_at = tasks[0]
+            if match(key) and (oldest is None or seq < oldest[1]):
+                oldest = (put_at, seq, key)
+        return oldest
+
+    def remove(self, seq, key):
+        """
+        Removes a task found by oldest
+        :param int seq: the order of the task
+        :param any key: the key of the task
+        """
+        queued = any(entry[0] == seq for entry in self.__ready)
+        if queued:
+            self.__ready = [entry for entry in self.__ready if entry[0] != seq]
+            heapq.heapify(self.__ready)
+        tasks = self.__keys.get(key)
+        if tasks and tasks[0][0] == seq:
+            tasks.popleft()
+            self.__queued.discard(key)
+            if not tasks:
+                del self.__keys[key]
+            elif queued:
+                self.wake(key)
+        self.__size -= 1
+
+
+class TaskQueue(object):
+    """
+    This class is the task queue of a ThreadPool, tasks are spread over one shard per worker by key and over lanes,
+    Tasks with the same key run one at a time in the order they were put, tasks with different keys run in parallel,
+    and the lanes of a shard share the workers by weighted fair scheduling, so a busy lane never starves the others.
+    A bounded queue handles overflow by one of the policies:
+        - block: put waits until a worker takes a task, so the producer slows down
+        - drop_oldest: drops the oldest task of the same key, or the oldest task when the key has none waiting
+        - drop_lanes: drops the oldest task of the shed lanes, and blocks for the other lanes
+        - spill: pickles the overflow to a temporary file and loads it back in order, a task put with picklable
+          data is spilled as that data and rebuilt by loader, tasks that can not be pickled block with a warning
+    """
+    policies = ('block', 'drop_oldest', 'drop_lanes', 'spill')
+
+    def __init__(self, shards=1, work_stealing=False, lanes=None, maxsize=0, overflow='block', shed_lanes=None,
+                 ordered=True, loader=None):
+        """
+        Initializes a new TaskQueue
+        :param int shards: number of shards, one per worker when tasks are ordered by key, default 1 shared shard
+        :param bool work_stealing: Pass True to let an idle worker take tasks from the other shards
+        :param dict or None lanes: lane weights, like {'callback_query': 8}, the lanes not listed weigh 1
+        :param int maxsize: maximum number of waiting tasks, default 0 for unbounded
+        :param str overflow: what to do with a task that does not fit, one of block, drop_oldest, drop_lanes, spill
+        :param list or None shed_lanes: lanes the drop_lanes policy may drop, like ['message', 'edited_message']
+        :param bool ordered: Pass False to run tasks with the same key in parallel, keys then only tell drop_oldest
+                             which tasks belong together
+        :param function or None loader: rebuilds a task from the data it was spilled as, see put
+        """
+        if overflow not in self.policies:
+            raise ValueError(f"overflow should be one of {', '.join(self.policies)}, not '{overflow}'")
+
+        self.shards = shards
+        self.work_stealing = work_stealing
+        self.lanes = dict(lanes or {})
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.shed_lanes = frozenset(shed_lanes or ())
+        self.ordered = ordered
+        self.loader = loader
+        self.shed = collections.Counter()
+        self.spilled = collections.Counter()
+
+        self.__mutex = threading.Lock()
+        self.__not_empty = threading.Condition(self.__mutex)
+        self.__not_full = threading.Condition(self.__mutex)
+        self.__queues = [{} for _ in range(shards)]
+        self.__credits = [{} for _ in range(shards)]
+        self.__stats = {}
+        self.__running = set()
+        self.__sequence = itertools.count()
+        self.__next_shard = 0
+        self.__size = 0
+        self.__spill = None
+
+    def qsize(self, lane=None):
+        """
+        Returns the number of tasks waiting in all shards
+        :param any lane: count only the tasks of this lane
+        :rtype: int
+        """
+        with self.__not_empty:
+            if lane is None:
+                return self.__size
+            return sum(len(lanes.get(lane, ())) for lanes in self.__queues)
+
+    def spill_size(self):
+        """
+        Returns the number of tasks spilled to disk
+        :rtype: int
+        """
+        return len(self.__spill) if self.__spill is not None else 0
+
+    def queue_wait(self):
+        """
+        Returns the queue wait statistics of every lane that received tasks
+        :rtype: dict[any, LaneStats]
+        """
+        return dict(self.__stats)
+
+    def put(self, item, key=None, lane=None, data=None):
+        """
+        Puts a task in the shard of its key, tasks without a key are spread round robin
+        :param any item: the task
+        :param any key: the ordering key, like a chat id
+        :param any lane: the lane of the task, like an update type
+        :param any data: picklable data the spill policy keeps instead of the task, loader rebuilds the task from it
+        :return: False when the overflow policy dropped or spilled the task
+        :rtype: bool
+        """
+        with self.__not_empty:
+            put_at = time.monotonic()
+            if self.maxsize and (self.__size >= self.maxsize or self.spill_size()):
+                if not self.__on_overflow(item, key, lane, put_at, data):
+                    return False
+            self.__append(item, key, lane, put_at)
+            return True
+
+    def get(self, index=0, block=True, timeout=None):
+        """
+        Removes and returns the next task a worker may run
+        :param int index: the shard of the worker
+        :param bool block: Pass False to raise queue.Empty at once when no task is ready
+        :param float or None timeout: seconds to wait for a task before raising queue.Empty
+        :return: the key and the task
+        :rtype: tuple
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.__not_empty:
+            while True:
+                entry = self.__take(index)
+                if entry is None and self.work_stealing:
+                    for offset in range(1, self.shards):
+                        entry = self.__take((index + offset) % self.shards)
+                        if entry is not None:
+                            break
+                if entry is not None:
+                    if entry[0] is not None and self.ordered:
+                        self.__running.add(entry[0])
+                    self.__size -= 1
+                    while self.__spill and self.__size < self.maxsize:
+                        spilled, loaded, key, lane, put_at = self.__spill.pop()
+                        self.__append(self.loader(spilled) if loaded else spilled, key, lane, put_at)
+                    self.__not_full.notify()
+                    return entry
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Empty
+                self.__not_empty.wait(remaining)
+
+    def task_done(self, key):
+        """
+        Marks the task of a key as completed, so the next task with that key can run
+        :param any key: the key returned by get
+        """
+        if key is None:
+            return
+        with self.__not_empty:
+            self.__running.discard(key)
+            if self.ordered:
+                for tasks in self.__queues[self.__shard_of(key)].values():
+                    tasks.wake(key)
+            self.__notify()
+
+    def close(self):
+        """
+        Deletes the spill file
+        """
+        if self.__spill is not None:
+            self.__spill.close()
+            self.__spill = None
+
+    def shard(self, index):
+        """
+        Returns the queue like view a worker reads its tasks from
+        :param int index: the shard of the worker
+        :rtype: ShardView
+        """
+        return ShardView(self, index)
+
+    def __append(self, item, key, lane, put_at):
+        """
+        Appends a task to the lane of its shard
+        """
+        if (key is None or not self.ordered) and self.shards > 1:
+            index = self.__next_shard
+            self.__next_shard = (index + 1) % self.shards
+        else:
+            index = self.__shard_of(key)
+        lanes = self.__queues[index]
+        if lane not in lanes:
+            lanes[lane] = LaneQueue(self.ordered)
+        lanes[lane].append(next(self.__sequence), key, item, put_at, self.__running)
+        self.__size += 1
+        self.__notify()
+
+    def __on_overflow(self, item, key, lane, put_at, data):
+        """
+        Applies the overflow policy to a task that does not fit, returns True when there is room for it now
+        """
+        if self.overflow == 'spill':
+            if self.__spill is None:
+                self.__spill = SpillFile()
+            loaded = data is not None and self.loader is not None
+            try:
+                self.__spill.push((data if loaded else item, loaded, key, lane, put_at))
+                self.spilled[lane] += 1
+                return False
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                logger.warning(f'A task of lane {lane} can not be spilled, waiting for room instead: {e}')
+        elif self.overflow == 'drop_oldest':
+            victim = None
+            if key is not None:
+                victim = self.__oldest(lambda entry_lane, entry_key: entry_key == key,
+                                       self.__shard_of(key) if self.ordered else None)
+            if victim is None:
+                victim = self.__oldest(lambda entry_lane, entry_key: True)
+            return self.__drop(victim)
+        elif self.overflow == 'drop_lanes':
+            if self.__drop(self.__oldest(lambda entry_lane, entry_key: entry_lane in self.shed_lanes)):
+                return True
+            if lane in self.shed_lanes:
+                self.shed[lane] += 1
+                return False
+
+        while self.__size >= self.maxsize:
+            self.__not_full.wait(.5)
+        return True
+
+    def __oldest(self, match, index=None):
+        """
+        Finds the oldest waiting task that matches, in one shard or in all, returns its shard, lane, order and key
+        """
+        oldest = None
+        for index in range(self.shards) if index is None else (index,):
+            for lane, tasks in self.__queues[index].items():
+                task = tasks.oldest(lambda key: match(lane, key))
+                if task is not None and (oldest is None or task[:2] < oldest[:2]):
+                    oldest = task[:2] + (index, lane, task[2])
+        return oldest
+
+    def __drop(self, victim):
+        """
+        Drops the task found by __oldest, returns False when there is none
+        """
+        if victim is None:
+            return False
+        put_at, seq, index, lane, key = victim
+        tasks = self.__queues[index][lane]
+        tasks.remove(seq, key)
+        if not tasks:
+            del self.__queues[index][lane]
+        self.__size -= 1
+        self.shed[lane] += 1
+        return True
+
+    def __shard_of(self, key):
+        """
+        Returns the shard of a key
+        """
+        return hash(key) % self.shards if self.shards > 1 else 0
+
+    def __notify(self):
+        """
+        Wakes the workers, every worker of a single shard can run any task so waking one is enough
+        """
+        if self.shards == 1:
+            self.__not_empty.notify()
+        else:
+            self.__not_empty.notify_all()
+
+    def __take(self, index):
+        """
+        Removes the next runnable task of a shard, the lane is chosen by smooth weighted round robin
+        """
+        lanes = self.__queues[index]
+        ready = [lane for lane, tasks in lanes.items() if tasks.runnable(self.__running)]
+        if not ready:
+            return None
+
+        if len(ready) == 1:
+            lane = ready[0]
+        else:
+            credits = self.__credits[index]
+            total = 0
+            for lane in ready:
+                weight = self.lanes.get(lane, 1)
+                credits[lane] = credits.get(lane, 0) + weight
+                total += weight
+            lane = max(ready, key=credits.__getitem__)
+            credits[lane] -= total
+
+        tasks = lanes[lane]
+        key, item, put_at = tasks.pop()
+        if not tasks:
+            del lanes[lane]
+
+        if lane not in self.__stats:
+            self.__stats[lane] = LaneStats()
+        self.__stats[lane].add(time.monotonic() - put_at)
+        return key, item
+
+
+class ShardView(object):
+    """
+    This class is the view of one TaskQueue shard, with the queue.Queue methods a ThreadWorker uses.
+    """
+
+    def __init__(self, sequence, index):
+        """
+        Initializes a new ShardView
+        :param TaskQueue sequence: the task queue
+        :param int index: the shard of the worker
+        """
+        self.sequence = sequence
+        self.index = index
+        self.__key = None
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the next task of the shard, see TaskQueue.get
+        """
+        self.__key, item = self.sequence.get(self.index, block, timeout)
+        return item
+
+    def put(self, item, key=None, lane=None):
+        """
+        Puts a task in the task queue, see TaskQueue.put
+        """
+        self.sequence.put(item, key, lane)
+
+    def task_done(self):
+        """
+        Marks the last task returned by get as completed
+        """
+        key, self.__key = self.__key, None
+        self.sequence.task_done(key)
 
 
 class ThreadPool(object):
@@ -106,30 +649,110 @@ class ThreadPool(object):
     ThreadPool class that can be used to run tasks in parallel.
     """
 
-    def __init__(self, max_workers, sequence=queue.Queue()):
+    def __init__(self, max_workers, sequence=None, sharded=False, work_stealing=False, lanes=None, maxsize=0,
+                 overflow='block', shed_lanes=None, loader=None):
         """
         Initializes a new ThreadPool
         :param int max_workers: maximum number of workers
-        :param sequence: Sequence to use for the thread
+        :param sequence: Sequence to use for the thread, a new TaskQueue by default
+        :param bool sharded: Pass True to run tasks with the same key in order, one shard per worker
+        :param bool work_stealing: Pass True to let idle workers take tasks from the other shards
+        :param dict or None lanes: lane weights for weighted fair scheduling, like {'callback_query': 8}
+        :param int maxsize: maximum number of waiting tasks, default 0 for unbounded
+        :param str overflow: what to do with a task that does not fit, one of block, drop_oldest, drop_lanes, spill
+        :param list or None shed_lanes: lanes the drop_lanes policy may drop
+        :param function or None loader: rebuilds a task from the data the spill policy kept, see put_task
         """
+        if sequence is None:
+            sequence = TaskQueue(max_workers if sharded else 1, work_stealing, lanes, maxsize, overflow, shed_lanes,
+                                 sharded, loader)
         self.sequence = sequence
-        self.workers = [ThreadWorker(f'', self.sequence, self.on_exception) for _ in range(max_workers)]
+        self.sharded = isinstance(sequence, TaskQueue) and sequence.shards > 1
+        self.workers = []
         self.max_workers = max_workers
 
+        # a worker whose task raised waits until clear_exceptions, so the exception can stop the bot
+        self.halt_on_exception = True
         self.event_exception = threading.Event()
         self.exception_info = None
+        self.__lock = threading.Lock()
+
+    def start(self):
+        """
+        Starts the workers, the first task put does it, so a pool that never gets a task runs no thread
+        """
+        if len(self.workers) == self.max_workers:
+            return
+        with self.__lock:
+            sequence = self.sequence
+            for i in range(len(self.workers), self.max_workers):
+                self.workers.append(
+                    ThreadWorker('', sequence.shard(i % sequence.shards) if isinstance(sequence, TaskQueue)
+                                 else sequence, self.on_exception))
 
     def put(self, func, *args, **kwargs):
         """
         Adds a task to the sequence.
         """
+        self.start()
         self.sequence.put((func, args, kwargs))
 
+    def put_task(self, func, args=(), kwargs=None, key=None, lane=None, data=None):
+        """
+        Adds a task to the sequence, tasks with the same key run in order when the pool is sharded
+        :param function func: the task
+        :param tuple args: task positional arguments
+        :param dict or None kwargs: task keyword arguments
+        :param any key: the ordering key, like a chat id
+        :param any lane: the lane of the task, like an update type
+        :param any data: picklable data the spill policy keeps instead of the task, the loader of the pool rebuilds
+                         the task from it
+        :return: False when the overflow policy dropped or spilled the task
+        :rtype: bool
+        """
+        self.start()
+        task = (func, args, kwargs or {})
+        if isinstance(self.sequence, TaskQueue):
+            return self.sequence.put(task, key, lane, data)
+        self.sequence.put(task)
+        return True
+
+    def set_lanes(self, lanes):
+        """
+        Sets the lane weights, a lane with weight 8 gets 8 tasks through for each task of a lane with weight 1
+        :param dict lanes: lane weights, like {'callback_query': 8, 'inline_query': 8}
+        """
+        self.sequence.lanes = dict(lanes)
+
+    def queue_wait(self):
+        """
+        Returns the queue wait statistics of every lane
+        :rtype: dict[any, LaneStats]
+        """
+        return self.sequence.queue_wait()
+
+    def shed(self):
+        """
+        Returns the number of tasks of every lane dropped by the overflow policy
+        :rtype: dict[any, int]
+        """
+        return dict(self.sequence.shed)
+
+    def spilled(self):
+        """
+        Returns the number of tasks of every lane spilled to disk by the overflow policy
+        :rtype: dict[any, int]
+        """
+        return dict(self.sequence.spilled)
+
     def on_exception(self, worker_thread, exception_info):
         """
-        Callback for exceptions in threads.
+        Callback for exceptions in threads, a worker that does not halt logged the exception and goes on at once.
         """
         self.exception_info = exception_info
+        if not self.halt_on_exception:
+            worker_thread.clear_exceptions()
+            return
         self.event_exception.set()
         worker_thread.event_exception.set()
 
@@ -142,9 +765,12 @@ class ThreadPool(object):
 
     def clear_exceptions(self):
         """
-        Clears exceptions in threads.
+        Clears exceptions in threads, and lets the failed workers take new tasks.
         """
         self.event_exception.clear()
+        for worker in self.workers:
+            if worker.event_exception.is_set():
+                worker.clear_exceptions()
 
     def close(self):
         """
@@ -154,6 +780,8 @@ class ThreadPool(object):
             worker.stop()
         for worker in self.workers:
             worker.join()
+        if isinstance(self.sequence, TaskQueue):
+            self.sequence.close()
 
 
 def events_handler(event=threading.Event(), *events_status):
@@ -6,14 +6,148 @@ tgbotapi.utils.json_helper
 This submodule provides json utility objects that are consumed internally by tgbotapi types
 """
 
+import importlib
 import json
+import sys
+
+LITERALS = (type(None), bool, int, float, str)
+
+
+class Field(object):
+    """
+    This class describes one field of a type in its field table, the de_json of the type is generated from the table,
+    The fields are passed to the constructor of the type in the order of the table.
+    """
+    __slots__ = ('name', 'key', 'ttype', 'depth', 'default', 'required')
+
+    def __init__(self, name, key=None, ttype=None, depth=0, default=None, required=False):
+        """
+        Initializes a new Field
+        :param str name: the attribute name of the field
+        :param str or None key: the json key of the field, default the attribute name
+        :param str or None ttype: the name of the nested type decoding the value, None keeps the value as is
+        :param int depth: the list depth of the value, 1 for a list of ttype, 2 for a list of lists of ttype
+        :param any default: the value of a missing field
+        :param bool required: the field is always present, a missing one raises KeyError
+        """
+        self.name = name
+        self.key = key or name
+        self.ttype = ttype
+        self.depth = depth
+        self.default = default
+        self.required = required
+
+    def expression(self, value, types=None):
+        """
+        Returns the source of the expression decoding a json value of the field
+        :param str value: the source of the json value
+        :param dict or None types: replaces nested type names, e.g. with their lazy counterparts
+        :rtype: str
+        """
+        if self.ttype is None:
+            return value
+        ttype = (types or {}).get(self.ttype, self.ttype)
+        source = f'{ttype}.de_json(item{self.depth})'
+        for depth in range(self.depth, 0, -1):
+            source = f'[{source} for item{depth} in item{depth - 1}]'
+        return source.replace('item0', value)
+
+
+def literal(value, constants):
+    """
+    Returns the source of a default value, values that are not literals are passed to the generated code as constants
+    """
+    if type(value) in LITERALS:
+        return repr(value)
+    constants.append(value)
+    return f'constants[{len(constants) - 1}]'
+
+
+def compile_function(source, name, module, constants):
+    """
+    Compiles the source of a generated function, nested type names are looked up in the globals of the module
+    """
+    namespace = {}
+    source = 'def make(constants):\n' + ''.join(f'    {line}\n' for line in source) + f'    return {name}\n'
+    exec(compile(source, f'<{module} {name}>', 'exec'), sys.modules[module].__dict__, namespace)
+    return namespace['make'](constants)
+
+
+def build_decoder(cls):
+    """
+    Generates the de_json of a type from its field table,
+    A type that keeps class level defaults only gets the fields present in the json, the others read the defaults.
+    :param type cls: the type with a field table
+    :return: the de_json classmethod
+    """
+    constants = []
+    source = ['def de_json(cls, obj_type):',
+              '    obj = obj_type if type(obj_type) is dict else cls.check_type(obj_type)',
+              '    get = obj.get']
+    if 'defaults' in cls.__dict__:
+        setters = {}
+        source.append('    self = object.__new__(cls)')
+        for field in cls.fields:
+            if field.required:
+                source.append(f'    self.{field.name} = {field.expression(f"obj[{field.key!r}]")}')
+            else:
+                setter = [f'def set_{field.name}(self, value):', f'    self.{field.name} = {field.expression("value")}']
+                setters[field.key] = compile_function(setter, f'set_{field.name}', cls.__module__, constants)
+        constants.append(setters)
+        source += [f'    setters = constants[{len(constants) - 1}]',
+                   '    for key in obj:',
+                   '        setter = setters.get(key)',
+                   '        if setter is not None:',
+                   '            setter(self, obj[key])',
+                   '    return self']
+    else:
+        arguments = []
+        for index, field in enumerate(cls.fields):
+            if field.required:
+                arguments.append(field.expression(f'obj[{field.key!r}]'))
+            elif field.ttype is None and field.default is None:
+                arguments.append(f'get({field.key!r})')
+            elif field.ttype is None:
+                arguments.append(f'get({field.key!r}, {literal(field.default, constants)})')
+            else:
+                source.append(f'    value{index} = get({field.key!r})')
+                arguments.append(f'{literal(field.default, constants)} if value{index} is None '
+                                 f'else {field.expression(f"value{index}")}')
+        source.append(f'    return cls({", ".join(arguments)})')
+    return classmethod(compile_function(source, 'de_json', cls.__module__, constants))
+
+
+def lazy_decoders(fields, module, types=None):
+    """
+    Generates the functions decoding each field from the raw json dict, for the types decoded on access
+    :param tuple fields: the field table
+    :param str module: the name of the module the nested type names are looked up in
+    :param dict or None types: replaces nested type names, e.g. with their lazy counterparts
+    :return: dict of attribute name to function(raw)
+    """
+    decoders = {}
+    for field in fields:
+        constants = []
+        source = [f'def decode_{field.name}(raw):',
+                  f'    value = raw.get({field.key!r})',
+                  f'    return {literal(field.default, constants)} if value is None '
+                  f'else {field.expression("value", types)}']
+        decoders[field.name] = compile_function(source, f'decode_{field.name}', module, constants)
+    return decoders
 
 
 class JsonDeserializable(object):
     """
     Subclasses of this class are guaranteed to be able to be created from a json-style dict or json formatted string,
-    All subclasses of this class must override de_json.
+    All subclasses of this class must override de_json, or declare a field table it is generated from.
     """
+    __slots__ = ()
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'fields' in cls.__dict__ and 'de_json' not in cls.__dict__:
+            cls.de_json = build_decoder(cls)
 
     @classmethod
     def de_json(cls, obj_type):
@@ -30,7 +164,7 @@ class JsonDeserializable(object):
         """
         implement
         Checks whether obj_type is a dict or a string. If it is already a dict, it is returned as-is,
-        If it is not, it is converted to a dict by means of json.loads(obj_type),
+        If it is not, it is converted to a dict by means of codec.loads(obj_type),
         :param str or dict obj_type:
         :return: dict
         """
@@ -38,7 +172,7 @@ class JsonDeserializable(object):
         if type(obj_type) == dict:
             return obj_type
         elif type(obj_type) == str:
-            return json.loads(obj_type)
+            return codec.loads(obj_type)
         else:
             raise ValueError("obj_type should be a dict or string.")
 
@@ -48,6 +182,7 @@ class JsonSerializable(object):
     Subclasses of this class are guaranteed to be able to be converted to JSON format,
     All subclasses of this class must override to_json.
     """
+    __slots__ = ()
 
     def to_dict(self):
         """
@@ -74,3 +209,81 @@ class JsonSerializable(object):
             return obj.to_dict()
         else:
             raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+class JsonCodec(object):
+    """
+    This class encodes and decodes JSON with one of the supported backends, orjson, ujson or the json module,
+    By default it uses the fastest one installed, every response and update is parsed once through it.
+    """
+    backends = ('orjson', 'ujson', 'json')
+
+    def __init__(self, backend=None):
+        """
+        Initializes a new JsonCodec
+        :param str or None backend: 'orjson', 'ujson' or 'json', default the first one installed
+        """
+        self.backend = None
+        self.__loads = None
+        self.__dumps = None
+        self.__dumpb = None
+        self.use(backend)
+
+    def use(self, backend=None):
+        """
+        Switches the backend
+        :param str or None backend: 'orjson', 'ujson' or 'json', default the first one installed
+        :raise ValueError: when the backend is unknown or not installed
+        """
+        if backend is not None and backend not in self.backends:
+            raise ValueError(f"backend should be one of {', '.join(self.backends)}, not {backend!r}")
+        for name in self.backends if backend is None else (backend,):
+            try:
+                module = importlib.import_module(name)
+            except ImportError:
+                if backend is not None:
+                    raise ValueError(f'{backend} is not installed') from None
+                continue
+            break
+
+        serializer = JsonSerializable.custom_serializer
+        self.__loads = module.loads
+        if name == 'orjson':
+            option = module.OPT_NON_STR_KEYS
+            self.__dumpb = lambda obj: module.dumps(obj, default=serializer, option=option)
+            self.__dumps = lambda obj: self.__dumpb(obj).decode()
+        else:
+            if name == 'ujson':
+                self.__dumps = lambda obj: module.dumps(obj, default=serializer, escape_forward_slashes=False)
+            else:
+                self.__dumps = lambda obj: module.dumps(obj, default=serializer)
+            self.__dumpb = lambda obj: self.__dumps(obj).encode()
+        self.backend = name
+
+    def loads(self, data):
+        """
+        Decodes JSON
+        :param bytes or str data: the JSON document
+        :return: the decoded object
+        :raise ValueError: when data is not valid JSON
+        """
+        return self.__loads(data)
+
+    def dumps(self, obj):
+        """
+        Encodes obj to a JSON string, JsonSerializable objects are encoded through their to_dict
+        :param any obj: the object to encode
+        :rtype: str
+        """
+        return self.__dumps(obj)
+
+    def dumpb(self, obj):
+        """
+        Encodes obj to UTF-8 JSON bytes, like dumps
+        :param any obj: the object to encode
+        :rtype: bytes
+        """
+        return self.__dumpb(obj)
+
+
+codec = JsonCodec()